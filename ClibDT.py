@@ -1,7 +1,8 @@
 ﻿# ------------------ Standard Library ----------------------
 import os
 import sys
-import re
+import time
+import importlib
 import subprocess
 import atexit
 import builtins
@@ -9,25 +10,30 @@ import webbrowser
 from datetime import datetime
 from pathlib import Path
 import argparse
+_STARTUP_T0 = time.perf_counter()
+from modules.startup_trace import tracer, enable_tracing
 from colorama import init, Fore, Style, AnsiToWin32
 init(autoreset=True) 
 
-# ------------------ Panel Imports (must be before usage) ----------------------
-from modules.create_project import CreateProjectPanel
-from modules.build_project import BuildProjectPanel
-from modules.update_project_deps import UpdateProjectDepsPanel
-from modules.detach_remove_git import DetachGitPanel
-from modules.refresh_project import RefreshProjectPanel
-from modules.explorer import ExplorerPanel
+# ------------------ Panel Imports ----------------------
+# Panel modules are imported by MainWindow.ensure_panel when the panel is first built (see PANEL_SPECS)
 from modules.quick_launch import QuickLaunchManager
-from modules.theme_manager import ThemeManager
-from modules.progress_widget import ProgressWidget, ActivityIndicator
+from modules.theme_manager import ThemeManager, set_theme_scope
+from modules.config_manager import config_store, get_config_namespace
+from modules.progress_widget import ProgressWidget
 
 
 parser = argparse.ArgumentParser()
 parser.add_argument('--no-pause', action='store_true', help='Disable input pauses for automation')
+parser.add_argument('--eager-panels', action='store_true', help='Build every panel before showing the window')
+parser.add_argument('--no-prewarm', action='store_true', help='Do not build hidden panels in the background')
+parser.add_argument('--profile-startup', action='store_true', help='Print an import-time breakdown before starting')
+parser.add_argument('--trace-startup', action='store_true', help='Record a startup timeline (Chrome trace + summary)')
+parser.add_argument('--bench-theme', action='store_true', help='Time theme and panel switches once the window is up, then exit')
 args, unknown = parser.parse_known_args()
 NO_PAUSE = args.no_pause
+if args.trace_startup or tracer.enabled:
+    enable_tracing(origin=_STARTUP_T0)
 
 # ------------------ Add to Module Path --------------------
 sys.path.append(str(Path(__file__).parent.resolve()))
@@ -38,12 +44,6 @@ sys.path.append(str(Path(__file__).parent.resolve()))
 # ------------------ Theme System ----------------------
 # Theme management moved to modules/theme_manager.py
 
-#----------requests----------
-try:
-    import requests
-except ImportError:
-    requests = None
-
 #----------version----------
 from modules.utilities.common import VERSION, NEXUS_URL
 _version_checked = False
@@ -53,6 +53,7 @@ _version_message = ""
 from modules.env_var_call import check_required_env_vars
 
 #----------project picker----------
+from modules.project_index import get_project_index
 def project_picker(require_existing_xmake=True):
     root = os.getenv("XSE_CLIBDT_DEVROOT")
     if not root:
@@ -62,29 +63,19 @@ def project_picker(require_existing_xmake=True):
     if not scan_base.exists():
         return None
     
-    # Import the new project detection module
-    try:
-        from modules.generate_clib_project import is_valid_clib_project
-    except ImportError:
-        # Fallback to old xmake.lua detection if module not available
-        def is_valid_clib_project(project_path):
-            return (project_path / "xmake.lua").exists()
-    
-    projects = []
-    for subdir in scan_base.iterdir():
-        if subdir.is_dir():
-            if require_existing_xmake:
-                if is_valid_clib_project(subdir):
-                    projects.append(subdir)
-            else:
-                projects.append(subdir)
+    # Shared with the GUI panels, so only a stat pass happens when nothing changed
+    index = get_project_index(scan_base)
+    index.refresh(notify=False)
+    projects = index.projects(valid_only=False)
+    if require_existing_xmake:
+        projects = [p for p in projects if p.has_clib_project]
     if not projects:
         return None
     print("\n=========================================")
     print("    Select a Project Folder")
     print("=========================================")
     for i, p in enumerate(projects, start=1):
-        print(f"{i}. {p.relative_to(scan_base)}")
+        print(f"{i}. {p.name}")
     print("M. Return to main menu\n")
     userInput = input("Enter project number: ").strip()
     if userInput.lower() == "m":
@@ -94,7 +85,7 @@ def project_picker(require_existing_xmake=True):
     idx = int(userInput)
     if not (1 <= idx <= len(projects)):
         return None
-    return str(projects[idx - 1])
+    return str(projects[idx - 1].path)
 
 #----------run py file----------
 from contextlib import contextmanager
@@ -202,30 +193,18 @@ def print_version_status():
         msg = f"           Supertron 2025 © -- v{VERSION}"
         color = Fore.LIGHTBLUE_EX
 
-        if not requests:
-            _version_message = f"{msg} (requests module missing)"
-            _version_checked = True
-            print(_version_message)
-            return
-
-        try:
-            res = requests.get(NEXUS_URL, timeout=5)
-            if "<div class=\"stat\">" in res.text:
-                match = re.search(r'<div class="stat">([\d\.]+)</div>', res.text)
-                if match:
-                    online = match.group(1)
-                    if online != VERSION:
-                        msg += f" (update available: v{online})"
-                        color = Fore.RED
-                    else:
-                        msg += " (up to date)"
-                else:
-                    msg += " (version check failed)"
-                    color = Fore.RED
-            else:
-                msg += " (parse failed)"
+        from modules.version_check import check_version, update_available
+        info = check_version(NEXUS_URL)
+        online = info.get("online_version")
+        if online:
+            if update_available(info):
+                msg += f" (update available: v{online})"
                 color = Fore.RED
-        except:
+            else:
+                msg += " (up to date)"
+        elif info.get("error") == "requests module missing":
+            msg += " (requests module missing)"
+        else:
             msg += " (network error)"
             color = Fore.RED
 
@@ -239,25 +218,13 @@ def print_version_status():
 
 #----------last backup----------
 def print_last_backup_info():
-    # Check config folder in dev root or fallback for clibdt_backup_config.json
-    from modules.config_utils import get_config_directory
-    config_dir = get_config_directory()
-    backup_config_file = config_dir / "clibdt_backup_config.json"
-
+    # Last backup recorded in the backup config namespace (clibdt_backup_config.json)
     best_timestamp = None
-    if backup_config_file.exists():
+    timestamp_str = get_config_namespace("backup").get("last_backup_timestamp")
+    if timestamp_str:
+        # Try parsing as ISO format
         try:
-            import json
-            with open(backup_config_file, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
-                timestamp_str = config_data.get("last_backup_timestamp")
-                if timestamp_str:
-                    # Try parsing as ISO format
-                    try:
-                        dt = datetime.fromisoformat(timestamp_str)
-                        best_timestamp = dt
-                    except Exception:
-                        pass
+            best_timestamp = datetime.fromisoformat(timestamp_str)
         except Exception:
             pass
     
@@ -287,6 +254,7 @@ def print_last_backup_info():
 
 import tempfile, shutil
 import io
+from modules.log_writer import RotatingLogWriter, DEFAULT_MAX_BYTES
 def atomic_write(path, data, mode='w', encoding='utf-8'):
     dirpath = os.path.dirname(path)
     with tempfile.NamedTemporaryFile(mode=mode, encoding=encoding, dir=dirpath, delete=False) as tf:
@@ -295,11 +263,15 @@ def atomic_write(path, data, mode='w', encoding='utf-8'):
     shutil.move(tempname, path)
 
 class FullTeeLogger(io.TextIOBase):
-    def __init__(self, log_path):
+    """Tees stdout/stderr to the console and a rotating log; disk I/O happens on a writer thread"""
+
+    def __init__(self, log_path, max_bytes=DEFAULT_MAX_BYTES, rotate_seconds=None):
         self.terminal_out = sys.stdout
         self.terminal_err = sys.stderr
         try:
-            self.logfile = open(log_path, "a", encoding="utf-8", buffering=1)
+            # The writer thread also echoes to the console, so callers never wait on either
+            self.logfile = RotatingLogWriter(log_path, max_bytes=max_bytes,
+                                             rotate_seconds=rotate_seconds, echo=self.terminal_out)
         except Exception:
             self.logfile = None
         self.original_input = __builtins__.input  # Always use the real input
@@ -310,21 +282,19 @@ class FullTeeLogger(io.TextIOBase):
         return self._encoding
 
     def write(self, message):
-        self.terminal_out.write(message)
-        if self.logfile:
-            try:
-                self.logfile.write(message)
-            except Exception:
-                pass
+        # Once the log is closed (e.g. during interpreter shutdown) output goes straight to the console
+        if self.logfile and not self.logfile.closed:
+            self.logfile.write(message)
+        else:
+            self.terminal_out.write(message)
         return len(message)
 
     def flush(self):
-        self.terminal_out.flush()
-        if self.logfile:
-            try:
-                self.logfile.flush()
-            except Exception:
-                pass
+        # Never blocks: the writer thread flushes on its own; close() drains it
+        if self.logfile and not self.logfile.closed:
+            self.logfile.flush()
+        else:
+            self.terminal_out.flush()
 
     def isatty(self):
         return True
@@ -343,17 +313,15 @@ class FullTeeLogger(io.TextIOBase):
 
     def input(self, prompt=""):
         self.write(prompt)
+        self.flush()
         user_input = self.original_input(prompt)
         #----------Do not log user keystrokes----------
         return user_input
 
     def close(self):
         if self.logfile:
-            try:
-                self.logfile.write("\n--- LOG CLOSED ---\n")
-                self.logfile.close()
-            except Exception:
-                pass
+            self.logfile.write("\n--- LOG CLOSED ---\n")
+            self.logfile.close()
 
 
 def setup_full_logger():
@@ -378,191 +346,46 @@ def safe_input(prompt):
 
 
 # -------------------- GUI Imports --------------------
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QStackedWidget, QLineEdit, QPushButton, QFileDialog, QMessageBox, QPlainTextEdit, QTextEdit, QSizePolicy)
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QStackedWidget, QLineEdit, QPushButton, QFileDialog, QMessageBox, QPlainTextEdit, QSizePolicy)
 import threading
-import requests
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QTextCursor, QFont, QIcon
-# If the file is named '@set_environment_variables.py', rename it to 'set_environment_variables.py' and import as:
-from modules.set_environment_variables import EnvVarsPanel, EnvSetupWizard
-# If Python cannot import from a file starting with '@', rename '@set_environment_variables.py' to 'set_environment_variables.py' and import as:
-# from set_environment_variables import EnvVarsPanel
-
-# Remove the EnvVarsPanel class and setx function from this file.
-# In the MainWindow class, use EnvVarsPanel from @set_environment_variables.py instead of the local definition.
-
-class MiniTerminal(QTextEdit):
-    append_text_signal = pyqtSignal(str)
-    append_html_signal = pyqtSignal(str)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setReadOnly(True)
-        self.setMinimumHeight(120)  # Reduced minimum height for better proportions
-        self.setMaximumHeight(300)  # Add maximum height to prevent excessive expansion
-        self.append_text_signal.connect(self._append_text)
-        self.append_html_signal.connect(self._append_html)
-        
-        # Set default font with better proportions
-        font = QFont("Consolas", 10)  # Slightly smaller font
-        self.setFont(font)
-        
-        # Color mapping for ANSI colors
-        self.color_map = {
-            'black': '#000000',
-            'red': '#e74c3c',
-            'green': '#27ae60',
-            'yellow': '#f39c12',
-            'blue': '#3498db',
-            'magenta': '#9b59b6',
-            'cyan': '#1abc9c',
-            'white': '#ffffff',
-            'bright_black': '#7f8c8d',
-            'bright_red': '#e74c3c',
-            'bright_green': '#2ecc71',
-            'bright_yellow': '#f1c40f',
-            'bright_blue': '#3498db',
-            'bright_magenta': '#9b59b6',
-            'bright_cyan': '#1abc9c',
-            'bright_white': '#ecf0f1'
-        }
-        
-        # Add line limit to prevent memory issues
-        self.max_lines = 1000
-        self.current_lines = 0
-
-    def write(self, text):
-        """Handle raw text output with color parsing"""
-        self.append_text(text)
-
-    def append_text(self, text):
-        """Append text with color parsing"""
-        if text:
-            # Parse ANSI color codes and convert to HTML
-            html_text = self._parse_ansi_colors(str(text))
-            self.append_html_signal.emit(html_text)
-
-    def _parse_ansi_colors(self, text):
-        """Convert ANSI color codes to HTML"""
-        import re
-        
-        # Reset color
-        text = text.replace('\033[0m', '</span>')
-        text = text.replace('\033[39m', '</span>')
-        
-        # Foreground colors
-        color_patterns = [
-            (r'\033\[30m', 'black'),
-            (r'\033\[31m', 'red'),
-            (r'\033\[32m', 'green'),
-            (r'\033\[33m', 'yellow'),
-            (r'\033\[34m', 'blue'),
-            (r'\033\[35m', 'magenta'),
-            (r'\033\[36m', 'cyan'),
-            (r'\033\[37m', 'white'),
-            (r'\033\[90m', 'bright_black'),
-            (r'\033\[91m', 'bright_red'),
-            (r'\033\[92m', 'bright_green'),
-            (r'\033\[93m', 'bright_yellow'),
-            (r'\033\[94m', 'bright_blue'),
-            (r'\033\[95m', 'bright_magenta'),
-            (r'\033\[96m', 'bright_cyan'),
-            (r'\033\[97m', 'bright_white'),
-        ]
-        
-        for pattern, color in color_patterns:
-            if color in self.color_map:
-                text = re.sub(pattern, f'<span style="color: {self.color_map[color]}">', text)
-        
-        # Handle bold text
-        text = text.replace('\033[1m', '<span style="font-weight: bold;">')
-        text = text.replace('\033[22m', '</span>')
-        
-        # Handle italic text
-        text = text.replace('\033[3m', '<span style="font-style: italic;">')
-        text = text.replace('\033[23m', '</span>')
-        
-        # Handle underline
-        text = text.replace('\033[4m', '<span style="text-decoration: underline;">')
-        text = text.replace('\033[24m', '</span>')
-        
-        return text
-
-    def _append_text(self, text):
-        """Append plain text"""
-        if text:
-            self.moveCursor(QTextCursor.MoveOperation.End)
-            self.insertPlainText(str(text).rstrip("\n") + "\n")
-            self._auto_scroll()
-
-    def _append_html(self, html_text):
-        """Append HTML formatted text with line limiting"""
-        if html_text:
-            self.moveCursor(QTextCursor.MoveOperation.End)
-            self.insertHtml(html_text.rstrip("\n") + "<br>")
-            self.current_lines += 1
-            
-            # Limit lines to prevent memory issues
-            if self.current_lines > self.max_lines:
-                self._trim_lines()
-            
-            self._auto_scroll()
-
-    def _trim_lines(self):
-        """Remove old lines to stay within limit"""
-        try:
-            # Get the document
-            doc = self.document()
-            if doc.blockCount() > self.max_lines:
-                # Remove blocks from the beginning
-                cursor = QTextCursor(doc)
-                cursor.movePosition(QTextCursor.MoveOperation.Start)
-                cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor, 
-                                  doc.blockCount() - self.max_lines)
-                cursor.removeSelectedText()
-                self.current_lines = doc.blockCount()
-        except Exception:
-            # Fallback: clear all content if trimming fails
-            self.clear()
-            self.current_lines = 0
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont, QIcon, QColor
+
+from modules.terminal import MiniTerminal, TerminalSearchBar
+
+tracer.add_span("imports", _STARTUP_T0, time.perf_counter())
+
+#----------Panels----------
+# Stack index -> (MainWindow attribute, terminal source, module, class)
+PANEL_SPECS = (
+    ("env_vars_panel", "Env Vars", "modules.set_environment_variables", "EnvVarsPanel"),                 # 0
+    ("install_tools_panel", "Install Tools", "modules.install_vstudio_xmake_git", "InstallToolsPanel"),  # 1
+    ("create_project_panel", "Create Project", "modules.create_project", "CreateProjectPanel"),          # 2
+    ("build_project_panel", "Build", "modules.build_project", "BuildProjectPanel"),                      # 3
+    ("update_deps_panel", "Update Deps", "modules.update_project_deps", "UpdateProjectDepsPanel"),       # 4
+    ("detach_git_panel", "Detach Git", "modules.detach_remove_git", "DetachGitPanel"),                   # 5
+    ("backup_dev_root_panel", "Backup", "modules.backup_dev_root", "BackupDevRootPanel"),                # 6
+    ("refresh_project_panel", "Refresh Project", "modules.refresh_project", "RefreshProjectPanel"),      # 7
+    ("settings_panel", "Settings", "modules.settings", "SettingsPanel"),                                 # 8
+    ("explorer_panel", "Explorer", "modules.explorer", "ExplorerPanel"),                                 # 9
+    ("health_panel", "Project Health", "modules.health_panel", "ProjectHealthPanel"),                    # 10
+)
+CREATE_PROJECT_INDEX = 2
+SETTINGS_INDEX = 8
+HEALTH_INDEX = 10
+# Panels with a project picker, kept current by the shared project index
+PROJECT_PICKER_INDEXES = (3, 4, 5, 7)
+# Hidden panels are built after the window is up, most used first
+PREWARM_ORDER = (3, 2, 4, 8, 1, 7, 5, 9, 6, 0, 10)
+PREWARM_DELAY_MS = 1500
 
-    def _auto_scroll(self):
-        """Auto-scroll to bottom with smooth behavior"""
-        sb = self.verticalScrollBar()
-        if sb is not None:
-            sb.setValue(sb.maximum())
-
-    def flush(self):
-        """Flush output buffer"""
-        pass
-
-    def clear(self):
-        """Clear terminal content"""
-        super().clear()
-        self.current_lines = 0
-        self._auto_scroll()
-
-    def set_verbose_mode(self, enabled=True):
-        """Enable/disable verbose output mode"""
-        if enabled:
-            self.max_lines = 2000  # Allow more lines in verbose mode
-        else:
-            self.max_lines = 1000  # Normal mode with fewer lines
-
-from modules.install_vstudio_xmake_git import InstallToolsPanel
-from modules.create_project import CreateProjectPanel
-from modules.quick_launch import QuickLaunchManager
-from modules.theme_manager import ThemeManager
-from modules.progress_widget import ProgressWidget, ActivityIndicator
-from modules.build_project import BuildProjectPanel
-from modules.update_project_deps import UpdateProjectDepsPanel
-from modules.detach_remove_git import DetachGitPanel
-from modules.refresh_project import RefreshProjectPanel
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"ClibDT GUI v{VERSION}")
+        self.first_paint_ms = None
+        self.panel_build_times = {}
         
         # Set application icon
         icon_path = Path(__file__).parent / "ClibDT_logo.ico"
@@ -578,8 +401,10 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(100, 100)
         
         # Initialize theme manager
-        self.theme_manager = ThemeManager()
+        with tracer.span("ThemeManager()"):
+            self.theme_manager = ThemeManager()
         self.theme_manager.theme_changed.connect(self.on_theme_changed)
+        set_theme_scope(self, "MainWindow")
 
         # Initialize progress widget
         self.progress_widget = ProgressWidget(self, "Operation in Progress")
@@ -589,6 +414,7 @@ class MainWindow(QMainWindow):
 
 
         self.menu = QListWidget()
+        set_theme_scope(self.menu, "MainMenu")
         self.menu.setMinimumWidth(160)
         self.menu.setMaximumWidth(250)
         
@@ -637,7 +463,8 @@ class MainWindow(QMainWindow):
             ("🔓 Detach Git", "Detach Git"),
             ("💿 Backup Dev Root", "Backup Dev Root"),
             ("🔄 Refresh Project", "Refresh Project"),
-            ("📂 Explorer", "Explorer")
+            ("📂 Explorer", "Explorer"),
+            ("🩺 Project Health", "Project Health")
         ]
         for display_text, action in additional_actions:
             item = QListWidgetItem(display_text, self.menu)
@@ -650,41 +477,20 @@ class MainWindow(QMainWindow):
         
         self.stack = QStackedWidget()
         self.terminal = MiniTerminal()
+        set_theme_scope(self.terminal, "Terminal")
         
         # Initialize quick launch manager
-        self.quick_launch_manager = QuickLaunchManager(self, self.terminal.append_text)
-        self.stack.addWidget(EnvVarsPanel(status_callback=self.terminal.append_text))         # 0
-        self.stack.addWidget(InstallToolsPanel(status_callback=self.terminal.append_text))    # 1
-        self.create_project_panel = CreateProjectPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.create_project_panel)                                       # 2
-        self.build_project_panel = BuildProjectPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.build_project_panel)                                        # 3
-        self.update_deps_panel = UpdateProjectDepsPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.update_deps_panel)                                          # 4
-        self.detach_git_panel = DetachGitPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.detach_git_panel)                                           # 5
-        from modules.backup_dev_root import BackupDevRootPanel
-        self.backup_dev_root_panel = BackupDevRootPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.backup_dev_root_panel)                                      # 6
-        self.refresh_project_panel = RefreshProjectPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.refresh_project_panel)                                      # 7
-        from modules.settings import SettingsPanel
-        self.settings_panel = SettingsPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.settings_panel)                                             # 8
-        self.explorer_panel = ExplorerPanel(status_callback=self.terminal.append_text)
-        self.stack.addWidget(self.explorer_panel)                                             # 9
-        
-        # Additional tools pages - create functional panels
-        # from modules.backup_dev_root import BackupDevRootPanel # This line is now redundant as it's added above
-        
-        # Detach Git panel
-        # self.stack.addWidget(DetachGitPanel(status_callback=self.terminal.append_text)) # This line is now redundant as it's added above
-        
-        # Backup Dev Root
-        # self.stack.addWidget(BackupDevRootPanel(status_callback=self.terminal.append_text)) # This line is now redundant as it's added above
-        
-        # Refresh Project
-        # self.stack.addWidget(RefreshProjectPanel(status_callback=self.terminal.append_text)) # This line is now redundant as it's added above
+        self.quick_launch_manager = QuickLaunchManager(self, self.terminal.source_callback("Quick Launch"))
+
+        # Panels are registered as factories and built the first time they are shown;
+        # until then the stack holds an empty placeholder at the panel's index
+        self._panels = {}
+        self.projects_watcher = None
+        for _ in PANEL_SPECS:
+            self.stack.addWidget(QWidget())
+        if args.eager_panels:
+            for index in range(len(PANEL_SPECS)):
+                self.ensure_panel(index)
 
         # Create top toolbar
         toolbar_layout = QHBoxLayout()
@@ -779,6 +585,7 @@ class MainWindow(QMainWindow):
         # Terminal toggle button with improved styling
         self.terminal_toggle_btn = QPushButton("Show Terminal")
         self.terminal_toggle_btn.setProperty("btnType", "secondary")
+        set_theme_scope(self.terminal_toggle_btn, "TerminalToggle")
         self.terminal_toggle_btn.setFixedSize(130, 28)  # Slightly larger button
         self.terminal_toggle_btn.clicked.connect(self.toggle_terminal)
         terminal_toggle_row.addWidget(self.terminal_toggle_btn)
@@ -792,9 +599,12 @@ class MainWindow(QMainWindow):
         # Create a container for the terminal with proper spacing
         terminal_container = QWidget()
         terminal_container.setObjectName("terminal_container")
+        set_theme_scope(terminal_container, "TerminalContainer")
         terminal_layout = QVBoxLayout(terminal_container)
         terminal_layout.setContentsMargins(12, 0, 12, 12)  # Top margin 0 to connect with toggle row
         terminal_layout.setSpacing(0)
+        self.terminal_search_bar = TerminalSearchBar(self.terminal)
+        terminal_layout.addWidget(self.terminal_search_bar)
         terminal_layout.addWidget(self.terminal)
         
         main_layout.addWidget(terminal_container)
@@ -822,24 +632,131 @@ class MainWindow(QMainWindow):
         self.menu.setCurrentRow(1)  # First selectable item
         
         # Load quick launch items on startup
-        self.quick_launch_manager.load_pinned_tools()
-        
-        # Connect settings panel with theme manager
-        self.connect_settings_panel()
+        with tracer.span("load_pinned_tools"):
+            self.quick_launch_manager.load_pinned_tools()
         
         # Apply initial theme
-        self.apply_theme()
+        with tracer.span("apply_theme"):
+            self.apply_theme()
 
         # Add version update notification
-        self.setup_version_notification()
-
-        # Connect project_created signal to all panels with project pickers
-        self.create_project_panel.project_created.connect(self.build_project_panel.load_projects)
-        if hasattr(self.build_project_panel, 'load_project_names_for_regenerate'):
-            self.create_project_panel.project_created.connect(self.build_project_panel.load_project_names_for_regenerate)
-        self.create_project_panel.project_created.connect(self.update_deps_panel.load_projects)
-        self.create_project_panel.project_created.connect(self.detach_git_panel.load_projects)
-        self.create_project_panel.project_created.connect(self.refresh_project_panel.load_projects)
+        with tracer.span("setup_version_notification"):
+            self.setup_version_notification()
+
+    #----------Lazy Panels----------
+    def ensure_panel(self, index):
+        """Build the panel at a stack index if needed and return it"""
+        panel = self._panels.get(index)
+        if panel is not None:
+            return panel
+        attr, source, module_name, class_name = PANEL_SPECS[index]
+        start = time.perf_counter()
+        with tracer.span(f"import {module_name}", "panel"):
+            panel_class = getattr(importlib.import_module(module_name), class_name)
+        with tracer.span(f"{class_name}()", "panel", prewarm=self.first_paint_ms is not None):
+            panel = panel_class(status_callback=self.terminal.source_callback(source))
+        placeholder = self.stack.widget(index)
+        # Swapping the placeholder must not change the page the user is looking at
+        current = self.stack.currentIndex()
+        self.stack.blockSignals(True)
+        self.stack.insertWidget(index, panel)
+        self.stack.removeWidget(placeholder)
+        self.stack.setCurrentIndex(current)
+        self.stack.blockSignals(False)
+        placeholder.deleteLater()
+        self._panels[index] = panel
+        setattr(self, attr, panel)
+        self._wire_panel(index, panel)
+        self._apply_panel_theme(panel)
+        self.panel_build_times[class_name] = (time.perf_counter() - start) * 1000.0
+        tracer.add_span(f"build {class_name}", start, time.perf_counter(), "panel")
+        return panel
+
+    def show_panel(self, index):
+        self.ensure_panel(index)
+        self.stack.setCurrentIndex(index)
+
+    def _wire_panel(self, index, panel):
+        """Cross-panel signal wiring, done when the panel is built"""
+        if index == CREATE_PROJECT_INDEX:
+            panel.project_created.connect(self._on_project_created)
+        elif index == SETTINGS_INDEX:
+            self.connect_settings_panel()
+        elif index in PROJECT_PICKER_INDEXES:
+            project_index = get_project_index()
+            if project_index is not None:
+                project_index.subscribe(panel.on_projects_changed)
+                self._start_projects_watcher(project_index)
+
+    def _start_projects_watcher(self, project_index):
+        """Watch projects/ once a panel with a project picker exists, so outside changes show up"""
+        if self.projects_watcher is not None:
+            return
+        from modules.project_watcher import ProjectsWatcher
+        self.projects_watcher = ProjectsWatcher(project_index, parent=self)
+        mode = self.projects_watcher.start()
+        print(f"[DEBUG] Watching {project_index.root} for project changes ({mode})")
+
+    def _on_project_created(self):
+        """Rescan the project index; panels with a project picker are notified if it changed"""
+        project_index = get_project_index()
+        if project_index is not None:
+            project_index.refresh()
+
+    def _prewarm_panels(self):
+        """Build the remaining panels one per idle turn of the event loop"""
+        for index in PREWARM_ORDER:
+            if index not in self._panels:
+                self.ensure_panel(index)
+                QTimer.singleShot(0, self._prewarm_panels)
+                return
+        if tracer.enabled:
+            # Rewrite the trace so it includes the pre-warmed panels
+            self._dump_startup_trace(report=False)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.first_paint_ms is None:
+            # Runs once the event loop has painted the window for the first time
+            QTimer.singleShot(0, self._on_first_paint)
+
+    def _on_first_paint(self):
+        if self.first_paint_ms is not None:
+            return
+        now = time.perf_counter()
+        self.first_paint_ms = (now - _STARTUP_T0) * 1000.0
+        tracer.add_span("start to first paint", _STARTUP_T0, now, "milestone")
+        tracer.instant("first paint")
+        self.terminal.append_text(
+            f"[DEBUG] Window painted {self.first_paint_ms:.0f} ms after start "
+            f"({len(self._panels)} of {len(PANEL_SPECS)} panels built)")
+        if tracer.enabled:
+            self._dump_startup_trace()
+        if args.bench_theme:
+            QTimer.singleShot(0, self._run_theme_benchmark)
+        elif not args.no_prewarm and len(self._panels) < len(PANEL_SPECS):
+            QTimer.singleShot(PREWARM_DELAY_MS, self._prewarm_panels)
+
+    def _run_theme_benchmark(self):
+        from modules.theme_manager import benchmark_theme_switching
+        report = benchmark_theme_switching(self)
+        print(report)
+        for line in report.splitlines():
+            self.terminal.append_text(f"[INFO] {line}")
+        QApplication.instance().quit()
+
+    def _dump_startup_trace(self, report=True):
+        """Write the startup timeline as a Chrome trace next to the config and show the summary"""
+        try:
+            from modules.config_utils import get_config_directory
+            trace_path = get_config_directory() / "startup_trace.json"
+            tracer.write_chrome_trace(trace_path)
+        except Exception as e:
+            self.terminal.append_text(f"[WARN] Could not write startup trace: {e}")
+            return
+        if report:
+            self.terminal.append_text(f"[INFO] Startup trace written to {trace_path} (open in chrome://tracing or Perfetto)")
+            self.terminal.append_text(tracer.summary())
 
 
     def setup_version_notification(self):
@@ -850,6 +767,7 @@ class MainWindow(QMainWindow):
         
         # Create notification widget
         self.version_notification = QLabel()
+        set_theme_scope(self.version_notification, "VersionNotification")
         self.version_notification.setVisible(False)
         self.version_notification.setMinimumHeight(20)
         self.version_notification.setMaximumHeight(25)
@@ -857,6 +775,7 @@ class MainWindow(QMainWindow):
         
         # Create container widget to add to the menu layout
         self.notification_container = QWidget()
+        set_theme_scope(self.notification_container, "NotificationContainer")
         self.notification_container.setFixedHeight(25)
         self.notification_container.setVisible(False)
         
@@ -876,40 +795,33 @@ class MainWindow(QMainWindow):
     def check_for_updates(self):
         """Check for version updates in background thread"""
         import threading
-        import re
+        from modules.version_check import check_version, update_available
         
         def check_update():
             try:
                 # Check if version checking is enabled in settings
-                if hasattr(self, 'settings_panel') and self.settings_panel:
-                    if not self.settings_panel.get_version_check_enabled():
-                        print("[DEBUG] Version checking disabled in settings")
-                        return
-                
-                if not requests:
-                    print("[DEBUG] No requests module available")
+                if getattr(self, 'settings_panel', None):
+                    enabled = self.settings_panel.get_version_check_enabled()
+                else:
+                    # Settings panel not built yet; read the saved choice
+                    from modules.settings import load_version_check_enabled
+                    enabled = load_version_check_enabled()
+                if not enabled:
+                    print("[DEBUG] Version checking disabled in settings")
                     return
                 
-                print(f"[DEBUG] Checking for updates... Local version: {VERSION}")
-                res = requests.get(NEXUS_URL, timeout=5)
-                print(f"[DEBUG] Got response from Nexus")
-                
-                if "<div class=\"stat\">" in res.text:
-                    print("[DEBUG] Found version div in page")
-                    match = re.search(r'<div class="stat">([\d\.]+)</div>', res.text)
-                    if match:
-                        online_version = match.group(1)
-                        print(f"[DEBUG] Online version: {online_version}")
-                        if online_version != VERSION:
-                            print(f"[DEBUG] Version mismatch! Showing notification")
-                            # Show update notification - simple approach like the original
-                            self.show_update_notification(online_version)
-                        else:
-                            print(f"[DEBUG] Versions match - no notification needed")
-                    else:
-                        print("[DEBUG] Could not parse version from div")
-                else:
-                    print("[DEBUG] Version div not found in page")
+                # A recent result is reused without any network traffic; otherwise a
+                # conditional request runs here on the background thread
+                info = check_version(NEXUS_URL)
+                if info.get("error"):
+                    print(f"[DEBUG] Version check error: {info['error']}")
+                online_version = update_available(info)
+                if online_version:
+                    print(f"[DEBUG] Version mismatch! Showing notification")
+                    self.show_update_notification(online_version)
+                elif info.get("online_version"):
+                    source = "cache" if info.get("from_cache") else "Nexus"
+                    print(f"[DEBUG] Versions match ({source}) - no notification needed")
             except Exception as e:
                 print(f"[DEBUG] Version check error: {e}")
                 # Silently fail - don't show errors for version check
@@ -942,25 +854,6 @@ class MainWindow(QMainWindow):
         self.version_notification.setText(f"⬆️ Update Available: v{online_version}")
         print(f"[DEBUG] Notification text set to: {self.version_notification.text()}")
         
-        # Style the notification container and label for menu panel (no background)
-        self.notification_container.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border: none;
-                margin: 2px;
-            }
-        """)
-        
-        self.version_notification.setStyleSheet("""
-            QLabel {
-                color: #27ae60;
-                font-weight: bold;
-                font-size: 10px;
-                padding: 2px 4px;
-                background-color: transparent;
-            }
-        """)
-        
         # Add to menu if not already added
         if self.notification_menu_item is None:
             self.menu.addItem("")
@@ -1048,7 +941,7 @@ class MainWindow(QMainWindow):
     
     def connect_settings_panel(self):
         """Connect settings panel with theme manager for proper integration"""
-        if hasattr(self, 'settings_panel') and self.settings_panel:
+        if getattr(self, 'settings_panel', None):
             # Connect theme change signals from settings panel to theme manager
             self.settings_panel.theme_changed.connect(self.theme_manager.set_theme)
     
@@ -1147,372 +1040,26 @@ class MainWindow(QMainWindow):
 
 
     def apply_theme(self):
-        theme = self.theme_manager.get_theme()
+        # The window, menu, terminal and every panel take their rules from one application
+        # stylesheet (see APPLICATION_SCOPES), so a theme change is a single re-polish pass
+        self.theme_manager.apply_application_theme()
         
-        # Apply theme to main window and global styles - LESS AGGRESSIVE
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {theme['window_bg']};
-            }}
-            QWidget {{
-                background-color: {theme['window_bg']};
-                color: {theme['text_primary']};
-            }}
-            /* Global fallback styles - only apply if no specific styling exists */
-            QLabel:not([objectName*="title"]):not([objectName*="header"]) {{
-                background-color: transparent;
-                color: {theme['text_primary']};
-                font-size: 11px;
-                font-weight: normal;
-            }}
-            QPushButton:not([btnType]) {{
-                background-color: {theme['button_bg']};
-                color: {theme['text_light']};
-                border: 1px solid {theme['button_bg']};
-                border-radius: 4px;
-                padding: 5px 10px;
-                font-size: 11px;
-                font-weight: normal;
-            }}
-            QPushButton:not([btnType]):hover {{
-                background-color: {theme['button_hover']};
-                border-color: {theme['button_hover']};
-            }}
-            QPushButton:not([btnType]):pressed {{
-                background-color: {theme['button_pressed']};
-                border-color: {theme['button_pressed']};
-            }}
-            QLineEdit:not([objectName*="custom"]) {{
-                background-color: {theme['input_bg']};
-                color: {theme['text_primary']};
-                border: 2px solid {theme['input_border']};
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 11px;
-                font-weight: normal;
-            }}
-            QLineEdit:not([objectName*="custom"]):focus {{
-                border-color: {theme['input_focus']};
-            }}
-            QTextEdit {{
-                background-color: {theme['input_bg']};
-                color: {theme['text_primary']};
-                border: 2px solid {theme['input_border']};
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 11px;
-            }}
-            QTextEdit:focus {{
-                border-color: {theme['input_focus']};
-            }}
-            QPlainTextEdit {{
-                background-color: {theme['input_bg']};
-                color: {theme['text_primary']};
-                border: 2px solid {theme['input_border']};
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 11px;
-            }}
-            QPlainTextEdit:focus {{
-                border-color: {theme['input_focus']};
-            }}
-        """)
-        
-        # Apply theme to menu
-        self.menu.setStyleSheet(f"""
-            QListWidget {{
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-                padding: 6px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-                color: {theme['text_primary']};
-                outline: none;
-            }}
-            QListWidget::item {{
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 10px;
-                margin: 1px 0px;
-                font-weight: normal;
-            }}
-            QListWidget::item:hover {{
-                background-color: {theme['bg_secondary']};
-            }}
-            QListWidget::item:selected {{
-                background-color: {theme['menu_item_selected']};
-                color: {theme['text_light']};
-                font-weight: bold;
-            }}
-            QListWidget::item:selected:active {{
-                background-color: {theme['button_pressed']};
-                color: {theme['text_light']};
-            }}
-            QScrollBar:vertical {{
-                background-color: {theme['bg_secondary']};
-                width: 6px;
-                border-radius: 3px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {theme['text_secondary']};
-                border-radius: 3px;
-                min-height: 16px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {theme['text_primary']};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
-        
-
-        
-        # Apply theme to terminal container and terminal
-        self.terminal_container.setStyleSheet(f"""
-            QWidget#terminal_container {{
-                background-color: {theme['bg_primary']};
-                border-top: 1px solid {theme['separator']};
-                border-radius: 0px;
-            }}
-        """)
-        
-        self.terminal.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {theme['terminal_bg']} !important;
-                color: {theme['terminal_text']} !important;
-                border: 1px solid {theme['input_border']};
-                border-radius: 6px;
-                padding: 10px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 10px;
-                selection-background-color: {theme['menu_item_selected']};
-                line-height: 1.2;
-            }}
-            QTextEdit QScrollBar:vertical {{
-                background-color: {theme['scrollbar_bg']};
-                width: 8px;
-                border-radius: 4px;
-            }}
-            QTextEdit QScrollBar::handle:vertical {{
-                background-color: {theme['scrollbar_handle']};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QTextEdit QScrollBar::handle:vertical:hover {{
-                background-color: {theme['scrollbar_handle_hover']};
-            }}
-            QTextEdit QScrollBar::add-line:vertical, QTextEdit QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-        """)
-        
-        # Apply theme to terminal toggle button
-        self.terminal_toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme['bg_secondary']};
-                color: {theme['text_primary']};
-                border: 1px solid {theme['input_border']};
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 11px;
-                font-weight: normal;
-            }}
-            QPushButton:hover {{
-                background-color: {theme['input_border']};
-                border-color: {theme['text_primary']};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme['button_pressed']};
-                border-color: {theme['button_pressed']};
-            }}
-        """)
-        
-        # Apply theme to dropdown (Windows XP style)
-        dropdown_style = f"""
-            QComboBox {{
-                background-color: {theme['input_bg']};
-                color: {theme['text_primary']};
-                border: 2px solid {theme['input_border']};
-                border-radius: 3px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-                min-width: 120px;
-            }}
-            QComboBox:hover {{
-                border-color: {theme['button_hover']};
-            }}
-            QComboBox:focus {{
-                border-color: {theme['input_focus']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid {theme['text_primary']};
-                margin-right: 5px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {theme['input_bg']};
-                color: {theme['text_primary']};
-                border: 2px solid {theme['input_border']};
-                border-radius: 3px;
-                selection-background-color: {theme['menu_item_selected']};
-                selection-color: {theme['text_light']};
-            }}
-        """
-        
-        # Apply theme to CreateProjectPanel if it exists
-        try:
-            create_project_panel = self.stack.widget(2)  # CreateProjectPanel is at index 2
-            if create_project_panel and hasattr(create_project_panel, 'set_theme_manager'):
-                # Use the set_theme_manager method to properly connect the theme manager
-                set_theme_manager_method = getattr(create_project_panel, 'set_theme_manager', None)
-                if set_theme_manager_method:
-                    set_theme_manager_method(self.theme_manager)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to EnvVarsPanel if it exists
-        try:
-            env_vars_panel = self.stack.widget(0)  # EnvVarsPanel is at index 0
-            if env_vars_panel and hasattr(env_vars_panel, 'apply_theme'):
-                # Use getattr to avoid type checking issues
-                apply_theme_method = getattr(env_vars_panel, 'apply_theme', None)
-                if apply_theme_method:
-                    apply_theme_method(theme)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to InstallToolsPanel if it exists
-        try:
-            install_tools_panel = self.stack.widget(1)  # InstallToolsPanel is at index 1
-            if install_tools_panel and hasattr(install_tools_panel, 'apply_theme'):
-                # Use getattr to avoid type checking issues
-                apply_theme_method = getattr(install_tools_panel, 'apply_theme', None)
-                if apply_theme_method:
-                    apply_theme_method(theme)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to BuildProjectPanel if it exists
-        try:
-            build_project_panel = self.stack.widget(3)  # BuildProjectPanel is at index 3
-            if build_project_panel and hasattr(build_project_panel, 'apply_theme'):
-                # Use getattr to avoid type checking issues
-                apply_theme_method = getattr(build_project_panel, 'apply_theme', None)
-                if apply_theme_method:
-                    apply_theme_method(theme)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to SettingsPanel if it exists
-        try:
-            settings_panel = self.stack.widget(8)  # SettingsPanel is at index 8
-            if settings_panel and hasattr(settings_panel, 'apply_theme'):
-                # Use getattr to avoid type checking issues
-                apply_theme_method = getattr(settings_panel, 'apply_theme', None)
-                if apply_theme_method:
-                    apply_theme_method(theme)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to UpdateProjectDepsPanel if it exists
-        try:
-            update_deps_panel = self.stack.widget(4)  # UpdateProjectDepsPanel is at index 4
-            if update_deps_panel and hasattr(update_deps_panel, 'apply_theme'):
-                # Use getattr to avoid type checking issues
-                apply_theme_method = getattr(update_deps_panel, 'apply_theme', None)
-                if apply_theme_method:
-                    apply_theme_method(theme)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to BackupDevRootPanel if it exists
-        try:
-            backup_dev_root_panel = self.stack.widget(6)  # BackupDevRootPanel is at index 6
-            if backup_dev_root_panel and hasattr(backup_dev_root_panel, 'set_theme_manager'):
-                # Use the set_theme_manager method to properly connect the theme manager
-                set_theme_manager_method = getattr(backup_dev_root_panel, 'set_theme_manager', None)
-                if set_theme_manager_method:
-                    set_theme_manager_method(self.theme_manager)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to DetachGitPanel if it exists
-        try:
-            detach_git_panel = self.stack.widget(5)  # DetachGitPanel is at index 5
-            if detach_git_panel and hasattr(detach_git_panel, 'set_theme_manager'):
-                # Use the set_theme_manager method to properly connect the theme manager
-                set_theme_manager_method = getattr(detach_git_panel, 'set_theme_manager', None)
-                if set_theme_manager_method:
-                    set_theme_manager_method(self.theme_manager)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to RefreshProjectPanel if it exists
-        try:
-            refresh_project_panel = self.stack.widget(7)  # RefreshProjectPanel is at index 7
-            if refresh_project_panel and hasattr(refresh_project_panel, 'set_theme_manager'):
-                # Use the set_theme_manager method to properly connect the theme manager
-                set_theme_manager_method = getattr(refresh_project_panel, 'set_theme_manager', None)
-                if set_theme_manager_method:
-                    set_theme_manager_method(self.theme_manager)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Apply theme to ExplorerPanel if it exists
-        try:
-            explorer_panel = self.stack.widget(9)  # ExplorerPanel is at index 9
-            if explorer_panel and hasattr(explorer_panel, 'set_theme_manager'):
-                # Use the set_theme_manager method to properly connect the theme manager
-                set_theme_manager_method = getattr(explorer_panel, 'set_theme_manager', None)
-                if set_theme_manager_method:
-                    set_theme_manager_method(self.theme_manager)
-        except Exception:
-            pass  # Panel might not be loaded yet
-        
-        # Update version notification styling if it exists and is visible
-        if hasattr(self, 'notification_container') and hasattr(self, 'version_notification'):
-            if self.notification_container.isVisible():
-                # Update notification styling to match current theme for menu panel (no background)
-                self.notification_container.setStyleSheet(f"""
-                    QWidget {{
-                        background-color: transparent;
-                        border: none;
-                        margin: 2px;
-                    }}
-                """)
-                
-                self.version_notification.setStyleSheet(f"""
-                    QLabel {{
-                        color: {theme['success_color']};
-                        font-weight: bold;
-                        font-size: 10px;
-                        padding: 2px 4px;
-                        background-color: transparent;
-                    }}
-                """)
-                print(f"[DEBUG] Version notification theme updated - visible: {self.notification_container.isVisible()}")
-            else:
-                print(f"[DEBUG] Version notification exists but not visible")
-        else:
-            print(f"[DEBUG] Version notification widgets not found")
+        # Panels that also use theme colours in code follow the theme manager
+        for panel in self._panels.values():
+            self._apply_panel_theme(panel)
         
         # Update menu divider colors
+        divider_color = QColor(self.theme_manager.get_theme()['text_primary'])
         for i in range(self.menu.count()):
             item = self.menu.item(i)
             if item and item.flags() == Qt.ItemFlag.NoItemFlags:  # Divider items
-                item.setForeground(Qt.GlobalColor.white if self.theme_manager.current_theme == 'dark' else Qt.GlobalColor.black)
-
+                item.setForeground(divider_color)
 
+    def _apply_panel_theme(self, panel):
+        """Hand the theme manager to panels that take it; their stylesheet is already on the application"""
+        set_theme_manager = getattr(panel, "set_theme_manager", None)
+        if set_theme_manager is not None:
+            set_theme_manager(self.theme_manager)
 
     def handle_menu_change(self, row):
         # Menu structure:
@@ -1528,7 +1075,8 @@ class MainWindow(QMainWindow):
         # Row 9: "💿 Backup Dev Root" → Stack index 6
         # Row 10: "🔄 Refresh Project" → Stack index 7
         # Row 11: "📂 Explorer" → Stack index 9
-        # Row 12: "⚙️ Settings" → Stack index 8 (Settings panel)
+        # Row 12: "🩺 Project Health" → Stack index 10
+        # Row 13: "⚙️ Settings" → Stack index 8 (Settings panel)
         
         # Handle dividers
         if row in (0, 3, 7):
@@ -1544,36 +1092,40 @@ class MainWindow(QMainWindow):
         # Check if this is the settings item
         item = self.menu.item(row)
         if item and item.data(Qt.ItemDataRole.UserRole) == "Settings":
-            self.stack.setCurrentIndex(8)  # Settings panel is at index 8
+            self.show_panel(8)  # Settings panel is at index 8
             return
         
         # Check if this is the explorer item
         if item and item.data(Qt.ItemDataRole.UserRole) == "Explorer":
-            self.stack.setCurrentIndex(9)  # Explorer panel is at index 9
+            self.show_panel(9)  # Explorer panel is at index 9
+            return
+        
+        if item and item.data(Qt.ItemDataRole.UserRole) == "Project Health":
+            self.show_panel(HEALTH_INDEX)
             return
         
         # Map menu rows to stack indices
         if row < 3:
             # Setup items (rows 1-2)
-            self.stack.setCurrentIndex(row - 1)
+            self.show_panel(row - 1)
         elif row == 4:
             # Create Project (row 4)
-            self.stack.setCurrentIndex(2)
+            self.show_panel(2)
         elif row == 5:
             # Compile Project (row 5)
-            self.stack.setCurrentIndex(3)
+            self.show_panel(3)
         elif row == 6:
             # Git & Updates (row 6)
-            self.stack.setCurrentIndex(4)
+            self.show_panel(4)
         elif row == 8:
             # Detach Git (row 8)
-            self.stack.setCurrentIndex(5)
+            self.show_panel(5)
         elif row == 9:
             # Backup Dev Root (row 9)
-            self.stack.setCurrentIndex(6)
+            self.show_panel(6)
         elif row == 10:
             # Refresh Project (row 10)
-            self.stack.setCurrentIndex(7)
+            self.show_panel(7)
 
     def pin_tool_as_icon(self, file_path):
         """Add a pinned tool icon button to the toolbar for quick launching."""
@@ -1607,15 +1159,23 @@ class MainWindow(QMainWindow):
 # -------------------- Main Entry Point --------------------
 if __name__ == "__main__":
     import sys
-    app = QApplication(sys.argv)
+    if args.profile_startup:
+        from modules.import_profile import print_startup_profile
+        print_startup_profile()
+    with tracer.span("QApplication()"):
+        app = QApplication(sys.argv)
+    # Write any preferences still waiting in the config store before the window goes away
+    app.aboutToQuit.connect(config_store.flush)
     
     # Set global application icon
     icon_path = Path(__file__).parent / "ClibDT_logo.ico"
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
     
-    window = MainWindow()
-    window.show()
+    with tracer.span("MainWindow()"):
+        window = MainWindow()
+    with tracer.span("show()"):
+        window.show()
     sys.exit(app.exec())
 
 # The following CLI menu code is now bypassed by the GUI above.
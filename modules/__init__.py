@@ -1,8 +1,19 @@
-from . import install_vstudio_xmake_git
-from . import set_environment_variables
-from . import create_project
-from . import update_project_deps
-from . import build_project
-from . import regenerate_xmakelua
-from . import git_stage_and_commit
-from . import detach_remove_git
+import importlib
+
+# Submodules load on first attribute access so importing one module does not pull in the rest
+_LAZY_SUBMODULES = (
+    "install_vstudio_xmake_git",
+    "set_environment_variables",
+    "create_project",
+    "update_project_deps",
+    "build_project",
+    "regenerate_xmakelua",
+    "git_stage_and_commit",
+    "detach_remove_git",
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
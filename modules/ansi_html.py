@@ -0,0 +1,256 @@
+import re
+import html
+
+#----------ANSI to HTML----------
+# Any CSI sequence; only SGR ("m") changes the style, the rest (cursor moves, erase line) is dropped
+CSI_RE = re.compile(r"\x1b\[([0-9;:?]*)([@-~])")
+
+DEFAULT_PALETTE = (
+    # 30-37 / 40-47
+    "#000000", "#e74c3c", "#27ae60", "#f39c12", "#3498db", "#9b59b6", "#1abc9c", "#ffffff",
+    # 90-97 / 100-107
+    "#7f8c8d", "#e74c3c", "#2ecc71", "#f1c40f", "#3498db", "#9b59b6", "#1abc9c", "#ecf0f1",
+)
+
+COLOR_NAMES = (
+    "black", "red", "green", "yellow", "blue", "magenta", "cyan", "white",
+    "bright_black", "bright_red", "bright_green", "bright_yellow",
+    "bright_blue", "bright_magenta", "bright_cyan", "bright_white",
+)
+
+_RESET_STATE = (None, None, False, False, False, False)  # fg, bg, bold, dim, italic, underline
+
+# Truecolor output (rich gradients, progress bars) produces endless distinct styles, so the
+# per-converter caches are dropped and rebuilt once they hold this many entries
+CACHE_LIMIT = 4096
+
+
+def palette_from_color_map(color_map):
+    """Build a 16 entry palette from a {'red': '#...', 'bright_red': ...} map"""
+    return tuple(color_map.get(name, DEFAULT_PALETTE[i]) for i, name in enumerate(COLOR_NAMES))
+
+
+def _escape(segment):
+    # Stray ESC characters that did not start a CSI sequence are dropped
+    if "\x1b" in segment:
+        segment = segment.replace("\x1b", "")
+    # Keep runs of spaces (indented report lines) from collapsing in the HTML view
+    return html.escape(segment, quote=False).replace("  ", " &nbsp;")
+
+
+def _xterm_256(index, palette):
+    if index < 16:
+        return palette[index]
+    if index < 232:
+        index -= 16
+        levels = (0, 95, 135, 175, 215, 255)
+        r, g, b = levels[index // 36], levels[(index // 6) % 6], levels[index % 6]
+        return f"#{r:02x}{g:02x}{b:02x}"
+    gray = 8 + (index - 232) * 10
+    return f"#{gray:02x}{gray:02x}{gray:02x}"
+
+
+class AnsiHtmlConverter:
+    """
+    Single-pass ANSI SGR to HTML converter. Text is HTML-escaped, styles never nest
+    (each style run is one <span> closed before the next opens) so the output is always
+    balanced, and the opening tag for each style combination is built once and cached
+    (as is the effect of each escape sequence on each style).
+    Handles combined codes (ESC[1;31m), 16/256/true colors, bold, dim, italic, underline and resets.
+    """
+
+    def __init__(self, palette=None):
+        self.palette = tuple(palette or DEFAULT_PALETTE)
+        self._tag_cache = {}
+        self._sgr_cache = {}
+
+    def _open_tag(self, state):
+        tag = self._tag_cache.get(state)
+        if tag is None:
+            fg, bg, bold, dim, italic, underline = state
+            styles = []
+            if fg:
+                styles.append(f"color: {fg}")
+            if bg:
+                styles.append(f"background-color: {bg}")
+            if bold:
+                styles.append("font-weight: bold")
+            if dim:
+                styles.append("opacity: 0.7")
+            if italic:
+                styles.append("font-style: italic")
+            if underline:
+                styles.append("text-decoration: underline")
+            tag = f'<span style="{"; ".join(styles)};">'
+            if len(self._tag_cache) >= CACHE_LIMIT:
+                self._tag_cache.clear()
+            self._tag_cache[state] = tag
+        return tag
+
+    def _extended_color(self, codes, i):
+        """Parse 38/48 arguments at codes[i]; returns (color or None, next index)"""
+        if i < len(codes) and codes[i] == 5 and i + 1 < len(codes):
+            return _xterm_256(max(0, min(255, codes[i + 1])), self.palette), i + 2
+        if i < len(codes) and codes[i] == 2 and i + 3 < len(codes):
+            r, g, b = (max(0, min(255, c)) for c in codes[i + 1:i + 4])
+            return f"#{r:02x}{g:02x}{b:02x}", i + 4
+        return None, len(codes)
+
+    def _apply_sgr(self, params, state):
+        fg, bg, bold, dim, italic, underline = state
+        codes = [int(p) if p.isdigit() else 0 for p in re.split(r"[;:]", params)] if params else [0]
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            i += 1
+            if code == 0:
+                fg, bg, bold, dim, italic, underline = _RESET_STATE
+            elif code == 1:
+                bold = True
+            elif code == 2:
+                dim = True
+            elif code == 3:
+                italic = True
+            elif code == 4:
+                underline = True
+            elif code == 22:
+                bold = dim = False
+            elif code == 23:
+                italic = False
+            elif code == 24:
+                underline = False
+            elif 30 <= code <= 37:
+                fg = self.palette[code - 30]
+            elif 90 <= code <= 97:
+                fg = self.palette[code - 90 + 8]
+            elif code == 39:
+                fg = None
+            elif 40 <= code <= 47:
+                bg = self.palette[code - 40]
+            elif 100 <= code <= 107:
+                bg = self.palette[code - 100 + 8]
+            elif code == 49:
+                bg = None
+            elif code == 38:
+                color, i = self._extended_color(codes, i)
+                fg = color or fg
+            elif code == 48:
+                color, i = self._extended_color(codes, i)
+                bg = color or bg
+        return fg, bg, bold, dim, italic, underline
+
+    def _transition(self, params, state):
+        """Style after applying one SGR sequence, cached per (params, style)"""
+        key = (params, state)
+        new_state = self._sgr_cache.get(key)
+        if new_state is None:
+            if len(self._sgr_cache) >= CACHE_LIMIT:
+                self._sgr_cache.clear()
+            new_state = self._sgr_cache[key] = self._apply_sgr(params, state)
+        return new_state
+
+    def convert(self, text):
+        """Convert one message; styles start from the default and all spans are closed at the end"""
+        if "\x1b" not in text:
+            return _escape(text)
+
+        out = []
+        state = _RESET_STATE
+        span_open = False
+        pos = 0
+        for match in CSI_RE.finditer(text):
+            if match.start() > pos:
+                # Spans open only in front of text, so back-to-back codes never leave empty ones
+                if not span_open and state != _RESET_STATE:
+                    out.append(self._open_tag(state))
+                    span_open = True
+                out.append(_escape(text[pos:match.start()]))
+            pos = match.end()
+            if match.group(2) != "m":
+                continue
+            new_state = self._transition(match.group(1), state)
+            if new_state == state:
+                continue
+            if span_open:
+                out.append("</span>")
+                span_open = False
+            state = new_state
+        if pos < len(text):
+            if not span_open and state != _RESET_STATE:
+                out.append(self._open_tag(state))
+                span_open = True
+            out.append(_escape(text[pos:]))
+        if span_open:
+            out.append("</span>")
+        return "".join(out)
+
+    def segments(self, text):
+        """Split a message into [(plain text, style)] runs for painting; style is
+        (fg, bg, bold, dim, italic, underline) with None colors meaning the default"""
+        if "\x1b" not in text:
+            return [(text, _RESET_STATE)] if text else []
+        runs = []
+        state = _RESET_STATE
+        pos = 0
+        for match in CSI_RE.finditer(text):
+            if match.start() > pos:
+                runs.append((text[pos:match.start()].replace("\x1b", ""), state))
+            pos = match.end()
+            if match.group(2) == "m":
+                state = self._transition(match.group(1), state)
+        if pos < len(text):
+            runs.append((text[pos:].replace("\x1b", ""), state))
+        return runs
+
+
+_default_converter = None
+
+
+def ansi_to_html(text):
+    """Convert with the default palette"""
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = AnsiHtmlConverter()
+    return _default_converter.convert(text)
+
+
+#----------Benchmark----------
+def _legacy_convert(text, color_map):
+    """The per-message re.sub/str.replace chain MiniTerminal used before, for comparison"""
+    text = text.replace('\033[0m', '</span>').replace('\033[39m', '</span>')
+    for i, name in enumerate(COLOR_NAMES):
+        code = 30 + i if i < 8 else 90 + i - 8
+        text = re.sub(rf'\033\[{code}m', f'<span style="color: {color_map[name]}">', text)
+    text = text.replace('\033[1m', '<span style="font-weight: bold;">').replace('\033[22m', '</span>')
+    text = text.replace('\033[3m', '<span style="font-style: italic;">').replace('\033[23m', '</span>')
+    text = text.replace('\033[4m', '<span style="text-decoration: underline;">').replace('\033[24m', '</span>')
+    return text
+
+
+def benchmark(iterations=50000):
+    """Messages/sec for the converter and the old chain on colorama and rich style output"""
+    import time
+    samples = [
+        "\x1b[36m[INFO] Changed to project directory: C:\\dev\\projects\\MyPlugin\x1b[0m",       # colorama Fore.CYAN
+        "\x1b[92m[OK] Build completed successfully!\x1b[0m",                                       # Fore.LIGHTGREEN_EX
+        "\x1b[1m\x1b[31m[ERROR] xmake build failed: <missing> & broken\x1b[0m",                    # Style.BRIGHT + Fore.RED
+        "\x1b[1;33m[WARN]\x1b[0m vector<int> is \x1b[3mnot\x1b[23m allowed",                        # rich combined codes
+        "\x1b[38;2;0;135;255m━━━━━━━━━━\x1b[0m \x1b[38;5;208m42%\x1b[0m \x1b[2K",                  # rich truecolor/256 + erase
+        "[ 42% ]: compiling.release src/Hooks.cpp",                                                 # plain xmake line
+    ]
+    color_map = dict(zip(COLOR_NAMES, DEFAULT_PALETTE))
+    converter = AnsiHtmlConverter()
+    results = {}
+    for name, func in (("single-pass", converter.convert), ("legacy", lambda t: _legacy_convert(t, color_map))):
+        start = time.perf_counter()
+        for _ in range(iterations // len(samples)):
+            for sample in samples:
+                func(sample)
+        elapsed = time.perf_counter() - start
+        results[name] = (iterations // len(samples)) * len(samples) / elapsed
+    return results
+
+
+if __name__ == "__main__":
+    for name, rate in benchmark().items():
+        print(f"{name:>12}: {rate:,.0f} messages/s")
@@ -23,10 +23,8 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 
 init(autoreset=True)
 
-# Use config directory from dev root or fallback
-from modules.config_utils import get_config_directory
-CONFIG_DIR = get_config_directory()
-LAST_BACKUP_PATH_FILE = CONFIG_DIR / "clibdt_backup_config.json"
+from modules.config_manager import get_config_namespace
+from modules.theme_manager import set_theme_scope
 
 def cprint(msg, color=Fore.RESET):
     print(color + msg + Style.RESET_ALL)
@@ -52,16 +50,12 @@ def collect_files_to_copy(dev_root: Path, backup_root: Path, smart: bool) -> lis
     return tasks
 
 def save_last_backup_info(backup_path: str):
-    """Saves the last backup path and timestamp to a JSON file."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)  # Ensure config directory exists
-    import json
-    config_data = {
-        "last_backup_path": backup_path,
-        "last_backup_timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
-        "clibdt_version": VERSION
-    }
-    with open(LAST_BACKUP_PATH_FILE, "w", encoding="utf-8") as f:
-        json.dump(config_data, f, indent=2)
+    """Records the last backup path and timestamp in the backup config namespace."""
+    get_config_namespace("backup").update(
+        last_backup_path=backup_path,
+        last_backup_timestamp=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        clibdt_version=VERSION
+    )
 
 class BackupThread(QThread):
     progress_signal = pyqtSignal(str)
@@ -160,6 +154,7 @@ class BackupThread(QThread):
 class BackupDevRootPanel(QWidget):
     def __init__(self, parent=None, status_callback=None):
         super().__init__(parent)
+        set_theme_scope(self, "BackupDevRootPanel")
         self.status_callback = status_callback
         self.backup_thread = None
         self.theme_manager = None
@@ -281,312 +276,10 @@ class BackupDevRootPanel(QWidget):
         layout.addStretch()
         
         self.setLayout(layout)
-        
-        # Apply initial theme
-        self.apply_theme()
     
     def set_theme_manager(self, theme_manager):
         """Set the theme manager for this panel"""
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-    
-    def apply_theme(self):
-        """Apply current theme to the panel"""
-        if self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            # Fallback theme
-            theme = {
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'bg_secondary': '#252525',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'text_light': '#ffffff',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'separator': '#404040',
-                'success_color': '#27ae60',
-                'warning_color': '#f39c12',
-                'error_color': '#e74c3c',
-                'info_color': '#3498db'
-            }
-        
-        self.setStyleSheet(f"""
-            /* Ultra-compact styling that overrides ALL global styling */
-            BackupDevRootPanel,
-            BackupDevRootPanel * {{
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                background-color: {theme['window_bg']} !important;
-                color: {theme['text_primary']} !important;
-                font-family: 'Segoe UI', Arial, sans-serif !important;
-            }}
-            
-            /* Typography Hierarchy - Only headers are bold */
-            BackupDevRootPanel QLabel {{
-                background-color: transparent !important;
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                font-weight: normal !important;
-            }}
-            
-            /* Header elements - ONLY these are bold */
-            BackupDevRootPanel QLabel#main_title {{
-                font-size: 18px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 2px !important;
-                background: transparent !important;
-            }}
-            
-            BackupDevRootPanel QLabel#section_desc {{
-                color: {theme['text_secondary']} !important;
-                font-size: 10px !important;
-                margin-bottom: 8px !important;
-                font-weight: normal !important;
-            }}
-            
-            BackupDevRootPanel QLabel#section_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-top: 8px !important;
-                margin-bottom: 4px !important;
-                background: transparent !important;
-            }}
-            
-            /* Divider lines */
-            BackupDevRootPanel QLabel#title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            BackupDevRootPanel QLabel#section_title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            /* Input field styling - responsive resizing */
-            BackupDevRootPanel QLineEdit,
-            BackupDevRootPanel QLineEdit:hover,
-            BackupDevRootPanel QLineEdit:focus {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-                min-height: 24px !important;
-                max-height: 32px !important;
-            }}
-            
-            BackupDevRootPanel QLineEdit:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            BackupDevRootPanel QLineEdit:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            /* CheckBox styling - completely transparent background */
-            BackupDevRootPanel QCheckBox {{
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                spacing: 8px !important;
-                padding: 2px 0px !important;
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-            }}
-            
-            /* Override any inherited backgrounds from parent widgets */
-            BackupDevRootPanel QCheckBox,
-            BackupDevRootPanel QCheckBox:hover,
-            BackupDevRootPanel QCheckBox:pressed,
-            BackupDevRootPanel QCheckBox:checked {{
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-            }}
-            
-            BackupDevRootPanel QCheckBox::indicator {{
-                width: 16px !important;
-                height: 16px !important;
-                border: 2px solid {theme['input_border']} !important;
-                background-color: {theme['input_bg']} !important;
-                border-radius: 3px !important;
-            }}
-            
-            BackupDevRootPanel QCheckBox::indicator:checked {{
-                background-color: {theme['button_bg']} !important;
-                border-color: {theme['button_bg']} !important;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
-            }}
-            
-            BackupDevRootPanel QCheckBox:hover::indicator:unchecked {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            /* Ensure checkbox text area is completely transparent */
-            BackupDevRootPanel QCheckBox::text {{
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            /* Nuclear option: Override ALL possible checkbox backgrounds */
-            BackupDevRootPanel QCheckBox * {{
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-            }}
-            
-            /* Progress Bar styling */
-            BackupDevRootPanel QProgressBar {{
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                text-align: center !important;
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                font-weight: normal !important;
-                min-height: 24px !important;
-                max-height: 32px !important;
-            }}
-            
-            BackupDevRootPanel QProgressBar::chunk {{
-                background-color: {theme['success_color']} !important;
-                border-radius: 2px !important;
-            }}
-            
-            /* Button styling - unified gradient system with responsive sizing */
-            BackupDevRootPanel QPushButton,
-            BackupDevRootPanel QPushButton:hover,
-            BackupDevRootPanel QPushButton:pressed,
-            BackupDevRootPanel QPushButton:disabled {{
-                border: none !important;
-                padding: 8px 16px !important;
-                border-radius: 6px !important;
-                font-size: 11px !important;
-                font-weight: bold !important;
-                min-height: 16px !important;
-                margin: 2px 4px !important;
-            }}
-            
-            BackupDevRootPanel QPushButton:disabled {{
-                background-color: {theme['text_secondary']} !important;
-                color: {theme['text_secondary']} !important;
-                opacity: 0.6 !important;
-            }}
-            
-            /* Success action buttons - Green theme with bright hover effects */
-            BackupDevRootPanel QPushButton[btnType="success"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['success_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            BackupDevRootPanel QPushButton[btnType="success"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
-                border: 2px solid #a9dfbf !important;
-                color: #ffffff !important;
-                padding: 7px 13px !important;
-            }}
-            
-            BackupDevRootPanel QPushButton[btnType="success"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954) !important;
-                border: 2px solid #1e8449 !important;
-                color: #ffffff !important;
-                padding: 8px 14px !important;
-            }}
-            
-            /* Folder buttons - Blue theme with bright hover effects */
-            BackupDevRootPanel QPushButton[btnType="folder"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['info_color']}, stop:1 {theme['info_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['info_color']} !important;
-                padding: 6px 8px !important;
-            }}
-            
-            BackupDevRootPanel QPushButton[btnType="folder"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #85c1e9, stop:0.5 #5dade2, stop:1 #3498db) !important;
-                border: 2px solid #a9cce3 !important;
-                color: #ffffff !important;
-                padding: 7px 9px !important;
-            }}
-            
-            BackupDevRootPanel QPushButton[btnType="folder"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2980b9, stop:1 #21618c) !important;
-                border: 2px solid #1b4f72 !important;
-                color: #ffffff !important;
-                padding: 8px 10px !important;
-            }}
-            
-            /* Uninstall/Danger buttons - Red theme with bright hover effects */
-            BackupDevRootPanel QPushButton[btnType="uninstall"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['error_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            BackupDevRootPanel QPushButton[btnType="uninstall"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b) !important;
-                border: 2px solid #f1948a !important;
-                color: #ffffff !important;
-            }}
-            
-            BackupDevRootPanel QPushButton[btnType="uninstall"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
-                border: 1px solid {theme['error_color']} !important;
-                opacity: 0.8 !important;
-            }}
-        """)
-    
-    def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
-        super().showEvent(event)
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
     
     def browse_backup_path(self):
         """Browse for backup destination folder"""
@@ -660,15 +353,7 @@ def run_backup_dev_root():
     cprint("=== SKSE Dev Backup Utility ===", Fore.CYAN)
     cprint(f"[INFO] Source folder: {dev_root}", Fore.CYAN)
 
-    last_path = None
-    if LAST_BACKUP_PATH_FILE.exists():
-        try:
-            import json
-            with open(LAST_BACKUP_PATH_FILE, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
-                last_path = config_data.get("last_backup_path")
-        except Exception:
-            pass
+    last_path = get_config_namespace("backup").get("last_backup_path")
 
     dest_base = prompt_input(f"Enter destination base folder [{last_path or 'required'}]:", last_path)
     if dest_base == "M":
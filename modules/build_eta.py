@@ -0,0 +1,232 @@
+import os
+import re
+import json
+import time
+import threading
+from pathlib import Path
+
+from modules.config_utils import get_config_directory
+
+#----------ETA Settings----------
+HISTORY_DIR_NAME = "build_history"
+# Weight of the newest measurement when blending with the stored duration
+DURATION_EMA_ALPHA = 0.5
+# How many prediction errors are kept per project/mode
+ERROR_HISTORY_SIZE = 20
+# Predictions are scored when the build is this far along (fraction of the real duration)
+ERROR_CHECKPOINTS = (0.25, 0.5, 0.75)
+
+PROGRESS_RE = re.compile(r"\[\s*(\d+)%\]:\s*(.+)")
+COMPILE_RE = re.compile(r"(?:cache\s+)?compiling\.\w+\s+(.+)$")
+LINK_RE = re.compile(r"(?:linking|archiving)\.\w+\s+(.+)$")
+
+_history_lock = threading.Lock()
+
+
+#----------History Storage----------
+def _history_path(project_path):
+    return get_config_directory() / HISTORY_DIR_NAME / f"{Path(project_path).name}.json"
+
+
+def load_build_history(project_path):
+    """Per-mode history for a project: {mode: {"tu": {path: seconds}, "link": s, "errors": [...]}}"""
+    with _history_lock:
+        try:
+            with open(_history_path(project_path), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def save_build_history(project_path, history):
+    path = _history_path(project_path)
+    with _history_lock:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(history, f, indent=1)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def load_tu_durations(project_path, build_mode):
+    """Measured compile seconds per translation unit (relative source path) for a mode"""
+    return dict(load_build_history(project_path).get(build_mode, {}).get("tu", {}))
+
+
+def normalize_source_path(path):
+    return path.strip().replace("\\", "/")
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "estimating..."
+    seconds = int(round(max(0, seconds)))
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+#----------Estimator----------
+class BuildEtaEstimator:
+    """
+    Predicts remaining build time from xmake's progress lines.
+
+    xmake prints a TU when its compile starts. With j parallel jobs a slot frees
+    up roughly when the next TU starts, so TU i is taken to run from its start
+    until TU i+j starts (the last j TUs run until linking begins). Those
+    durations are learned per project and mode and used on the next build,
+    together with the live start events and the job count, to estimate what is left.
+
+    Only TUs this build compiles count as pending: expected_tus when the caller knows
+    them (from the changed inputs), otherwise as many as xmake's percentage implies.
+    """
+
+    def __init__(self, project_path, build_mode, jobs=1, expected_tus=None):
+        self.project_path = project_path
+        self.build_mode = build_mode
+        self.jobs = max(1, int(jobs or 1))
+        self.expected_tus = None if expected_tus is None else {normalize_source_path(tu) for tu in expected_tus}
+        history = load_build_history(project_path).get(build_mode, {})
+        self.known_tu = dict(history.get("tu", {}))
+        self.known_link = history.get("link")
+        self.start_time = time.monotonic()
+        self.starts = []          # (tu, monotonic start)
+        self.started = set()
+        self.link_start = None
+        self.last_percent = 0
+        self.predictions = []     # (elapsed, predicted total)
+
+    def _mean_tu(self):
+        if self.known_tu:
+            return sum(self.known_tu.values()) / len(self.known_tu)
+        return None
+
+    def _pending(self, mean_tu):
+        """Learned seconds of the TUs this build has not started yet"""
+        if self.expected_tus is not None:
+            return [self.known_tu.get(tu, mean_tu) for tu in self.expected_tus if tu not in self.started]
+        pending = [d for tu, d in self.known_tu.items() if tu not in self.started]
+        if self.starts and self.last_percent > 0:
+            # xmake's percentage counts this build's jobs only, so it bounds how many TUs are left
+            left = round(len(self.starts) * (100 - self.last_percent) / self.last_percent)
+            average = sum(pending) / len(pending) if pending else mean_tu
+            return [average] * left
+        return pending
+
+    def feed(self, line, now=None):
+        """Consume one output line; returns (percent, eta_seconds or None) or None if not a progress line"""
+        match = PROGRESS_RE.match(line.strip())
+        if not match:
+            return None
+        now = time.monotonic() if now is None else now
+        self.last_percent = max(self.last_percent, int(match.group(1)))
+        desc = match.group(2)
+
+        compile_match = COMPILE_RE.search(desc)
+        if compile_match:
+            tu = normalize_source_path(compile_match.group(1))
+            if tu not in self.started:
+                self.started.add(tu)
+                self.starts.append((tu, now))
+        elif LINK_RE.search(desc) and self.link_start is None:
+            self.link_start = now
+
+        return self.estimate(now)
+
+    def estimate(self, now=None):
+        """Current (percent, eta_seconds or None)"""
+        now = time.monotonic() if now is None else now
+        elapsed = now - self.start_time
+        mean_tu = self._mean_tu()
+
+        if mean_tu is None:
+            # Nothing learned yet: extrapolate xmake's own percentage
+            if self.last_percent <= 0:
+                return self.last_percent, None
+            eta = elapsed * (100 - self.last_percent) / self.last_percent
+            self._record_prediction(elapsed, elapsed + eta)
+            return self.last_percent, eta
+
+        link_time = self.known_link if self.known_link is not None else mean_tu
+        if self.link_start is not None:
+            remaining = max(0.0, link_time - (now - self.link_start))
+        else:
+            # Work not started yet, spread over the job slots, plus what in-flight TUs still need
+            pending = self._pending(mean_tu)
+            in_flight = self.starts[-self.jobs:]
+            in_flight_left = [
+                max(0.0, self.known_tu.get(tu, mean_tu) - (now - started))
+                for tu, started in in_flight
+            ]
+            remaining = (sum(pending) + sum(in_flight_left)) / self.jobs + link_time
+            if not self.starts and not pending:
+                remaining = link_time
+
+        total = elapsed + remaining
+        percent = int(min(99, max(self.last_percent, 100 * elapsed / total))) if total > 0 else self.last_percent
+        self._record_prediction(elapsed, total)
+        return percent, remaining
+
+    def _record_prediction(self, elapsed, predicted_total):
+        self.predictions.append((elapsed, predicted_total))
+
+    #----------Learning----------
+    def measured_tu_durations(self, end_time):
+        """Durations implied by the start events (see class docstring)"""
+        durations = {}
+        link_or_end = self.link_start if self.link_start is not None else end_time
+        for i, (tu, started) in enumerate(self.starts):
+            if i + self.jobs < len(self.starts):
+                finished = self.starts[i + self.jobs][1]
+            else:
+                finished = link_or_end
+            durations[tu] = max(0.0, finished - started)
+        return durations
+
+    def finish(self, success, now=None):
+        """Store learned durations and the prediction error; returns the mean error (%) or None"""
+        now = time.monotonic() if now is None else now
+        actual_total = now - self.start_time
+        history = load_build_history(self.project_path)
+        entry = history.setdefault(self.build_mode, {})
+
+        if success:
+            tu_history = entry.setdefault("tu", {})
+            for tu, measured in self.measured_tu_durations(now).items():
+                old = tu_history.get(tu)
+                tu_history[tu] = round(measured if old is None else
+                                       DURATION_EMA_ALPHA * measured + (1 - DURATION_EMA_ALPHA) * old, 3)
+            if self.link_start is not None:
+                measured_link = now - self.link_start
+                old_link = entry.get("link")
+                entry["link"] = round(measured_link if old_link is None else
+                                      DURATION_EMA_ALPHA * measured_link + (1 - DURATION_EMA_ALPHA) * old_link, 3)
+
+        # Score what was predicted at fixed points of the real timeline
+        errors = entry.setdefault("errors", [])
+        scored = []
+        if success and actual_total > 0 and self.predictions:
+            for checkpoint in ERROR_CHECKPOINTS:
+                at = checkpoint * actual_total
+                candidates = [p for e, p in self.predictions if e <= at]
+                if candidates:
+                    scored.append(abs(candidates[-1] - actual_total) / actual_total * 100.0)
+        if scored:
+            errors.append(round(sum(scored) / len(scored), 1))
+            del errors[:-ERROR_HISTORY_SIZE]
+        entry["last_duration"] = round(actual_total, 2)
+        entry["last_success"] = bool(success)
+        entry["last_finished"] = round(time.time(), 1)
+        save_build_history(self.project_path, history)
+        return errors[-1] if scored else None
+
+
+def get_eta_error_stats(project_path, build_mode):
+    """(latest error %, mean error % over the kept history, samples) or None"""
+    errors = load_build_history(project_path).get(build_mode, {}).get("errors", [])
+    if not errors:
+        return None
+    return errors[-1], sum(errors) / len(errors), len(errors)
@@ -2,13 +2,14 @@
 import subprocess
 import shutil
 import sys
-import json
 from pathlib import Path
 from colorama import init, Fore, Style
-from tqdm import tqdm
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QCheckBox, QGroupBox, QProgressBar, QTextEdit, QMessageBox, QFileDialog, QLineEdit, QFrame, QSizePolicy)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
+from modules.project_index import get_project_index, fill_project_combo, apply_project_changes
+from modules.theme_manager import set_theme_scope
+from modules.config_manager import get_config_namespace
 
 init(autoreset=True)
 
@@ -41,6 +42,14 @@ def pause():
 #----------External Module Imports----------
 from modules.utilities.common import VERSION
 from modules.backup_function_call import backup_project_snapshot
+from modules.build_snapshot import check_build_up_to_date, scan_build_inputs, save_build_snapshot, changed_build_inputs
+from modules.clean_engine import CLEAN_SCOPES, clean_project_scope, wait_for_pending_deletes
+from modules.job_control import choose_job_count, MemoryPeakMonitor, record_tu_peak_bytes
+from modules.deploy import deploy_build
+from modules.build_eta import BuildEtaEstimator, format_eta, get_eta_error_stats
+from modules.compile_db import ensure_compile_db, install_compile_db
+from modules.header_graph import header_impact_report, dirty_tus
+from modules.object_cache import ObjectCache, write_compiler_shim, format_stats
 from modules.msvc_toolchain_check import (
     detect_msvc,
     install_msvc_build_tools_silent,
@@ -304,30 +313,30 @@ def on_rm_error(func, path, exc_info):
         # cprint(f"[ERROR] Failed to delete {path}: {e}", Fore.RED)
         pass
 
-def clean_project(status_callback=None):
-    def status(msg):
-        if status_callback:
-            status_callback(msg)
-        # Don't call cprint to avoid duplication
-        # cprint(msg)
-    
-    for folder in ["build", ".xmake"]:
-        path = Path(folder)
-        if path.exists() and path.is_dir():
-            try:
-                shutil.rmtree(path, onerror=on_rm_error)
-                status(f"[OK] {folder}/ folder deleted.")
-            except Exception as e:
-                status(f"[ERROR] Failed to delete {folder}/: {e}")
+def clean_project(status_callback=None, scope="all", build_mode=None):
+    """Clean the project in the current directory; folders are moved aside and deleted in the background"""
+    return clean_project_scope(Path.cwd(), scope, build_mode, status_callback)
+
+def kill_process_tree(proc):
+    """Kill a process and its children (xmake spawns cl.exe/link.exe workers)"""
+    if proc is None or proc.poll() is not None:
+        return
+    try:
+        if sys.platform.startswith("win"):
+            subprocess.run(["taskkill", "/T", "/F", "/PID", str(proc.pid)], capture_output=True,
+                           creationflags=subprocess.CREATE_NO_WINDOW)
         else:
-            status(f"[INFO] {folder}/ not found. Skipping.")
+            proc.kill()
+    except Exception:
+        pass
 
 #----------Build Thread Class----------
 class BuildThread(QThread):
     progress_signal = pyqtSignal(str)
     finished_signal = pyqtSignal(bool, str)
+    eta_signal = pyqtSignal(int, str)  # percent, remaining time text
     
-    def __init__(self, build_mode, runtime_flags, clean_build, status_callback=None, project_path=None, toolchain_path=None):
+    def __init__(self, build_mode, runtime_flags, clean_build, status_callback=None, project_path=None, toolchain_path=None, force_build=False, clean_scope="all", deploy=False, merge_compile_db=False, object_cache=False):
         super().__init__()
         self.build_mode = build_mode
         self.runtime_flags = runtime_flags
@@ -335,6 +344,21 @@ class BuildThread(QThread):
         self.status_callback = status_callback
         self.project_path = project_path
         self.toolchain_path = toolchain_path
+        self.force_build = force_build
+        self.clean_scope = clean_scope
+        self.deploy = deploy
+        self.merge_compile_db = merge_compile_db
+        self.object_cache = object_cache
+        self._cancelled = False
+        self._proc = None
+    
+    def cancel(self):
+        """Stop the build at the next step and kill a running xmake"""
+        self._cancelled = True
+        kill_process_tree(self._proc)
+    
+    def is_cancelled(self):
+        return self._cancelled
     
     def run(self):
         try:
@@ -367,10 +391,27 @@ class BuildThread(QThread):
                 os.chdir(self.project_path)
                 status(f"[INFO] Changed to project directory: {self.project_path}")
                 
+                # Pre-flight: skip vcvarsall/xmake entirely when no input changed
+                build_inputs = None
+                if self.clean_build or self.force_build:
+                    status("[INFO] Skipping up-to-date check (clean or forced build).")
+                else:
+                    up_to_date, reason, build_inputs, elapsed_ms = check_build_up_to_date(
+                        self.project_path, self.build_mode, self.runtime_flags)
+                    if up_to_date:
+                        status(f"[OK] Project is up to date: {reason} (checked in {elapsed_ms:.1f} ms)")
+                        # Nothing to configure, but the cached database may belong to another runtime
+                        install_compile_db(self.project_path, self.build_mode, self.runtime_flags, self.merge_compile_db)
+                        if self.deploy:
+                            deploy_build(self.project_path, self.build_mode, self.runtime_flags, status)
+                        self.finished_signal.emit(True, "Project is up to date. Nothing to build.")
+                        return
+                    status(f"[INFO] Build required: {reason} (checked in {elapsed_ms:.1f} ms)")
+                
                 # Clean if requested
                 if self.clean_build:
-                    status("Cleaning project...")
-                    clean_project(status)
+                    status(f"Cleaning project ({CLEAN_SCOPES.get(self.clean_scope, self.clean_scope)})...")
+                    clean_project(status, self.clean_scope, self.build_mode)
                 
                 # Find xmake and add to PATH
                 xmake_path = find_xmake()
@@ -506,8 +547,22 @@ class BuildThread(QThread):
                     Path(xmake_globaldir).mkdir(parents=True, exist_ok=True)
                     status(f"[INFO] Set XMAKE_GLOBALDIR to {xmake_globaldir} (fallback)")
                 
+                if self._cancelled:
+                    self.finished_signal.emit(False, "Build cancelled.")
+                    return
+                
                 # Pre-generate config
                 cmd = [xmake_path, "f", "-m", self.build_mode, "--toolchain=msvc", *self.runtime_flags]
+                cache_stats_before = None
+                if self.object_cache:
+                    real_cl = shutil.which("cl", path=(env or os.environ).get("PATH"))
+                    if real_cl:
+                        shim = write_compiler_shim(real_cl)
+                        cmd += [f"--cc={shim}", f"--cxx={shim}"]
+                        cache_stats_before = ObjectCache().stats()
+                        status(f"[INFO] Object cache enabled (compiler: {real_cl})")
+                    else:
+                        status("[WARN] Object cache skipped: cl.exe not found in the MSVC environment")
                 status("[INFO] Pre-generating .xmake/ config...")
                 status(f"[DEBUG] Command: {' '.join(cmd)}")
                 status(f"[DEBUG] Working directory: {os.getcwd()}")
@@ -522,36 +577,95 @@ class BuildThread(QThread):
                     self.finished_signal.emit(False, error_msg)
                     return
                 
+                # Editor compilation database, re-exported only when the configuration changed
+                try:
+                    # Configure flags beyond the runtime (the compiler shim) also change the commands
+                    ensure_compile_db(self.project_path, self.build_mode, cmd[4:], xmake_path,
+                                      env, self.merge_compile_db, status)
+                except Exception as e:
+                    status(f"[WARN] compile_commands.json export failed: {e}")
+                
+                if self._cancelled:
+                    self.finished_signal.emit(False, "Build cancelled.")
+                    return
+                
                 # Run build
                 status("[INFO] Starting build...")
+                if build_inputs is None:
+                    build_inputs = scan_build_inputs(self.project_path)
+                
+                # Take a share of the global CPU budget sized to free memory
+                job_lease = choose_job_count(self.project_path, self.build_mode, status)
+                memory_monitor = MemoryPeakMonitor(lease=job_lease).start()
+                # Only the TUs behind the changed inputs compile; unknown after a clean or config change
+                expected_tus = None
+                changed = None if self.clean_build else changed_build_inputs(
+                    self.project_path, self.build_mode, self.runtime_flags, build_inputs)
+                if changed is not None:
+                    try:
+                        expected_tus = dirty_tus(self.project_path, changed)
+                        status(f"[DEBUG] ETA: {len(expected_tus)} TU(s) to compile from {len(changed)} changed file(s)")
+                    except Exception as e:
+                        status(f"[WARN] Could not resolve changed TUs for the ETA: {e}")
+                eta = BuildEtaEstimator(self.project_path, self.build_mode, job_lease.jobs, expected_tus)
                 
                 # Build command
-                cmd = [xmake_path]
+                cmd = [xmake_path, "-j", str(job_lease.jobs)]
                 status(f"[DEBUG] Build command: {' '.join(cmd)}")
                 status(f"[DEBUG] Working directory: {os.getcwd()}")
-                creationflags = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
-                proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, creationflags=creationflags)
-                
-                import re
-                progress_re = re.compile(r"\[\s*(\d+)%\]: (.+)")
-                
-                if proc.stdout is not None:
-                    for line in proc.stdout:
-                        line = line.rstrip()
-                        match = progress_re.match(line)
-                        if match:
-                            percent = int(match.group(1))
-                            desc = match.group(2)
-                            status(f"[ {percent:3d}% ]: {desc}")
-                        else:
-                            status(line)
+                proc = None
+                try:
+                    creationflags = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
+                    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, creationflags=creationflags)
+                    self._proc = proc
+                    if self._cancelled:
+                        kill_process_tree(proc)
+                    
+                    import re
+                    progress_re = re.compile(r"\[\s*(\d+)%\]: (.+)")
+                    
+                    if proc.stdout is not None:
+                        for line in proc.stdout:
+                            line = line.rstrip()
+                            match = progress_re.match(line)
+                            if match:
+                                percent = int(match.group(1))
+                                desc = match.group(2)
+                                status(f"[ {percent:3d}% ]: {desc}")
+                                estimate = eta.feed(line)
+                                if estimate:
+                                    self.eta_signal.emit(estimate[0], format_eta(estimate[1]))
+                            else:
+                                status(line)
+                    
+                    proc.wait()
+                    eta_error = eta.finish(proc.returncode == 0 and not self._cancelled)
+                    if eta_error is not None:
+                        stats = get_eta_error_stats(self.project_path, self.build_mode)
+                        status(f"[DEBUG] ETA error: {eta_error:.0f}% this build, {stats[1]:.0f}% average over {stats[2]} build(s)")
+                finally:
+                    self._proc = None
+                    tu_peak = memory_monitor.stop(job_lease.jobs)
+                    job_lease.release()
+                    # Failed or cancelled builds stop early, so only complete builds teach the peak
+                    if proc is not None and proc.returncode == 0 and not self._cancelled:
+                        record_tu_peak_bytes(self.project_path, self.build_mode, tu_peak)
                 
-                proc.wait()
+                if cache_stats_before is not None:
+                    stats = ObjectCache().stats()
+                    delta = {k: stats[k] - cache_stats_before[k] for k in ("hit", "miss", "uncacheable", "evicted")}
+                    status(f"[INFO] Object cache this build: {format_stats({**stats, **delta})}")
                 
-                if proc.returncode != 0:
+                if self._cancelled:
+                    self.finished_signal.emit(False, "Build cancelled.")
+                elif proc.returncode != 0:
                     self.finished_signal.emit(False, "xmake build failed.")
                 else:
+                    # Remember what was built so an unchanged tree can be skipped next time
+                    save_build_snapshot(self.project_path, self.build_mode, self.runtime_flags, build_inputs)
                     status("[OK] Build completed successfully!")
+                    if self.deploy:
+                        deploy_build(self.project_path, self.build_mode, self.runtime_flags, status)
                     self.finished_signal.emit(True, "Build completed successfully!")
                     
             except Exception as e:
@@ -566,14 +680,38 @@ class BuildThread(QThread):
         except Exception as e:
             self.finished_signal.emit(False, f"Thread initialization failed: {e}")
 
+#----------Header Impact Thread----------
+class HeaderImpactThread(QThread):
+    progress_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, str)
+    
+    def __init__(self, project_path, header, build_mode):
+        super().__init__()
+        self.project_path = project_path
+        self.header = header
+        self.build_mode = build_mode
+    
+    def run(self):
+        try:
+            header_impact_report(self.project_path, self.header, self.build_mode, status_callback=self.progress_signal.emit)
+            self.finished_signal.emit(True, "Header analysis finished.")
+        except Exception as e:
+            self.finished_signal.emit(False, f"Header analysis failed: {e}")
+
 #----------GUI Panel----------
 class BuildProjectPanel(QWidget):
     def __init__(self, parent=None, status_callback=None, theme_manager=None):
         super().__init__(parent)
+        set_theme_scope(self, "BuildProjectPanel")
         self.status_callback = status_callback
         self.build_thread = None
         self.selected_project_path = None
         self.theme_manager = theme_manager
+        # Watch mode state: builds are numbered so output of a superseded build is dropped
+        self.source_watcher = None
+        self._build_generation = 0
+        self._watch_build = False
+        self._watch_rebuild_pending = False
         # Load user preferences
         self.load_preferences()
         
@@ -660,12 +798,69 @@ class BuildProjectPanel(QWidget):
         layout.addLayout(runtime_row)
         
         # Clean Build Option
-        self.clean_checkbox = QCheckBox("Clean build (delete build and .xmake folders)")
+        clean_row = QHBoxLayout()
+        clean_row.setSpacing(8)
+        clean_row.setContentsMargins(0, 0, 0, 0)
+        
+        self.clean_checkbox = QCheckBox("Clean build:")
         self.clean_checkbox.setObjectName("clean_checkbox")
         self.clean_checkbox.setChecked(self.last_clean_build)
-        self.clean_checkbox.setToolTip("Delete build/.xmake folders before compiling.")
+        self.clean_checkbox.setToolTip("Remove build state before compiling. Deletion runs in the background.")
         self.clean_checkbox.toggled.connect(self.save_preferences)
-        layout.addWidget(self.clean_checkbox)
+        clean_row.addWidget(self.clean_checkbox)
+        
+        self.clean_scope_combo = QComboBox()
+        self.clean_scope_combo.setObjectName("clean_scope_combo")
+        for scope, label in CLEAN_SCOPES.items():
+            self.clean_scope_combo.addItem(label, scope)
+        scope_index = self.clean_scope_combo.findData(self.last_clean_scope)
+        self.clean_scope_combo.setCurrentIndex(scope_index if scope_index >= 0 else 0)
+        self.clean_scope_combo.setToolTip("Objects only keeps the xmake package configuration; Everything deletes build/ and .xmake/.")
+        self.clean_scope_combo.currentIndexChanged.connect(self.save_preferences)
+        clean_row.addWidget(self.clean_scope_combo)
+        layout.addLayout(clean_row)
+        
+        # Force Build Option
+        self.force_checkbox = QCheckBox("Force build (skip up-to-date check)")
+        self.force_checkbox.setObjectName("force_checkbox")
+        self.force_checkbox.setChecked(self.last_force_build)
+        self.force_checkbox.setToolTip("Always run xmake, even when no source, header or config file changed.")
+        self.force_checkbox.toggled.connect(self.save_preferences)
+        layout.addWidget(self.force_checkbox)
+        
+        # Watch Mode Option
+        self.watch_checkbox = QCheckBox("Watch mode (rebuild automatically when src/ or xmake.lua is saved)")
+        self.watch_checkbox.setObjectName("watch_checkbox")
+        self.watch_checkbox.setChecked(self.last_watch_mode)
+        self.watch_checkbox.setToolTip("Debounces bursts of saves, cancels an outdated build and starts an incremental one.")
+        self.watch_checkbox.toggled.connect(self.save_preferences)
+        self.watch_checkbox.toggled.connect(self.update_source_watcher)
+        layout.addWidget(self.watch_checkbox)
+        
+        # Deploy Option
+        self.deploy_checkbox = QCheckBox("Deploy plugin to mods folder after build")
+        self.deploy_checkbox.setObjectName("deploy_checkbox")
+        self.deploy_checkbox.setChecked(self.last_deploy)
+        self.deploy_checkbox.setToolTip("Copy changed DLL/PDB files into XSE_TES5_MODS_PATH/<project>/SKSE/Plugins "
+                                        "or the targets in clibdt_deploy_config.json.")
+        self.deploy_checkbox.toggled.connect(self.save_preferences)
+        layout.addWidget(self.deploy_checkbox)
+        
+        self.merge_compile_db_checkbox = QCheckBox("Merge compile_commands.json across runtimes")
+        self.merge_compile_db_checkbox.setObjectName("merge_compile_db_checkbox")
+        self.merge_compile_db_checkbox.setChecked(self.last_merge_compile_db)
+        self.merge_compile_db_checkbox.setToolTip("compile_commands.json is exported for clangd/IntelliSense after each configure. "
+                                                  "When checked, files only built for other runtimes (SE, AE, VR) are included too.")
+        self.merge_compile_db_checkbox.toggled.connect(self.save_preferences)
+        layout.addWidget(self.merge_compile_db_checkbox)
+        
+        self.object_cache_checkbox = QCheckBox("Object cache (reuse compiled objects across runtimes and cleans)")
+        self.object_cache_checkbox.setObjectName("object_cache_checkbox")
+        self.object_cache_checkbox.setChecked(self.last_object_cache)
+        self.object_cache_checkbox.setToolTip("Routes cl.exe through a ccache-style wrapper with a shared LRU store in the dev root. "
+                                              "Cap it with CLIBDT_OBJCACHE_MAX_GB (default 5). /Zi and PCH creation are not cached.")
+        self.object_cache_checkbox.toggled.connect(self.save_preferences)
+        layout.addWidget(self.object_cache_checkbox)
         
         # Progress Bar
         self.progress_bar = QProgressBar()
@@ -697,6 +892,15 @@ class BuildProjectPanel(QWidget):
         self.stop_btn.setEnabled(False)
         btn_row.addWidget(self.stop_btn)
         
+        # Header impact analysis button
+        self.header_impact_btn = QPushButton("Header Impact...")
+        self.header_impact_btn.setProperty("btnType", "secondary")
+        self.header_impact_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.header_impact_btn.setFixedHeight(32)
+        self.header_impact_btn.setToolTip("Show which TUs a header change recompiles, or rank headers by rebuild cost")
+        self.header_impact_btn.clicked.connect(self.analyze_header_impact)
+        btn_row.addWidget(self.header_impact_btn)
+        
         layout.addLayout(btn_row)
         
         # Regenerate xmake.lua section with divider
@@ -802,70 +1006,29 @@ class BuildProjectPanel(QWidget):
         layout.addStretch()
         
         self.setLayout(layout)
-        
-        # Connect to theme manager if provided
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
     
     def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
+        """Load projects the first time the panel is shown"""
         super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        # Apply theme when panel is shown
-        self.apply_theme()
-        
         # Load projects when panel is first shown (lazy loading)
         if not hasattr(self, '_projects_loaded'):
             self.load_projects()
             self.load_project_names_for_regenerate()
             self._projects_loaded = True
     
-    def load_projects(self):
-        """Load available projects from dev_root/projects folder"""
+    def load_projects(self, index=None):
+        """Load available projects from the shared project index (no disk scan when unchanged)"""
         try:
-            # Import the new project detection module
-            try:
-                from modules.refresh_project import is_valid_clib_project
-            except ImportError:
-                # Fallback to old xmake.lua detection if module not available
-                def is_valid_clib_project(project_path):
-                    return (project_path / "xmake.lua").exists()
-            
-            dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
-            if not dev_root:
-                self.project_combo.addItem("No dev root found")
+            index = index or get_project_index()
+            if index is None:
+                fill_project_combo(self.project_combo, [], empty_text="No dev root found")
                 return
             
-            projects_path = Path(dev_root) / "projects"
-            if not projects_path.exists():
-                self.project_combo.addItem("No projects folder found")
-                return
-            
-            projects = []
-            for item in projects_path.iterdir():
-                if item.is_dir() and is_valid_clib_project(item):
-                    projects.append(item.name)
-            
-            if not projects:
-                self.project_combo.addItem("No valid ClibDT projects found")
+            if not index.root_exists():
+                fill_project_combo(self.project_combo, [], empty_text="No projects folder found")
                 return
             
-            projects.sort()
-            self.project_combo.addItems(projects)
-            
-            # Select last used project if available
-            if hasattr(self, 'last_project') and self.last_project in projects:
-                self.project_combo.setCurrentText(self.last_project)
-            elif projects:
-                self.project_combo.setCurrentText(projects[0])
+            fill_project_combo(self.project_combo, index.names(), getattr(self, 'last_project', None))
                 
         except Exception as e:
             self.project_combo.addItem(f"Error loading projects: {e}")
@@ -881,37 +1044,37 @@ class BuildProjectPanel(QWidget):
                 
                 # Populate metadata fields with project info
                 self.populate_metadata_fields()
+                
+                # Follow the selected project in watch mode
+                self.update_source_watcher()
     
-    def load_project_names_for_regenerate(self):
+    def load_project_names_for_regenerate(self, index=None):
         """Load available project names for the regenerate dropdown"""
         try:
-            # Clear existing items
+            current = self.project_name_input.currentText()
+            self.project_name_input.blockSignals(True)
             self.project_name_input.clear()
             
-            # Add projects from dev root
-            dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
-            if dev_root:
-                projects_path = Path(dev_root) / "projects"
-                if projects_path.exists():
-                    # Import the new project detection module
-                    try:
-                        from modules.refresh_project import is_valid_clib_project
-                    except ImportError:
-                        # Fallback to old xmake.lua detection if module not available
-                        def is_valid_clib_project(project_path):
-                            return (project_path / "xmake.lua").exists()
-                    
-                    projects = []
-                    for item in projects_path.iterdir():
-                        if item.is_dir() and is_valid_clib_project(item):
-                            projects.append(item.name)
-                    
-                    projects.sort()
-                    for project_name in projects:
-                        self.project_name_input.addItem(project_name)
+            index = index or get_project_index()
+            if index is not None:
+                for name in index.names():
+                    self.project_name_input.addItem(name, name)
+            self.project_name_input.setCurrentText(current)
             
         except Exception as e:
             self.status(f"[ERROR] Failed to load project names: {e}")
+        finally:
+            self.project_name_input.blockSignals(False)
+    
+    def on_projects_changed(self, index, changes):
+        """Project index listener: patch both pickers once the panel has been shown"""
+        if getattr(self, '_projects_loaded', False):
+            apply_project_changes(self.project_combo, changes)
+            # The regenerate name is editable: keep what was typed unless that project was renamed
+            name_text = dict(changes.renamed).get(self.project_name_input.currentText(),
+                                                  self.project_name_input.currentText())
+            apply_project_changes(self.project_name_input, changes, empty_text=None)
+            self.project_name_input.setCurrentText(name_text)
     
     def populate_metadata_fields(self):
         """Populate metadata fields with current project information"""
@@ -922,41 +1085,18 @@ class BuildProjectPanel(QWidget):
         project_name = self.selected_project_path.name
         self.project_name_input.setCurrentText(project_name)
         
-        # Try to read existing xmake.lua to extract current metadata
-        xmake_file = self.selected_project_path / "xmake.lua"
-        if xmake_file.exists():
-            try:
-                with open(xmake_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Extract version
-                    import re
-                    version_match = re.search(r'set_version\("([^"]+)"\)', content)
-                    if version_match:
-                        self.version_input.setText(version_match.group(1))
-                    else:
-                        self.version_input.setText("1.0.0")
-                    
-                    # Extract description
-                    desc_match = re.search(r'set_description\("([^"]+)"\)', content)
-                    if desc_match:
-                        self.description_input.setText(desc_match.group(1))
-                    else:
-                        self.description_input.setText("No description provided.")
-                    
-                    # Extract author (harder to parse, use default)
-                    self.author_input.setText("Unknown")
-                    
-            except Exception:
-                # If parsing fails, use defaults
-                self.version_input.setText("1.0.0")
-                self.description_input.setText("No description provided.")
-                self.author_input.setText("Unknown")
-        else:
-            # No existing xmake.lua, use defaults
-            self.version_input.setText("1.0.0")
-            self.description_input.setText("No description provided.")
-            self.author_input.setText("Unknown")
+        # Current metadata comes from the project index's parse of xmake.lua, re-checked
+        # first so an edit made outside ClibDT since the last scan is picked up
+        index = get_project_index()
+        record = None
+        if index:
+            index.refresh_project(project_name)
+            record = index.get(project_name)
+        xmake_meta = (record.xmake_meta if record else None) or {}
+        self.version_input.setText(xmake_meta.get("version", "1.0.0"))
+        self.description_input.setText(xmake_meta.get("description", "No description provided."))
+        # Author is not parsed from xmake.lua, use default
+        self.author_input.setText("Unknown")
     
     def regenerate_xmake_lua(self):
         """Regenerate xmake.lua file for the selected project"""
@@ -998,6 +1138,9 @@ class BuildProjectPanel(QWidget):
             # Generate the xmake.lua file
             xmake_file = self.selected_project_path / "xmake.lua"
             generate_xmake_lua(xmake_file, project_name, version, author, description)
+            index = get_project_index()
+            if index is not None:
+                index.refresh_project(self.selected_project_path.name)
             
             self.status(f"[SUCCESS] xmake.lua regenerated for project: {project_name}")
             self.status(f"[INFO] File location: {xmake_file}")
@@ -1008,55 +1151,39 @@ class BuildProjectPanel(QWidget):
             self.status(f"[ERROR] Failed to regenerate xmake.lua: {e}")
     
     def load_preferences(self):
-        """Load user preferences from a simple config file"""
-        self.last_build_mode = "Release"
-        self.last_runtime = "SE + AE (dual)"
-        self.last_clean_build = False
-        self.last_project = None
-
-        
-        try:
-            # Use config folder in parent root
-            config_dir = Path(__file__).parent.parent / "config"
-            config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-            config_path = config_dir / "clibdt_build_config.json"
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config_data = json.load(f)
-                    mode = config_data.get('build_mode')
-                    if mode in ["Release", "Debug", "Releasedbg"]:
-                        self.last_build_mode = mode
-                    runtime = config_data.get('runtime')
-                    if runtime in ["SE + AE (dual)", "SE only", "AE only", "VR only"]:
-                        self.last_runtime = runtime
-                    self.last_clean_build = config_data.get('clean_build', False)
-                    self.last_project = config_data.get('project')
-        except Exception:
-            # If loading fails, use defaults
-            pass
+        """Load user preferences from the build config namespace"""
+        prefs = get_config_namespace("build")
+        mode = prefs.get('build_mode')
+        self.last_build_mode = mode if mode in ["Release", "Debug", "Releasedbg"] else "Release"
+        runtime = prefs.get('runtime')
+        self.last_runtime = runtime if runtime in ["SE + AE (dual)", "SE only", "AE only", "VR only"] else "SE + AE (dual)"
+        self.last_clean_build = prefs.get('clean_build')
+        scope = prefs.get('clean_scope')
+        self.last_clean_scope = scope if scope in CLEAN_SCOPES else "all"
+        self.last_force_build = prefs.get('force_build')
+        self.last_watch_mode = prefs.get('watch_mode')
+        self.last_deploy = prefs.get('deploy')
+        self.last_merge_compile_db = prefs.get('merge_compile_db')
+        self.last_object_cache = prefs.get('object_cache')
+        self.last_project = prefs.get('project')
     
     def save_preferences(self):
-        """Save user preferences to a simple config file"""
-        try:
-            # Use config folder in parent root
-            config_dir = Path(__file__).parent.parent / "config"
-            config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-            config_path = config_dir / "clibdt_build_config.json"
-            config_data = {
-                'build_mode': self.build_mode_combo.currentText(),
-                'runtime': self.runtime_combo.currentText(),
-                'clean_build': self.clean_checkbox.isChecked(),
-                'clibdt_version': VERSION
-            }
-            if hasattr(self, 'last_project') and self.last_project:
-                config_data['project'] = self.last_project
-            
-            with open(config_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
-
-        except Exception:
-            # If saving fails, just continue
-            pass
+        """Record user preferences; the config store writes them once changes settle"""
+        prefs = {
+            'build_mode': self.build_mode_combo.currentText(),
+            'runtime': self.runtime_combo.currentText(),
+            'clean_build': self.clean_checkbox.isChecked(),
+            'clean_scope': self.clean_scope_combo.currentData() or "all",
+            'force_build': self.force_checkbox.isChecked(),
+            'watch_mode': self.watch_checkbox.isChecked(),
+            'deploy': self.deploy_checkbox.isChecked(),
+            'merge_compile_db': self.merge_compile_db_checkbox.isChecked(),
+            'object_cache': self.object_cache_checkbox.isChecked(),
+            'clibdt_version': VERSION
+        }
+        if getattr(self, 'last_project', None):
+            prefs['project'] = self.last_project
+        get_config_namespace("build").update(prefs)
     
     def status(self, msg):
         if self.status_callback:
@@ -1079,7 +1206,59 @@ class BuildProjectPanel(QWidget):
         }
         return runtime_map.get(self.runtime_combo.currentText(), ["--skyrim_se=y", "--skyrim_ae=y"])
     
+    def update_source_watcher(self):
+        """Start, retarget or stop the watch-mode source watcher"""
+        wanted = self.watch_checkbox.isChecked() and self.selected_project_path is not None
+        if self.source_watcher is not None:
+            if wanted and self.source_watcher.project_path == self.selected_project_path:
+                return
+            self.source_watcher.stop()
+            self.source_watcher.deleteLater()
+            self.source_watcher = None
+            if not wanted:
+                self.status("[WATCH] Watch mode stopped.")
+        if not wanted:
+            return
+        
+        from modules.source_watcher import SourceWatcher
+        self.source_watcher = SourceWatcher(self.selected_project_path, parent=self)
+        self.source_watcher.changed.connect(self.on_sources_changed)
+        mode = self.source_watcher.start()
+        self.status(f"[WATCH] Watching {self.selected_project_path.name} for changes ({mode} mode).")
+    
+    def on_sources_changed(self, changed_paths):
+        """Debounced change from the source watcher: (re)start an incremental build"""
+        preview = ", ".join(changed_paths[:3]) + (" ..." if len(changed_paths) > 3 else "")
+        self.status(f"[WATCH] {len(changed_paths)} change(s): {preview}")
+        if self.build_thread and self.build_thread.isRunning():
+            # Only the newest build's diagnostics matter: drop the old output and restart once it stops
+            self._watch_rebuild_pending = True
+            self._build_generation += 1
+            self.build_thread.cancel()
+            self.status("[WATCH] Cancelling outdated build...")
+            return
+        self.start_watch_build()
+    
+    def start_watch_build(self):
+        self._watch_build = True
+        self.start_build()
+    
+    def _on_build_output(self, generation, msg):
+        if generation == self._build_generation:
+            self.status(msg)
+    
+    def _on_build_finished(self, generation, success, message):
+        if self._watch_rebuild_pending:
+            self._watch_rebuild_pending = False
+            self._reset_build_controls()
+            self.start_watch_build()
+            return
+        if generation == self._build_generation:
+            self.build_finished(success, message)
+    
     def start_build(self):
+        from_watch = self._watch_build
+        self._watch_build = False
         if not self.selected_project_path:
             QMessageBox.warning(self, "No Project Selected", "Please select a project to build.")
             return
@@ -1099,24 +1278,35 @@ class BuildProjectPanel(QWidget):
         self.build_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.progress_bar.setRange(0, 0)  # Indeterminate until the first ETA arrives
+        self.progress_bar.setFormat("%p%")
         
         self.status("=== Starting Build ===")
         self.status(f"Project: {self.selected_project_path.name}")
         self.status(f"Build Mode: {self.build_mode_combo.currentText()}")
         self.status(f"Runtime: {self.runtime_combo.currentText()}")
-        self.status(f"Clean Build: {self.clean_checkbox.isChecked()}")
+        self.status(f"Clean Build: {self.clean_checkbox.isChecked()}" + (f" ({self.clean_scope_combo.currentText()})" if self.clean_checkbox.isChecked() else ""))
+        self.status(f"Force Build: {self.force_checkbox.isChecked()}")
+        self.status(f"Deploy: {self.deploy_checkbox.isChecked()}")
         self.status("Toolchain: Auto-detected from environment variables")
         self.status("")
         
         # Start build thread (no custom toolchain path - use environment variables)
+        self._build_generation += 1
+        self._current_build_from_watch = from_watch
+        # Watch builds are always incremental: no clean, no forced rebuild
         self.build_thread = BuildThread(
             self.get_build_mode(),
             self.get_runtime_flags(),
-            self.clean_checkbox.isChecked(),
+            self.clean_checkbox.isChecked() and not from_watch,
             self.status,
             str(self.selected_project_path),
-            None  # Always use auto-detection from environment variables
+            None,  # Always use auto-detection from environment variables
+            force_build=self.force_checkbox.isChecked() and not from_watch,
+            clean_scope=self.clean_scope_combo.currentData(),
+            deploy=self.deploy_checkbox.isChecked(),
+            merge_compile_db=self.merge_compile_db_checkbox.isChecked(),
+            object_cache=self.object_cache_checkbox.isChecked()
         )
         
         # Disconnect any existing connections to prevent duplicates
@@ -1130,437 +1320,75 @@ class BuildProjectPanel(QWidget):
             pass
         
         # Connect signals
-        self.build_thread.progress_signal.connect(self.status)
-        self.build_thread.finished_signal.connect(self.build_finished)
+        generation = self._build_generation
+        self.build_thread.progress_signal.connect(lambda msg, g=generation: self._on_build_output(g, msg))
+        self.build_thread.finished_signal.connect(lambda ok, msg, g=generation: self._on_build_finished(g, ok, msg))
+        self.build_thread.eta_signal.connect(lambda percent, eta, g=generation: self._on_build_eta(g, percent, eta))
         self.build_thread.start()
     
     def stop_build(self):
         if self.build_thread and self.build_thread.isRunning():
-            self.build_thread.terminate()
-            self.build_thread.wait()
+            self._watch_rebuild_pending = False
+            self._build_generation += 1  # Ignore anything the stopped build still reports
+            self.build_thread.cancel()
+            if not self.build_thread.wait(10000):
+                self.build_thread.terminate()
+                self.build_thread.wait()
             self.status("[INFO] Build stopped by user.")
             self.build_finished(False, "Build stopped by user.")
     
-    def build_finished(self, success, message):
+    def analyze_header_impact(self):
+        if not self.selected_project_path:
+            QMessageBox.warning(self, "No Project Selected", "Please select a project first.")
+            return
+        if getattr(self, 'header_thread', None) and self.header_thread.isRunning():
+            return
+        from PyQt6.QtWidgets import QInputDialog
+        header, ok = QInputDialog.getText(self, "Header Impact",
+                                          "Header to analyze (e.g. pch.h, Hooks.h).\nLeave empty to rank headers by rebuild cost:")
+        if not ok:
+            return
+        self.header_impact_btn.setEnabled(False)
+        self.header_thread = HeaderImpactThread(str(self.selected_project_path), header.strip() or None, self.get_build_mode())
+        self.header_thread.progress_signal.connect(self.status)
+        self.header_thread.finished_signal.connect(self._on_header_impact_finished)
+        self.header_thread.start()
+    
+    def _on_header_impact_finished(self, success, message):
+        self.header_impact_btn.setEnabled(True)
+        self.status(f"[OK] {message}" if success else f"[ERROR] {message}")
+    
+    def _on_build_eta(self, generation, percent, eta):
+        if generation != self._build_generation:
+            return
+        # First estimate switches the bar from busy to determinate
+        if self.progress_bar.maximum() == 0:
+            self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(percent)
+        self.progress_bar.setFormat(f"%p% - ETA {eta}")
+    
+    def _reset_build_controls(self):
         self.build_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
+    
+    def build_finished(self, success, message):
+        self._reset_build_controls()
+        
+        if getattr(self, '_current_build_from_watch', False):
+            # No modal dialogs in watch mode; the terminal shows the result
+            self.status(f"[WATCH] {'OK' if success else 'FAILED'}: {message}")
+            return
         
         if success:
-            self.status("[SUCCESS] Build completed successfully!")
-            QMessageBox.information(self, "Build Complete", "Build completed successfully!")
+            self.status(f"[SUCCESS] {message}")
+            QMessageBox.information(self, "Build Complete", message)
         else:
             self.status(f"[ERROR] {message}")
             QMessageBox.critical(self, "Build Failed", f"Build failed: {message}")
     
     def set_theme_manager(self, theme_manager):
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-
-    def apply_theme(self):
-        """Apply theme colors to the panel"""
-        if self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            # Fallback theme
-            theme = {
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'bg_secondary': '#252525',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'text_light': '#ffffff',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'separator': '#404040',
-                'success_color': '#27ae60',
-                'error_color': '#e74c3c',
-                'warning_color': '#f39c12',
-                'info_color': '#3498db'
-            }
-        
-        # Ultra-compact styling that overrides ALL global styling
-        self.setStyleSheet(f"""
-            /* Nuclear option: Override ALL global styling with ultra-compact layout */
-            BuildProjectPanel,
-            BuildProjectPanel * {{
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                background-color: {theme['window_bg']} !important;
-                color: {theme['text_primary']} !important;
-                font-family: 'Segoe UI', Arial, sans-serif !important;
-            }}
-            
-            /* Typography Hierarchy - Only headers are bold */
-            BuildProjectPanel QLabel {{
-                background-color: transparent !important;
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                font-weight: normal !important;
-            }}
-            
-            /* Header elements - ONLY these are bold */
-            BuildProjectPanel QLabel#build_project_title {{
-                font-size: 18px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                background: transparent !important;
-                padding: 6px 0px !important;
-            }}
-            
-            BuildProjectPanel QLabel#title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            BuildProjectPanel QLabel#build_project_desc {{
-                color: {theme['text_secondary']} !important;
-                font-size: 11px !important;
-                margin-bottom: 8px !important;
-                font-weight: normal !important;
-            }}
-            
-            BuildProjectPanel QLabel#section_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-top: 8px !important;
-                margin-bottom: 4px !important;
-                background: transparent !important;
-                padding: 4px 0px !important;
-            }}
-            
-            BuildProjectPanel QLabel#section_title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            BuildProjectPanel QLabel#section_desc {{
-                color: {theme['text_secondary']} !important;
-                font-size: 10px !important;
-                margin-bottom: 6px !important;
-                font-weight: normal !important;
-            }}
-            
-            BuildProjectPanel QLabel#metadata_label {{
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                font-weight: normal !important;
-                background: transparent !important;
-            }}
-            
-            /* Separator styling */
-            BuildProjectPanel QLabel#section_divider {{
-                background-color: {theme['separator']} !important;
-                height: 2px !important;
-                margin: 8px 0px !important;
-            }}
-            
-            /* Input styling - responsive and modern */
-            BuildProjectPanel QLineEdit,
-            BuildProjectPanel QLineEdit:hover,
-            BuildProjectPanel QLineEdit:focus {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-                min-width: 120px !important;
-            }}
-            
-            BuildProjectPanel QLineEdit:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            BuildProjectPanel QLineEdit:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            /* Project name combo box styling */
-            BuildProjectPanel QComboBox#project_name_input {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-                min-width: 150px !important;
-            }}
-            
-            BuildProjectPanel QComboBox#project_name_input:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            BuildProjectPanel QComboBox#project_name_input:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            BuildProjectPanel QComboBox#project_name_input::drop-down {{
-                border: none !important;
-                width: 24px !important;
-            }}
-            
-            BuildProjectPanel QComboBox#project_name_input::down-arrow {{
-                image: none !important;
-                border-left: 6px solid transparent !important;
-                border-right: 6px solid transparent !important;
-                border-top: 6px solid {theme['text_primary']} !important;
-                margin-right: 6px !important;
-            }}
-            
-            BuildProjectPanel QComboBox#project_name_input QAbstractItemView {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 6px !important;
-                selection-background-color: {theme['button_bg']} !important;
-                selection-color: {theme['text_light']} !important;
-                padding: 4px !important;
-            }}
-            
-            /* Metadata input fields styling */
-            BuildProjectPanel QLineEdit#project_name_input,
-            BuildProjectPanel QLineEdit#version_input,
-            BuildProjectPanel QLineEdit#author_input,
-            BuildProjectPanel QLineEdit#description_input {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-                min-width: 120px !important;
-            }}
-            
-            BuildProjectPanel QLineEdit#project_name_input:hover,
-            BuildProjectPanel QLineEdit#version_input:hover,
-            BuildProjectPanel QLineEdit#author_input:hover,
-            BuildProjectPanel QLineEdit#description_input:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            BuildProjectPanel QLineEdit#project_name_input:focus,
-            BuildProjectPanel QLineEdit#version_input:focus,
-            BuildProjectPanel QLineEdit#author_input:focus,
-            BuildProjectPanel QLineEdit#description_input:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            /* ComboBox styling - responsive resizing */
-            BuildProjectPanel QComboBox,
-            BuildProjectPanel QComboBox:hover,
-            BuildProjectPanel QComboBox:focus {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-                min-width: 120px !important;
-            }}
-            
-            BuildProjectPanel QComboBox:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            BuildProjectPanel QComboBox:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            BuildProjectPanel QComboBox::drop-down {{
-                border: none !important;
-                width: 24px !important;
-            }}
-            
-            BuildProjectPanel QComboBox::down-arrow {{
-                image: none !important;
-                border-left: 6px solid transparent !important;
-                border-right: 6px solid transparent !important;
-                border-top: 6px solid {theme['text_primary']} !important;
-                margin-right: 6px !important;
-            }}
-            
-            BuildProjectPanel QComboBox QAbstractItemView {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 6px !important;
-                selection-background-color: {theme['button_bg']} !important;
-                selection-color: {theme['text_light']} !important;
-                padding: 4px !important;
-            }}
-            
-            /* CheckBox styling - transparent background */
-            BuildProjectPanel QCheckBox {{
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                spacing: 8px !important;
-                padding: 2px 0px !important;
-                background: transparent !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-            }}
-            
-            BuildProjectPanel QCheckBox::indicator {{
-                width: 16px !important;
-                height: 16px !important;
-                border: 2px solid {theme['input_border']} !important;
-                background-color: {theme['input_bg']} !important;
-                border-radius: 3px !important;
-            }}
-            
-            BuildProjectPanel QCheckBox::indicator:checked {{
-                background-color: {theme['button_bg']} !important;
-                border-color: {theme['button_bg']} !important;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
-            }}
-            
-            BuildProjectPanel QCheckBox:hover::indicator:unchecked {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            /* Progress Bar styling */
-            BuildProjectPanel QProgressBar#build_progress_bar {{
-                border: 1px solid {theme['input_border']} !important;
-                border-radius: 6px !important;
-                text-align: center !important;
-                font-size: 11px !important;
-                color: {theme['text_primary']} !important;
-                background-color: {theme['input_bg']} !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-            }}
-            
-            BuildProjectPanel QProgressBar#build_progress_bar::chunk {{
-                background-color: {theme['button_bg']} !important;
-                border-radius: 4px !important;
-            }}
-            
-            /* Button styling - unified gradient system with responsive sizing */
-            BuildProjectPanel QPushButton,
-            BuildProjectPanel QPushButton:hover,
-            BuildProjectPanel QPushButton:pressed,
-            BuildProjectPanel QPushButton:disabled {{
-                border: none !important;
-                padding: 8px 16px !important;
-                border-radius: 6px !important;
-                font-size: 11px !important;
-                font-weight: bold !important;
-                min-height: 16px !important;
-                margin: 2px 4px !important;
-            }}
-            
-            BuildProjectPanel QPushButton:disabled {{
-                background-color: {theme['text_secondary']} !important;
-                color: {theme['text_secondary']} !important;
-                opacity: 0.6 !important;
-            }}
-            
-            /* Success action buttons */
-            BuildProjectPanel QPushButton[btnType="success"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['success_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            BuildProjectPanel QPushButton[btnType="success"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
-                border: 2px solid #a9dfbf !important;
-                color: #ffffff !important;
-                padding: 7px 13px !important;
-            }}
-            
-            BuildProjectPanel QPushButton[btnType="success"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954) !important;
-                border: 2px solid #1e8449 !important;
-                color: #ffffff !important;
-                padding: 8px 14px !important;
-            }}
-            
-            /* Uninstall/Danger buttons */
-            BuildProjectPanel QPushButton[btnType="uninstall"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['error_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            BuildProjectPanel QPushButton[btnType="uninstall"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b) !important;
-                border: 2px solid #f1948a !important;
-                color: #ffffff !important;
-            }}
-            
-            BuildProjectPanel QPushButton[btnType="uninstall"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
-                border: 1px solid {theme['error_color']} !important;
-                opacity: 0.8 !important;
-            }}
-            
-            /* Secondary button - Gray theme */
-            BuildProjectPanel QPushButton[btnType="secondary"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6c757d, stop:1 #5a6268) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid #5a6268 !important;
-            }}
-            BuildProjectPanel QPushButton[btnType="secondary"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #868e96, stop:1 #6c757d) !important;
-                border: 1px solid #868e96 !important;
-            }}
-            BuildProjectPanel QPushButton[btnType="secondary"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a6268, stop:1 #495057) !important;
-                border: 1px solid #495057 !important;
-            }}
-            
-
-            
-
-        """)
-    
-
 
 #----------Legacy CLI Functions (for backward compatibility)----------
 def choose_build_mode():
@@ -1585,21 +1413,18 @@ def choose_runtime():
     }.get(choice or "3", ["--skyrim_se=y", "--skyrim_ae=y"])
 
 def maybe_clean():
-    do_clean = input("Clean project? (deletes Build and .xmake folders)? (Y/N): ").strip().lower()
+    do_clean = input("Clean project? (Y/N): ").strip().lower()
     if do_clean == "m":
         return "__menu__"
 
     if do_clean == "y" or do_clean == "":
-        for folder in ["build", ".xmake"]:
-            path = Path(folder)
-            if path.exists() and path.is_dir():
-                try:
-                    shutil.rmtree(path, onerror=on_rm_error)
-                    cprint(f"[OK] {folder}/ folder deleted.", Fore.GREEN)
-                except Exception as e:
-                    cprint(f"[ERROR] Failed to delete {folder}/: {e}", Fore.RED)
-            else:
-                cprint(f"[INFO] {folder}/ not found. Skipping.", Fore.LIGHTBLACK_EX)
+        cprint("=== Choose Clean Scope ===", Fore.LIGHTCYAN_EX)
+        print("  1. Objects only (keep .xmake package config)\n  2. Package cache (.xmake)\n  3. Everything (build + .xmake)\n  m. Return to menu")
+        choice = input("Choose clean scope [Default: 3]: ").strip().lower()
+        if choice == "m":
+            return "__menu__"
+        scope = {"1": "objects", "2": "packages", "3": "all"}.get(choice or "3", "all")
+        clean_project(cprint, scope)
     else:
         cprint("[INFO] Skipping clean step.", Fore.LIGHTBLACK_EX)
 
@@ -1653,9 +1478,10 @@ def run_xmake_in_vcvars_env(build_mode, runtime_flags, env=None):
         return proc.returncode
 
     if env:
-        cmd = [xmake_path]
-        cprint("[INFO] Running xmake with injected MSVC env...", Fore.CYAN)
-        stream_xmake(cmd, env)
+        with choose_job_count(Path.cwd(), build_mode, cprint) as job_lease:
+            cmd = [xmake_path, "-j", str(job_lease.jobs)]
+            cprint("[INFO] Running xmake with injected MSVC env...", Fore.CYAN)
+            stream_xmake(cmd, env)
     else:
         tools_root = os.environ.get("XSE_MSVCTOOLS_ROOT")
         if not tools_root:
@@ -1667,7 +1493,8 @@ def run_xmake_in_vcvars_env(build_mode, runtime_flags, env=None):
             pause()
             return
 
-        cmd = f'call "{vcvarsall}" x64 && "{xmake_path}"'
+        job_lease = choose_job_count(Path.cwd(), build_mode, cprint)
+        cmd = f'call "{vcvarsall}" x64 && "{xmake_path}" -j {job_lease.jobs}'
         cprint("[INFO] Running xmake inside MSVC shell via vcvarsall...", Fore.CYAN)
         # Use a temp batch file to stream output
         import tempfile
@@ -1688,6 +1515,7 @@ def run_xmake_in_vcvars_env(build_mode, runtime_flags, env=None):
                 else:
                     print(line)
         proc.wait()
+        job_lease.release()
         if proc.returncode != 0:
             cprint("[ERROR] xmake build failed.", Fore.RED)
         else:
@@ -1768,6 +1596,7 @@ def run_build_project():
         return
 
     run_xmake_in_vcvars_env(build_mode, runtime_flags, env)
+    wait_for_pending_deletes()
 
     cprint("[INFO] Endorsements appreciated ❤️", Fore.GREEN)
     cprint("https://www.nexusmods.com/skyrimspecialedition/mods/154240", Fore.CYAN)
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+from pathlib import Path
+
+#----------Snapshot Settings----------
+# Folders (relative to the project root) whose contents feed the compiler
+INPUT_DIRS = ("src", "include", "ClibUtil", "xbyak")
+
+# Top-level files that change the build configuration
+CONFIG_FILES = ("xmake.lua", "clib_project.json", "clibdt_project.json", "vcpkg.json")
+
+# File types that count as build inputs inside INPUT_DIRS
+INPUT_EXTENSIONS = {
+    ".c", ".cc", ".cpp", ".cxx", ".ixx",
+    ".h", ".hh", ".hpp", ".hxx", ".inl", ".ipp",
+    ".rc", ".def", ".lua", ".json", ".toml", ".ini",
+}
+
+# Where the last successful build snapshot is kept (deleted together with build/)
+SNAPSHOT_DIR = Path("build") / ".clibdt"
+SNAPSHOT_FILE = "build_snapshot.json"
+SNAPSHOT_FORMAT = 1
+
+
+#----------Scanning----------
+def scan_build_inputs(project_path):
+    """Collect {relative path: [mtime_ns, size]} for every build input in one scandir pass"""
+    project_path = Path(project_path)
+    inputs = {}
+
+    # Top-level config files come from the same listing as the input folders
+    stack = []
+    try:
+        with os.scandir(project_path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and entry.name in CONFIG_FILES:
+                    st = entry.stat()
+                    inputs[entry.name] = [st.st_mtime_ns, st.st_size]
+                elif entry.name in INPUT_DIRS and entry.is_dir():
+                    stack.append((entry.path, entry.name))
+    except OSError:
+        return inputs
+
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    rel = f"{rel_dir}/{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.startswith("."):
+                            continue
+                        stack.append((entry.path, rel))
+                    elif os.path.splitext(entry.name)[1].lower() in INPUT_EXTENSIONS:
+                        # DirEntry.stat() is served from the directory listing on Windows
+                        st = entry.stat()
+                        inputs[rel] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            continue
+
+    return inputs
+
+
+def snapshot_key(build_mode, runtime_flags):
+    """Key a snapshot by build mode and runtime flags so switching either forces a build"""
+    return f"{build_mode}|{' '.join(sorted(runtime_flags))}"
+
+
+#----------Storage----------
+def _snapshot_path(project_path):
+    return Path(project_path) / SNAPSHOT_DIR / SNAPSHOT_FILE
+
+
+def load_build_snapshots(project_path):
+    """Load all stored snapshots for a project, or an empty dict"""
+    path = _snapshot_path(project_path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") == SNAPSHOT_FORMAT:
+            return data.get("snapshots", {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def save_build_snapshot(project_path, build_mode, runtime_flags, inputs):
+    """Record the inputs of a successful build; written atomically"""
+    path = _snapshot_path(project_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        snapshots = load_build_snapshots(project_path)
+        snapshots[snapshot_key(build_mode, runtime_flags)] = {
+            "saved": time.time(),
+            "inputs": inputs,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": SNAPSHOT_FORMAT, "snapshots": snapshots}, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        return False
+
+
+def invalidate_build_snapshots(project_path):
+    """Forget every stored snapshot so the next build always runs"""
+    try:
+        _snapshot_path(project_path).unlink()
+    except OSError:
+        pass
+
+
+def changed_build_inputs(project_path, build_mode, runtime_flags, inputs):
+    """
+    Inputs added or modified since the last successful build, or None when the whole
+    project rebuilds (no snapshot for this mode/runtime, or a config file changed).
+    """
+    previous = load_build_snapshots(project_path).get(snapshot_key(build_mode, runtime_flags))
+    if not previous:
+        return None
+    old_inputs = previous.get("inputs", {})
+    changed = [p for p, meta in inputs.items() if old_inputs.get(p) != meta]
+    if any(p in CONFIG_FILES for p in changed) or any(p in CONFIG_FILES and p not in inputs for p in old_inputs):
+        return None
+    return changed
+
+
+#----------Pre-flight Check----------
+def check_build_up_to_date(project_path, build_mode, runtime_flags):
+    """
+    Compare the current build inputs against the last successful build.
+    Returns (up_to_date, reason, inputs, elapsed_ms); inputs can be passed to
+    save_build_snapshot() once the build succeeds.
+    """
+    start = time.perf_counter()
+    inputs = scan_build_inputs(project_path)
+
+    def result(up_to_date, reason):
+        return up_to_date, reason, inputs, (time.perf_counter() - start) * 1000.0
+
+    if "xmake.lua" not in inputs:
+        return result(False, "xmake.lua not found")
+    if not (Path(project_path) / ".xmake").is_dir():
+        return result(False, "project is not configured")
+
+    previous = load_build_snapshots(project_path).get(snapshot_key(build_mode, runtime_flags))
+    if not previous:
+        return result(False, "no previous build for this mode/runtime")
+
+    old_inputs = previous.get("inputs", {})
+    if old_inputs == inputs:
+        return result(True, "no source, header or config changes")
+
+    changed = [p for p, meta in inputs.items() if old_inputs.get(p) != meta]
+    removed = [p for p in old_inputs if p not in inputs]
+    if changed:
+        reason = f"{len(changed)} file(s) changed, e.g. {changed[0]}"
+    else:
+        reason = f"{len(removed)} file(s) removed, e.g. {removed[0]}"
+    return result(False, reason)
@@ -0,0 +1,250 @@
+import os
+import stat
+import time
+import shutil
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from modules.build_snapshot import invalidate_build_snapshots
+
+#----------Clean Scopes----------
+# objects  - compiler intermediates only (build/.objs, .deps, .gens); keeps .xmake config and linked outputs
+# mode     - intermediates and outputs of one build mode (release/debug/releasedbg)
+# packages - the project's .xmake/ configuration and package cache
+# all      - build/ and .xmake/ (the old behaviour)
+CLEAN_SCOPES = {
+    "objects": "Objects only",
+    "mode": "Current build mode",
+    "packages": "Package cache (.xmake)",
+    "all": "Everything (build + .xmake)",
+}
+
+INTERMEDIATE_DIRS = (".objs", ".deps", ".gens")
+
+# Trees with more files than this are removed with a thread pool
+PARALLEL_DELETE_THRESHOLD = 2000
+TRASH_DIR_NAME = ".clibdt_trash"
+
+_pending_deletes = []
+_pending_lock = threading.Lock()
+_trash_swept = False
+
+
+def runtime_from_flags(runtime_flags):
+    """Map xmake runtime flags to the runtime name used by the generated xmake.lua"""
+    flags = set(runtime_flags or [])
+    if "--skyrim_vr=y" in flags:
+        return "vr"
+    se = "--skyrim_se=y" in flags
+    ae = "--skyrim_ae=y" in flags
+    if ae and not se:
+        return "ae"
+    if se and not ae:
+        return "se"
+    return "se_ae"
+
+
+#----------Deletion----------
+def _make_writable_and_retry(func, path, exc_info):
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except Exception:
+        pass
+
+
+def _remove_file(path):
+    try:
+        os.unlink(path)
+    except PermissionError:
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            os.unlink(path)
+        except OSError:
+            pass
+    except OSError:
+        pass
+
+
+def _remove_batch(paths):
+    for path in paths:
+        _remove_file(path)
+
+
+def delete_tree_parallel(path, max_workers=None):
+    """Delete a directory tree, spreading file removal over a thread pool for large trees"""
+    path = Path(path)
+    if not path.exists():
+        return
+
+    files = []
+    dirs = []
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError:
+            continue
+
+    if len(files) < PARALLEL_DELETE_THRESHOLD:
+        shutil.rmtree(path, onerror=_make_writable_and_retry)
+        return
+
+    # File unlinks are I/O bound and release the GIL, so threads scale on Windows/NTFS
+    workers = max_workers or min(32, (os.cpu_count() or 4) * 2)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chunk = max(64, len(files) // (workers * 4))
+        for i in range(0, len(files), chunk):
+            pool.submit(_remove_batch, files[i:i + chunk])
+
+    # Directories are removed deepest first once they are empty
+    for d in sorted(dirs, key=len, reverse=True):
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+    if path.exists():
+        shutil.rmtree(path, onerror=_make_writable_and_retry)
+
+
+def _trash_root(folder):
+    dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
+    if dev_root:
+        return Path(dev_root) / TRASH_DIR_NAME
+    return Path(folder).parent / TRASH_DIR_NAME
+
+
+def _start_background_delete(path):
+    thread = threading.Thread(target=delete_tree_parallel, args=(path,), daemon=True)
+    with _pending_lock:
+        _pending_deletes[:] = [t for t in _pending_deletes if t.is_alive()]
+        _pending_deletes.append(thread)
+    thread.start()
+
+
+def sweep_trash(folder=None):
+    """Delete leftovers from earlier sessions that were interrupted mid-delete"""
+    global _trash_swept
+    trash = _trash_root(folder or Path.cwd())
+    _trash_swept = True
+    if not trash.is_dir():
+        return
+    for entry in trash.iterdir():
+        _start_background_delete(entry)
+
+
+def discard_folder(folder, background=True):
+    """
+    Remove a folder the fast way: rename it into the trash (same volume, instant)
+    and delete it on a background thread. Falls back to an in-place delete when
+    the rename is not possible. Returns True if the folder is gone from its path.
+    """
+    folder = Path(folder)
+    if not folder.exists():
+        return True
+
+    if not _trash_swept:
+        sweep_trash(folder)
+
+    trash = _trash_root(folder)
+    target = trash / f"{folder.name}-{time.time_ns()}"
+    try:
+        trash.mkdir(parents=True, exist_ok=True)
+        os.rename(folder, target)
+    except OSError:
+        # Different volume or locked file: delete where it is
+        delete_tree_parallel(folder)
+        return not folder.exists()
+
+    if background:
+        _start_background_delete(target)
+    else:
+        delete_tree_parallel(target)
+    return True
+
+
+def wait_for_pending_deletes(timeout=None):
+    """Block until background deletes finish (used by the CLI before exiting)"""
+    with _pending_lock:
+        threads = list(_pending_deletes)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for thread in threads:
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        thread.join(remaining)
+
+
+#----------Scope Resolution----------
+def _mode_dirs(build_dir, build_mode):
+    """Find build/<plat>/<arch>/<mode> and build/.objs/<target>/<plat>/<arch>/<mode> style folders"""
+    found = []
+    if not build_dir.is_dir() or not build_mode:
+        return found
+    for root, dirnames, _ in os.walk(build_dir):
+        depth = len(Path(root).relative_to(build_dir).parts)
+        for name in list(dirnames):
+            if name.lower() == build_mode.lower():
+                found.append(Path(root) / name)
+                dirnames.remove(name)
+        # Mode folders never sit deeper than .objs/<target>/<plat>/<arch>
+        if depth >= 4:
+            dirnames[:] = []
+    return found
+
+
+def resolve_clean_targets(project_path, scope="all", build_mode=None):
+    """List the folders a clean of the given scope would remove"""
+    project_path = Path(project_path)
+    build_dir = project_path / "build"
+    xmake_dir = project_path / ".xmake"
+
+    if scope == "objects":
+        return [build_dir / d for d in INTERMEDIATE_DIRS if (build_dir / d).is_dir()]
+    if scope == "mode":
+        return _mode_dirs(build_dir, build_mode)
+    if scope == "packages":
+        return [xmake_dir] if xmake_dir.is_dir() else []
+    return [d for d in (build_dir, xmake_dir) if d.is_dir()]
+
+
+def clean_project_scope(project_path, scope="all", build_mode=None, status_callback=None, background=True):
+    """Clean part of a project's build state; returns the list of removed folders"""
+    def status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    if scope not in CLEAN_SCOPES:
+        status(f"[ERROR] Unknown clean scope: {scope}")
+        return []
+
+    project_path = Path(project_path)
+    start = time.perf_counter()
+    targets = resolve_clean_targets(project_path, scope, build_mode)
+    if not targets:
+        status(f"[INFO] Nothing to clean for scope: {CLEAN_SCOPES[scope]}")
+
+    removed = []
+    for folder in targets:
+        rel = folder.relative_to(project_path).as_posix()
+        try:
+            if discard_folder(folder, background=background):
+                removed.append(folder)
+                status(f"[OK] {rel}/ removed.")
+            else:
+                status(f"[ERROR] Failed to delete {rel}/")
+        except Exception as e:
+            status(f"[ERROR] Failed to delete {rel}/: {e}")
+
+    # Objects are gone, so the pre-flight snapshot no longer describes the build
+    invalidate_build_snapshots(project_path)
+
+    if removed:
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        status(f"[INFO] Clean ({CLEAN_SCOPES[scope]}) finished in {elapsed_ms:.0f} ms")
+    return removed
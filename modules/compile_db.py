@@ -0,0 +1,201 @@
+import os
+import re
+import json
+import hashlib
+import tempfile
+import subprocess
+import sys
+from pathlib import Path
+
+from modules.clean_engine import runtime_from_flags
+
+#----------Compile Database Settings----------
+CACHE_DIR = Path("build") / ".clibdt" / "compile_commands"
+INDEX_FILE = "index.json"
+OUTPUT_FILE = "compile_commands.json"
+# Environment that identifies the MSVC toolchain a configure ran against
+TOOLCHAIN_ENV_VARS = ("XSE_MSVCTOOLS_ROOT", "VCToolsVersion", "VCToolsInstallDir", "WindowsSDKVersion")
+# Source patterns of xmake.lua; the database has one entry per file they match
+ADD_FILES_RE = re.compile(r'add_files\(([^)]*)\)')
+DEFAULT_SOURCE_PATTERNS = ("src/**.cpp",)
+
+
+#----------Fingerprint----------
+def _file_digest(path):
+    try:
+        return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _pattern_regex(pattern):
+    """xmake file pattern as a regex: ** crosses folders, * and ? stay inside one"""
+    parts = re.split(r"(\*\*|\*|\?)", pattern)
+    wildcards = {"**": ".*", "*": "[^/]*", "?": "[^/]"}
+    return re.compile("".join(wildcards.get(part) or re.escape(part) for part in parts) + "$")
+
+
+def source_files(project_path):
+    """Sorted relative paths matched by the add_files() patterns of xmake.lua"""
+    project_path = Path(project_path)
+    try:
+        text = (project_path / "xmake.lua").read_text(encoding="utf-8")
+    except OSError:
+        text = ""
+    patterns = [p for args in ADD_FILES_RE.findall(text) for p in re.findall(r'"([^"]+)"', args)]
+    matched = set()
+    for pattern in patterns or DEFAULT_SOURCE_PATTERNS:
+        # Exclusions after | only narrow the match; listing a few extra files is harmless
+        pattern = pattern.split("|", 1)[0].replace("\\", "/").removeprefix("./")
+        base = pattern.split("*", 1)[0].split("?", 1)[0].rpartition("/")[0]
+        regex = _pattern_regex(pattern)
+        for dir_path, dir_names, file_names in os.walk(project_path / base):
+            dir_names[:] = [d for d in dir_names if not d.startswith(".")]
+            rel_dir = Path(dir_path).relative_to(project_path).as_posix()
+            for name in file_names:
+                rel = name if rel_dir == "." else f"{rel_dir}/{name}"
+                if regex.match(rel):
+                    matched.add(rel)
+    return sorted(matched)
+
+
+def compile_db_key(build_mode, runtime_flags):
+    return f"{build_mode}-{runtime_from_flags(runtime_flags)}"
+
+
+def compile_db_fingerprint(project_path, build_mode, runtime_flags, env=None, xmake_path=None):
+    """
+    Hash of everything that changes the compile commands: mode, flags, toolchain, xmake.lua
+    and the list of source files it matches (adding or removing a .cpp adds or drops an entry)
+    """
+    env = env or os.environ
+    parts = [
+        build_mode,
+        " ".join(sorted(runtime_flags or [])),
+        str(xmake_path or ""),
+        *(f"{name}={env.get(name, '')}" for name in TOOLCHAIN_ENV_VARS),
+        _file_digest(Path(project_path) / "xmake.lua"),
+        *source_files(project_path),
+    ]
+    return hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+#----------Cache----------
+def _cache_dir(project_path):
+    return Path(project_path) / CACHE_DIR
+
+
+def _load_index(project_path):
+    try:
+        with open(_cache_dir(project_path) / INDEX_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _atomic_write_bytes(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _save_index(project_path, index):
+    _atomic_write_bytes(_cache_dir(project_path) / INDEX_FILE, json.dumps(index, indent=2).encode("utf-8"))
+
+
+def is_compile_db_fresh(project_path, build_mode, runtime_flags, fingerprint):
+    key = compile_db_key(build_mode, runtime_flags)
+    cached = _cache_dir(project_path) / f"{key}.json"
+    return _load_index(project_path).get(key) == fingerprint and cached.is_file()
+
+
+#----------Generation----------
+def generate_compile_db(project_path, build_mode, runtime_flags, xmake_path, env=None, fingerprint=None):
+    """
+    Ask xmake to export the database for the current configuration (no compile is run)
+    and store it in the per mode/runtime cache. Returns True on success.
+    """
+    project_path = Path(project_path)
+    key = compile_db_key(build_mode, runtime_flags)
+    cache_dir = _cache_dir(project_path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(dir=cache_dir) as out_dir:
+        creationflags = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
+        result = subprocess.run([xmake_path, "project", "-k", "compile_commands", out_dir],
+                                cwd=project_path, env=env, capture_output=True, text=True,
+                                creationflags=creationflags)
+        generated = Path(out_dir) / OUTPUT_FILE
+        if result.returncode != 0 or not generated.is_file():
+            return False
+        try:
+            json.loads(generated.read_text(encoding="utf-8"))
+        except ValueError:
+            return False
+        os.replace(generated, cache_dir / f"{key}.json")
+
+    index = _load_index(project_path)
+    index[key] = fingerprint or compile_db_fingerprint(project_path, build_mode, runtime_flags, env, xmake_path)
+    _save_index(project_path, index)
+    return True
+
+
+def install_compile_db(project_path, build_mode, runtime_flags, merge_runtimes=False):
+    """
+    Publish the cached database as <project>/compile_commands.json. With merge_runtimes the
+    other runtimes of the same mode are appended for files the current one does not cover.
+    The file is only rewritten when its content changes so editors do not re-index needlessly.
+    """
+    project_path = Path(project_path)
+    cache_dir = _cache_dir(project_path)
+    key = compile_db_key(build_mode, runtime_flags)
+    try:
+        entries = json.loads((cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+
+    if merge_runtimes:
+        seen = {entry.get("file") for entry in entries}
+        for other in sorted(cache_dir.glob(f"{build_mode}-*.json")):
+            if other.stem == key:
+                continue
+            try:
+                for entry in json.loads(other.read_text(encoding="utf-8")):
+                    if entry.get("file") not in seen:
+                        seen.add(entry.get("file"))
+                        entries.append(entry)
+            except (OSError, ValueError):
+                continue
+
+    data = json.dumps(entries, indent=2).encode("utf-8")
+    output = project_path / OUTPUT_FILE
+    try:
+        if output.is_file() and output.read_bytes() == data:
+            return True
+    except OSError:
+        pass
+    _atomic_write_bytes(output, data)
+    return True
+
+
+def ensure_compile_db(project_path, build_mode, runtime_flags, xmake_path, env=None,
+                      merge_runtimes=False, status_callback=None):
+    """Regenerate the database only when the configure inputs changed, then publish it"""
+    def status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    fingerprint = compile_db_fingerprint(project_path, build_mode, runtime_flags, env, xmake_path)
+    if is_compile_db_fresh(project_path, build_mode, runtime_flags, fingerprint):
+        status("[INFO] compile_commands.json is current for this configuration.")
+    else:
+        status("[INFO] Configure inputs changed, exporting compile_commands.json...")
+        if not generate_compile_db(project_path, build_mode, runtime_flags, xmake_path, env, fingerprint):
+            status("[WARN] xmake could not export compile_commands.json")
+            return False
+    if install_compile_db(project_path, build_mode, runtime_flags, merge_runtimes):
+        return True
+    status("[WARN] Failed to write compile_commands.json")
+    return False
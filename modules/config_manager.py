@@ -1,81 +1,291 @@
-from pathlib import Path
-import json
 import os
-from typing import Any, Dict, Optional
-
-class ConfigManager:
-    """Centralized configuration management for ClibDT"""
-    
-    def __init__(self):
-        # Use config folder in parent root
-        self.config_dir = Path(__file__).parent.parent / "config"
-        self.config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-    
-    def get_config_path(self, filename: str) -> Path:
-        """Get full path for a config file"""
-        return self.config_dir / filename
-    
-    def save_json(self, filename: str, data: Dict[str, Any]) -> bool:
-        """Save data to a JSON config file"""
-        try:
-            config_file = self.get_config_path(filename)
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"[ERROR] Failed to save config {filename}: {e}")
-            return False
-    
-    def load_json(self, filename: str) -> Optional[Dict[str, Any]]:
-        """Load data from a JSON config file"""
-        try:
-            config_file = self.get_config_path(filename)
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return None
-        except Exception as e:
-            print(f"[ERROR] Failed to load config {filename}: {e}")
-            return None
-    
-    def save_text(self, filename: str, content: str) -> bool:
-        """Save text content to a config file"""
-        try:
-            config_file = self.get_config_path(filename)
-            with open(config_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        except Exception as e:
-            print(f"[ERROR] Failed to save config {filename}: {e}")
-            return False
-    
-    def load_text(self, filename: str) -> Optional[str]:
-        """Load text content from a config file"""
-        try:
-            config_file = self.get_config_path(filename)
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return f.read()
-            return None
-        except Exception as e:
-            print(f"[ERROR] Failed to load config {filename}: {e}")
-            return None
-    
-    def file_exists(self, filename: str) -> bool:
-        """Check if a config file exists"""
-        return self.get_config_path(filename).exists()
-    
-    def delete_file(self, filename: str) -> bool:
-        """Delete a config file"""
+import copy
+import json
+import time
+import atexit
+import threading
+
+from modules.config_utils import get_config_directory
+
+#----------Config Store Settings----------
+# Changes are written this long after the last one, so a burst of UI events costs one write
+FLUSH_DELAY = 0.5
+# A stream of changes that never settles is still written at least this often
+MAX_FLUSH_DELAY = 3.0
+
+#----------Namespaces----------
+# Preferences file and keys of each namespace. A key's default also fixes its type
+# (None accepts anything); keys not listed here are kept as they are
+NAMESPACES = {
+    "settings": ("clibdt_settings.json", {
+        "theme": "dark",
+        "version_check_enabled": True,
+    }),
+    "build": ("clibdt_build_config.json", {
+        "build_mode": "Release",
+        "runtime": "SE + AE (dual)",
+        "clean_build": False,
+        "clean_scope": "all",
+        "force_build": False,
+        "watch_mode": False,
+        "deploy": False,
+        "merge_compile_db": False,
+        "object_cache": False,
+        "project": None,
+    }),
+    "update_deps": ("clibdt_update_prefs.json", {
+        "update_packages": True,
+        "upgrade_deps": True,
+        "last_project": None,
+    }),
+    "refresh": ("clibdt_refresh_prefs.json", {
+        "last_project": None,
+    }),
+    "detach": ("clibdt_detach_prefs.json", {
+        "last_project": None,
+    }),
+    "tool_paths": ("clibdt_tool_paths_config.json", {
+        "vs_buildtools_path": None,
+        "xmake_path": None,
+        "git_path": None,
+        "skse_path": None,
+        "github_desktop_path": None,
+    }),
+    "launcher": ("clibdt_launcher_config.json", {
+        "pinned_items": [],
+        "preferred_code_editor": "",
+    }),
+    "backup": ("clibdt_backup_config.json", {
+        "last_backup_path": None,
+        "last_backup_timestamp": None,
+    }),
+    "deploy": ("clibdt_deploy_config.json", {
+        "targets": {},
+    }),
+}
+
+_MISSING = object()
+
+
+def _matches(default, value):
+    """True when value has the type the namespace declares for its key"""
+    if default is None:
+        return True
+    if isinstance(default, bool):
+        return isinstance(value, bool)
+    return isinstance(value, type(default)) and not isinstance(value, bool)
+
+
+def _copy(value):
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+def _atomic_write_text(path, text):
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class ConfigNamespace:
+    """
+    One preferences file, read once and then served from memory. set()/update() only touch
+    the cached values; the store writes the file behind them, so UI handlers never do I/O.
+    """
+
+    def __init__(self, store, name, filename, defaults):
+        self.store = store
+        self.name = name
+        self.filename = filename
+        self.defaults = defaults
+        self._values = None
+        self._path = None
+
+    def _ensure_loaded(self):
+        """Cached values for the current config directory (call with the store lock held)"""
+        config_dir = self.store.config_dir()
+        if self._values is None:
+            self._path = config_dir / self.filename
+            self._values = self._read()
+        return self._values
+
+    def _read(self):
         try:
-            config_file = self.get_config_path(filename)
-            if config_file.exists():
-                config_file.unlink()
-                return True
-            return False
-        except Exception as e:
-            print(f"[ERROR] Failed to delete config {filename}: {e}")
-            return False
-
-# Global config manager instance
-config_manager = ConfigManager() 
\ No newline at end of file
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Could not read {self.filename}: {e}")
+            return {}
+        if not isinstance(data, dict):
+            print(f"[WARN] Ignoring {self.filename}: expected a JSON object")
+            return {}
+        # Drop values of the wrong type so get() falls back to the default
+        return {key: value for key, value in data.items()
+                if key not in self.defaults or _matches(self.defaults[key], value)}
+
+    def get(self, key, default=_MISSING):
+        with self.store.lock:
+            values = self._ensure_loaded()
+            if key in values:
+                return _copy(values[key])
+        if default is _MISSING:
+            return _copy(self.defaults.get(key))
+        return default
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def update(self, values=None, **kwargs):
+        """Change several keys at once; unchanged values do not schedule a write"""
+        values = dict(values or {}, **kwargs)
+        for key, value in values.items():
+            if key in self.defaults and not _matches(self.defaults[key], value):
+                raise TypeError(f"{self.name}.{key} expects {type(self.defaults[key]).__name__}, "
+                                f"got {type(value).__name__}")
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError) as e:
+                raise TypeError(f"{self.name}.{key} must be JSON serializable: {e}") from None
+        with self.store.lock:
+            current = self._ensure_loaded()
+            changed = False
+            for key, value in values.items():
+                if current.get(key, _MISSING) != value:
+                    current[key] = _copy(value)
+                    changed = True
+            if changed:
+                self.store.mark_dirty(self)
+
+    def as_dict(self):
+        """Defaults overlaid with the stored values"""
+        with self.store.lock:
+            values = dict(self.defaults, **self._ensure_loaded())
+        return {key: _copy(value) for key, value in values.items()}
+
+
+class ConfigStore:
+    """
+    Central, in-memory cache of the preferences files in the config directory. Changed
+    namespaces are written by a background thread once changes settle (FLUSH_DELAY, at most
+    MAX_FLUSH_DELAY after the first one) with a temp file and os.replace, and flushed at exit.
+    """
+
+    def __init__(self, flush_delay=FLUSH_DELAY, max_delay=MAX_FLUSH_DELAY):
+        self.flush_delay = flush_delay
+        self.max_delay = max_delay
+        self.lock = threading.RLock()
+        self._wake = threading.Condition(self.lock)
+        self._flush_lock = threading.Lock()
+        self._namespaces = {}
+        self._dirty = set()
+        # Snapshots of changes made before the dev root moved, still owed to the old directory
+        self._detached = []
+        self._first_change = None
+        self._last_change = None
+        self._writer = None
+        self._config_dir = None
+        self._dev_root = None
+        self.changes = 0
+        self.writes = 0
+
+    def namespace(self, name):
+        with self.lock:
+            namespace = self._namespaces.get(name)
+            if namespace is None:
+                filename, defaults = NAMESPACES[name]
+                namespace = self._namespaces[name] = ConfigNamespace(self, name, filename, defaults)
+            return namespace
+
+    def config_dir(self):
+        """The config directory, resolved again only when the dev root changes"""
+        dev_root = os.environ.get('XSE_CLIBDT_DEVROOT')
+        with self.lock:
+            if self._config_dir is None or dev_root != self._dev_root:
+                if self._config_dir is not None:
+                    # Pending changes belong to the old directory; reload from the new one
+                    self._detached.extend(self._snapshots(self._dirty))
+                    self._dirty.clear()
+                    for namespace in self._namespaces.values():
+                        namespace._values = None
+                self._config_dir = get_config_directory()
+                self._dev_root = dev_root
+            return self._config_dir
+
+    def mark_dirty(self, namespace):
+        with self.lock:
+            now = time.monotonic()
+            if not self._dirty and not self._detached:
+                self._first_change = now
+            self._last_change = now
+            self._dirty.add(namespace)
+            self.changes += 1
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="ClibDT-config", daemon=True)
+                self._writer.start()
+            self._wake.notify()
+
+    def _write_behind(self):
+        while True:
+            with self.lock:
+                while True:
+                    if not self._dirty and not self._detached:
+                        self._wake.wait()
+                        continue
+                    due = min(self._last_change + self.flush_delay, self._first_change + self.max_delay)
+                    remaining = due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+            try:
+                self.flush()
+            except Exception as e:
+                # The writer must survive anything, or later changes are only saved at exit
+                print(f"[WARN] Config writer: {e}")
+
+    @staticmethod
+    def _snapshots(namespaces):
+        """(path, text) of each namespace; one that cannot be serialized is skipped with a warning"""
+        snapshots = []
+        for namespace in namespaces:
+            try:
+                snapshots.append((namespace._path, json.dumps(namespace._values, indent=2)))
+            except (TypeError, ValueError) as e:
+                print(f"[WARN] Could not save {namespace.filename}: {e}")
+        return snapshots
+
+    def flush(self):
+        """Write every changed namespace now; returns the number of files written"""
+        # Never taken while holding self.lock, so files are written without blocking readers
+        with self._flush_lock:
+            with self.lock:
+                pending = self._detached + self._snapshots(self._dirty)
+                self._detached = []
+                self._dirty.clear()
+                self._first_change = None
+            written = 0
+            for path, text in pending:
+                try:
+                    _atomic_write_text(path, text)
+                    written += 1
+                except Exception as e:
+                    print(f"[WARN] Could not save {path.name}: {e}")
+            self.writes += written
+            return written
+
+
+# Global config store; panels take their namespace with get_config_namespace()
+config_store = ConfigStore()
+atexit.register(config_store.flush)
+
+
+def get_config_namespace(name):
+    """Shared namespace of the global config store (see NAMESPACES)"""
+    return config_store.namespace(name)
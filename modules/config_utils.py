@@ -38,7 +38,8 @@ def migrate_config_files(old_dir, new_dir):
             "clibdt_launcher_config.json",
             "clibdt_detach_prefs.json",
             "clibdt_build_config.json",
-            "clibdt_backup_config.json"
+            "clibdt_backup_config.json",
+            "clibdt_deploy_config.json"
         ]
         
         for config_file in config_files:
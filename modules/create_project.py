@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushBut
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 from modules.progress_widget import ProgressWidget
+from modules.theme_manager import set_theme_scope
 
 init(autoreset=True)
 
@@ -600,6 +601,7 @@ class CreateProjectPanel(QWidget):
     project_created = pyqtSignal()
     def __init__(self, parent=None, status_callback=None, theme_manager=None):
         super().__init__(parent)
+        set_theme_scope(self, "CreateProjectPanel")
         self.status_callback = status_callback
         self.theme_manager = theme_manager
         layout = QVBoxLayout()
@@ -749,25 +751,6 @@ class CreateProjectPanel(QWidget):
         layout.addStretch()
         
         self.setLayout(layout)
-        
-        # Connect to theme manager if provided
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-    
-    def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
-        super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        # Apply theme when panel is shown
-        self.apply_theme()
     
     def status(self, msg):
         if self.status_callback:
@@ -917,49 +900,3 @@ class CreateProjectPanel(QWidget):
     
     def set_theme_manager(self, theme_manager):
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-
-    def apply_theme(self):
-        """Apply current theme to the panel"""
-        if self.theme_manager:
-            self.setStyleSheet(self.theme_manager.get_create_project_style())
-        else:
-            # Fallback styling
-            try:
-                from modules.theme_manager import ThemeManager
-                fallback_manager = ThemeManager()
-                self.setStyleSheet(fallback_manager.get_create_project_style())
-            except Exception:
-                # Ultimate fallback with basic styling
-                self.setStyleSheet("""
-                    QWidget {
-                        background-color: #1e1e1e;
-                        color: #e0e0e0;
-                        font-family: 'Segoe UI', Arial, sans-serif;
-                    }
-                    QLabel {
-                        background-color: transparent;
-                        color: #e0e0e0;
-                        font-size: 11px;
-                    }
-                    QLineEdit {
-                        background-color: #2d2d2d;
-                        color: #e0e0e0;
-                        border: 2px solid #404040;
-                        border-radius: 4px;
-                        padding: 6px 8px;
-                        font-size: 11px;
-                    }
-                    QPushButton {
-                        background-color: #0078d4;
-                        color: #ffffff;
-                        border: 1px solid #0078d4;
-                        border-radius: 4px;
-                        padding: 8px 16px;
-                        font-size: 11px;
-                        font-weight: bold;
-                    }
-                """)
-
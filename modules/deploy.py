@@ -0,0 +1,214 @@
+import os
+import re
+import time
+import hashlib
+import shutil
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.config_manager import get_config_namespace
+from modules.clean_engine import runtime_from_flags
+
+#----------Deploy Settings----------
+ARTIFACT_EXTENSIONS = (".dll", ".pdb")
+# Used when no target is configured for a runtime; {project} is the project folder name
+DEFAULT_TARGET_TEMPLATE = "{mods}/{project}/SKSE/Plugins"
+# A dual SE+AE DLL loads on both runtimes, so it goes to their targets too
+RUNTIME_TARGET_KEYS = {
+    "se_ae": ("se_ae", "se", "ae"),
+    "se": ("se",),
+    "ae": ("ae",),
+    "vr": ("vr",),
+}
+HASH_CHUNK = 1024 * 1024
+
+
+#----------Configuration----------
+def load_deploy_config():
+    """
+    Load deploy targets: {"targets": {"se_ae": [...], "se": [...], "ae": [...], "vr": [...]}}.
+    Paths may use {project} and {mods} (XSE_TES5_MODS_PATH) placeholders.
+    """
+    return {"targets": get_config_namespace("deploy").get("targets")}
+
+
+def resolve_deploy_targets(project_path, runtime_flags, status_callback=None):
+    """
+    List destination folders for this project and runtime. Entries that are not strings,
+    need {mods} while XSE_TES5_MODS_PATH is unset, use unknown placeholders or do not
+    resolve to an absolute folder below a drive root are skipped with a warning.
+    """
+    def status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    project_name = Path(project_path).name
+    mods = os.getenv("XSE_TES5_MODS_PATH", "")
+    configured = load_deploy_config()["targets"]
+    runtime = runtime_from_flags(runtime_flags)
+
+    templates = []
+    for key in RUNTIME_TARGET_KEYS.get(runtime, (runtime,)):
+        entries = configured.get(key, [])
+        templates.extend(entries if isinstance(entries, list) else [entries])
+    if not templates:
+        if not mods:
+            return []
+        templates = [DEFAULT_TARGET_TEMPLATE]
+
+    targets = []
+    for template in templates:
+        if not isinstance(template, str):
+            status(f"[WARN] Ignoring deploy target {template!r}: expected a path string")
+            continue
+        if "{mods}" in template and not mods:
+            status(f"[WARN] Ignoring deploy target {template}: XSE_TES5_MODS_PATH is not set")
+            continue
+        try:
+            path = Path(template.format(project=project_name, mods=mods))
+        except (KeyError, IndexError, ValueError) as e:
+            status(f"[WARN] Ignoring deploy target {template}: unknown or malformed placeholder {e}")
+            continue
+        if not path.is_absolute() or path == Path(path.anchor):
+            status(f"[WARN] Ignoring deploy target {path}: expected an absolute folder below a drive root")
+            continue
+        if path not in targets:
+            targets.append(path)
+    return targets
+
+
+#----------Artifacts----------
+def _target_name(project_path):
+    xmake_file = Path(project_path) / "xmake.lua"
+    try:
+        match = re.search(r'^\s*target\("([^"]+)"\)', xmake_file.read_text(encoding="utf-8"), re.MULTILINE)
+        if match:
+            return match.group(1)
+    except OSError:
+        pass
+    return None
+
+
+def find_build_artifacts(project_path, build_mode):
+    """Find the plugin DLL/PDB produced by xmake for this mode (build/windows/x64/<mode>)"""
+    build_dir = Path(project_path) / "build"
+    mode_dirs = [d for d in build_dir.glob(f"*/*/{build_mode}") if d.is_dir()]
+    target = _target_name(project_path)
+
+    artifacts = []
+    for mode_dir in mode_dirs:
+        for ext in ARTIFACT_EXTENSIONS:
+            if target and (mode_dir / f"{target}{ext}").is_file():
+                artifacts.append(mode_dir / f"{target}{ext}")
+            elif not target:
+                artifacts.extend(p for p in mode_dir.glob(f"*{ext}") if p.is_file())
+    return artifacts
+
+
+#----------Change Detection----------
+def _file_hash(path):
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def needs_copy(src, dest):
+    """Size and mtime first; equal sizes with different mtimes are settled by hash"""
+    try:
+        dst_stat = dest.stat()
+    except OSError:
+        return True
+    src_stat = src.stat()
+    if src_stat.st_size != dst_stat.st_size:
+        return True
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return False
+    if _file_hash(src) != _file_hash(dest):
+        return True
+    # Same content, just a newer build: sync the mtime so the next check is cheap
+    try:
+        os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    except OSError:
+        pass
+    return False
+
+
+def atomic_copy(src, dest):
+    """Copy next to the destination, then swap it in with a rename"""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest.with_name(f".{dest.name}.clibdt-{os.getpid()}.tmp")
+    try:
+        shutil.copy2(src, tmp_path)
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, dest)
+    finally:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+#----------Deploy----------
+def _deploy_to_target(artifacts, target):
+    """Copy changed artifacts into one target; returns (target, copied, skipped, errors, ms)"""
+    start = time.perf_counter()
+    copied, skipped, errors = [], [], []
+    for src in artifacts:
+        dest = target / src.name
+        try:
+            if needs_copy(src, dest):
+                atomic_copy(src, dest)
+                copied.append(src.name)
+            else:
+                skipped.append(src.name)
+        except PermissionError:
+            errors.append(f"{src.name} is in use (is the game or mod manager running?)")
+        except OSError as e:
+            errors.append(f"{src.name}: {e}")
+    return target, copied, skipped, errors, (time.perf_counter() - start) * 1000.0
+
+
+def deploy_build(project_path, build_mode, runtime_flags, status_callback=None):
+    """Deploy the built plugin to every target for the runtime in parallel; returns True if nothing failed"""
+    def status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    # A broken deploy setup must not turn a finished build into a failed one
+    try:
+        return _deploy_build(project_path, build_mode, runtime_flags, status)
+    except Exception as e:
+        status(f"[ERROR] Deploy failed: {e}")
+        return False
+
+
+def _deploy_build(project_path, build_mode, runtime_flags, status):
+    start = time.perf_counter()
+    artifacts = find_build_artifacts(project_path, build_mode)
+    if not artifacts:
+        status(f"[WARN] Deploy skipped: no DLL/PDB found in build/*/*/{build_mode}")
+        return False
+
+    targets = resolve_deploy_targets(project_path, runtime_flags, status)
+    if not targets:
+        status("[WARN] Deploy skipped: no usable deploy target (set XSE_TES5_MODS_PATH or configure targets)")
+        return False
+
+    ok = True
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        for target, copied, skipped, errors, elapsed_ms in pool.map(lambda t: _deploy_to_target(artifacts, t), targets):
+            if copied:
+                status(f"[OK] Deployed {', '.join(copied)} -> {target} ({elapsed_ms:.0f} ms)")
+            if skipped and not copied and not errors:
+                status(f"[INFO] {target} already up to date ({elapsed_ms:.0f} ms)")
+            for error in errors:
+                ok = False
+                status(f"[ERROR] Deploy to {target} failed: {error}")
+
+    status(f"[INFO] Deploy finished in {(time.perf_counter() - start) * 1000.0:.0f} ms "
+           f"({len(artifacts)} file(s), {len(targets)} target(s))")
+    return ok
@@ -10,6 +10,7 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QFont
 from modules.utilities.common import VERSION
 from modules.config_utils import get_config_directory
+from modules.theme_manager import set_theme_scope
 
 
 class ExplorerPanel(QWidget):
@@ -17,14 +18,11 @@ class ExplorerPanel(QWidget):
 
     def __init__(self, parent=None, status_callback=None, theme_manager=None):
         super().__init__(parent)
+        set_theme_scope(self, "ExplorerPanel")
         self.status_callback = status_callback
         self.theme_manager = theme_manager
         self.current_theme = 'dark'
 
-        # Connect to theme changes if theme manager is provided
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-
         # Main layout with proper spacing (AI Theme Instructions)
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
@@ -67,26 +65,9 @@ class ExplorerPanel(QWidget):
         # Load folders on initialization
         self.load_folders()
 
-    def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
-        super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        # Apply theme when panel is shown
-        self.apply_theme()
-
     def set_theme_manager(self, theme_manager):
         """Set the theme manager for this panel"""
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
 
     def get_dev_root(self):
         """Get the development root directory"""
@@ -205,124 +186,3 @@ class ExplorerPanel(QWidget):
             self.status_callback(message)
         else:
             print(message)
-
-    def apply_theme(self):
-        """Apply current theme to the panel"""
-        if self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            # Fallback theme
-            theme = {
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'bg_secondary': '#252525',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'text_light': '#ffffff',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'separator': '#404040',
-                'success_color': '#27ae60',
-                'error_color': '#e74c3c',
-                'warning_color': '#f39c12',
-                'info_color': '#3498db',
-                'menu_item_selected': '#0078d4',
-                'scrollbar_bg': '#2d2d2d',
-                'scrollbar_handle': '#404040',
-                'scrollbar_handle_hover': '#505050'
-            }
-
-        # Apply comprehensive theme styling
-        self.setStyleSheet(f"""
-            /* Main panel styling */
-            ExplorerPanel {{
-                background-color: {theme['window_bg']};
-                color: {theme['text_primary']};
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-
-            /* Main title styling */
-            ExplorerPanel QLabel#main_title {{
-                font-size: 18px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                padding: 6px 0px !important;
-                background: transparent !important;
-            }}
-
-            /* Divider lines */
-            ExplorerPanel QLabel#title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-
-            /* Section descriptions */
-            ExplorerPanel QLabel#section_desc {{
-                color: {theme['text_secondary']} !important;
-                font-size: 10px !important;
-                margin-bottom: 6px !important;
-                background: transparent !important;
-            }}
-
-            /* Folders list styling */
-            ExplorerPanel QListWidget#folders_list {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 6px !important;
-                padding: 8px !important;
-                font-size: 11px !important;
-                selection-background-color: {theme['menu_item_selected']} !important;
-                selection-color: {theme['text_light']} !important;
-            }}
-
-            ExplorerPanel QListWidget::item {{
-                background-color: transparent !important;
-                border: none !important;
-                border-radius: 4px !important;
-                padding: 8px 12px !important;
-                margin: 2px 0px !important;
-                font-weight: normal !important;
-            }}
-
-            ExplorerPanel QListWidget::item:hover {{
-                background-color: {theme['bg_secondary']} !important;
-            }}
-
-            ExplorerPanel QListWidget::item:selected {{
-                background-color: {theme['menu_item_selected']} !important;
-                color: {theme['text_light']} !important;
-                font-weight: bold !important;
-            }}
-
-            /* Scrollbar styling */
-            ExplorerPanel QListWidget QScrollBar:vertical {{
-                background-color: {theme['scrollbar_bg']} !important;
-                width: 8px !important;
-                border-radius: 4px !important;
-            }}
-
-            ExplorerPanel QListWidget QScrollBar::handle:vertical {{
-                background-color: {theme['scrollbar_handle']} !important;
-                border-radius: 4px !important;
-                min-height: 20px !important;
-            }}
-
-            ExplorerPanel QListWidget QScrollBar::handle:vertical:hover {{
-                background-color: {theme['scrollbar_handle_hover']} !important;
-            }}
-
-            ExplorerPanel QListWidget QScrollBar::add-line:vertical, 
-            ExplorerPanel QListWidget QScrollBar::sub-line:vertical {{
-                height: 0px !important;
-            }}
-
-
-        """) 
\ No newline at end of file
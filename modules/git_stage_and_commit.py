@@ -5,6 +5,7 @@ from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                            QLineEdit, QTextEdit, QFrame, QGroupBox, QCheckBox, QSizePolicy)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from modules.theme_manager import set_theme_scope
 
 init(autoreset=True)
 
@@ -60,6 +61,7 @@ class GitCommitThread(QThread):
 class GitCommitPanel(QWidget):
     def __init__(self, parent=None, status_callback=None, theme_manager=None):
         super().__init__(parent)
+        set_theme_scope(self, "GitCommitPanel")
         self.status_callback = status_callback
         self.commit_thread = None
         self.theme_manager = theme_manager
@@ -146,233 +148,10 @@ class GitCommitPanel(QWidget):
         # Add stretch to prevent content from expanding to fill available space
         layout.addStretch()
         self.setLayout(layout)
-        
-        # Connect to theme manager if provided
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-    
-    def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
-        super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        # Apply theme when panel is shown
-        self.apply_theme()
     
     def set_theme_manager(self, theme_manager):
         """Set the theme manager for this panel"""
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-    
-    def apply_theme(self):
-        """Apply current theme to the panel"""
-        if self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            # Fallback theme
-            theme = {
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'bg_secondary': '#252525',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'text_light': '#ffffff',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'separator': '#404040',
-                'success_color': '#27ae60',
-                'error_color': '#e74c3c',
-                'warning_color': '#f39c12',
-                'info_color': '#3498db'
-            }
-        
-        # Ultra-compact styling that overrides ALL global styling
-        self.setStyleSheet(f"""
-            /* Nuclear option: Override ALL global styling with ultra-compact layout */
-            GitCommitPanel,
-            GitCommitPanel * {{
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                background-color: {theme['window_bg']} !important;
-                color: {theme['text_primary']} !important;
-                font-family: 'Segoe UI', Arial, sans-serif !important;
-            }}
-            
-            /* Typography Hierarchy - Only headers are bold */
-            GitCommitPanel QLabel {{
-                background-color: transparent !important;
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                font-weight: normal !important;
-            }}
-            
-            /* Main title - largest and most prominent */
-            GitCommitPanel QLabel#main_title {{
-                font-size: 18px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                padding: 6px 0px !important;
-            }}
-            
-            /* Color-coded section titles */
-            GitCommitPanel QLabel#custom_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['info_color']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            GitCommitPanel QLabel#success_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['success_color']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            GitCommitPanel QLabel#section_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            /* Section descriptions */
-            GitCommitPanel QLabel#section_desc {{
-                color: {theme['text_secondary']} !important;
-                font-size: 10px !important;
-                margin-bottom: 6px !important;
-            }}
-            
-            /* Divider lines */
-            GitCommitPanel QLabel#title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            /* LineEdit styling - responsive resizing */
-            GitCommitPanel QLineEdit,
-            GitCommitPanel QLineEdit:hover,
-            GitCommitPanel QLineEdit:focus {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-                min-width: 120px !important;
-            }}
-            
-            GitCommitPanel QLineEdit:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            GitCommitPanel QLineEdit:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            /* CheckBox styling - transparent background */
-            GitCommitPanel QCheckBox {{
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                spacing: 8px !important;
-                padding: 2px 0px !important;
-                background: transparent !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-            }}
-            
-            GitCommitPanel QCheckBox::indicator {{
-                width: 16px !important;
-                height: 16px !important;
-                border: 2px solid {theme['input_border']} !important;
-                background-color: {theme['input_bg']} !important;
-                border-radius: 3px !important;
-            }}
-            
-            GitCommitPanel QCheckBox::indicator:checked {{
-                background-color: {theme['button_bg']} !important;
-                border-color: {theme['button_bg']} !important;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
-            }}
-            
-            GitCommitPanel QCheckBox:hover::indicator:unchecked {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            /* Base button styling for all states */
-            GitCommitPanel QPushButton,
-            GitCommitPanel QPushButton:hover,
-            GitCommitPanel QPushButton:pressed,
-            GitCommitPanel QPushButton:disabled {{
-                border: none !important;
-                padding: 8px 16px !important;
-                border-radius: 6px !important;
-                font-size: 11px !important;
-                font-weight: bold !important;
-                min-height: 16px !important;
-                margin: 2px 4px !important;
-            }}
-            
-            /* General disabled button styling (applies to ALL button types) */
-            GitCommitPanel QPushButton:disabled {{
-                background-color: {theme['text_secondary']} !important;
-                color: {theme['text_secondary']} !important;
-                opacity: 0.6 !important;
-            }}
-            
-            /* Success action buttons - Green theme with bright hover effects */
-            GitCommitPanel QPushButton[btnType="success"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['success_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            GitCommitPanel QPushButton[btnType="success"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
-                border: 2px solid #a9dfbf !important;
-                color: #ffffff !important;
-                padding: 7px 13px !important;
-            }}
-            
-            GitCommitPanel QPushButton[btnType="success"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954) !important;
-                border: 2px solid #1e8449 !important;
-                color: #ffffff !important;
-                padding: 8px 14px !important;
-            }}
-        """)
     
     def start_commit(self):
         commit_msg = self.commit_msg_edit.text().strip()
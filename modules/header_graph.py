@@ -0,0 +1,258 @@
+import os
+import re
+import sys
+import json
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.build_eta import load_tu_durations
+
+#----------Header Graph Settings----------
+SCAN_DIRS = ("src", "include", "ClibUtil", "xbyak")
+HEADER_EXTENSIONS = {".h", ".hpp", ".hh", ".hxx", ".inl", ".ipp"}
+SOURCE_EXTENSIONS = {".cpp", ".cc", ".cxx", ".c"}
+# Directories searched for quoted and angled includes, after the including file's own folder
+INCLUDE_ROOTS = ("", "src", "include")
+CACHE_FILE = Path("build") / ".clibdt" / "header_graph.json"
+CACHE_FORMAT = 1
+
+INCLUDE_RE = re.compile(rb'^[ \t]*#[ \t]*include[ \t]*[<"]([^">\r\n]+)[">]', re.MULTILINE)
+PCH_RE = re.compile(r'set_pcxxheader\(\s*"([^"]+)"\s*\)')
+
+
+#----------Scanning----------
+def _list_files(project_path):
+    """{relative path: (mtime_ns, size)} for every header and source under the scanned dirs"""
+    files = {}
+    stack = [project_path / d for d in SCAN_DIRS if (project_path / d).is_dir()]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append(Path(entry.path))
+                        continue
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in HEADER_EXTENSIONS or ext in SOURCE_EXTENSIONS:
+                        st = entry.stat()
+                        rel = Path(entry.path).relative_to(project_path).as_posix()
+                        files[rel] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            continue
+    return files
+
+
+def _parse_includes(path):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    return [m.decode("utf-8", "replace").strip().replace("\\", "/") for m in INCLUDE_RE.findall(data)]
+
+
+def _pch_header(project_path):
+    try:
+        match = PCH_RE.search((project_path / "xmake.lua").read_text(encoding="utf-8"))
+    except OSError:
+        return None
+    return match.group(1).replace("\\", "/").removeprefix("./") if match else None
+
+
+class HeaderGraph:
+    """
+    #include graph of a project's own sources (src/, include/, ClibUtil, xbyak).
+    Includes that resolve outside the project (CommonLibSSE, STL) are ignored.
+    The precompiled header from xmake.lua counts as included by every TU.
+    """
+
+    def __init__(self, project_path, includes, pch=None):
+        self.project_path = Path(project_path)
+        self.pch = pch if pch in includes else None
+        self.includes = {}
+        for rel, raw_includes in includes.items():
+            self.includes[rel] = self._resolve_all(rel, raw_includes, includes)
+        self.tus = sorted(rel for rel in includes if Path(rel).suffix.lower() in SOURCE_EXTENSIONS)
+        if self.pch:
+            for tu in self.tus:
+                if self.pch not in self.includes[tu]:
+                    self.includes[tu].append(self.pch)
+        self._closure_cache = {}
+
+    @staticmethod
+    def _resolve_all(rel, raw_includes, known):
+        resolved = []
+        here = Path(rel).parent.as_posix()
+        for raw in raw_includes:
+            for base in (here, *INCLUDE_ROOTS):
+                candidate = os.path.normpath(f"{base}/{raw}" if base and base != "." else raw).replace("\\", "/")
+                if candidate in known:
+                    if candidate not in resolved and candidate != rel:
+                        resolved.append(candidate)
+                    break
+        return resolved
+
+    #----------Queries----------
+    def find(self, name):
+        """Files matching a relative path or a bare file name (e.g. 'Hooks.h')"""
+        name = name.replace("\\", "/").removeprefix("./")
+        if name in self.includes:
+            return [name]
+        lowered = name.lower()
+        return sorted(rel for rel in self.includes
+                      if rel.lower().endswith("/" + lowered) or rel.lower() == lowered)
+
+    def closure(self, rel):
+        """Every file reachable through includes from rel (cycles are tolerated)"""
+        cached = self._closure_cache.get(rel)
+        if cached is not None:
+            return cached
+        seen = set()
+        stack = list(self.includes.get(rel, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            stack.extend(self.includes.get(current, ()))
+        self._closure_cache[rel] = seen
+        return seen
+
+    def affected_tus(self, header):
+        """Translation units recompiled when the given file changes"""
+        targets = set(self.find(header))
+        return sorted(tu for tu in self.tus if tu in targets or self.closure(tu) & targets)
+
+    def rank_headers(self, build_mode="release", top=None):
+        """
+        Headers sorted by the compile seconds an edit would cost, from past per-TU durations.
+        TUs without a measurement are counted at the mean (1s when nothing is known yet).
+        Returns [(header, seconds, affected TU count)].
+        """
+        durations = load_tu_durations(self.project_path, build_mode)
+        default = sum(durations.values()) / len(durations) if durations else 1.0
+        cost = {}
+        count = {}
+        for tu in self.tus:
+            tu_cost = durations.get(tu, default)
+            for header in self.closure(tu):
+                if header in self.tus:
+                    continue
+                cost[header] = cost.get(header, 0.0) + tu_cost
+                count[header] = count.get(header, 0) + 1
+        ranked = sorted(((h, cost[h], count[h]) for h in cost), key=lambda r: (-r[1], r[0]))
+        return ranked[:top] if top else ranked
+
+
+def scan_header_graph(project_path, status_callback=None):
+    """
+    Build the graph, re-parsing only files whose mtime or size changed since the cached
+    scan in build/.clibdt/header_graph.json. Changed files are parsed on a thread pool.
+    """
+    def status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    start = time.perf_counter()
+    project_path = Path(project_path)
+    cache_path = project_path / CACHE_FILE
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("format") != CACHE_FORMAT:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    cached_files = cache.get("files", {})
+
+    files = _list_files(project_path)
+    includes = {}
+    stale = []
+    for rel, stamp in files.items():
+        entry = cached_files.get(rel)
+        if entry and entry[0] == stamp[0] and entry[1] == stamp[1]:
+            includes[rel] = entry[2]
+        else:
+            stale.append(rel)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 4))) as pool:
+            for rel, parsed in zip(stale, pool.map(lambda r: _parse_includes(project_path / r), stale)):
+                includes[rel] = parsed
+    if stale or len(cached_files) != len(files):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"format": CACHE_FORMAT,
+                           "files": {rel: [*files[rel], includes[rel]] for rel in files}}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    graph = HeaderGraph(project_path, includes, _pch_header(project_path))
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    status(f"[INFO] Include graph: {len(files)} files, {len(graph.tus)} TUs, "
+           f"{len(stale)} re-parsed ({elapsed_ms:.0f} ms)")
+    return graph
+
+
+def dirty_tus(project_path, changed):
+    """TUs xmake recompiles after the given files changed: changed sources and every TU including a changed file"""
+    graph = scan_header_graph(project_path)
+    changed = set(changed)
+    return {tu for tu in graph.tus if tu in changed or graph.closure(tu) & changed}
+
+
+#----------Reports----------
+def header_impact_report(project_path, header=None, build_mode="release", top=15, status_callback=None):
+    """Print which TUs a header affects, or the most expensive headers when none is given"""
+    def status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    graph = scan_header_graph(project_path, status)
+    if header:
+        matches = graph.find(header)
+        if not matches:
+            status(f"[WARN] No header named {header} in src/, include/, ClibUtil or xbyak")
+            return graph
+        durations = load_tu_durations(project_path, build_mode)
+        for match in matches:
+            tus = graph.affected_tus(match)
+            known = [durations[tu] for tu in tus if tu in durations]
+            cost = f", ~{sum(known):.1f}s measured ({len(known)}/{len(tus)} TUs timed)" if known else ""
+            pch_note = " [precompiled header]" if match == graph.pch else ""
+            status(f"[INFO] {match}{pch_note}: {len(tus)} of {len(graph.tus)} TUs recompile{cost}")
+            for tu in tus:
+                timing = f" ({durations[tu]:.1f}s)" if tu in durations else ""
+                status(f"    {tu}{timing}")
+        return graph
+
+    ranked = graph.rank_headers(build_mode, top)
+    if not ranked:
+        status("[INFO] No project headers are included by any TU.")
+        return graph
+    timed = " (estimated: no builds timed yet)" if not load_tu_durations(project_path, build_mode) else ""
+    status(f"[INFO] Headers by rebuild cost, {build_mode}{timed}:")
+    for rel, seconds, count in ranked:
+        status(f"    {seconds:8.1f}s  {count:4d} TU(s)  {rel}")
+    return graph
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="ClibDT header dependency and rebuild impact analysis")
+    parser.add_argument("project", nargs="?", default=".", help="Project folder (default: current directory)")
+    parser.add_argument("--impact", metavar="HEADER", help="List the TUs a header change recompiles (e.g. pch.h)")
+    parser.add_argument("--mode", default="release", help="Build mode whose timings are used (default: release)")
+    parser.add_argument("--top", type=int, default=15, help="Number of headers to rank (default: 15)")
+    args = parser.parse_args(argv)
+    header_impact_report(Path(args.project).resolve(), args.impact, args.mode, args.top, print)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
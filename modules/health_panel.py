@@ -0,0 +1,206 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QSizePolicy
+)
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QColor
+
+from modules.project_index import get_project_index
+from modules.project_health import HealthScanner, PROBE_NAMES, TARGET_SECONDS, format_probe
+from modules.theme_manager import set_theme_scope
+
+COLUMN_TITLES = {
+    "git": "Git",
+    "deps": "ClibUtil / xbyak",
+    "xmake": "xmake.lua",
+    "build": "Last Build",
+    "disk": "build / .xmake / backups",
+    "snapshot": "Last Snapshot",
+}
+# Cell colours used before a theme manager is attached
+DEFAULT_STATE_THEME = {
+    'success_color': '#27ae60',
+    'warning_color': '#f39c12',
+    'error_color': '#e74c3c',
+    'text_secondary': '#b0b0b0',
+}
+
+
+class ProjectHealthPanel(QWidget):
+    """One row per project; cells fill in as the probes finish on the scanner's thread pool"""
+
+    # Emitted from the scan thread, delivered on the GUI thread (queued connection)
+    result_ready = pyqtSignal(str, str, object)
+    scan_finished = pyqtSignal(float)
+
+    def __init__(self, parent=None, status_callback=None):
+        super().__init__(parent)
+        set_theme_scope(self, "ProjectHealthPanel")
+        self.status_callback = status_callback
+        self.theme_manager = None
+        self.scanner = HealthScanner()
+        self._rows = {}
+        self._results = {}
+        self._scanning = False
+        self._rescan_pending = False
+        self._subscribed = False
+        self.result_ready.connect(self.on_result)
+        self.scan_finished.connect(self.on_scan_finished)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(8)
+
+        # Title row with divider
+        title_row = QHBoxLayout()
+        title_row.setSpacing(8)
+        title_row.setContentsMargins(0, 0, 0, 0)
+        title = QLabel("Project Health")
+        title.setObjectName("main_title")
+        title_row.addWidget(title)
+        divider = QLabel()
+        divider.setObjectName("title_divider")
+        divider.setFixedHeight(2)
+        divider.setMinimumWidth(120)
+        title_row.addWidget(divider)
+        title_row.addStretch()
+        layout.addLayout(title_row)
+
+        desc = QLabel("Git state, dependencies, xmake.lua, last build, disk usage and snapshots for every project.")
+        desc.setObjectName("section_desc")
+        layout.addWidget(desc)
+
+        self.table = QTableWidget(0, len(PROBE_NAMES) + 1)
+        self.table.setObjectName("health_table")
+        self.table.setHorizontalHeaderLabels(["Project"] + [COLUMN_TITLES[name] for name in PROBE_NAMES])
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        layout.addWidget(self.table)
+
+        # Button row
+        btn_row = QHBoxLayout()
+        btn_row.setSpacing(8)
+        btn_row.setContentsMargins(0, 0, 0, 0)
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.setProperty("btnType", "success")
+        self.refresh_btn.setMinimumHeight(24)
+        self.refresh_btn.setMaximumHeight(32)
+        self.refresh_btn.clicked.connect(lambda: self.refresh(force=self.force_checkbox.isChecked()))
+        btn_row.addWidget(self.refresh_btn)
+        self.force_checkbox = QCheckBox("Ignore cached results")
+        btn_row.addWidget(self.force_checkbox)
+        btn_row.addStretch()
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("status_label")
+        btn_row.addWidget(self.status_label)
+        layout.addLayout(btn_row)
+
+        self.setLayout(layout)
+        self.apply_theme()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Unchanged probes come from the cache, so re-checking on every visit is cheap
+        self.refresh()
+
+    def status(self, message):
+        if self.status_callback:
+            self.status_callback(message)
+        else:
+            print(message)
+
+    #----------Scanning----------
+    def refresh(self, force=False):
+        if self._scanning:
+            self._rescan_pending = True
+            return
+        index = get_project_index()
+        if index is None:
+            self.status_label.setText("No dev root found")
+            return
+        if not self._subscribed:
+            index.subscribe(self.on_projects_changed)
+            self._subscribed = True
+        projects = [(record.name, record.path) for record in index.projects()]
+        self._set_rows([name for name, _ in projects])
+        if not projects:
+            self.status_label.setText("No valid ClibDT projects found")
+            return
+        self._scanning = True
+        self.refresh_btn.setEnabled(False)
+        self.status_label.setText(f"Checking {len(projects)} project(s)...")
+        self.scanner.scan_async(projects, self.result_ready.emit,
+                                lambda results: self.scan_finished.emit(self.scanner.last_elapsed),
+                                force=force)
+
+    def _set_rows(self, names):
+        """Keep rows (and shown results) for projects still listed, add rows for new ones"""
+        if list(self._rows) == names:
+            return
+        self._results = {name: self._results.get(name, {}) for name in names}
+        self._rows = {name: row for row, name in enumerate(names)}
+        self.table.setRowCount(len(names))
+        for name, row in self._rows.items():
+            self.table.setItem(row, 0, QTableWidgetItem(name))
+            for probe_name in PROBE_NAMES:
+                self._set_cell(name, probe_name, self._results[name].get(probe_name))
+
+    def _set_cell(self, name, probe_name, result):
+        text, state = format_probe(probe_name, result)
+        item = QTableWidgetItem(text)
+        color = self._state_colors.get(state)
+        if color:
+            item.setForeground(QColor(color))
+        if result:
+            item.setToolTip(", ".join(f"{key}: {value}" for key, value in result.items()))
+        self.table.setItem(self._rows[name], PROBE_NAMES.index(probe_name) + 1, item)
+
+    def on_result(self, name, probe_name, result):
+        if name not in self._rows:
+            return
+        self._results[name][probe_name] = result
+        self._set_cell(name, probe_name, result)
+
+    def on_scan_finished(self, elapsed):
+        self._scanning = False
+        self.refresh_btn.setEnabled(True)
+        count = len(self._rows)
+        self.status_label.setText(f"{count} project(s) checked in {elapsed:.2f} s")
+        if elapsed > TARGET_SECONDS:
+            self.status(f"[WARN] Project health took {elapsed:.2f} s for {count} project(s)")
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self.refresh()
+
+    def on_projects_changed(self, index, changes):
+        """Project index listener: re-check once the panel is visible"""
+        if self.isVisible():
+            self.refresh()
+
+    #----------Theme----------
+    def set_theme_manager(self, theme_manager):
+        if theme_manager is self.theme_manager:
+            return
+        self.theme_manager = theme_manager
+        if self.theme_manager:
+            self.theme_manager.theme_changed.connect(self.apply_theme)
+        self.apply_theme()
+
+    def apply_theme(self, *args):
+        """Cell colours come from the theme; the rest is in the application stylesheet"""
+        theme = self.theme_manager.get_theme() if self.theme_manager else DEFAULT_STATE_THEME
+        self._state_colors = {
+            'ok': theme['success_color'],
+            'warn': theme['warning_color'],
+            'error': theme['error_color'],
+            'info': theme['text_secondary'],
+        }
+        for name in self._rows:
+            for probe_name in PROBE_NAMES:
+                self._set_cell(name, probe_name, self._results[name].get(probe_name))
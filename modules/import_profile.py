@@ -0,0 +1,157 @@
+"""
+Import-time profile for ClibDT startup, based on python -X importtime.
+
+    python -m modules.import_profile            breakdown of a cold 'import ClibDT'
+    python -m modules.import_profile --check    exit 1 when the import exceeds the budget
+"""
+import os
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+
+#----------Import Budget----------
+# Cold import of ClibDT.py (no window shown); override with CLIBDT_IMPORT_BUDGET_MS
+DEFAULT_BUDGET_MS = 1500
+BUDGET_ENV_VAR = "CLIBDT_IMPORT_BUDGET_MS"
+# Modules that should never load before their panel or feature is used
+DEFERRED_MODULES = (
+    "requests",
+    "rich",
+    "tqdm",
+    "modules.install_vstudio_xmake_git",
+    "modules.build_project",
+    "modules.create_project",
+    "modules.update_project_deps",
+    "modules.detach_remove_git",
+    "modules.refresh_project",
+    "modules.explorer",
+    "modules.backup_dev_root",
+    "modules.set_environment_variables",
+    "modules.project_watcher",
+    "modules.health_panel",
+    "modules.project_health",
+)
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def get_budget_ms():
+    try:
+        return float(os.environ[BUDGET_ENV_VAR])
+    except (KeyError, ValueError):
+        return DEFAULT_BUDGET_MS
+
+
+def parse_importtime(text):
+    """
+    Parse -X importtime output into [(module, self_us, cumulative_us, depth)] in the
+    order the imports finished (children before their parent); depth 0 is a top-level import.
+    """
+    entries = []
+    for line in text.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((stripped.strip(), self_us, cumulative_us, depth))
+    return entries
+
+
+def profile_imports(target="ClibDT", python=None):
+    """Import target in a fresh interpreter and return the parsed -X importtime entries"""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, errors="replace")
+    if result.returncode != 0:
+        errors = [l for l in result.stderr.splitlines() if l.strip() and not l.startswith("import time:")]
+        raise RuntimeError(errors[-1] if errors else f"import {target} failed")
+    return parse_importtime(result.stderr)
+
+
+def target_subtree(entries, target="ClibDT"):
+    """Entries imported while importing target (target last); -X importtime lists children first"""
+    end = next((i for i in range(len(entries) - 1, -1, -1) if entries[i][0] == target), None)
+    if end is None:
+        return entries
+    depth = entries[end][3]
+    start = end
+    while start > 0 and entries[start - 1][3] > depth:
+        start -= 1
+    return entries[start:end + 1]
+
+
+def total_ms(entries, target="ClibDT"):
+    return target_subtree(entries, target)[-1][2] / 1000.0 if entries else 0.0
+
+
+def format_report(entries, target="ClibDT", top=20):
+    """Top-level imports by cumulative time, then the slowest modules by self time"""
+    lines = [f"Import time for '{target}': {total_ms(entries, target):.0f} ms"]
+    entries = target_subtree(entries, target)
+    # Direct imports of the target sit one level below it
+    direct = [e for e in entries if e[3] == entries[-1][3] + 1]
+    lines.append("")
+    lines.append("  cumulative      self  module (imported directly)")
+    for name, self_us, cumulative_us, _ in sorted(direct, key=lambda e: -e[2])[:top]:
+        lines.append(f"  {cumulative_us / 1000.0:8.1f} ms {self_us / 1000.0:6.1f} ms  {name}")
+    lines.append("")
+    lines.append("        self  module (slowest overall)")
+    for name, self_us, _, _ in sorted(entries, key=lambda e: -e[1])[:top]:
+        lines.append(f"  {self_us / 1000.0:8.1f} ms  {name}")
+    loaded = {name for name, _, _, _ in entries}
+    early = [m for m in DEFERRED_MODULES if m in loaded]
+    if early:
+        lines.append("")
+        lines.append(f"[WARN] Loaded at startup but meant to be deferred: {', '.join(early)}")
+    return "\n".join(lines)
+
+
+def check_import_budget(budget_ms=None, target="ClibDT"):
+    """(ok, measured ms, report); also fails when a deferred module is imported at startup"""
+    budget_ms = get_budget_ms() if budget_ms is None else budget_ms
+    entries = profile_imports(target)
+    measured = total_ms(entries, target)
+    loaded = {name for name, _, _, _ in target_subtree(entries, target)}
+    ok = measured <= budget_ms and not any(m in loaded for m in DEFERRED_MODULES)
+    return ok, measured, format_report(entries, target)
+
+
+def print_startup_profile(target="ClibDT", top=20):
+    """Used by ClibDT.py --profile-startup"""
+    try:
+        print(format_report(profile_imports(target), target, top))
+    except Exception as e:
+        print(f"[WARN] Could not profile startup imports: {e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ClibDT import-time profile")
+    parser.add_argument("--target", default="ClibDT")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--check", action="store_true", help="exit 1 when over budget")
+    parser.add_argument("--budget", type=float, default=None, help=f"budget in ms (default {DEFAULT_BUDGET_MS})")
+    args = parser.parse_args(argv)
+
+    try:
+        if not args.check:
+            print(format_report(profile_imports(args.target), args.target, args.top))
+            return 0
+        ok, measured, report = check_import_budget(args.budget, args.target)
+    except RuntimeError as e:
+        print(f"[ERROR] Could not import {args.target}: {e}")
+        return 2
+    print(report)
+    budget = get_budget_ms() if args.budget is None else args.budget
+    print(f"\n[{'OK' if ok else 'ERROR'}] {measured:.0f} ms against a budget of {budget:.0f} ms")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
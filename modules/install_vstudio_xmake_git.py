@@ -10,7 +10,8 @@ from colorama import init, Fore, Style
 import stat
 import time
 from modules.utilities.common import VERSION
-from modules.config_utils import get_config_directory
+from modules.config_manager import get_config_namespace
+from modules.theme_manager import set_theme_scope
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QHBoxLayout, QFileDialog, QSizePolicy, QDialog, QButtonGroup, QRadioButton, QDialogButtonBox, QApplication)
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, pyqtSlot
 from PyQt6.QtGui import QFont
@@ -31,6 +32,7 @@ class InstallToolsPanel(QWidget):
     
     def __init__(self, parent=None, status_callback=None):
         super().__init__(parent)
+        set_theme_scope(self, "InstallToolsPanel")
         self.status_callback = status_callback
         self.theme_manager = None
         
@@ -394,10 +396,7 @@ class InstallToolsPanel(QWidget):
         self.tool_paths_config = {}
         self.load_tool_paths_config()
         
-        # Apply initial theme (will use fallback theme)
-        self.apply_theme()
-        
-        # Initialize status orbs with lazy loading (after theme is applied)
+        # Initialize status orbs with lazy loading
         self.tool_status_cache = {}  # Cache for tool status to avoid repeated checks
         self.status_orbs_initialized = False
         # Removed automatic tool check on startup - user must click "Check Paths" button
@@ -429,22 +428,10 @@ class InstallToolsPanel(QWidget):
     def set_theme_manager(self, theme_manager):
         """Set the theme manager for this panel"""
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
     
     def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
+        """Set up the status orbs the first time the panel is shown"""
         super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        
         # Initialize status orbs with neutral state if not already done
         if not self.status_orbs_initialized:
             self.update_status_orbs_lazy()
@@ -3301,87 +3288,29 @@ When prompted for installation directory, use:
         threading.Thread(target=run).start()
 
     def load_tool_paths_config(self):
-        """Load tool paths configuration from storage"""
-        try:
-            import json
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_tool_paths_config.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    self.tool_paths_config = json.load(f)
-            else:
-                # Initialize with default empty config
-                self.tool_paths_config = {
-                    'vs_buildtools_path': None,
-                    'xmake_path': None,
-                    'git_path': None,
-                    'skse_path': None,
-                    'github_desktop_path': None,
-                    'clibdt_version': VERSION
-                }
-        except Exception as e:
-            self.set_status(f"[WARN] Could not load tool paths config: {e}")
-            # Initialize with default empty config
-            self.tool_paths_config = {
-                'vs_buildtools_path': None,
-                'xmake_path': None,
-                'git_path': None,
-                'skse_path': None,
-                'github_desktop_path': None,
-                'clibdt_version': VERSION
-            }
+        """Load tool paths configuration from the tool_paths config namespace"""
+        self.tool_paths_config = get_config_namespace("tool_paths")
 
     def save_tool_paths_config(self):
-        """Save tool paths configuration to storage"""
-        try:
-            import json
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_tool_paths_config.json"
-            
-            # Update version
-            self.tool_paths_config['clibdt_version'] = VERSION
-            
-            with open(config_file, 'w') as f:
-                json.dump(self.tool_paths_config, f, indent=2)
-        except Exception as e:
-            self.set_status(f"[WARN] Could not save tool paths config: {e}")
+        """Record the tool paths; the config store writes them once changes settle"""
+        self.tool_paths_config.set('clibdt_version', VERSION)
 
     def update_tool_path(self, tool_name, path):
         """Update a tool path in the configuration"""
         if path and Path(path).exists():
-            self.tool_paths_config[f'{tool_name}_path'] = str(path)
-            self.save_tool_paths_config()
+            key = f'{tool_name}_path'
+            if self.tool_paths_config.get(key) == str(path):
+                return
+            self.tool_paths_config.update({key: str(path), 'clibdt_version': VERSION})
             self.set_status(f"[OK] Updated {tool_name} path: {path}")
 
     def load_pinned_items(self):
-        """Load pinned items from storage"""
-        try:
-            import json
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_launcher_config.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    data = json.load(f)
-                    self.pinned_items = data.get('pinned_items', [])
-        except Exception as e:
-            self.set_status(f"[WARN] Could not load launcher config: {e}")
+        """Load pinned items from the launcher config namespace"""
+        self.pinned_items = get_config_namespace("launcher").get('pinned_items')
 
     def save_pinned_items(self):
-        """Save pinned items to storage"""
-        try:
-            import json
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_launcher_config.json"
-            with open(config_file, 'w') as f:
-                json.dump({'pinned_items': self.pinned_items}, f, indent=2)
-        except Exception as e:
-            self.set_status(f"[WARN] Could not save launcher config: {e}")
-
-
+        """Record pinned items; the config store writes them once changes settle"""
+        get_config_namespace("launcher").set('pinned_items', self.pinned_items)
 
     def launch_file(self, file_path):
         """Launch a file with appropriate method"""
@@ -3423,50 +3352,6 @@ When prompted for installation directory, use:
         except Exception as e:
             self.set_status(f"[ERROR] Failed to launch {file_path}: {e}")
 
-    def apply_theme(self):
-        """Apply current theme to the panel"""
-        if self.theme_manager:
-            self.setStyleSheet(self.theme_manager.get_install_tools_style())
-        else:
-            # Fallback to basic theme if no theme manager
-            try:
-                from modules.theme_manager import ThemeManager
-                fallback_manager = ThemeManager()
-                self.setStyleSheet(fallback_manager.get_install_tools_style())
-            except Exception:
-                # Ultimate fallback with basic styling
-                self.setStyleSheet("""
-                    QWidget {
-                        background-color: #1e1e1e;
-                        color: #e0e0e0;
-                        font-family: 'Segoe UI', Arial, sans-serif;
-                    }
-                    QLabel {
-                        background-color: transparent;
-                        color: #e0e0e0;
-                        font-size: 11px;
-                    }
-                    QLineEdit {
-                        background-color: #2d2d2d;
-                        color: #e0e0e0;
-                        border: 2px solid #404040;
-                        border-radius: 4px;
-                        padding: 6px 8px;
-                        font-size: 11px;
-                    }
-                    QPushButton {
-                        background-color: #0078d4;
-                        color: #ffffff;
-                        border: 1px solid #0078d4;
-                        border-radius: 4px;
-                        padding: 8px 16px;
-                        font-size: 11px;
-                        font-weight: bold;
-                    }
-                """)
-        
-        # Status orbs will be updated when user clicks "Check Paths" button
-
     @pyqtSlot()
     def show_xmake_path_dialog(self):
         """Show a dialog with xmake installation path"""
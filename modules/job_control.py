@@ -0,0 +1,310 @@
+import os
+import sys
+import json
+import threading
+from pathlib import Path
+
+from modules.config_utils import get_config_directory
+
+#----------Job Control Settings----------
+# Peak memory of one CommonLibSSE-NG translation unit with PCH when nothing has been measured yet
+DEFAULT_TU_PEAK_BYTES = 1536 * 1024 * 1024
+# Memory left alone for the OS, the editor and the game/mod manager
+MEMORY_RESERVE_BYTES = 2048 * 1024 * 1024
+# How many measured peaks are kept per project/mode
+HISTORY_SIZE = 5
+HISTORY_FILE = "clibdt_job_history.json"
+LEASE_DIR_NAME = ".clibdt_jobs"
+
+
+#----------System Probes----------
+def get_cpu_count():
+    """Logical processors usable by this process"""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
+
+
+def get_free_memory_bytes():
+    """Available physical memory in bytes, or None if it cannot be read"""
+    if sys.platform.startswith("win"):
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            stat = MEMORYSTATUSEX()
+            stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+                return int(stat.ullAvailPhys)
+        except Exception:
+            return None
+        return None
+
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return True
+    if sys.platform.startswith("win"):
+        try:
+            import ctypes
+            PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+            STILL_ACTIVE = 259
+            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if not handle:
+                return False
+            code = ctypes.c_ulong()
+            ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            ctypes.windll.kernel32.CloseHandle(handle)
+            return code.value == STILL_ACTIVE
+        except Exception:
+            return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+
+#----------Peak Memory History----------
+_history_lock = threading.Lock()
+
+
+def _history_key(project_path, build_mode):
+    return f"{Path(project_path).name}|{build_mode}"
+
+
+def _load_history():
+    try:
+        with open(get_config_directory() / HISTORY_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_tu_peak_bytes(project_path, build_mode):
+    """Highest recent per-job peak memory measured for this project and mode"""
+    with _history_lock:
+        samples = _load_history().get(_history_key(project_path, build_mode), [])
+    return max(samples) if samples else DEFAULT_TU_PEAK_BYTES
+
+
+def record_tu_peak_bytes(project_path, build_mode, peak_bytes):
+    """Remember a measured per-job peak; only the last HISTORY_SIZE are kept"""
+    if not peak_bytes or peak_bytes <= 0:
+        return
+    with _history_lock:
+        history = _load_history()
+        key = _history_key(project_path, build_mode)
+        history[key] = (history.get(key, []) + [int(peak_bytes)])[-HISTORY_SIZE:]
+        path = get_config_directory() / HISTORY_FILE
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(history, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+#----------Global CPU Budget----------
+class BuildJobBudget:
+    """
+    One CPU budget shared by every build: builds in this process are tracked
+    in memory, builds in other ClibDT processes through lease files in the dev root.
+    """
+
+    def __init__(self, total_jobs=None):
+        self.total_jobs = total_jobs or get_cpu_count()
+        self._lock = threading.Lock()
+        self._local = {}
+        self._next_id = 0
+
+    def _lease_dir(self):
+        dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
+        return Path(dev_root) / LEASE_DIR_NAME if dev_root else None
+
+    def _foreign_jobs(self):
+        lease_dir = self._lease_dir()
+        if not lease_dir or not lease_dir.is_dir():
+            return 0
+        used = 0
+        for lease in lease_dir.glob("*.lease"):
+            try:
+                pid_str, _ = lease.stem.split("-", 1)
+                pid = int(pid_str)
+                if pid == os.getpid():
+                    continue
+                if not _pid_alive(pid):
+                    lease.unlink()
+                    continue
+                used += int(lease.read_text().strip() or 0)
+            except (OSError, ValueError):
+                continue
+        return used
+
+    def jobs_in_use(self):
+        with self._lock:
+            return sum(self._local.values()) + self._foreign_jobs()
+
+    def acquire(self, wanted):
+        """Grant up to `wanted` jobs from what is left of the budget (never less than 1)"""
+        with self._lock:
+            available = self.total_jobs - sum(self._local.values()) - self._foreign_jobs()
+            granted = max(1, min(int(wanted), available))
+            self._next_id += 1
+            lease_id = self._next_id
+            self._local[lease_id] = granted
+            lease_dir = self._lease_dir()
+            if lease_dir:
+                try:
+                    lease_dir.mkdir(parents=True, exist_ok=True)
+                    (lease_dir / f"{os.getpid()}-{lease_id}.lease").write_text(str(granted))
+                except OSError:
+                    pass
+        return JobLease(self, lease_id, granted)
+
+    def others_active(self, lease_id):
+        """Whether any build besides the given lease holds jobs, here or in another ClibDT"""
+        with self._lock:
+            local = any(other != lease_id for other in self._local)
+        return local or self._foreign_jobs() > 0
+
+    def release(self, lease_id):
+        with self._lock:
+            self._local.pop(lease_id, None)
+            lease_dir = self._lease_dir()
+            if lease_dir:
+                try:
+                    (lease_dir / f"{os.getpid()}-{lease_id}.lease").unlink()
+                except OSError:
+                    pass
+
+
+class JobLease:
+    """A share of the global budget; release it when the build ends"""
+
+    def __init__(self, budget, lease_id, jobs):
+        self._budget = budget
+        self._lease_id = lease_id
+        self.jobs = jobs
+
+    def release(self):
+        if self._budget:
+            self._budget.release(self._lease_id)
+            self._budget = None
+
+    def shared(self):
+        """True while another build runs alongside this one (False once released)"""
+        return bool(self._budget) and self._budget.others_active(self._lease_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+_global_budget = None
+_global_budget_lock = threading.Lock()
+
+
+def get_job_budget():
+    global _global_budget
+    with _global_budget_lock:
+        if _global_budget is None:
+            _global_budget = BuildJobBudget()
+        return _global_budget
+
+
+#----------Job Count Controller----------
+def choose_job_count(project_path, build_mode, status_callback=None):
+    """
+    Pick xmake's -j from core count, free memory and the historical per-TU peak,
+    then take that many jobs from the global budget. Returns a JobLease.
+    """
+    def status(msg):
+        if status_callback:
+            status_callback(msg)
+
+    cores = get_cpu_count()
+    wanted = cores
+    free_bytes = get_free_memory_bytes()
+    tu_peak = get_tu_peak_bytes(project_path, build_mode)
+    if free_bytes is not None:
+        memory_jobs = max(1, int((free_bytes - MEMORY_RESERVE_BYTES) // tu_peak))
+        wanted = min(wanted, memory_jobs)
+
+    lease = get_job_budget().acquire(wanted)
+    free_text = f"{free_bytes / 1024 ** 3:.1f} GB free" if free_bytes is not None else "free memory unknown"
+    status(f"[INFO] Build jobs: {lease.jobs} (cores: {cores}, {free_text}, "
+           f"~{tu_peak / 1024 ** 2:.0f} MB per TU)")
+    if lease.jobs < wanted:
+        status(f"[INFO] Limited to {lease.jobs} job(s) because other builds share the CPU budget")
+    return lease
+
+
+class MemoryPeakMonitor:
+    """
+    Samples free memory during a build to estimate the per-job peak afterwards. Free memory
+    is system wide, so no estimate is made when another build held jobs at any sample.
+    """
+
+    def __init__(self, interval=0.5, lease=None):
+        self.interval = interval
+        self.lease = lease
+        self.baseline = get_free_memory_bytes()
+        self.lowest = self.baseline
+        self.shared = lease is not None and lease.shared()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self.lease is not None and not self.shared and self.lease.shared():
+                self.shared = True
+            free_bytes = get_free_memory_bytes()
+            if free_bytes is not None and (self.lowest is None or free_bytes < self.lowest):
+                self.lowest = free_bytes
+
+    def start(self):
+        if self.baseline is not None:
+            self._thread.start()
+        return self
+
+    def stop(self, jobs):
+        """Stop sampling and return the estimated peak bytes per job (or None)"""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(self.interval * 2)
+        if self.baseline is None or self.lowest is None or jobs <= 0 or self.shared:
+            return None
+        used = self.baseline - self.lowest
+        # Tiny drops mean nothing was compiled (or other apps freed memory)
+        if used < 64 * 1024 * 1024:
+            return None
+        return used // jobs
@@ -0,0 +1,250 @@
+import heapq
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+from modules.log_store import LEVEL_NAMES, LEVEL_ERROR
+
+#----------Log Index Settings----------
+# Lines per text chunk; full chunks are joined into one lowercase string searched with str.find
+CHUNK_LINES = 1024
+
+
+class _Postings:
+    """Sorted sequence numbers in a compact array; evicted entries are dropped lazily"""
+
+    def __init__(self):
+        self.items = array("q")
+        self.start = 0
+
+    def add(self, seq):
+        self.items.append(seq)
+
+    def trim(self, first_seq):
+        self.start = bisect_left(self.items, first_seq, self.start)
+        # Compact once the dead prefix dominates
+        if self.start > 4096 and self.start * 2 > len(self.items):
+            del self.items[:self.start]
+            self.start = 0
+
+    def after(self, seq):
+        """Index of the first entry > seq"""
+        return bisect_right(self.items, seq, self.start)
+
+    def before(self, seq):
+        """Index just past the last entry < seq"""
+        return bisect_left(self.items, seq, self.start)
+
+    def __len__(self):
+        return len(self.items) - self.start
+
+
+class LogIndex:
+    """
+    Indexes a LogStore as lines arrive: postings per level and per source, plus the
+    lowercase text kept in chunks so substring search runs at str.find speed instead
+    of a Python loop per line. Everything follows the store's eviction.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self.levels = [_Postings() for _ in LEVEL_NAMES]
+        self.sources = {}
+        # chunk number -> (joined text, line start offsets) for sealed chunks
+        self._chunks = {}
+        self._open_chunk = None
+        self._open_lines = []
+        self._first_seq = store.first_seq
+        store.add_listener(self._on_record)
+
+    #----------Indexing----------
+    def _on_record(self, seq, level, source_id, plain_text, first_seq):
+        with self._lock:
+            self.levels[level].add(seq)
+            postings = self.sources.get(source_id)
+            if postings is None:
+                postings = self.sources[source_id] = _Postings()
+            postings.add(seq)
+
+            chunk = seq // CHUNK_LINES
+            if chunk != self._open_chunk:
+                self._seal_open_chunk()
+                self._open_chunk = chunk
+                self._open_lines = [""] * (seq - chunk * CHUNK_LINES)
+            self._open_lines.append(plain_text.lower().replace("\n", " "))
+            if len(self._open_lines) == CHUNK_LINES:
+                self._seal_open_chunk()
+
+            if first_seq != self._first_seq:
+                self._first_seq = first_seq
+                self._evict(first_seq)
+
+    def _seal_open_chunk(self):
+        if self._open_chunk is None or not self._open_lines:
+            return
+        offsets = array("l")
+        position = 0
+        for line in self._open_lines:
+            offsets.append(position)
+            position += len(line) + 1
+        self._chunks[self._open_chunk] = ("\n".join(self._open_lines), offsets)
+        self._open_chunk = None
+        self._open_lines = []
+
+    def _evict(self, first_seq):
+        dead_chunk = first_seq // CHUNK_LINES
+        for chunk in [c for c in self._chunks if c < dead_chunk]:
+            del self._chunks[chunk]
+        for postings in self.levels:
+            postings.trim(first_seq)
+        for postings in self.sources.values():
+            postings.trim(first_seq)
+
+    def clear(self):
+        with self._lock:
+            self.levels = [_Postings() for _ in LEVEL_NAMES]
+            self.sources = {}
+            self._chunks = {}
+            self._open_chunk = None
+            self._open_lines = []
+
+    #----------Level and Source Queries----------
+    def next_with_level(self, seq, levels=(LEVEL_ERROR,)):
+        """First line after seq whose level is in levels, or None"""
+        with self._lock:
+            best = None
+            for level in levels:
+                postings = self.levels[level]
+                i = postings.after(seq)
+                if i < len(postings.items) and (best is None or postings.items[i] < best):
+                    best = postings.items[i]
+            return best
+
+    def prev_with_level(self, seq, levels=(LEVEL_ERROR,)):
+        with self._lock:
+            best = None
+            for level in levels:
+                postings = self.levels[level]
+                i = postings.before(seq)
+                if i > postings.start and (best is None or postings.items[i - 1] > best):
+                    best = postings.items[i - 1]
+            return best
+
+    def count(self, level):
+        return len(self.levels[level])
+
+    def matching(self, levels=None, source_id=None, after_seq=-1):
+        """Sorted sequence numbers after after_seq passing a level set and/or source filter"""
+        first_seq = self.store.first_seq
+        after_seq = max(after_seq, first_seq - 1)
+        with self._lock:
+            if source_id is not None:
+                postings = self.sources.get(source_id)
+                if postings is None:
+                    return []
+                seqs = postings.items[postings.after(after_seq):]
+                if levels is None:
+                    return list(seqs)
+                store_level = self.store.level
+                return [s for s in seqs if store_level(s) in levels]
+            if levels is None:
+                return list(range(after_seq + 1, self.store.next_seq))
+            parts = [self.levels[level].items[self.levels[level].after(after_seq):] for level in levels]
+        return list(parts[0]) if len(parts) == 1 else list(heapq.merge(*parts))
+
+    #----------Text Search----------
+    def _chunk_text(self, chunk):
+        """(text, offsets) for a chunk; the open chunk is joined on demand"""
+        if chunk == self._open_chunk:
+            lines = self._open_lines
+            offsets = array("l")
+            position = 0
+            for line in lines:
+                offsets.append(position)
+                position += len(line) + 1
+            return "\n".join(lines), offsets
+        return self._chunks.get(chunk)
+
+    def find_next(self, query, after_seq):
+        """First line after after_seq containing query (case-insensitive), or None"""
+        query = query.lower()
+        if not query or "\n" in query:
+            return None
+        with self._lock:
+            # The oldest chunk may be partly evicted, so never start before first_seq
+            start_seq = max(after_seq + 1, self.store.first_seq)
+            first_chunk = start_seq // CHUNK_LINES
+            last_chunk = (self.store.next_seq - 1) // CHUNK_LINES
+            for chunk in range(first_chunk, last_chunk + 1):
+                data = self._chunk_text(chunk)
+                if data is None:
+                    continue
+                text, offsets = data
+                start_line = max(0, start_seq - chunk * CHUNK_LINES)
+                if start_line >= len(offsets):
+                    continue
+                hit = text.find(query, offsets[start_line])
+                while hit >= 0:
+                    line = bisect_right(offsets, hit) - 1
+                    seq = chunk * CHUNK_LINES + line
+                    if self.store.contains(seq):
+                        return seq
+                    # Keep looking further down the same chunk
+                    if line + 1 >= len(offsets):
+                        break
+                    hit = text.find(query, offsets[line + 1])
+        return None
+
+    def find_prev(self, query, before_seq):
+        """Last line before before_seq containing query (case-insensitive), or None"""
+        query = query.lower()
+        if not query or "\n" in query:
+            return None
+        with self._lock:
+            first_chunk = self.store.first_seq // CHUNK_LINES
+            last_chunk = min(before_seq - 1, self.store.next_seq - 1) // CHUNK_LINES
+            for chunk in range(last_chunk, first_chunk - 1, -1):
+                data = self._chunk_text(chunk)
+                if data is None:
+                    continue
+                text, offsets = data
+                end_line = min(len(offsets), before_seq - chunk * CHUNK_LINES)
+                if end_line <= 0:
+                    continue
+                end = offsets[end_line] - 1 if end_line < len(offsets) else len(text)
+                hit = text.rfind(query, 0, end)
+                if hit >= 0:
+                    seq = chunk * CHUNK_LINES + bisect_right(offsets, hit) - 1
+                    if self.store.contains(seq):
+                        return seq
+        return None
+
+    def find_all(self, query, limit=None):
+        """All matching lines in order (stops after limit matches)"""
+        query = query.lower()
+        found = []
+        if not query or "\n" in query:
+            return found
+        with self._lock:
+            first_chunk = self.store.first_seq // CHUNK_LINES
+            last_chunk = (self.store.next_seq - 1) // CHUNK_LINES
+            for chunk in range(first_chunk, last_chunk + 1):
+                data = self._chunk_text(chunk)
+                if data is None:
+                    continue
+                text, offsets = data
+                hit = text.find(query)
+                while hit >= 0:
+                    line = bisect_right(offsets, hit) - 1
+                    seq = chunk * CHUNK_LINES + line
+                    if self.store.contains(seq):
+                        found.append(seq)
+                        if limit and len(found) >= limit:
+                            return found
+                    # Continue on the next line so a line is reported once
+                    next_line = line + 1
+                    if next_line >= len(offsets):
+                        break
+                    hit = text.find(query, offsets[next_line])
+        return found
@@ -0,0 +1,167 @@
+import re
+import time
+import threading
+from array import array
+
+#----------Log Store Settings----------
+DEFAULT_CAPACITY = 200000
+
+# Level codes kept in one byte per record
+LEVEL_NONE, LEVEL_DEBUG, LEVEL_INFO, LEVEL_OK, LEVEL_WARN, LEVEL_ERROR = range(6)
+LEVEL_NAMES = ("", "DEBUG", "INFO", "OK", "WARN", "ERROR")
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;:?]*[@-~]")
+# Tags the modules put in front of their messages
+_TAG_RE = re.compile(r"^\s*\[(DEBUG|INFO|OK|SUCCESS|WARN|WARNING|ERROR|FAIL|FAILED|WATCH)\]", re.IGNORECASE)
+# Compiler and linker diagnostics from xmake/MSVC output
+_DIAG_ERROR_RE = re.compile(r"\berror\s+[A-Z]+\d+\b|:\s*(?:fatal\s+)?error\b|^error:", re.IGNORECASE)
+_DIAG_WARN_RE = re.compile(r"\bwarning\s+[A-Z]+\d+\b|:\s*warning\b|^warning:", re.IGNORECASE)
+_TAG_LEVELS = {
+    "DEBUG": LEVEL_DEBUG, "INFO": LEVEL_INFO, "OK": LEVEL_OK, "SUCCESS": LEVEL_OK,
+    "WARN": LEVEL_WARN, "WARNING": LEVEL_WARN, "ERROR": LEVEL_ERROR, "FAIL": LEVEL_ERROR,
+    "FAILED": LEVEL_ERROR, "WATCH": LEVEL_INFO,
+}
+
+
+def strip_ansi(text):
+    return _ANSI_RE.sub("", text) if "\x1b" in text else text
+
+
+def detect_level(plain_text):
+    """Level of a message from its [TAG] prefix, or from compiler diagnostics"""
+    match = _TAG_RE.match(plain_text)
+    if match:
+        return _TAG_LEVELS[match.group(1).upper()]
+    if _DIAG_ERROR_RE.search(plain_text):
+        return LEVEL_ERROR
+    if _DIAG_WARN_RE.search(plain_text):
+        return LEVEL_WARN
+    return LEVEL_NONE
+
+
+class LogStore:
+    """
+    Fixed-capacity ring buffer of (timestamp, level, source, text) records.
+
+    Records are addressed by a sequence number that keeps growing; once the buffer
+    is full the oldest record is overwritten, so first_seq moves forward. Timestamps,
+    levels and source ids live in typed arrays; only the text is a Python object.
+    Appends are thread-safe; reads from the GUI thread take the same lock only briefly.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._lock = threading.Lock()
+        self._sources = [""]
+        self._source_ids = {"": 0}
+        self._listeners = []
+        self._allocate(max(1, int(capacity)))
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._levels = bytearray(capacity)
+        self._source_of = array("H", bytes(2 * capacity))
+        self._texts = [None] * capacity
+        self.first_seq = 0
+        self.next_seq = 0
+
+    def __len__(self):
+        return self.next_seq - self.first_seq
+
+    #----------Writing----------
+    def source_id(self, source):
+        source_id = self._source_ids.get(source)
+        if source_id is None:
+            with self._lock:
+                source_id = self._source_ids.get(source)
+                if source_id is None:
+                    source_id = len(self._sources)
+                    self._sources.append(source)
+                    self._source_ids[source] = source_id
+        return source_id
+
+    def append(self, text, level=None, source="", ts=None):
+        """Store one line; returns its sequence number"""
+        plain = strip_ansi(text)
+        if level is None:
+            level = detect_level(plain)
+        source_id = self.source_id(source)
+        with self._lock:
+            seq = self.next_seq
+            slot = seq % self.capacity
+            self._ts[slot] = time.time() if ts is None else ts
+            self._levels[slot] = level
+            self._source_of[slot] = source_id
+            self._texts[slot] = text
+            self.next_seq = seq + 1
+            if self.next_seq - self.first_seq > self.capacity:
+                self.first_seq = self.next_seq - self.capacity
+            # Inside the lock so listeners see sequence numbers in order
+            for listener in self._listeners:
+                listener(seq, level, source_id, plain, self.first_seq)
+        return seq
+
+    def add_listener(self, callback):
+        """callback(seq, level, source_id, plain_text, first_seq) runs for every append; keep it cheap"""
+        self._listeners.append(callback)
+
+    def resize(self, capacity):
+        """Change the capacity, keeping the newest records"""
+        capacity = max(1, int(capacity))
+        with self._lock:
+            keep = min(len(self), capacity)
+            start = self.next_seq - keep
+            old = [(self._ts[s % self.capacity], self._levels[s % self.capacity],
+                    self._source_of[s % self.capacity], self._texts[s % self.capacity])
+                   for s in range(start, self.next_seq)]
+            next_seq = self.next_seq
+            self._allocate(capacity)
+            self.first_seq = start
+            self.next_seq = next_seq
+            for seq, (ts, level, source_id, text) in zip(range(start, next_seq), old):
+                slot = seq % capacity
+                self._ts[slot] = ts
+                self._levels[slot] = level
+                self._source_of[slot] = source_id
+                self._texts[slot] = text
+
+    def clear(self):
+        with self._lock:
+            for seq in range(self.first_seq, self.next_seq):
+                self._texts[seq % self.capacity] = None
+            self.first_seq = self.next_seq
+
+    #----------Reading----------
+    def contains(self, seq):
+        return self.first_seq <= seq < self.next_seq
+
+    def text(self, seq):
+        return self._texts[seq % self.capacity] if self.contains(seq) else None
+
+    def level(self, seq):
+        return self._levels[seq % self.capacity] if self.contains(seq) else LEVEL_NONE
+
+    def source(self, seq):
+        return self._sources[self._source_of[seq % self.capacity]] if self.contains(seq) else ""
+
+    def source_name(self, source_id):
+        return self._sources[source_id]
+
+    def sources(self):
+        return list(self._sources)
+
+    def record(self, seq):
+        """(timestamp, level name, source, text) or None once the record was overwritten"""
+        with self._lock:
+            if not self.contains(seq):
+                return None
+            slot = seq % self.capacity
+            return (self._ts[slot], LEVEL_NAMES[self._levels[slot]],
+                    self._sources[self._source_of[slot]], self._texts[slot])
+
+    def texts(self, start, stop):
+        """Texts for sequence numbers [start, stop) clipped to what is retained"""
+        with self._lock:
+            start = max(start, self.first_seq)
+            stop = min(stop, self.next_seq)
+            return [self._texts[s % self.capacity] for s in range(start, stop)]
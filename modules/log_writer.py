@@ -0,0 +1,221 @@
+import os
+import gzip
+import time
+import queue
+import shutil
+import threading
+from pathlib import Path
+
+#----------Log Writer Settings----------
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+# Messages written per batch before the file is flushed
+BATCH_LIMIT = 4096
+_CLOSE = object()
+
+
+class RotatingLogWriter:
+    """
+    Background log writer. write() only puts the text on a queue (SimpleQueue never blocks
+    the caller), and a daemon thread drains it in batches to the log file and, optionally,
+    an echo stream such as the real stdout. The file rotates by size and/or age; rotated
+    segments are gzip-compressed on the writer thread and the oldest beyond backup_count removed.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, rotate_seconds=None,
+                 backup_count=DEFAULT_BACKUP_COUNT, compress=True, echo=None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.backup_count = backup_count
+        self.compress = compress
+        self.echo = echo
+        self.rotations = 0
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._size = 0
+        self._next_rollover = None
+        self._closed = False
+        self._open()
+        self._thread = threading.Thread(target=self._run, name="ClibDTLogWriter", daemon=True)
+        self._thread.start()
+
+    #----------Producer Side----------
+    @property
+    def closed(self):
+        return self._closed
+
+    def write(self, text):
+        if text and not self._closed:
+            self._queue.put(text)
+        return len(text)
+
+    def flush(self):
+        """Non-blocking: the writer thread wakes on every write and flushes each batch itself"""
+
+    def close(self, timeout=5.0):
+        """Drain the queue, close the file and stop the thread (safe to call more than once)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join(timeout)
+        # Text queued by a write() racing with close() still reaches the echo stream
+        leftover = []
+        while True:
+            try:
+                leftover.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if leftover and self.echo is not None:
+            self._echo("".join(item for item in leftover if item is not _CLOSE))
+
+    #----------Writer Thread----------
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch, closing = [], False
+            while True:
+                if item is _CLOSE:
+                    closing = True
+                else:
+                    batch.append(item)
+                if closing or len(batch) >= BATCH_LIMIT:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch("".join(batch))
+            if closing:
+                self._close_file()
+                return
+
+    def _echo(self, text):
+        try:
+            self.echo.write(text)
+            self.echo.flush()
+        except Exception:
+            pass
+
+    def _write_batch(self, text):
+        if self.echo is not None:
+            self._echo(text)
+        if self._file is None:
+            return
+        # max_bytes is a file size, so count encoded bytes rather than characters
+        size = len(text.encode("utf-8", "replace"))
+        if self._should_rotate(size):
+            self._rotate()
+        try:
+            self._file.write(text)
+            self._file.flush()
+            self._size += size
+        except Exception:
+            pass
+
+    #----------Rotation----------
+    def _open(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8", errors="replace")
+            self._size = self._file.tell()
+        except OSError:
+            self._file = None
+            self._size = 0
+        if self.rotate_seconds:
+            self._next_rollover = time.time() + self.rotate_seconds
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+    def _should_rotate(self, incoming):
+        if self.max_bytes and self._size and self._size + incoming > self.max_bytes:
+            return True
+        return bool(self._next_rollover and time.time() >= self._next_rollover)
+
+    def _rotate(self):
+        self._close_file()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        target = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        counter = 1
+        while target.exists() or Path(f"{target}.gz").exists():
+            target = self.path.with_name(f"{self.path.stem}.{stamp}-{counter}{self.path.suffix}")
+            counter += 1
+        try:
+            os.replace(self.path, target)
+            if self.compress:
+                with open(target, "rb") as src, gzip.open(f"{target}.gz", "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                target.unlink()
+            self.rotations += 1
+        except OSError:
+            pass
+        self._prune()
+        self._open()
+
+    def rotated_segments(self):
+        """Rotated files, oldest first"""
+        pattern = f"{self.path.stem}.*{self.path.suffix}*"
+        segments = [p for p in self.path.parent.glob(pattern) if p != self.path]
+        return sorted(segments, key=lambda p: p.stat().st_mtime)
+
+    def _prune(self):
+        segments = self.rotated_segments()
+        for doomed in segments[:max(0, len(segments) - self.backup_count)]:
+            try:
+                doomed.unlink()
+            except OSError:
+                pass
+
+
+#----------Benchmark----------
+def benchmark_writers(writes=200000, threads=4, message="[INFO] compiling.release src/Hooks.cpp\n"):
+    """
+    Time how long writer threads spend inside write() for a line-buffered file (what
+    FullTeeLogger used before) and for RotatingLogWriter. Returns {name: (total s, worst call ms)}.
+    """
+    import tempfile
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_file = open(Path(tmp) / "sync.log", "a", encoding="utf-8", buffering=1)
+        async_writer = RotatingLogWriter(Path(tmp) / "async.log", max_bytes=4 * 1024 * 1024)
+        for name, write in (("line-buffered", sync_file.write), ("async", async_writer.write)):
+            worst = [0.0] * threads
+
+            def produce(index):
+                per_thread = writes // threads
+                for _ in range(per_thread):
+                    start = time.perf_counter()
+                    write(message)
+                    elapsed = time.perf_counter() - start
+                    if elapsed > worst[index]:
+                        worst[index] = elapsed
+
+            start = time.perf_counter()
+            workers = [threading.Thread(target=produce, args=(i,)) for i in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            results[name] = (time.perf_counter() - start, max(worst) * 1000.0)
+        drain_start = time.perf_counter()
+        async_writer.close()
+        results["async drain"] = (time.perf_counter() - drain_start, 0.0)
+        results["rotations"] = async_writer.rotations
+        sync_file.close()
+    return results
+
+
+if __name__ == "__main__":
+    result = benchmark_writers()
+    rotations = result.pop("rotations")
+    for name, (seconds, worst_ms) in result.items():
+        print(f"{name:>14}: {seconds:.3f}s in writers, slowest write {worst_ms:.2f} ms")
+    print(f"{'rotations':>14}: {rotations}")
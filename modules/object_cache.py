@@ -0,0 +1,401 @@
+"""
+Compiler wrapper cache for cl.exe style compilers (in the spirit of ccache).
+
+Run as a script: object_cache.py --compiler <real cl.exe> -- <compiler arguments>
+The module imports nothing from ClibDT so a generated cl.bat shim can start it directly.
+"""
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import hashlib
+import subprocess
+from pathlib import Path
+
+#----------Object Cache Settings----------
+CACHE_DIR_NAME = ".clibdt_objcache"
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+MAX_SIZE_ENV_VAR = "CLIBDT_OBJCACHE_MAX_GB"
+# Objects are spread over 16 buckets; each bucket gets 1/16 of the size cap and is trimmed on store
+BUCKET_COUNT = 16
+SOURCE_EXTENSIONS = (".cpp", ".cc", ".cxx", ".c")
+# Output/location flags that do not change the object's content. /Fp only names where the
+# precompiled header lives; what it contains is keyed by pch_identity()
+OUTPUT_FLAGS = ("/Fo", "-Fo", "/Fd", "-Fd", "/Fp", "-Fp")
+PCH_USE_FLAGS = ("/Yu", "-Yu")
+INCLUDE_FLAGS = ("/I", "-I")
+# Flags that make a compile uncacheable: shared PDBs written by every TU, or PCH creation
+UNCACHEABLE_FLAGS = ("/Zi", "-Zi", "/ZI", "-ZI", "/Yc", "-Yc")
+LINE_DIRECTIVE_RE = re.compile(rb'^\s*#(?:line)?\s*\d+\s+"[^"\n]*"[^\n]*\n', re.MULTILINE)
+STATS_EVENTS = ("hit", "miss", "uncacheable", "evicted")
+# stats.log is folded into one line per event once it grows past this
+STATS_LOG_MAX_BYTES = 256 * 1024
+
+
+def get_cache_root():
+    dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
+    base = Path(dev_root) if dev_root else Path.home()
+    return base / CACHE_DIR_NAME
+
+
+def get_max_bytes():
+    try:
+        return int(float(os.environ[MAX_SIZE_ENV_VAR]) * 1024 ** 3)
+    except (KeyError, ValueError):
+        return DEFAULT_MAX_BYTES
+
+
+#----------Argument Handling----------
+def _split_response_file(text):
+    """Split a response file the way cl.exe does (whitespace separated, double quotes group)"""
+    args, current, quoted, has_token = [], [], False, False
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+            has_token = True
+        elif ch.isspace() and not quoted:
+            if has_token:
+                args.append("".join(current))
+                current, has_token = [], False
+        else:
+            current.append(ch)
+            has_token = True
+    if has_token:
+        args.append("".join(current))
+    return args
+
+
+def expand_args(args):
+    """Inline @response files (xmake uses them for long command lines on Windows)"""
+    expanded = []
+    for arg in args:
+        if arg.startswith("@") and Path(arg[1:]).is_file():
+            raw = Path(arg[1:]).read_bytes()
+            if raw.startswith(b"\xff\xfe") or raw.startswith(b"\xfe\xff"):
+                text = raw.decode("utf-16")
+            else:
+                text = raw.decode("utf-8-sig", "replace")
+            expanded.extend(_split_response_file(text))
+        else:
+            expanded.append(arg)
+    return expanded
+
+
+def parse_compile_args(args):
+    """
+    Pick out what the cache needs from a cl.exe command line.
+    Returns (source, object_path, key_args) or None when the call is not a cacheable compile.
+    """
+    if "/c" not in args and "-c" not in args:
+        return None
+    if any(arg.startswith(flag) for arg in args for flag in UNCACHEABLE_FLAGS):
+        return None
+
+    sources = [a for a in args if not a.startswith(("/", "-")) and a.lower().endswith(SOURCE_EXTENSIONS)]
+    if len(sources) != 1:
+        return None
+    source = sources[0]
+
+    object_path = None
+    key_args = []
+    for arg in args:
+        if arg.startswith(("/Fo", "-Fo")):
+            object_path = arg[3:]
+        if arg == source or arg.startswith(OUTPUT_FLAGS):
+            continue
+        key_args.append(arg)
+
+    if object_path is None or object_path.endswith(("/", "\\")):
+        object_path = os.path.join(object_path or "", Path(source).stem + ".obj")
+    return source, object_path, key_args
+
+
+def preprocess_args(args, source):
+    """The same compile as a preprocess-only run to stdout"""
+    skip = ("/c", "-c", "/showIncludes", "-showIncludes")
+    kept = [a for a in args if a not in skip and a != source and not a.startswith(OUTPUT_FLAGS)]
+    return kept + ["/E", source]
+
+
+def _include_dirs(args):
+    dirs = []
+    for i, arg in enumerate(args):
+        if arg in INCLUDE_FLAGS and i + 1 < len(args):
+            dirs.append(args[i + 1])
+        elif arg.startswith(INCLUDE_FLAGS) and len(arg) > 2:
+            dirs.append(arg[2:])
+    return dirs
+
+
+def pch_identity(args, source):
+    """
+    Key parts for the precompiled header a compile uses (/Yu): the header's name and content.
+    The PCH is built from that header with the same flags as the TU, which are already in
+    the key, so this identifies it without hashing the (large, non-reproducible) .pch file.
+    """
+    header = next((arg[3:].strip('"') for arg in args if arg.startswith(PCH_USE_FLAGS)), None)
+    if header is None:
+        return []
+    digest = "missing"
+    for base in (Path(source).parent, Path.cwd(), *map(Path, _include_dirs(args))):
+        try:
+            digest = hashlib.blake2b((base / header).read_bytes(), digest_size=20).hexdigest()
+            break
+        except OSError:
+            continue
+    return [f"pch={header}|{digest}"]
+
+
+#----------Cache Key----------
+def compiler_identity(compiler):
+    """Path, size and mtime of the compiler binary (a toolchain update changes the key)"""
+    path = shutil.which(compiler) or compiler
+    try:
+        st = os.stat(path)
+        return f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    except OSError:
+        return os.path.abspath(path)
+
+
+def normalize_preprocessed(output):
+    """Drop #line markers so the same source in another folder hashes the same"""
+    return LINE_DIRECTIVE_RE.sub(b"", output.replace(b"\r\n", b"\n"))
+
+
+def compute_key(compiler, key_args, preprocessed):
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(compiler_identity(compiler).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update("\0".join(key_args).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_preprocessed(preprocessed))
+    return digest.hexdigest()
+
+
+#----------Store----------
+class ObjectCache:
+    """Size-capped LRU store of object files plus the compiler output to replay on a hit"""
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = Path(root) if root else get_cache_root()
+        self.max_bytes = max_bytes or get_max_bytes()
+
+    def _paths(self, key):
+        bucket = self.root / "objects" / key[0]
+        return bucket / f"{key}.obj", bucket / f"{key}.json"
+
+    def lookup(self, key, object_path):
+        """Copy a cached object to object_path; returns the stored compiler output or None"""
+        obj, meta = self._paths(key)
+        try:
+            with open(meta, "r", encoding="utf-8") as f:
+                info = json.load(f)
+            Path(object_path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(obj, object_path)
+            now = time.time()
+            # mtime is the LRU clock
+            os.utime(obj, (now, now))
+            os.utime(meta, (now, now))
+        except (OSError, ValueError):
+            return None
+        return info
+
+    def store(self, key, object_path, stdout, stderr):
+        obj, meta = self._paths(key)
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        try:
+            shutil.copyfile(object_path, str(obj) + suffix)
+            os.replace(str(obj) + suffix, obj)
+            with open(str(meta) + suffix, "w", encoding="utf-8") as f:
+                json.dump({"stdout": stdout, "stderr": stderr}, f)
+            os.replace(str(meta) + suffix, meta)
+        except OSError:
+            return
+        self.trim_bucket(obj.parent)
+
+    def trim_bucket(self, bucket):
+        """Evict least recently used entries until the bucket fits its share of the cap"""
+        limit = self.max_bytes // BUCKET_COUNT
+        entries = []
+        total = 0
+        try:
+            with os.scandir(bucket) as it:
+                for entry in it:
+                    if entry.name.endswith(".obj"):
+                        st = entry.stat()
+                        meta_size = 0
+                        try:
+                            meta_size = os.stat(entry.path[:-4] + ".json").st_size
+                        except OSError:
+                            pass
+                        entries.append((st.st_mtime, entry.path, st.st_size + meta_size))
+                        total += st.st_size + meta_size
+        except OSError:
+            return
+        if total <= limit:
+            return
+        evicted = 0
+        for _, path, size in sorted(entries):
+            if total <= limit * 0.9:
+                break
+            for doomed in (path, path[:-4] + ".json"):
+                try:
+                    os.unlink(doomed)
+                except OSError:
+                    pass
+            total -= size
+            evicted += 1
+        if evicted:
+            self.record("evicted", evicted)
+
+    #----------Statistics----------
+    def record(self, event, count=1):
+        """Append events to a log; small O_APPEND writes are safe across parallel compiles"""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.root / "stats.log", os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+            try:
+                os.write(fd, f"{event} {count}\n".encode("ascii"))
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+        except OSError:
+            return
+        if size > STATS_LOG_MAX_BYTES:
+            self.compact_stats()
+
+    def _read_counts(self):
+        counts = dict.fromkeys(STATS_EVENTS, 0)
+        try:
+            with open(self.root / "stats.log", "r", encoding="ascii") as f:
+                for line in f:
+                    event, _, count = line.partition(" ")
+                    if event in counts:
+                        counts[event] += int(count or 1)
+        except (OSError, ValueError):
+            pass
+        return counts
+
+    def compact_stats(self):
+        """
+        Replace the log with one line per event. An event appended by another compile
+        between the read and the replace can be lost, which only skews the counters.
+        """
+        path = self.root / "stats.log"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="ascii") as f:
+                f.writelines(f"{event} {count}\n" for event, count in self._read_counts().items() if count)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def stats(self):
+        """{'hit', 'miss', 'uncacheable', 'evicted', 'entries', 'size_bytes'}"""
+        counts = self._read_counts()
+        entries = size = 0
+        objects = self.root / "objects"
+        if objects.is_dir():
+            for bucket in objects.iterdir():
+                for path in bucket.glob("*.obj"):
+                    entries += 1
+                    try:
+                        size += path.stat().st_size
+                    except OSError:
+                        pass
+        counts.update(entries=entries, size_bytes=size)
+        return counts
+
+    def clear(self):
+        shutil.rmtree(self.root / "objects", ignore_errors=True)
+        try:
+            (self.root / "stats.log").unlink()
+        except OSError:
+            pass
+
+
+def format_stats(stats):
+    lookups = stats["hit"] + stats["miss"]
+    rate = f"{stats['hit'] / lookups * 100:.0f}%" if lookups else "n/a"
+    return (f"hits {stats['hit']}, misses {stats['miss']} (hit rate {rate}), "
+            f"uncacheable {stats['uncacheable']}, evicted {stats['evicted']}, "
+            f"{stats['entries']} objects / {stats['size_bytes'] / 1024 ** 2:.0f} MB")
+
+
+#----------Wrapper----------
+def run_compiler(compiler, args, cache=None):
+    """Compile through the cache; returns the compiler's exit code"""
+    cache = cache or ObjectCache()
+    args = expand_args(args)
+    parsed = parse_compile_args(args)
+    if parsed is None:
+        cache.record("uncacheable")
+        return subprocess.call([compiler, *args])
+
+    source, object_path, key_args = parsed
+    pre = subprocess.run([compiler, *preprocess_args(args, source)], capture_output=True)
+    if pre.returncode != 0:
+        # Let the real compile report the error
+        cache.record("uncacheable")
+        return subprocess.call([compiler, *args])
+
+    key = compute_key(compiler, key_args + pch_identity(args, source), pre.stdout)
+    info = cache.lookup(key, object_path)
+    if info is not None:
+        cache.record("hit")
+        # Replay what cl printed (the source name and /showIncludes notes xmake reads for deps)
+        sys.stdout.write(info.get("stdout", ""))
+        sys.stderr.write(info.get("stderr", ""))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        return 0
+
+    result = subprocess.run([compiler, *args], capture_output=True, text=True, errors="replace")
+    sys.stdout.write(result.stdout)
+    sys.stderr.write(result.stderr)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if result.returncode == 0 and Path(object_path).is_file():
+        cache.record("miss")
+        cache.store(key, object_path, result.stdout, result.stderr)
+    else:
+        cache.record("uncacheable")
+    return result.returncode
+
+
+def write_compiler_shim(real_compiler, shim_dir=None):
+    """
+    Create a cl.bat that routes compiles through this wrapper. xmake picks the
+    tool family from the program name, so the shim keeps the name 'cl'.
+    """
+    shim_dir = Path(shim_dir) if shim_dir else get_cache_root() / "shim"
+    shim_dir.mkdir(parents=True, exist_ok=True)
+    shim = shim_dir / "cl.bat"
+    content = (f'@"{sys.executable}" "{Path(__file__).resolve()}" '
+               f'--compiler "{real_compiler}" -- %*\r\n'
+               f"@exit /b %ERRORLEVEL%\r\n")
+    if not shim.exists() or shim.read_text(encoding="utf-8", errors="replace") != content:
+        shim.write_text(content, encoding="utf-8")
+    return shim
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["--stats"]:
+        print(format_stats(ObjectCache().stats()))
+        return 0
+    if argv[:1] == ["--clear"]:
+        ObjectCache().clear()
+        return 0
+    if len(argv) < 3 or argv[0] != "--compiler" or "--" not in argv:
+        print("usage: object_cache.py --compiler <cl.exe> -- <args> | --stats | --clear", file=sys.stderr)
+        return 2
+    separator = argv.index("--")
+    return run_compiler(argv[1], argv[separator + 1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
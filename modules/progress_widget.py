@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread
 from PyQt6.QtGui import QFont
+from modules.theme_manager import set_theme_scope
 import time
 
 
@@ -17,6 +18,7 @@ class ProgressWidget(QWidget):
     
     def __init__(self, parent=None, title="Operation in Progress", show_cancel=True):
         super().__init__(parent)
+        set_theme_scope(self, "ProgressWidget")
         self.title = title
         self.show_cancel = show_cancel
         self.is_cancelled = False
@@ -208,120 +210,8 @@ class ProgressWidget(QWidget):
             self.ok_btn.setVisible(False)
     
     def set_theme_manager(self, theme_manager):
-        """Set theme manager for styling"""
+        """Keep the theme manager; the styling comes from the application stylesheet"""
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-    
-
-    
-    def apply_theme(self):
-        """Apply current theme to the progress widget"""
-        if hasattr(self, 'theme_manager') and self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            # Fallback theme
-            theme = {
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'success_color': '#27ae60',
-                'error_color': '#e74c3c',
-                'warning_color': '#f39c12',
-                'separator': '#404040'
-            }
-        
-        self.setStyleSheet(f"""
-            ProgressWidget {{
-                background-color: {theme['bg_primary']};
-                border: 1px solid {theme['separator']};
-                border-radius: 6px;
-                padding: 8px;
-            }}
-            
-            ProgressWidget QLabel#progress_title {{
-                color: {theme['text_primary']};
-                font-size: 13px;
-                font-weight: bold;
-                background: transparent;
-            }}
-            
-            ProgressWidget QLabel#progress_status {{
-                color: {theme['text_secondary']};
-                font-size: 11px;
-                background: transparent;
-            }}
-            
-            ProgressWidget QProgressBar {{
-                border: 2px solid {theme['separator']};
-                border-radius: 4px;
-                text-align: center;
-                background-color: {theme['window_bg']};
-                color: {theme['text_primary']};
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            
-            ProgressWidget QProgressBar::chunk {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['button_bg']}, stop:1 {theme['button_pressed']});
-                border-radius: 2px;
-            }}
-            
-            ProgressWidget QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['button_bg']}, stop:1 {theme['button_pressed']});
-                color: #ffffff;
-                border: 1px solid {theme['button_bg']};
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            
-            ProgressWidget QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['button_hover']}, stop:1 {theme['button_bg']});
-                border: 1px solid {theme['button_hover']};
-            }}
-            
-            ProgressWidget QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['button_pressed']}, stop:1 {theme['button_pressed']});
-                border: 1px solid {theme['button_pressed']};
-            }}
-            
-            ProgressWidget QPushButton[btnType="danger"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
-                border: 1px solid {theme['error_color']};
-            }}
-            
-            ProgressWidget QPushButton[btnType="danger"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
-                border: 1px solid {theme['error_color']};
-                opacity: 0.9;
-            }}
-            
-            ProgressWidget QPushButton[btnType="success"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']});
-                border: 1px solid {theme['success_color']};
-            }}
-            
-            ProgressWidget QPushButton[btnType="success"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']});
-                border: 1px solid {theme['success_color']};
-                opacity: 0.9;
-            }}
-        """)
 
 
 class OperationThread(QThread):
@@ -372,6 +262,7 @@ class ActivityIndicator(QWidget):
     
     def __init__(self, parent=None, message="Processing..."):
         super().__init__(parent)
+        set_theme_scope(self, "ActivityIndicator")
         self.message = message
         self.setup_ui()
         
@@ -423,31 +314,6 @@ class ActivityIndicator(QWidget):
         """Update the activity message"""
         self.message = message
         self.message_label.setText(message)
-    
-    def apply_theme(self, theme):
-        """Apply theme to the activity indicator"""
-        self.setStyleSheet(f"""
-            ActivityIndicator {{
-                background-color: {theme['bg_primary']};
-                border: 1px solid {theme['separator']};
-                border-radius: 4px;
-                padding: 4px;
-            }}
-            
-            ActivityIndicator QLabel#activity_message {{
-                color: {theme['text_secondary']};
-                font-size: 11px;
-                background: transparent;
-            }}
-            
-            ActivityIndicator QLabel#activity_spinner {{
-                color: {theme['button_bg']};
-                font-size: 12px;
-                font-weight: bold;
-                background: transparent;
-                min-width: 20px;
-            }}
-        """)
 
 
 # Utility functions for common progress patterns
@@ -541,9 +407,11 @@ def create_install_progress(operation_name="Installation"):
 
 def create_build_progress(operation_name="Build"):
     """Create a progress function for build operations"""
-    def build_progress(progress_callback, status_callback, build_command, **kwargs):
+    def build_progress(progress_callback, status_callback, build_command, project_path=None, build_mode="release", jobs=1, **kwargs):
         import subprocess
         import sys
+        from pathlib import Path
+        from modules.build_eta import BuildEtaEstimator, format_eta
         
         try:
             status_callback(f"Starting {operation_name}...")
@@ -551,7 +419,6 @@ def create_build_progress(operation_name="Build"):
             
             # Run build command
             status_callback(f"Running build command...")
-            progress_callback(10, 100)
             
             creationflags = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
             process = subprocess.Popen(
@@ -562,15 +429,19 @@ def create_build_progress(operation_name="Build"):
                 creationflags=creationflags
             )
             
-            # Monitor output and update progress
-            progress = 10
+            # Progress comes from xmake's [ N%] lines and past build durations, not line counts
+            eta = BuildEtaEstimator(project_path or Path.cwd(), build_mode, jobs)
             for line in process.stdout:
-                status_callback(line.strip())
-                if progress < 90:
-                    progress += 2
-                    progress_callback(progress, 100)
+                line = line.strip()
+                status_callback(line)
+                estimate = eta.feed(line)
+                if estimate:
+                    percent, remaining = estimate
+                    progress_callback(percent, 100)
+                    status_callback(f"ETA: {format_eta(remaining)}")
             
             process.wait()
+            eta.finish(process.returncode == 0)
             
             if process.returncode == 0:
                 status_callback(f"{operation_name} completed successfully")
@@ -0,0 +1,365 @@
+"""
+Health probes for every project under the dev root, run concurrently.
+
+    python -m modules.project_health [--root DIR] [--workers N] [--force]
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from modules.project_index import get_project_index, parse_xmake_metadata
+from modules.build_eta import load_build_history, HISTORY_DIR_NAME
+from modules.config_utils import get_config_directory
+
+#----------Health Settings----------
+DEFAULT_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+# Refreshing the dashboard for 100 projects should stay under this
+TARGET_SECONDS = 2.0
+GIT_TIMEOUT = 5.0
+DISK_TIMEOUT = 3.0
+# Results are reused while their stamp is unchanged and they are younger than the TTL
+GIT_TTL = 30.0
+DISK_TTL = 300.0
+DEPENDENCY_DIRS = ("ClibUtil", "xbyak")
+DISK_DIRS = ("build", ".xmake", "backups")
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+#----------Probes----------
+# Each probe takes (project path, deadline) and returns a small dict; errors become {"error": ...}
+
+def probe_git(path, deadline):
+    if not (path / ".git").exists():
+        return {"repo": False}
+    timeout = max(0.1, min(GIT_TIMEOUT, deadline - time.monotonic()))
+    # --no-optional-locks keeps concurrent status calls from contending for index.lock
+    result = subprocess.run(
+        ["git", "--no-optional-locks", "-C", str(path), "status", "--porcelain=v1", "--branch"],
+        capture_output=True, text=True, errors="replace", timeout=timeout, creationflags=_CREATION_FLAGS)
+    if result.returncode != 0:
+        return {"error": (result.stderr.strip().splitlines() or ["git status failed"])[-1]}
+    lines = result.stdout.splitlines()
+    branch_line = lines[0] if lines and lines[0].startswith("## ") else ""
+    ahead = behind = 0
+    upstream = "..." in branch_line
+    if "[" in branch_line:
+        for part in branch_line[branch_line.rindex("[") + 1:].rstrip("]").split(","):
+            count = part.split()
+            if len(count) == 2 and count[1].isdigit():
+                if count[0] == "ahead":
+                    ahead = int(count[1])
+                elif count[0] == "behind":
+                    behind = int(count[1])
+    branch = branch_line[3:]
+    if branch.startswith("No commits yet on "):
+        branch = branch[len("No commits yet on "):]
+    branch = branch.split("...")[0].split(" ")[0]
+    changed = len(lines) - (1 if branch_line else 0)
+    return {"repo": True, "branch": branch, "dirty": changed > 0, "changed": changed,
+            "ahead": ahead, "behind": behind, "upstream": upstream}
+
+
+def _git_stamp(path):
+    git_dir = path / ".git"
+    return tuple(_mtime(git_dir / name) for name in ("index", "HEAD", "FETCH_HEAD")) + (_mtime(git_dir),)
+
+
+def probe_dependencies(path, deadline):
+    present = {}
+    for name in DEPENDENCY_DIRS:
+        folder = path / name
+        try:
+            present[name] = folder.is_dir() and any(os.scandir(folder))
+        except OSError:
+            present[name] = False
+    return present
+
+
+def probe_xmake(path, deadline):
+    xmake_file = path / "xmake.lua"
+    if not xmake_file.exists():
+        return {"valid": False, "reason": "missing"}
+    meta = parse_xmake_metadata(xmake_file)
+    if meta is None:
+        return {"valid": False, "reason": "unreadable"}
+    if "target" not in meta:
+        return {"valid": False, "reason": "no target()"}
+    return {"valid": True, "target": meta["target"], "version": meta.get("version")}
+
+
+def probe_last_build(path, deadline):
+    latest = None
+    for mode, entry in load_build_history(path).items():
+        if isinstance(entry, dict) and entry.get("last_finished"):
+            if latest is None or entry["last_finished"] > latest["finished"]:
+                latest = {"mode": mode, "success": entry.get("last_success"),
+                          "finished": entry["last_finished"], "duration": entry.get("last_duration")}
+    return latest or {"finished": None}
+
+
+def _tree_size(folder, deadline):
+    total = 0
+    stack = [str(folder)]
+    while stack:
+        if time.monotonic() > deadline:
+            return total, False
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total, True
+
+
+def probe_disk_usage(path, deadline):
+    sizes = {}
+    complete = True
+    for name in DISK_DIRS:
+        size, done = _tree_size(path / name, deadline)
+        sizes[name] = size
+        complete = complete and done
+    sizes["complete"] = complete
+    return sizes
+
+
+def probe_snapshot(path, deadline):
+    newest = None
+    try:
+        with os.scandir(path / "backups") as it:
+            for entry in it:
+                if entry.name.endswith(".zip") and entry.is_file():
+                    mtime = entry.stat().st_mtime
+                    newest = mtime if newest is None or mtime > newest else newest
+    except OSError:
+        pass
+    return {"saved": newest}
+
+
+class Probe:
+    __slots__ = ("name", "func", "stamp", "ttl", "timeout")
+
+    def __init__(self, name, func, stamp, ttl=None, timeout=1.0):
+        self.name = name
+        self.func = func
+        self.stamp = stamp    # cheap fingerprint; a change invalidates the cached result
+        self.ttl = ttl        # seconds, None = valid until the stamp changes
+        self.timeout = timeout
+
+
+PROBES = (
+    Probe("git", probe_git, _git_stamp, ttl=GIT_TTL, timeout=GIT_TIMEOUT),
+    Probe("deps", probe_dependencies, lambda p: tuple(_mtime(p / d) for d in DEPENDENCY_DIRS)),
+    Probe("xmake", probe_xmake, lambda p: _mtime(p / "xmake.lua")),
+    Probe("build", probe_last_build, lambda p: _mtime(get_config_directory() / HISTORY_DIR_NAME / f"{p.name}.json")),
+    Probe("disk", probe_disk_usage, lambda p: tuple(_mtime(p / d) for d in DISK_DIRS), ttl=DISK_TTL,
+          timeout=DISK_TIMEOUT),
+    Probe("snapshot", probe_snapshot, lambda p: _mtime(p / "backups")),
+)
+PROBE_NAMES = tuple(probe.name for probe in PROBES)
+
+
+#----------Scanner----------
+class HealthScanner:
+    """
+    Runs every probe for every project on one bounded thread pool. Cached results are
+    reported first, then fresh ones as they complete, so a view can fill in progressively.
+    Probes enforce their own timeouts since a running thread cannot be interrupted:
+    git status is killed and reports {"error": "timed out"}, disk walks stop and report
+    partial sizes.
+    """
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, probes=PROBES):
+        self.max_workers = max_workers
+        self.probes = probes
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.last_elapsed = None
+
+    def _cached(self, path, probe, stamp, now):
+        with self._lock:
+            entry = self._cache.get((str(path), probe.name))
+        if entry is None or entry[0] != stamp:
+            return None
+        if probe.ttl is not None and now - entry[1] > probe.ttl:
+            return None
+        return entry[2]
+
+    def _run_probe(self, path, probe, stamp):
+        started = time.monotonic()
+        try:
+            result = probe.func(path, started + probe.timeout)
+        except subprocess.TimeoutExpired:
+            result = {"error": "timed out"}
+        except Exception as e:
+            result = {"error": str(e)}
+        if "error" not in result:
+            with self._lock:
+                self._cache[(str(path), probe.name)] = (stamp, time.monotonic(), result)
+        return result
+
+    def scan(self, projects, on_result=None, force=False):
+        """
+        projects: iterable of (name, path). Calls on_result(name, probe name, result) as
+        results arrive (on the calling thread) and returns {name: {probe name: result}}.
+        """
+        start = time.perf_counter()
+        results = {}
+        now = time.monotonic()
+
+        def report(name, probe_name, result):
+            results.setdefault(name, {})[probe_name] = result
+            if on_result:
+                on_result(name, probe_name, result)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ClibDTHealth") as pool:
+            pending = []
+            for name, path in projects:
+                path = Path(path)
+                for probe in self.probes:
+                    stamp = probe.stamp(path)
+                    cached = None if force else self._cached(path, probe, stamp, now)
+                    if cached is not None:
+                        report(name, probe.name, cached)
+                    else:
+                        pending.append((name, probe, pool.submit(self._run_probe, path, probe, stamp)))
+            for name, probe, future in _completed(pending):
+                report(name, probe.name, future.result())
+        self.last_elapsed = time.perf_counter() - start
+        return results
+
+    def scan_async(self, projects, on_result, on_done=None, force=False):
+        """scan() on a daemon thread; callbacks run on that thread"""
+        projects = list(projects)
+
+        def run():
+            results = self.scan(projects, on_result, force)
+            if on_done:
+                on_done(results)
+        thread = threading.Thread(target=run, name="ClibDTHealthScan", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+def _completed(pending):
+    """Yield (name, probe, future) in completion order"""
+    by_future = {future: (name, probe) for name, probe, future in pending}
+    remaining = set(by_future)
+    while remaining:
+        done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            name, probe = by_future[future]
+            yield name, probe, future
+
+
+def index_projects(root=None):
+    """(name, path) of every folder the project index knows, refreshed first"""
+    index = get_project_index(root)
+    if index is None:
+        return []
+    index.refresh(notify=False)
+    return [(record.name, record.path) for record in index.projects(valid_only=False)]
+
+
+#----------Formatting----------
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
+
+
+def format_age(timestamp, now=None):
+    if not timestamp:
+        return "never"
+    seconds = max(0, (now or time.time()) - timestamp)
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m ago"
+    if seconds < 86400:
+        return f"{seconds / 3600:.0f}h ago"
+    return f"{seconds / 86400:.0f}d ago"
+
+
+def format_probe(probe_name, result):
+    """(text, state) for one cell; state is 'ok', 'warn', 'error' or 'info'"""
+    if result is None:
+        return "...", "info"
+    if "error" in result:
+        return result["error"], "error"
+    if probe_name == "git":
+        if not result["repo"]:
+            return "no repo", "info"
+        text = f"{result['branch']} " + (f"dirty ({result['changed']})" if result["dirty"] else "clean")
+        if result["ahead"] or result["behind"]:
+            text += f" +{result['ahead']}/-{result['behind']}"
+        return text, "warn" if result["dirty"] or result["behind"] else "ok"
+    if probe_name == "deps":
+        missing = [name for name, present in result.items() if not present]
+        return ("missing " + ", ".join(missing), "warn") if missing else ("ClibUtil, xbyak", "ok")
+    if probe_name == "xmake":
+        return ("valid", "ok") if result["valid"] else (result["reason"], "error")
+    if probe_name == "build":
+        if not result.get("finished"):
+            return "never built", "info"
+        outcome = "ok" if result.get("success") else "failed"
+        return f"{outcome} {result['mode']} {format_age(result['finished'])}", "ok" if result.get("success") else "error"
+    if probe_name == "disk":
+        text = " / ".join(format_size(result[name]) for name in DISK_DIRS)
+        return (text if result["complete"] else text + " (partial)"), "info"
+    if probe_name == "snapshot":
+        return format_age(result["saved"]), "info" if result["saved"] else "warn"
+    return str(result), "info"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Project health for every project under the dev root")
+    parser.add_argument("--root", default=None, help="projects folder (default <dev root>/projects)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--force", action="store_true", help="ignore cached probe results")
+    args = parser.parse_args(argv)
+
+    projects = index_projects(args.root)
+    if not projects:
+        print("[ERROR] No projects found (set XSE_CLIBDT_DEVROOT or pass --root)")
+        return 1
+    scanner = HealthScanner(args.workers)
+    results = scanner.scan(projects, force=args.force)
+    width = max(len(name) for name, _ in projects)
+    print(f"{'project':<{width}}  " + "  ".join(f"{name:<18}" for name in PROBE_NAMES))
+    for name, _ in projects:
+        cells = [format_probe(probe, results[name].get(probe))[0][:18] for probe in PROBE_NAMES]
+        print(f"{name:<{width}}  " + "  ".join(f"{cell:<18}" for cell in cells))
+    cold = scanner.last_elapsed
+    scanner.scan(projects)
+    state = "OK" if cold <= TARGET_SECONDS else "WARN"
+    print(f"\n[{state}] {len(projects)} projects: {cold:.2f} s cold, {scanner.last_elapsed:.2f} s cached "
+          f"({args.workers} workers, target {TARGET_SECONDS:.0f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,374 @@
+import os
+import re
+import json
+import threading
+from pathlib import Path
+
+#----------Project Index Settings----------
+PROJECT_FILES = ("clibdt_project.json", "clib_project.json", "xmake.lua")
+# Fields generate_clib_project.is_valid_clib_project requires in clib_project.json
+CLIB_REQUIRED_FIELDS = ("project_name", "version", "project_type")
+_XMAKE_FIELDS = {
+    "project": re.compile(r'set_project\("([^"]+)"\)'),
+    "version": re.compile(r'set_version\("([^"]+)"\)'),
+    "description": re.compile(r'set_description\("([^"]+)"\)'),
+    "target": re.compile(r'\btarget\("([^"]+)"\)'),
+}
+
+
+class ProjectRecord:
+    """What the pickers need to know about one project folder"""
+
+    __slots__ = ("name", "path", "ident", "stamps", "clibdt_meta", "clib_meta", "xmake_meta")
+
+    def __init__(self, path, ident=None):
+        self.path = Path(path)
+        self.name = self.path.name
+        # Folder inode, used to recognise a rename (same folder, new name)
+        self.ident = ident
+        # file name -> (mtime_ns, size) of the files parsed below, None when missing
+        self.stamps = {}
+        self.clibdt_meta = None
+        self.clib_meta = None
+        self.xmake_meta = None
+
+    @property
+    def is_valid(self):
+        """The panels' rule (refresh_project.is_valid_clib_project): clibdt_project.json or xmake.lua"""
+        return self.stamps.get("clibdt_project.json") is not None or self.stamps.get("xmake.lua") is not None
+
+    @property
+    def has_clib_project(self):
+        """generate_clib_project's rule: clib_project.json with the required fields"""
+        return bool(self.clib_meta) and all(field in self.clib_meta for field in CLIB_REQUIRED_FIELDS)
+
+    def rename(self, path):
+        self.path = Path(path)
+        self.name = self.path.name
+
+    def metadata(self):
+        """Merged view: xmake.lua values, overridden by the project json files"""
+        merged = dict(self.xmake_meta or {})
+        merged.update(self.clib_meta or {})
+        merged.update(self.clibdt_meta or {})
+        return merged
+
+
+class ProjectChanges:
+    """What a refresh changed in the list of valid projects"""
+
+    __slots__ = ("added", "removed", "renamed", "updated")
+
+    def __init__(self, added=(), removed=(), renamed=(), updated=()):
+        self.added = sorted(added)
+        self.removed = sorted(removed)
+        self.renamed = sorted(renamed)  # (old name, new name)
+        self.updated = sorted(updated)  # still listed, project files changed
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.renamed or self.updated)
+
+    def __repr__(self):
+        return (f"ProjectChanges(added={self.added}, removed={self.removed}, "
+                f"renamed={self.renamed}, updated={self.updated})")
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def parse_xmake_metadata(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            content = f.read()
+    except OSError:
+        return None
+    meta = {}
+    for key, pattern in _XMAKE_FIELDS.items():
+        match = pattern.search(content)
+        if match:
+            meta[key] = match.group(1)
+    return meta
+
+
+class ProjectIndex:
+    """
+    In-memory index of the project folders under one directory (normally <dev root>/projects).
+
+    The folder is scanned once; refresh() re-stats it and re-parses only the project files
+    whose mtime or size changed. Readers (projects(), names(), get()) never touch the disk.
+    Listeners registered with subscribe() are called after a refresh that changed something.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._records = {}
+        self._listeners = []
+        self._lock = threading.RLock()
+        self.loaded = False
+        self._root_exists = False
+        self.scans = 0
+        self.parses = 0
+
+    #----------Scanning----------
+    def _update_record(self, record):
+        """Re-parse the files of one project whose stamps changed; True if anything did"""
+        changed = False
+        for file_name in PROJECT_FILES:
+            stamp = _stamp(record.path / file_name)
+            if file_name in record.stamps and record.stamps[file_name] == stamp:
+                continue
+            record.stamps[file_name] = stamp
+            changed = True
+            self.parses += stamp is not None
+            if file_name == "clibdt_project.json":
+                record.clibdt_meta = _read_json(record.path / file_name) if stamp else None
+            elif file_name == "clib_project.json":
+                record.clib_meta = _read_json(record.path / file_name) if stamp else None
+            else:
+                record.xmake_meta = parse_xmake_metadata(record.path / file_name) if stamp else None
+        return changed
+
+    def _list_root(self):
+        """{folder name: (path, inode)} of the project folders, or None when the folder is missing"""
+        found = {}
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        found[entry.name] = (entry.path, entry.inode())
+        except OSError:
+            return None
+        return found
+
+    def _valid_view(self):
+        return {name: record.ident for name, record in self._records.items() if record.is_valid}
+
+    def _diff(self, before, changed_names):
+        """ProjectChanges between a _valid_view() taken before an update and the current state"""
+        after = self._valid_view()
+        gone = {name: ident for name, ident in before.items() if name not in after}
+        new = {name: ident for name, ident in after.items() if name not in before}
+        by_ident = {ident: name for name, ident in new.items() if ident}
+        renamed = []
+        for old, ident in gone.items():
+            if ident and ident in by_ident:
+                renamed.append((old, by_ident.pop(ident)))
+        renamed_old = {old for old, _ in renamed}
+        renamed_new = {new_name for _, new_name in renamed}
+        return ProjectChanges(
+            added=[n for n in new if n not in renamed_new],
+            removed=[n for n in gone if n not in renamed_old],
+            renamed=renamed,
+            updated=[n for n in changed_names if n in before and n in after])
+
+    def refresh(self, notify=True, projects=None):
+        """
+        Bring the index up to date with the disk and return the ProjectChanges.
+        By default every project's files are re-stat'ed; with `projects` (names) only
+        those and newly appeared folders are, for callers that know what was touched.
+        """
+        with self._lock:
+            self.scans += 1
+            before = self._valid_view()
+            found = self._list_root()
+            self._root_exists = found is not None
+            found = found or {}
+            removed = {name: record for name, record in self._records.items() if name not in found}
+            for name in removed:
+                del self._records[name]
+            # A folder that disappeared and one that appeared with the same inode is a rename
+            by_ident = {record.ident: record for record in removed.values() if record.ident}
+            changed_names = set()
+            for name, (path, ident) in found.items():
+                record = self._records.get(name)
+                if record is None:
+                    record = by_ident.pop(ident, None) if ident else None
+                    if record is not None:
+                        record.rename(path)
+                    else:
+                        record = ProjectRecord(path, ident)
+                    self._records[name] = record
+                elif projects is not None and name not in projects:
+                    continue
+                if self._update_record(record):
+                    changed_names.add(name)
+            first_load = not self.loaded
+            self.loaded = True
+            changes = self._diff(before, changed_names)
+        if notify and changes and not first_load:
+            self.notify(changes)
+        return changes
+
+    def refresh_project(self, name, notify=True):
+        """Re-check a single project folder without listing the projects folder"""
+        with self._lock:
+            before = self._valid_view()
+            path = self.root / name
+            try:
+                ident = os.stat(path).st_ino if path.is_dir() else None
+            except OSError:
+                ident = None
+            changed_names = set()
+            if ident is None:
+                self._records.pop(name, None)
+            else:
+                record = self._records.get(name)
+                if record is None:
+                    record = self._records[name] = ProjectRecord(path, ident)
+                if self._update_record(record):
+                    changed_names.add(name)
+            changes = self._diff(before, changed_names)
+        if notify and changes:
+            self.notify(changes)
+        return changes
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.refresh(notify=False)
+
+    #----------Queries----------
+    def root_exists(self):
+        """Whether the projects folder existed at the last scan"""
+        self.ensure_loaded()
+        return self._root_exists
+
+    def projects(self, valid_only=True):
+        """Sorted ProjectRecords; valid_only uses the panels' validity rule"""
+        self.ensure_loaded()
+        with self._lock:
+            records = [r for r in self._records.values() if r.is_valid or not valid_only]
+        return sorted(records, key=lambda r: r.name)
+
+    def names(self, valid_only=True):
+        return [r.name for r in self.projects(valid_only)]
+
+    def get(self, name):
+        self.ensure_loaded()
+        with self._lock:
+            return self._records.get(name)
+
+    #----------Notifications----------
+    def subscribe(self, callback):
+        """callback(index, changes) after every refresh that changed the valid projects"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def notify(self, changes):
+        for callback in list(self._listeners):
+            try:
+                callback(self, changes)
+            except Exception as e:
+                print(f"[WARN] Project list listener failed: {e}")
+
+
+#----------Shared Instances----------
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_projects_root():
+    dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
+    return Path(dev_root) / "projects" if dev_root else None
+
+
+def get_project_index(root=None):
+    """The shared index for root (default <dev root>/projects), or None without a dev root"""
+    root = Path(root) if root else get_projects_root()
+    if root is None:
+        return None
+    key = os.path.normcase(os.path.abspath(root))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = ProjectIndex(root)
+    return index
+
+
+def fill_project_combo(combo, names, last_project=None, empty_text="No valid ClibDT projects found"):
+    """
+    Repopulate a picker from index names, keeping the last used project selected.
+    Signals are held while the items are rebuilt so handlers see only the final selection.
+    """
+    previous = combo.currentText()
+    combo.blockSignals(True)
+    try:
+        combo.clear()
+        if not names:
+            combo.addItem(empty_text)
+        else:
+            for name in names:
+                combo.addItem(name, name)
+            combo.setCurrentText(last_project if last_project in names else names[0])
+    finally:
+        combo.blockSignals(False)
+    if combo.currentText() != previous:
+        combo.currentTextChanged.emit(combo.currentText())
+
+
+def _project_rows(combo):
+    """Row of every project item (placeholders have no item data)"""
+    return {combo.itemData(i): i for i in range(combo.count()) if combo.itemData(i) is not None}
+
+
+def _insert_sorted(combo, name):
+    row = 0
+    while row < combo.count() and (combo.itemData(row) is None or combo.itemData(row) < name):
+        row += 1
+    combo.insertItem(row, name, name)
+
+
+def apply_project_changes(combo, changes, empty_text="No valid ClibDT projects found"):
+    """
+    Patch a picker filled by fill_project_combo in place: renamed items move to their sorted
+    position and stay selected, added ones are inserted in order, removed ones are dropped.
+    Pass empty_text=None for pickers that should not show a placeholder.
+    """
+    previous = combo.currentText()
+    current = combo.currentData()
+    combo.blockSignals(True)
+    try:
+        rows = _project_rows(combo)
+        for old, new in changes.renamed:
+            if old in rows:
+                combo.removeItem(combo.findData(old))
+                _insert_sorted(combo, new)
+                if current == old:
+                    current = new
+        for name in changes.removed:
+            row = combo.findData(name)
+            if row >= 0:
+                combo.removeItem(row)
+        for name in changes.added:
+            if combo.findData(name) < 0:
+                _insert_sorted(combo, name)
+        has_projects = bool(_project_rows(combo))
+        # Drop the "No ..." placeholder once there is a project, or show it when none are left
+        for row in range(combo.count() - 1, -1, -1):
+            if combo.itemData(row) is None and has_projects:
+                combo.removeItem(row)
+        if not has_projects and combo.count() == 0 and empty_text:
+            combo.addItem(empty_text)
+        if current is not None and combo.findData(current) >= 0:
+            combo.setCurrentIndex(combo.findData(current))
+    finally:
+        combo.blockSignals(False)
+    if combo.currentText() != previous:
+        combo.currentTextChanged.emit(combo.currentText())
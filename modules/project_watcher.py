@@ -0,0 +1,157 @@
+import os
+import time
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+from modules.source_watcher import POLLING_ENV_VAR
+
+#----------Watcher Settings----------
+DEFAULT_DEBOUNCE_MS = 400
+# A burst that never settles (a long clone) is still applied at least this often
+MAX_DELAY_MS = 3000
+DEFAULT_POLL_INTERVAL_MS = 5000
+
+
+class ProjectsWatcher(QObject):
+    """
+    Keeps a ProjectIndex current while ClibDT runs. Watches the projects folder (folders
+    added, removed or renamed) plus the top level of folders that are not valid projects
+    yet, so a clone in progress is picked up once its xmake.lua lands. Trees are never
+    watched, so thousands of files written into src/ or .git/ cost nothing, and valid
+    project folders are left unwatched (Windows would refuse to rename a watched folder).
+    Events are collected until the burst settles, then only the touched projects are
+    re-checked and the index publishes the resulting ProjectChanges. Falls back to polling
+    the index when native notifications are unavailable.
+    """
+
+    changed = pyqtSignal(object)  # ProjectChanges
+
+    def __init__(self, index, debounce_ms=DEFAULT_DEBOUNCE_MS, max_delay_ms=MAX_DELAY_MS,
+                 poll_interval_ms=DEFAULT_POLL_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.mode = "stopped"
+        self.max_delay = max_delay_ms / 1000.0
+        self._watcher = None
+        self._root_dirty = False
+        self._dirty_projects = set()
+        self._first_event = None
+        self.events = 0
+        self.updates = 0
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self._apply_pending)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+    def start(self):
+        """Begin watching; returns the mode in use ('native' or 'polling')"""
+        self.stop()
+        self.index.ensure_loaded()
+
+        if os.getenv(POLLING_ENV_VAR) != "1":
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.directoryChanged.connect(self._on_fs_event)
+            if self._sync_watch_paths():
+                self.mode = "native"
+                return self.mode
+            self._watcher.deleteLater()
+            self._watcher = None
+
+        self._poll_timer.start()
+        self.mode = "polling"
+        return self.mode
+
+    def stop(self):
+        self._debounce.stop()
+        self._poll_timer.stop()
+        if self._watcher is not None:
+            paths = self._watcher.directories()
+            if paths:
+                self._watcher.removePaths(paths)
+            self._watcher.deleteLater()
+            self._watcher = None
+        self._root_dirty = False
+        self._dirty_projects.clear()
+        self._first_event = None
+        self.mode = "stopped"
+
+    def is_active(self):
+        return self.mode != "stopped"
+
+    #----------Native Notifications----------
+    def _desired_paths(self):
+        root = self.index.root
+        if not self.index.root_exists():
+            # Wait for the projects folder itself to be created
+            return {str(root.parent)} if root.parent.is_dir() else set()
+        paths = {str(root)}
+        paths.update(str(record.path) for record in self.index.projects(valid_only=False) if not record.is_valid)
+        return paths
+
+    def _sync_watch_paths(self):
+        desired = self._desired_paths()
+        current = set(self._watcher.directories())
+        stale = [p for p in current if p not in desired]
+        if stale:
+            self._watcher.removePaths(stale)
+        missing = [p for p in desired if p not in current]
+        if missing:
+            failed = self._watcher.addPaths(missing)
+            if len(failed) == len(missing) and not current:
+                return False
+        return True
+
+    def _on_fs_event(self, path):
+        self.events += 1
+        parent = os.path.dirname(os.path.normpath(path))
+        if os.path.normcase(parent) == os.path.normcase(str(self.index.root)):
+            self._dirty_projects.add(os.path.basename(os.path.normpath(path)))
+        else:
+            # The projects folder (or its parent while it does not exist yet)
+            self._root_dirty = True
+        now = time.monotonic()
+        if self._first_event is None:
+            self._first_event = now
+        if now - self._first_event >= self.max_delay:
+            self._apply_pending()
+        else:
+            # Restart the timer so a burst of events becomes one update
+            self._debounce.start()
+
+    #----------Applying Changes----------
+    def _apply_pending(self):
+        self._debounce.stop()
+        root_dirty, dirty = self._root_dirty, self._dirty_projects
+        self._root_dirty, self._dirty_projects, self._first_event = False, set(), None
+        if root_dirty:
+            # One listing of the projects folder; only new folders and the touched ones are stat'ed
+            changes = self.index.refresh(projects=dirty)
+        else:
+            changes = None
+            for name in sorted(dirty):
+                result = self.index.refresh_project(name)
+                if result:
+                    changes = result if changes is None else _merge(changes, result)
+        if self._watcher is not None and (root_dirty or changes):
+            self._sync_watch_paths()
+        if changes:
+            self.updates += 1
+            self.changed.emit(changes)
+
+    def _poll(self):
+        changes = self.index.refresh()
+        if changes:
+            self.updates += 1
+            self.changed.emit(changes)
+
+
+def _merge(first, second):
+    first.added.extend(second.added)
+    first.removed.extend(second.removed)
+    first.renamed.extend(second.renamed)
+    first.updated.extend(second.updated)
+    return first
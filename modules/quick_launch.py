@@ -4,11 +4,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QFont, QIcon, QPixmap
 from functools import partial
-import json
 import subprocess
 import os
 import sys
 from pathlib import Path
+from modules.config_manager import get_config_namespace
 
 
 class QuickLaunchManager:
@@ -18,10 +18,8 @@ class QuickLaunchManager:
         self.main_window = main_window
         self.status_callback = status_callback
         self.quick_launch_items = []
-        # Use config folder in parent root
-        config_dir = Path(__file__).parent.parent / "config"
-        config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-        self.config_file = config_dir / "clibdt_launcher_config.json"
+        # Pinned items and the code editor live in the launcher config namespace
+        self.config = get_config_namespace("launcher")
         self.quick_launch_bar = None
         self.tool_buttons = {}
         
@@ -70,16 +68,12 @@ class QuickLaunchManager:
                 widget.setParent(None)
         self.tool_buttons.clear()
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    pinned_items = data.get('pinned_items', [])
-                    # Create buttons for each pinned item
-                    for item in pinned_items:
-                        button = self.create_tool_button(item['path'])
-                        if button:
-                            tool_layout.addWidget(button)
-                            self.tool_buttons[item['path']] = button
+            # Create buttons for each pinned item
+            for item in self.config.get('pinned_items'):
+                button = self.create_tool_button(item['path'])
+                if button:
+                    tool_layout.addWidget(button)
+                    self.tool_buttons[item['path']] = button
         except Exception as e:
             self.set_status(f"[WARN] Could not load quick launch items: {e}")
     
@@ -213,15 +207,8 @@ class QuickLaunchManager:
         name = path.name
         
         try:
-            # Load existing config
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-            else:
-                data = {'pinned_items': []}
-            
             # Check if already exists
-            pinned_items = data.get('pinned_items', [])
+            pinned_items = self.config.get('pinned_items')
             for item in pinned_items:
                 if item['path'] == str(path):
                     self.set_status(f"[INFO] {name} is already in quick launch")
@@ -232,11 +219,7 @@ class QuickLaunchManager:
                 'name': name,
                 'path': str(path)
             })
-            data['pinned_items'] = pinned_items
-            
-            # Save config
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.config.set('pinned_items', pinned_items)
             
             # Update toolbar
             self.load_pinned_tools()
@@ -250,16 +233,8 @@ class QuickLaunchManager:
         """Remove a quick launch item from toolbar"""
         try:
             # Remove from config
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                
-                pinned_items = data.get('pinned_items', [])
-                pinned_items = [item for item in pinned_items if item['path'] != file_path]
-                data['pinned_items'] = pinned_items
-                
-                with open(self.config_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+            pinned_items = [item for item in self.config.get('pinned_items') if item['path'] != file_path]
+            self.config.set('pinned_items', pinned_items)
             
             # Update toolbar
             self.load_pinned_tools()
@@ -272,21 +247,13 @@ class QuickLaunchManager:
         """Move a quick launch item to the top in toolbar"""
         try:
             # Update config
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                
-                pinned_items = data.get('pinned_items', [])
-                # Find and move item to top
-                for i, pinned_item in enumerate(pinned_items):
-                    if pinned_item['path'] == file_path:
-                        pinned_items.insert(0, pinned_items.pop(i))
-                        break
-                
-                data['pinned_items'] = pinned_items
-                
-                with open(self.config_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+            pinned_items = self.config.get('pinned_items')
+            # Find and move item to top
+            for i, pinned_item in enumerate(pinned_items):
+                if pinned_item['path'] == file_path:
+                    pinned_items.insert(0, pinned_items.pop(i))
+                    break
+            self.config.set('pinned_items', pinned_items)
             
             # Update toolbar
             self.load_pinned_tools()
@@ -335,27 +302,13 @@ class QuickLaunchManager:
             self.set_status(f"[ERROR] Failed to launch {file_path}: {e}")
 
     def get_editor_path(self):
-        # Try config first
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('preferred_code_editor', "")
-        except Exception:
-            pass
-        # Fallback to env var
-        return os.environ.get("XSE_CODE_EDITOR_PATH", "")
+        # Try config first, then fall back to the env var
+        return self.config.get('preferred_code_editor') or os.environ.get("XSE_CODE_EDITOR_PATH", "")
 
     def save_editor_path(self, path):
         try:
-            data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-            data['preferred_code_editor'] = path
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
+            self.config.set('preferred_code_editor', path)
+        except TypeError as e:
             self.set_status(f"[ERROR] Could not save code editor path: {e}")
 
     def set_status(self, message):
@@ -13,6 +13,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from modules.utilities.logger import cprint
 from modules.git_stage_and_commit import run_git_commit
 from modules.xmake_gen import generate_xmake_lua
+from modules.clean_engine import discard_folder
+from modules.project_index import get_project_index, fill_project_combo, apply_project_changes
+from modules.theme_manager import set_theme_scope
+from modules.config_manager import get_config_namespace
 
 from modules.utilities.common import VERSION
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
@@ -71,17 +75,12 @@ def is_valid_clib_project(project_path):
     return False
 
 def delete_folder(folder: Path):
-    def onerror(func, path, exc_info):
-        import stat
-        try:
-            os.chmod(path, stat.S_IWRITE)
-            func(path)
-        except Exception as e:
-            cprint(f"[ERROR] Could not delete {path}: {e}", Fore.RED)
-
+    """Move a folder aside and delete it in the background so the refresh can continue"""
     if folder.exists() and folder.is_dir():
         try:
-            shutil.rmtree(folder, onerror=onerror)
+            if not discard_folder(folder):
+                cprint(f"[ERROR] Failed to delete {folder.name}/", Fore.RED)
+                return
             cprint(f"[OK] {folder.name}/ deleted.", Fore.GREEN)
         except Exception as e:
             cprint(f"[ERROR] Failed to delete {folder.name}/: {e}", Fore.RED)
@@ -628,6 +627,7 @@ class RefreshThread(QThread):
 class RefreshProjectPanel(QWidget):
     def __init__(self, parent=None, status_callback=None):
         super().__init__(parent)
+        set_theme_scope(self, "RefreshProjectPanel")
         self.status_callback = status_callback
         self.theme_manager = None
         self.selected_project_path = None
@@ -713,57 +713,29 @@ class RefreshProjectPanel(QWidget):
         layout.addLayout(btn_row)
         layout.addStretch()
         self.setLayout(layout)
-        self.apply_theme()
 
     def showEvent(self, event):
         super().showEvent(event)
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        self.apply_theme()
         if not self._projects_loaded:
             self.load_projects()
             self._projects_loaded = True
 
-    def load_projects(self):
-        try:
-            from modules.refresh_project import is_valid_clib_project
-        except ImportError:
-            def is_valid_clib_project(project_path):
-                return (project_path / "xmake.lua").exists()
-
-        dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
-        self.project_combo.clear()
-        if not dev_root:
-            self.project_combo.addItem("No dev root found")
+    def load_projects(self, index=None):
+        index = index or get_project_index()
+        if index is None:
+            fill_project_combo(self.project_combo, [], empty_text="No dev root found")
             return
 
-        projects_path = Path(dev_root) / "projects"
-        if not projects_path.exists():
-            self.project_combo.addItem("No projects folder found")
+        if not index.root_exists():
+            fill_project_combo(self.project_combo, [], empty_text="No projects folder found")
             return
 
-        projects = []
-        for item in projects_path.iterdir():
-            if item.is_dir() and is_valid_clib_project(item):
-                projects.append(item.name)
-
-        if not projects:
-            self.project_combo.addItem("No valid ClibDT projects found")
-            return
+        fill_project_combo(self.project_combo, index.names(), getattr(self, 'last_project', None))
 
-        projects.sort()
-        self.project_combo.addItems(projects)
-        
-        # Select last used project if available
-        if hasattr(self, 'last_project') and self.last_project in projects:
-            self.project_combo.setCurrentText(self.last_project)
-        elif projects:
-            self.project_combo.setCurrentText(projects[0])
+    def on_projects_changed(self, index, changes):
+        """Project index listener: patch the picker once the panel has been shown"""
+        if self._projects_loaded:
+            apply_project_changes(self.project_combo, changes)
 
     def on_project_changed(self, project_name):
         if project_name and not project_name.startswith("No ") and not project_name.startswith("Error"):
@@ -776,170 +748,15 @@ class RefreshProjectPanel(QWidget):
             self.selected_project_path = None
 
     def load_preferences(self):
-        """Load user preferences from a simple config file"""
-        self.last_project = None
-        
-        try:
-            # Use config folder in parent root
-            config_dir = Path(__file__).parent.parent / "config"
-            config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-            config_file = config_dir / "clibdt_refresh_prefs.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    prefs = json.load(f)
-                    self.last_project = prefs.get('last_project', None)
-        except Exception:
-            # If loading fails, use defaults
-            pass
+        """Load user preferences from the refresh config namespace"""
+        self.last_project = get_config_namespace("refresh").get('last_project')
 
     def save_preferences(self):
-        """Save user preferences to a simple config file"""
-        try:
-            # Use config folder in parent root
-            config_dir = Path(__file__).parent.parent / "config"
-            config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-            config_file = config_dir / "clibdt_refresh_prefs.json"
-            config_data = {
-                'last_project': self.last_project,
-                'clibdt_version': VERSION
-            }
-            
-            with open(config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-        except Exception:
-            # If saving fails, just continue
-            pass
+        """Record user preferences; the config store writes them once changes settle"""
+        get_config_namespace("refresh").update(last_project=self.last_project, clibdt_version=VERSION)
 
     def set_theme_manager(self, theme_manager):
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-
-    def apply_theme(self):
-        if self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            theme = {
-                'window_bg': '#1e1e1e',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'separator': '#404040',
-                'success_color': '#27ae60',
-                'error_color': '#e74c3c',
-                'warning_color': '#f39c12',
-                'info_color': '#3498db',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'text_light': '#ffffff',
-            }
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {theme['window_bg']};
-                color: {theme['text_primary']};
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-            QLabel#main_title {{
-                font-size: 18px;
-                font-weight: bold;
-                color: {theme['text_primary']};
-                margin-bottom: 4px;
-                padding: 6px 0px;
-            }}
-            QLabel#title_divider {{
-                background-color: {theme['separator']};
-                border: none;
-                margin: 0px;
-                padding: 0px;
-            }}
-            QLabel#section_desc {{
-                color: {theme['text_secondary']};
-                font-size: 10px;
-                margin-bottom: 6px;
-            }}
-            QLabel#status_label {{
-                color: {theme['info_color']};
-                font-size: 11px;
-                margin-bottom: 6px;
-            }}
-            QComboBox, QComboBox:hover, QComboBox:focus {{
-                background-color: {theme['input_bg']};
-                color: {theme['text_primary']};
-                border: 2px solid {theme['input_border']};
-                border-radius: 4px;
-                padding: 6px 8px;
-                font-size: 11px;
-                margin: 0px;
-                font-weight: normal;
-                min-width: 120px;
-            }}
-            QComboBox:hover {{
-                border-color: {theme['button_hover']};
-                background-color: {theme['input_bg']};
-            }}
-            QComboBox:focus {{
-                border-color: {theme['input_focus']};
-                background-color: {theme['input_bg']};
-            }}
-            QPushButton, QPushButton:hover, QPushButton:pressed, QPushButton:disabled {{
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: bold;
-                min-height: 16px;
-                margin: 2px 4px;
-            }}
-            QPushButton:disabled {{
-                background-color: {theme['text_secondary']};
-                color: {theme['text_secondary']};
-                opacity: 0.6;
-            }}
-            QPushButton[btnType="success"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']});
-                color: {theme['text_light']};
-                border: 1px solid {theme['success_color']};
-                padding: 6px 12px;
-            }}
-            QPushButton[btnType="success"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71);
-                border: 2px solid #a9dfbf;
-                color: #ffffff;
-                padding: 7px 13px;
-            }}
-            QPushButton[btnType="success"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954);
-                border: 2px solid #1e8449;
-                color: #ffffff;
-                padding: 8px 14px;
-            }}
-            QPushButton[btnType="uninstall"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
-                color: {theme['text_light']};
-                border: 1px solid {theme['error_color']};
-                padding: 6px 12px;
-            }}
-            QPushButton[btnType="uninstall"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b);
-                border: 2px solid #f1948a;
-                color: #ffffff;
-            }}
-            QPushButton[btnType="uninstall"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
-                border: 1px solid {theme['error_color']};
-                opacity: 0.8;
-            }}
-        """)
 
 def run_git_commit_nonblocking():
     """Non-blocking version of git commit for use in threads"""
@@ -6,8 +6,11 @@ from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QFileDialog, QMessageBox, QWizard, QWizardPage, QSizePolicy, QDialog)
 from PyQt6.QtGui import QIcon, QFont
 from PyQt6.QtCore import Qt
+from modules.theme_manager import set_theme_scope, set_widget_role
 from PyQt6.QtWidgets import QApplication
 
+# set_status types with a style in ThemeManager.get_env_vars_style
+STATUS_TYPES = ("success", "error", "warning", "info")
 
 
 def setx(var, value, parent=None, terminal=None, show_popup=False):
@@ -84,13 +87,10 @@ def setx(var, value, parent=None, terminal=None, show_popup=False):
 class EnvVarsPanel(QWidget):
     def __init__(self, parent=None, status_callback=None, theme_manager=None):
         super().__init__(parent)
+        set_theme_scope(self, "EnvVarsPanel")
         self.status_callback = status_callback
         self.theme_manager = theme_manager
         
-        # Connect to theme changes if theme manager is provided
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        
         # Main layout with proper spacing (following create_project.py pattern)
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
@@ -244,33 +244,13 @@ class EnvVarsPanel(QWidget):
         layout.addStretch()
         
         self.setLayout(layout)
-        
-        # Apply initial theme
-        self.apply_theme()
         # Connect dev root edit to update visibility
         self.edits["XSE_CLIBDT_DEVROOT"].textChanged.connect(self._on_dev_root_changed)
         self._on_dev_root_changed(self.edits["XSE_CLIBDT_DEVROOT"].text())
     
-    def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
-        super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        # Apply theme when panel is shown
-        self.apply_theme()
-    
     def set_theme_manager(self, theme_manager):
         """Set the theme manager for this panel"""
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
 
     def browse_folder(self, var):
         dlg = QFileDialog(self)
@@ -380,104 +360,11 @@ class EnvVarsPanel(QWidget):
         # Show the status label
         self.status.setVisible(True)
         
-        # Apply fancy styling based on status type
-        if status_type == "success":
-            self.status.setStyleSheet("""
-                QLabel {
-                    color: #27ae60;
-                    background-color: rgba(39, 174, 96, 0.1);
-                    border: 1px solid #27ae60;
-                    border-radius: 6px;
-                    padding: 8px 12px;
-                    font-size: 11px;
-                    font-weight: bold;
-                    margin: 4px 0px;
-                }
-            """)
-        elif status_type == "error":
-            self.status.setStyleSheet("""
-                QLabel {
-                    color: #e74c3c;
-                    background-color: rgba(231, 76, 60, 0.1);
-                    border: 1px solid #e74c3c;
-                    border-radius: 6px;
-                    padding: 8px 12px;
-                    font-size: 11px;
-                    font-weight: bold;
-                    margin: 4px 0px;
-                }
-            """)
-        elif status_type == "warning":
-            self.status.setStyleSheet("""
-                QLabel {
-                    color: #f39c12;
-                    background-color: rgba(243, 156, 18, 0.1);
-                    border: 1px solid #f39c12;
-                    border-radius: 6px;
-                    padding: 8px 12px;
-                    font-size: 11px;
-                    font-weight: bold;
-                    margin: 4px 0px;
-                }
-            """)
-        else:  # info
-            self.status.setStyleSheet("""
-                QLabel {
-                    color: #3498db;
-                    background-color: rgba(52, 152, 219, 0.1);
-                    border: 1px solid #3498db;
-                    border-radius: 6px;
-                    padding: 8px 12px;
-                    font-size: 11px;
-                    font-weight: bold;
-                    margin: 4px 0px;
-                }
-            """)
+        # The stylesheet picks the colours from the statusType role
+        set_widget_role(self.status, "statusType", status_type if status_type in STATUS_TYPES else "info")
         
         self.status.setText(message)
     
-    def apply_theme(self):
-        """Apply theme colors to the panel"""
-        if self.theme_manager:
-            self.setStyleSheet(self.theme_manager.get_env_vars_style())
-        else:
-            # Fallback to basic theme if no theme manager
-            try:
-                from modules.theme_manager import ThemeManager
-                fallback_manager = ThemeManager()
-                self.setStyleSheet(fallback_manager.get_env_vars_style())
-            except Exception:
-                # Ultimate fallback with basic styling
-                self.setStyleSheet("""
-                    QWidget {
-                        background-color: #1e1e1e;
-                        color: #e0e0e0;
-                        font-family: 'Segoe UI', Arial, sans-serif;
-                    }
-                    QLabel {
-                        background-color: transparent;
-                        color: #e0e0e0;
-                        font-size: 11px;
-                    }
-                    QLineEdit {
-                        background-color: #2d2d2d;
-                        color: #e0e0e0;
-                        border: 2px solid #404040;
-                        border-radius: 4px;
-                        padding: 6px 8px;
-                        font-size: 11px;
-                    }
-                    QPushButton {
-                        background-color: #0078d4;
-                        color: #ffffff;
-                        border: 1px solid #0078d4;
-                        border-radius: 4px;
-                        padding: 8px 16px;
-                        font-size: 11px;
-                        font-weight: bold;
-                    }
-                """)
-
     def _on_dev_root_changed(self, text):
         dev_root = text.strip()
         show_others = bool(dev_root)
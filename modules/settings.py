@@ -4,11 +4,15 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QObject
 from PyQt6.QtGui import QFont
-import json
-from pathlib import Path
 from typing import Optional
 from modules.utilities.common import VERSION, NEXUS_URL
-from modules.config_utils import get_config_directory
+from modules.config_manager import get_config_namespace
+from modules.theme_manager import set_theme_scope, apply_stylesheet, memoized_style
+
+
+def load_version_check_enabled():
+    """Saved version check choice, readable before the Settings panel is built"""
+    return get_config_namespace("settings").get('version_check_enabled')
 
 
 class SettingsPanel(QWidget):
@@ -16,6 +20,7 @@ class SettingsPanel(QWidget):
 
     def __init__(self, parent=None, status_callback=None, theme_manager=None):
         super().__init__(parent)
+        set_theme_scope(self, "SettingsPanel")
         self.status_callback = status_callback
         self.theme_manager = theme_manager
         self.current_theme = 'dark'
@@ -160,110 +165,71 @@ class SettingsPanel(QWidget):
         layout.addStretch()
         self.setLayout(layout)
 
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
+        self.populate_theme_dropdown()
         self.load_settings()
-        self.apply_theme()
-    
-    def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
-        super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        # Apply theme when panel is shown
-        self.apply_theme()
     
     def set_theme_manager(self, theme_manager):
         """Set the theme manager for this panel"""
-        self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
+        if theme_manager is not self.theme_manager:
+            self.theme_manager = theme_manager
+            self.populate_theme_dropdown()
+    
+    def populate_theme_dropdown(self):
+        """List the built-in themes and every theme file, keeping the current selection"""
+        if not self.theme_manager:
+            return
+        selected = self.theme_manager.current_theme
+        self.theme_dropdown.blockSignals(True)
+        self.theme_dropdown.clear()
+        for theme_id, display_name in self.theme_manager.get_available_themes():
+            self.theme_dropdown.addItem(display_name, theme_id)
+        self.select_theme(selected)
+        self.theme_dropdown.blockSignals(False)
+    
+    def select_theme(self, theme_id):
+        """Select a theme in the dropdown by id (the first entry if it is not listed)"""
+        index = self.theme_dropdown.findData(theme_id)
+        self.theme_dropdown.setCurrentIndex(index if index >= 0 else 0)
     
     def load_settings(self):
         """Load settings from config file with proper theme integration"""
+        settings = get_config_namespace("settings")
+        
+        # Load theme from main window's theme manager if available
         try:
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_settings.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    settings = json.load(f)
-                    
-                    # Load theme from main window's theme manager if available
-                    try:
-                        from ClibDT import MainWindow
-                        main_window = self.window()
-                        if isinstance(main_window, MainWindow) and hasattr(main_window, 'theme_manager'):
-                            current_theme = main_window.theme_manager.current_theme
-                            if current_theme == 'dark':
-                                self.theme_dropdown.setCurrentText("Dark Theme")
-                            else:
-                                self.theme_dropdown.setCurrentText("Light Theme")
-                        else:
-                            # Fallback to config file
-                            theme = settings.get('theme', 'dark')
-                            if theme == 'dark':
-                                self.theme_dropdown.setCurrentText("Dark Theme")
-                            else:
-                                self.theme_dropdown.setCurrentText("Light Theme")
-                    except Exception:
-                        # Fallback to config file
-                        theme = settings.get('theme', 'dark')
-                        if theme == 'dark':
-                            self.theme_dropdown.setCurrentText("Dark Theme")
-                        else:
-                            self.theme_dropdown.setCurrentText("Light Theme")
-                    
-                    # Load version check setting
-                    version_check_enabled = settings.get('version_check_enabled', True)
-                    self.version_check_cb.setChecked(version_check_enabled)
-                    
-        except Exception as e:
-            self.set_status(f"[WARN] Could not load settings: {e}")
+            from ClibDT import MainWindow
+            main_window = self.window()
+            if isinstance(main_window, MainWindow) and hasattr(main_window, 'theme_manager'):
+                self.select_theme(main_window.theme_manager.current_theme)
+            else:
+                # Fallback to config file
+                self.select_theme(settings.get('theme'))
+        except Exception:
+            # Fallback to config file
+            self.select_theme(settings.get('theme'))
+        
+        # Load version check setting
+        self.version_check_cb.setChecked(settings.get('version_check_enabled'))
     
     def save_settings(self):
-        """Save current settings to config file"""
-        try:
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_settings.json"
-            
-            settings = {
-                'theme': 'dark' if 'Dark' in self.theme_dropdown.currentText() else 'light',
-                'version_check_enabled': self.version_check_cb.isChecked()
-            }
-            
-            with open(config_file, 'w') as f:
-                json.dump(settings, f, indent=2)
-            
-            self.set_status("[OK] Settings saved successfully")
-            
-        except Exception as e:
-            self.set_status(f"[ERROR] Could not save settings: {e}")
+        """Save current settings (written to the config file in the background)"""
+        get_config_namespace("settings").update(
+            theme=self.theme_dropdown.currentData() or 'dark',
+            version_check_enabled=self.version_check_cb.isChecked()
+        )
+        self.set_status("[OK] Settings saved successfully")
     
     def reset_to_defaults(self):
         """Reset all settings to default values"""
-        self.theme_dropdown.setCurrentText("Dark Theme")
+        self.select_theme('dark')
         self.version_check_cb.setChecked(True)
         
         self.set_status("[OK] Settings reset to defaults")
     
     def on_theme_changed(self, text):
         """Handle theme dropdown selection change with integrated theme management"""
-        # Determine theme from dropdown text
-        if "Dark" in text:
-            theme = 'dark'
-        elif "Light" in text:
-            theme = 'light'
-        else:
-            theme = 'dark'
+        # Item data holds the theme id; display names come from the theme files
+        theme = self.theme_dropdown.currentData() or 'dark'
         
         # Update current theme
         if theme != self.current_theme:
@@ -322,6 +288,8 @@ class SettingsPanel(QWidget):
     
     def get_typography_sizes(self):
         """Get current typography sizes for use by other modules"""
+        if self.theme_manager and hasattr(self.theme_manager, 'typography'):
+            return dict(self.theme_manager.typography)
         return {
             'header_size': 14,  # Default value
             'text_size': 11     # Default value
@@ -371,7 +339,8 @@ class SettingsPanel(QWidget):
     
     def set_theme(self, theme_name):
         """Set the current theme and emit signal"""
-        if theme_name in ['dark', 'light']:
+        known = self.theme_manager.themes if self.theme_manager else ['dark', 'light']
+        if theme_name in known:
             if theme_name != self.current_theme:
                 self.current_theme = theme_name
                 self.save_settings()
@@ -382,18 +351,24 @@ class SettingsPanel(QWidget):
     
     def get_available_themes(self):
         """Get list of available theme names and display names"""
+        if self.theme_manager:
+            return self.theme_manager.get_available_themes()
         return [('dark', 'Dark Theme'), ('light', 'Light Theme')]
     
     def get_current_theme_name(self):
         """Get the display name of the current theme"""
-        return 'Dark Theme' if self.current_theme == 'dark' else 'Light Theme'
+        return self.theme_dropdown.currentText()
     
     def apply_theme_to_widget(self, widget, theme_name=None):
         """Apply theme colors to a widget with comprehensive styling"""
+        apply_stylesheet(widget, self.get_widget_style(theme_name))
+    
+    @memoized_style
+    def get_widget_style(self, theme_name=None):
+        """Comprehensive widget styling used by apply_theme_to_widget"""
         theme = self.get_theme(theme_name)
         
-        # Apply comprehensive theme to widget
-        widget.setStyleSheet(f"""
+        return f"""
             QWidget {{
                 background-color: {theme['window_bg']};
                 color: {theme['text_primary']};
@@ -531,8 +506,9 @@ class SettingsPanel(QWidget):
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
                 height: 0px;
             }}
-        """)
+        """
     
+    @memoized_style
     def get_button_style(self, button_type='primary', theme_name=None):
         """Get styled button CSS for different button types"""
         theme = self.get_theme(theme_name)
@@ -630,6 +606,7 @@ class SettingsPanel(QWidget):
                 }}
             """
     
+    @memoized_style
     def get_input_style(self, input_type='text', theme_name=None):
         """Get styled input CSS for different input types"""
         theme = self.get_theme(theme_name)
@@ -712,241 +689,3 @@ class SettingsPanel(QWidget):
                     {focus_style}
                 }}
             """
-
-    def apply_theme(self):
-        """Apply current theme to the panel"""
-        if self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            # Fallback theme
-            theme = {
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'bg_secondary': '#252525',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'text_light': '#ffffff',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'separator': '#404040',
-                'success_color': '#27ae60',
-                'error_color': '#e74c3c',
-                'warning_color': '#f39c12',
-                'info_color': '#3498db'
-            }
-        
-        # Apply theme following AI Theme Instructions pattern
-        self.setStyleSheet(f"""
-            /* Base styling */
-            SettingsPanel {{
-                background-color: {theme['window_bg']};
-                color: {theme['text_primary']};
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-            
-            /* Main title styling */
-            SettingsPanel QLabel#main_title {{
-                font-size: 18px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                padding: 6px 0px !important;
-            }}
-            
-            /* Main title divider */
-            SettingsPanel QLabel#title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            /* Section description */
-            SettingsPanel QLabel#section_desc {{
-                color: {theme['text_secondary']} !important;
-                font-size: 10px !important;
-                margin-bottom: 6px !important;
-            }}
-            
-            /* Section titles */
-            SettingsPanel QLabel#section_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            /* Section title dividers */
-            SettingsPanel QLabel#section_title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            /* Setting labels */
-            SettingsPanel QLabel#setting_label {{
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                font-weight: normal !important;
-            }}
-            
-            /* ComboBox styling */
-            SettingsPanel QComboBox {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                min-height: 24px !important;
-                max-height: 32px !important;
-            }}
-            
-            SettingsPanel QComboBox:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            SettingsPanel QComboBox:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            SettingsPanel QComboBox::drop-down {{
-                border: none !important;
-                width: 24px !important;
-            }}
-            
-            SettingsPanel QComboBox::down-arrow {{
-                image: none !important;
-                border-left: 6px solid transparent !important;
-                border-right: 6px solid transparent !important;
-                border-top: 6px solid {theme['text_primary']} !important;
-                margin-right: 6px !important;
-            }}
-            
-            SettingsPanel QComboBox QAbstractItemView {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 6px !important;
-                selection-background-color: {theme['button_bg']} !important;
-                selection-color: {theme['text_light']} !important;
-                padding: 4px !important;
-            }}
-            
-            /* CheckBox styling */
-            SettingsPanel QCheckBox {{
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                spacing: 8px !important;
-                padding: 2px 0px !important;
-                min-height: 24px !important;
-                max-height: 32px !important;
-            }}
-            
-            SettingsPanel QCheckBox::indicator {{
-                width: 16px !important;
-                height: 16px !important;
-                border: 2px solid {theme['input_border']} !important;
-                background-color: {theme['input_bg']} !important;
-                border-radius: 3px !important;
-            }}
-            
-            SettingsPanel QCheckBox::indicator:checked {{
-                background-color: {theme['button_bg']} !important;
-                border-color: {theme['button_bg']} !important;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
-            }}
-            
-            SettingsPanel QCheckBox:hover::indicator:unchecked {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            /* Button styling */
-            SettingsPanel QPushButton {{
-                border: none !important;
-                padding: 8px 16px !important;
-                border-radius: 6px !important;
-                font-size: 11px !important;
-                font-weight: bold !important;
-                min-height: 24px !important;
-                max-height: 32px !important;
-                margin: 2px 4px !important;
-            }}
-            
-            SettingsPanel QPushButton:disabled {{
-                background-color: {theme['text_secondary']} !important;
-                color: {theme['text_secondary']} !important;
-                opacity: 0.6 !important;
-            }}
-            
-            /* Success buttons */
-            SettingsPanel QPushButton[btnType="success"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['success_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            SettingsPanel QPushButton[btnType="success"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
-                border: 2px solid #a9dfbf !important;
-                color: #ffffff !important;
-                padding: 7px 13px !important;
-            }}
-            
-            SettingsPanel QPushButton[btnType="success"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954) !important;
-                border: 2px solid #1e8449 !important;
-                color: #ffffff !important;
-                padding: 8px 14px !important;
-            }}
-            
-            /* Secondary buttons */
-            SettingsPanel QPushButton[btnType="secondary"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6c757d, stop:1 #5a6268) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid #5a6268 !important;
-                padding: 6px 12px !important;
-            }}
-            
-            SettingsPanel QPushButton[btnType="secondary"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #bdc3c7, stop:0.5 #95a5a6, stop:1 #7f8c8d) !important;
-                border: 2px solid #d5dbdb !important;
-                color: #ffffff !important;
-            }}
-            
-            SettingsPanel QPushButton[btnType="secondary"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a6268, stop:1 #495057) !important;
-                border: 1px solid #495057 !important;
-            }}
-            
-            /* About section styling */
-            SettingsPanel QLabel#about_version {{
-                color: {theme['text_secondary']} !important;
-                font-size: 10px !important;
-            }}
-            
-            SettingsPanel QLabel#about_link {{
-                color: {theme['info_color']} !important;
-                font-size: 10px !important;
-            }}
-            
-            SettingsPanel QLabel#about_link:hover {{
-                color: {theme['button_hover']} !important;
-            }}
-        """) 
\ No newline at end of file
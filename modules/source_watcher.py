@@ -0,0 +1,120 @@
+import os
+from pathlib import Path
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+from modules.build_snapshot import scan_build_inputs
+
+#----------Watcher Settings----------
+DEFAULT_DEBOUNCE_MS = 750
+DEFAULT_POLL_INTERVAL_MS = 2000
+# Set CLIBDT_WATCH_POLLING=1 to skip native notifications (network drives, some VMs)
+POLLING_ENV_VAR = "CLIBDT_WATCH_POLLING"
+
+
+class SourceWatcher(QObject):
+    """
+    Watches a project's src/ tree and xmake.lua and emits `changed` once a burst
+    of saves has settled. Native notifications (QFileSystemWatcher) are used when
+    available; otherwise the inputs are polled. Every event is confirmed against a
+    scan of the build inputs, so touching build/ or backups/ never triggers a build.
+    """
+
+    changed = pyqtSignal(list)  # relative paths that were added, modified or removed
+
+    def __init__(self, project_path, debounce_ms=DEFAULT_DEBOUNCE_MS,
+                 poll_interval_ms=DEFAULT_POLL_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.project_path = Path(project_path)
+        self.mode = "stopped"
+        self._inputs = {}
+        self._watcher = None
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self._check_for_changes)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._check_for_changes)
+
+    def start(self):
+        """Take a baseline and begin watching; returns the mode in use ('native' or 'polling')"""
+        self.stop()
+        self._inputs = scan_build_inputs(self.project_path)
+
+        if os.getenv(POLLING_ENV_VAR) != "1":
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.directoryChanged.connect(self._on_fs_event)
+            self._watcher.fileChanged.connect(self._on_fs_event)
+            if self._sync_watch_paths():
+                self.mode = "native"
+                return self.mode
+            self._watcher.deleteLater()
+            self._watcher = None
+
+        self._poll_timer.start()
+        self.mode = "polling"
+        return self.mode
+
+    def stop(self):
+        self._debounce.stop()
+        self._poll_timer.stop()
+        if self._watcher is not None:
+            paths = self._watcher.files() + self._watcher.directories()
+            if paths:
+                self._watcher.removePaths(paths)
+            self._watcher.deleteLater()
+            self._watcher = None
+        self.mode = "stopped"
+
+    def is_active(self):
+        return self.mode != "stopped"
+
+    #----------Native Notifications----------
+    def _desired_paths(self):
+        paths = {str(self.project_path)}
+        xmake_file = self.project_path / "xmake.lua"
+        if xmake_file.exists():
+            paths.add(str(xmake_file))
+        src_dir = self.project_path / "src"
+        if src_dir.is_dir():
+            for root, dirnames, filenames in os.walk(src_dir):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                paths.add(root)
+                # Files are watched too: directory events do not report content edits on every platform
+                for name in filenames:
+                    paths.add(os.path.join(root, name))
+        return paths
+
+    def _sync_watch_paths(self):
+        """Match the watched set to the current tree (saves via rename drop file watches)"""
+        desired = self._desired_paths()
+        current = set(self._watcher.files()) | set(self._watcher.directories())
+        stale = [p for p in current if p not in desired]
+        if stale:
+            self._watcher.removePaths(stale)
+        missing = [p for p in desired if p not in current]
+        if missing:
+            failed = self._watcher.addPaths(missing)
+            if len(failed) == len(missing) and not current:
+                return False
+        return True
+
+    def _on_fs_event(self, path):
+        # Restart the timer so a burst of saves becomes one check
+        self._debounce.start()
+
+    #----------Change Confirmation----------
+    def _check_for_changes(self):
+        new_inputs = scan_build_inputs(self.project_path)
+        if new_inputs == self._inputs:
+            return
+        changed = sorted(
+            p for p in set(new_inputs) | set(self._inputs)
+            if new_inputs.get(p) != self._inputs.get(p)
+        )
+        self._inputs = new_inputs
+        if self._watcher is not None:
+            self._sync_watch_paths()
+        self.changed.emit(changed)
@@ -0,0 +1,143 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+#----------Trace Settings----------
+TRACE_ENV_VAR = "CLIBDT_TRACE_STARTUP"
+
+
+class _NullSpan:
+    """Shared do-nothing context returned while tracing is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Records named spans as Chrome trace events ("X" complete events, microseconds since
+    origin). When disabled, span() returns a shared no-op context manager and nothing is
+    recorded, so instrumentation can stay in place permanently.
+    """
+
+    def __init__(self, enabled=False, origin=None):
+        self.enabled = enabled
+        self.origin = time.perf_counter() if origin is None else origin
+        self.events = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _us(self, t):
+        return (t - self.origin) * 1e6
+
+    def span(self, name, category="startup", **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, category, args)
+
+    @contextmanager
+    def _span(self, name, category, args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, time.perf_counter(), category, **args)
+
+    def add_span(self, name, start, end, category="startup", **args):
+        """Record a span measured elsewhere (perf_counter start/end)"""
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": category, "ph": "X", "ts": self._us(start),
+                 "dur": max(0.0, (end - start) * 1e6), "pid": self._pid, "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def instant(self, name, category="startup", **args):
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": category, "ph": "i", "s": "p", "ts": self._us(time.perf_counter()),
+                 "pid": self._pid, "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def traced(self, name=None, category="startup"):
+        """Decorator form of span()"""
+        def decorate(func):
+            label = name or func.__qualname__
+
+            def wrapper(*a, **kw):
+                with self.span(label, category):
+                    return func(*a, **kw)
+            wrapper.__name__ = func.__name__
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+        return decorate
+
+    #----------Output----------
+    def chrome_trace(self):
+        """Trace in the JSON Object Format read by chrome://tracing and Perfetto"""
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        thread_names = [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+                         "args": {"name": "main" if tid == threading.main_thread().ident else f"thread {tid}"}}
+                        for tid in {e["tid"] for e in events}]
+        return {"traceEvents": thread_names + events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        os.replace(tmp_path, path)
+        return path
+
+    def summary(self, category=None):
+        """Spans as an indented timeline (nesting from time containment, per thread)"""
+        with self._lock:
+            events = [e for e in self.events if category is None or e["cat"] == category]
+        # Parents first when two spans start together
+        events.sort(key=lambda e: (e["tid"], e["ts"], -e.get("dur", 0.0)))
+        lines = [f"{'start':>9} {'duration':>10}  span"]
+        open_ends = {}
+        for event in events:
+            stack = open_ends.setdefault(event["tid"], [])
+            while stack and event["ts"] >= stack[-1]:
+                stack.pop()
+            indent = "  " * len(stack)
+            if event["ph"] == "X":
+                lines.append(f"{event['ts'] / 1000.0:8.1f}ms {event['dur'] / 1000.0:8.1f}ms  {indent}{event['name']}")
+                stack.append(event["ts"] + event["dur"])
+            else:
+                lines.append(f"{event['ts'] / 1000.0:8.1f}ms {'':>10}  {indent}* {event['name']}")
+        return "\n".join(lines)
+
+    def clear(self):
+        with self._lock:
+            self.events = []
+
+
+#----------Shared Tracer----------
+tracer = Tracer(enabled=os.getenv(TRACE_ENV_VAR, "") not in ("", "0"))
+
+
+def get_tracer():
+    return tracer
+
+
+def enable_tracing(origin=None):
+    """Turn the shared tracer on; origin (a perf_counter value) anchors ts 0, e.g. process start"""
+    tracer.enabled = True
+    if origin is not None:
+        tracer.origin = origin
+    return tracer
@@ -0,0 +1,724 @@
+import os
+import sys
+import time
+import threading
+from bisect import bisect_left
+
+from PyQt6.QtWidgets import (QAbstractScrollArea, QApplication, QMenu, QWidget, QHBoxLayout,
+                             QLineEdit, QPushButton, QComboBox, QLabel)
+from PyQt6.QtCore import pyqtSignal, QTimer, QThread, Qt, QRect
+from PyQt6.QtGui import QFont, QFontMetrics, QPainter, QColor, QPalette, QKeySequence
+
+from modules.ansi_html import AnsiHtmlConverter, palette_from_color_map
+from modules.log_store import (LogStore, DEFAULT_CAPACITY, strip_ansi, LEVEL_NONE, LEVEL_DEBUG,
+                               LEVEL_INFO, LEVEL_OK, LEVEL_WARN, LEVEL_ERROR)
+from modules.log_index import LogIndex
+
+#----------Terminal Settings----------
+# Pending output is shown at most this often (~30 frames per second)
+FLUSH_INTERVAL_MS = 33
+VERBOSE_CAPACITY = 1000000
+# Parsed color runs kept for recently painted lines
+SEGMENT_CACHE_LIMIT = 4096
+TAB_SPACES = "    "
+# Level filters offered by the search bar (None shows everything)
+LEVEL_FILTERS = (
+    ("All levels", None),
+    ("Errors", frozenset((LEVEL_ERROR,))),
+    ("Warnings + errors", frozenset((LEVEL_WARN, LEVEL_ERROR))),
+    ("Hide debug", frozenset((LEVEL_NONE, LEVEL_INFO, LEVEL_OK, LEVEL_WARN, LEVEL_ERROR))),
+    ("Debug only", frozenset((LEVEL_DEBUG,))),
+)
+MATCH_COUNT_LIMIT = 10000
+
+
+class MiniTerminal(QAbstractScrollArea):
+    """
+    Terminal view over a LogStore ring buffer. Only the rows inside the viewport are
+    painted, so scrolling stays smooth no matter how many lines are retained. Producers on
+    any thread append to the store; a frame timer then updates the scroll range and repaints.
+    A LogIndex kept alongside the store makes search, level/source filters and error jumps
+    independent of the history size. When a filter is set, rows map to a sorted seq list.
+    """
+
+    append_text_signal = pyqtSignal(str)
+    _flush_requested = pyqtSignal()
+    sources_changed = pyqtSignal()
+    find_requested = pyqtSignal()
+
+    def __init__(self, parent=None, capacity=DEFAULT_CAPACITY):
+        super().__init__(parent)
+        self.setMinimumHeight(120)  # Reduced minimum height for better proportions
+        self.setMaximumHeight(300)  # Add maximum height to prevent excessive expansion
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.append_text_signal.connect(self.append_text)
+
+        # Set default font with better proportions
+        font = QFont("Consolas", 10)  # Slightly smaller font
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.setFont(font)
+
+        # Color mapping for ANSI colors
+        self.color_map = {
+            'black': '#000000',
+            'red': '#e74c3c',
+            'green': '#27ae60',
+            'yellow': '#f39c12',
+            'blue': '#3498db',
+            'magenta': '#9b59b6',
+            'cyan': '#1abc9c',
+            'white': '#ffffff',
+            'bright_black': '#7f8c8d',
+            'bright_red': '#e74c3c',
+            'bright_green': '#2ecc71',
+            'bright_yellow': '#f1c40f',
+            'bright_blue': '#3498db',
+            'bright_magenta': '#9b59b6',
+            'bright_cyan': '#1abc9c',
+            'bright_white': '#ecf0f1'
+        }
+        self._ansi = AnsiHtmlConverter(palette_from_color_map(self.color_map))
+        self._segment_cache = {}
+        self._color_cache = {}
+
+        # Line storage lives outside the widget
+        self.store = LogStore(capacity)
+        self._max_columns = 0
+        self.store.add_listener(self._on_record)
+        self.index = LogIndex(self.store)
+        self._shown_first_seq = 0
+        self._known_sources = 1
+
+        # Filtered view: None shows every line, otherwise the sorted seqs that pass
+        self._filter_levels = None
+        self._filter_source = None
+        self._rows = None
+        self._rows_through = -1
+
+        # Selection as an inclusive range of sequence numbers
+        self._sel_anchor = None
+        self._sel_end = None
+
+        # Write coalescing: any thread appends, the GUI thread refreshes in frames
+        self._flush_lock = threading.Lock()
+        self._flush_queued = False
+        self._last_flush = 0.0
+        self.lines_rendered = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        # Queued across threads, so producers never touch the widget
+        self._flush_requested.connect(self._schedule_flush)
+
+        self.verticalScrollBar().setSingleStep(1)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+    @property
+    def max_lines(self):
+        return self.store.capacity
+
+    @max_lines.setter
+    def max_lines(self, value):
+        self.store.resize(value)
+        self._request_flush()
+
+    #----------Writing----------
+    def write(self, text):
+        """Handle raw text output with color parsing"""
+        self.append_text(text)
+
+    def append_text(self, text, source=""):
+        """Append text (safe to call from any thread); multi-line text becomes several records"""
+        if text:
+            text = str(text).rstrip("\n")
+            for line in text.split("\n"):
+                self.store.append(line.rstrip("\r"), source=source)
+            self._request_flush()
+
+    def source_callback(self, source):
+        """A status_callback that tags every line with the panel it came from"""
+        return lambda text: self.append_text(text, source)
+
+    def _on_record(self, seq, level, source_id, plain_text, first_seq):
+        if len(plain_text) > self._max_columns:
+            self._max_columns = len(plain_text)
+
+    def _request_flush(self):
+        with self._flush_lock:
+            if self._flush_queued:
+                return
+            self._flush_queued = True
+        self._flush_requested.emit()
+
+    def _schedule_flush(self):
+        """Refresh on the next frame boundary, never more often than FLUSH_INTERVAL_MS"""
+        if self._flush_timer.isActive():
+            return
+        since_last_ms = (time.monotonic() - self._last_flush) * 1000.0
+        self._flush_timer.start(int(max(0.0, FLUSH_INTERVAL_MS - since_last_ms)))
+
+    def _flush_pending(self):
+        """Bring the scroll range up to date with the store and repaint once"""
+        with self._flush_lock:
+            self._flush_queued = False
+        self._last_flush = time.monotonic()
+
+        sb = self.verticalScrollBar()
+        at_bottom = sb.value() >= sb.maximum()
+        # Lines evicted from the front shift everything up; keep the same lines in view
+        if self._rows is None:
+            evicted = self.store.first_seq - self._shown_first_seq
+        else:
+            evicted = self._extend_rows()
+        self._shown_first_seq = self.store.first_seq
+        self._update_scrollbars()
+        if at_bottom:
+            sb.setValue(sb.maximum())
+        elif evicted > 0:
+            sb.setValue(max(0, sb.value() - evicted))
+        self.lines_rendered = self.store.next_seq
+        if len(self.store.sources()) != self._known_sources:
+            self._known_sources = len(self.store.sources())
+            self.sources_changed.emit()
+        self.viewport().update()
+
+    #----------Filtering----------
+    def set_filter(self, levels=None, source=None):
+        """Show only lines whose level is in levels and/or that came from source (None for all)"""
+        self._filter_levels = frozenset(levels) if levels is not None else None
+        self._filter_source = source or None
+        sb = self.verticalScrollBar()
+        keep = None if sb.value() >= sb.maximum() else self._current_seq()
+        if self._filter_levels is None and self._filter_source is None:
+            self._rows = None
+        else:
+            self._rows = []
+            self._rows_through = self.store.first_seq - 1
+            self._extend_rows()
+        self._update_scrollbars()
+        if keep is not None:
+            self._scroll_to_row(self._row_for_seq(keep), center=False)
+        else:
+            self._auto_scroll()
+        self.viewport().update()
+
+    def _source_filter_id(self):
+        if self._filter_source is None:
+            return None
+        return self.store.source_id(self._filter_source)
+
+    def _extend_rows(self):
+        """Add newly indexed lines that pass the filter and drop evicted ones; returns rows dropped"""
+        through = self.store.next_seq - 1
+        if through > self._rows_through:
+            self._rows.extend(self.index.matching(self._filter_levels, self._source_filter_id(),
+                                                  self._rows_through))
+            self._rows_through = through
+        dropped = bisect_left(self._rows, self.store.first_seq)
+        if dropped:
+            del self._rows[:dropped]
+        return dropped
+
+    def passes_filter(self, seq):
+        if self._filter_levels is not None and self.store.level(seq) not in self._filter_levels:
+            return False
+        if self._filter_source is not None and self.store.source(seq) != self._filter_source:
+            return False
+        return self.store.contains(seq)
+
+    def _row_count(self):
+        return len(self.store) if self._rows is None else len(self._rows)
+
+    def _seq_for_row(self, row):
+        if self._rows is None:
+            return self.store.first_seq + row
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def _row_for_seq(self, seq):
+        """Row showing seq, or the nearest row after it when seq is filtered out"""
+        if self._rows is None:
+            return seq - self.store.first_seq
+        return bisect_left(self._rows, seq)
+
+    #----------Search and Navigation----------
+    def _current_seq(self):
+        """Where searches start: the selection end, else the first visible line"""
+        if self._sel_end is not None and self.store.contains(self._sel_end):
+            return self._sel_end
+        return self._first_visible_seq()
+
+    def _scroll_to_row(self, row, center=True):
+        sb = self.verticalScrollBar()
+        offset = self._visible_rows() // 2 if center else 0
+        sb.setValue(max(0, min(row - offset, sb.maximum())))
+
+    def reveal(self, seq):
+        """Select a line and scroll it into the middle of the view"""
+        self.flush()
+        if seq is None or not self.store.contains(seq):
+            return False
+        self._sel_anchor = self._sel_end = seq
+        self._scroll_to_row(self._row_for_seq(seq))
+        self.viewport().update()
+        return True
+
+    def find_next(self, query, backwards=False):
+        """Select the next (or previous) visible line containing query; wraps around"""
+        self.flush()
+        start = self._current_seq()
+        if start is None:
+            return False
+        search = self.index.find_prev if backwards else self.index.find_next
+        for origin in (start, self.store.next_seq if backwards else -1):
+            seq = search(query, origin)
+            while seq is not None and not self.passes_filter(seq):
+                seq = search(query, seq)
+            if seq is not None:
+                return self.reveal(seq)
+        return False
+
+    def count_matches(self, query):
+        """Matching lines that pass the filter, capped at MATCH_COUNT_LIMIT"""
+        if self._rows is None:
+            return len(self.index.find_all(query, MATCH_COUNT_LIMIT))
+        count = 0
+        for seq in self.index.find_all(query):
+            if self.passes_filter(seq):
+                count += 1
+                if count >= MATCH_COUNT_LIMIT:
+                    break
+        return count
+
+    def next_error(self, backwards=False):
+        """Jump to the next (or previous) ERROR line; wraps around"""
+        self.flush()
+        start = self._current_seq()
+        if start is None:
+            return False
+        search = self.index.prev_with_level if backwards else self.index.next_with_level
+        for origin in (start, self.store.next_seq if backwards else -1):
+            seq = search(origin, (LEVEL_ERROR,))
+            while seq is not None and not self.passes_filter(seq):
+                seq = search(seq, (LEVEL_ERROR,))
+            if seq is not None:
+                return self.reveal(seq)
+        return False
+
+    def error_count(self):
+        return self.index.count(LEVEL_ERROR)
+
+    #----------Geometry----------
+    def _metrics(self):
+        return QFontMetrics(self.font())
+
+    def _line_height(self):
+        return max(1, self._metrics().lineSpacing())
+
+    def _visible_rows(self):
+        return max(1, self.viewport().height() // self._line_height())
+
+    def _update_scrollbars(self):
+        rows = self._visible_rows()
+        sb = self.verticalScrollBar()
+        sb.setPageStep(rows)
+        sb.setRange(0, max(0, self._row_count() - rows))
+        content_width = self._max_columns * self._metrics().horizontalAdvance("M") + 8
+        hsb = self.horizontalScrollBar()
+        hsb.setPageStep(self.viewport().width())
+        hsb.setRange(0, max(0, content_width - self.viewport().width()))
+
+    def _first_visible_seq(self):
+        if not self._row_count():
+            return None
+        return self._seq_for_row(min(self.verticalScrollBar().value(), self._row_count() - 1))
+
+    def _seq_at(self, y):
+        row = self.verticalScrollBar().value() + int(y // self._line_height())
+        return self._seq_for_row(max(0, min(row, self._row_count() - 1)))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        sb = self.verticalScrollBar()
+        at_bottom = sb.value() >= sb.maximum()
+        self._update_scrollbars()
+        if at_bottom:
+            sb.setValue(sb.maximum())
+
+    #----------Painting----------
+    def _segments(self, seq, text):
+        runs = self._segment_cache.get(seq)
+        if runs is None:
+            if len(self._segment_cache) > SEGMENT_CACHE_LIMIT:
+                self._segment_cache.clear()
+            runs = [(run.replace("\t", TAB_SPACES), style) for run, style in self._ansi.segments(text)]
+            self._segment_cache[seq] = runs
+        return runs
+
+    def _color(self, value):
+        color = self._color_cache.get(value)
+        if color is None:
+            color = self._color_cache[value] = QColor(value)
+        return color
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        palette = self.palette()
+        default_fg = palette.color(QPalette.ColorRole.Text)
+        highlight = palette.color(QPalette.ColorRole.Highlight)
+        line_height = self._line_height()
+        base_font = self.font()
+        ascent = QFontMetrics(base_font).ascent()
+        width = self.viewport().width()
+        x_origin = 4 - self.horizontalScrollBar().value()
+
+        first_row = self.verticalScrollBar().value()
+        if self._rows is None:
+            first = self.store.first_seq + first_row
+            seqs = range(first, first + len(self.store.texts(first, first + self._visible_rows() + 1)))
+        else:
+            seqs = self._rows[first_row:first_row + self._visible_rows() + 1]
+        selection = self._selection_range()
+        fonts = {}
+
+        for row, seq in enumerate(seqs):
+            text = self.store.text(seq)
+            top = row * line_height
+            if selection and selection[0] <= seq <= selection[1]:
+                painter.fillRect(QRect(0, top, width, line_height), highlight)
+            x = x_origin
+            for run, (fg, bg, bold, dim, italic, underline) in self._segments(seq, text or ""):
+                key = (bold, italic, underline)
+                cached = fonts.get(key)
+                if cached is None:
+                    run_font = QFont(base_font)
+                    run_font.setBold(bold)
+                    run_font.setItalic(italic)
+                    run_font.setUnderline(underline)
+                    cached = fonts[key] = (run_font, QFontMetrics(run_font))
+                run_font, run_metrics = cached
+                advance = run_metrics.horizontalAdvance(run)
+                if x + advance >= 0 and x <= width:
+                    if bg:
+                        painter.fillRect(QRect(x, top, advance, line_height), self._color(bg))
+                    color = self._color(fg) if fg else default_fg
+                    if dim:
+                        color = QColor(color)
+                        color.setAlphaF(0.7)
+                    painter.setFont(run_font)
+                    painter.setPen(color)
+                    painter.drawText(x, top + ascent, run)
+                x += advance
+                if x > width:
+                    break
+        painter.end()
+
+    #----------Selection and Clipboard----------
+    def _selection_range(self):
+        if self._sel_anchor is None or self._sel_end is None:
+            return None
+        return min(self._sel_anchor, self._sel_end), max(self._sel_anchor, self._sel_end)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self._row_count():
+            seq = self._seq_at(event.position().y())
+            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier and self._sel_anchor is not None:
+                self._sel_end = seq
+            else:
+                self._sel_anchor = self._sel_end = seq
+            self.viewport().update()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.MouseButton.LeftButton and self._sel_anchor is not None:
+            y = event.position().y()
+            sb = self.verticalScrollBar()
+            if y < 0:
+                sb.setValue(sb.value() - 1)
+            elif y > self.viewport().height():
+                sb.setValue(sb.value() + 1)
+            self._sel_end = self._seq_at(y)
+            self.viewport().update()
+        super().mouseMoveEvent(event)
+
+    def selected_text(self):
+        selection = self._selection_range()
+        if not selection:
+            return ""
+        if self._rows is None:
+            texts = self.store.texts(selection[0], selection[1] + 1)
+        else:
+            start = bisect_left(self._rows, selection[0])
+            stop = bisect_left(self._rows, selection[1] + 1)
+            texts = [self.store.text(seq) for seq in self._rows[start:stop]]
+        return "\n".join(strip_ansi(t or "") for t in texts)
+
+    def copy(self):
+        text = self.selected_text()
+        if text:
+            QApplication.clipboard().setText(text)
+
+    def selectAll(self):
+        if self._row_count():
+            self._sel_anchor, self._sel_end = self._seq_for_row(0), self._seq_for_row(self._row_count() - 1)
+            self.viewport().update()
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            self.copy()
+        elif event.matches(QKeySequence.StandardKey.SelectAll):
+            self.selectAll()
+        elif event.key() == Qt.Key.Key_End and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            self._auto_scroll()
+        elif event.key() == Qt.Key.Key_Home and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            self.verticalScrollBar().setValue(0)
+        elif event.key() == Qt.Key.Key_F8:
+            self.next_error(backwards=bool(event.modifiers() & Qt.KeyboardModifier.ShiftModifier))
+        elif event.matches(QKeySequence.StandardKey.Find):
+            self.find_requested.emit()
+        else:
+            super().keyPressEvent(event)
+
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        copy_action = menu.addAction("Copy")
+        copy_action.setEnabled(self._selection_range() is not None)
+        copy_action.triggered.connect(self.copy)
+        menu.addAction("Select All").triggered.connect(self.selectAll)
+        menu.addSeparator()
+        menu.addAction("Find... (Ctrl+F)").triggered.connect(self.find_requested.emit)
+        next_error = menu.addAction(f"Next Error (F8) - {self.error_count()} total")
+        next_error.setEnabled(self.error_count() > 0)
+        next_error.triggered.connect(lambda: self.next_error())
+        menu.addSeparator()
+        menu.addAction("Clear").triggered.connect(self.clear)
+        menu.exec(event.globalPos())
+
+    #----------Compatibility----------
+    def _auto_scroll(self):
+        """Scroll to the newest line"""
+        sb = self.verticalScrollBar()
+        if sb is not None:
+            sb.setValue(sb.maximum())
+
+    def flush(self):
+        """Flush output buffer (refreshes immediately when called on the GUI thread)"""
+        if QThread.currentThread() == self.thread():
+            self._flush_timer.stop()
+            self._flush_pending()
+
+    def clear(self):
+        """Clear terminal content"""
+        self.store.clear()
+        self.index.clear()
+        if self._rows is not None:
+            self._rows = []
+            self._rows_through = self.store.first_seq - 1
+        self._segment_cache.clear()
+        self._sel_anchor = self._sel_end = None
+        self._max_columns = 0
+        self._shown_first_seq = self.store.first_seq
+        self._update_scrollbars()
+        self.viewport().update()
+
+    def set_verbose_mode(self, enabled=True):
+        """Enable/disable verbose output mode"""
+        if enabled:
+            self.max_lines = VERBOSE_CAPACITY  # Keep far more history in verbose mode
+        else:
+            self.max_lines = DEFAULT_CAPACITY
+
+
+class TerminalSearchBar(QWidget):
+    """Find box, level/source filters and error navigation for a MiniTerminal"""
+
+    def __init__(self, terminal, parent=None):
+        super().__init__(parent)
+        self.setObjectName("terminal_search_bar")
+        self.terminal = terminal
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 6)
+        layout.setSpacing(6)
+
+        self.find_edit = QLineEdit()
+        self.find_edit.setPlaceholderText("Find in log (Enter: next, Shift+Enter: previous)")
+        self.find_edit.setClearButtonEnabled(True)
+        self.find_edit.returnPressed.connect(self._find_from_edit)
+        self.find_edit.textChanged.connect(lambda _: self._count_timer.start())
+        layout.addWidget(self.find_edit, 1)
+
+        self.prev_btn = QPushButton("Prev")
+        self.prev_btn.clicked.connect(lambda: self.find(backwards=True))
+        layout.addWidget(self.prev_btn)
+        self.next_btn = QPushButton("Next")
+        self.next_btn.clicked.connect(lambda: self.find())
+        layout.addWidget(self.next_btn)
+
+        self.match_label = QLabel("")
+        self.match_label.setMinimumWidth(80)
+        layout.addWidget(self.match_label)
+
+        self.level_combo = QComboBox()
+        for name, _ in LEVEL_FILTERS:
+            self.level_combo.addItem(name)
+        self.level_combo.currentIndexChanged.connect(self._apply_filter)
+        layout.addWidget(self.level_combo)
+
+        self.source_combo = QComboBox()
+        self.source_combo.addItem("All sources", None)
+        self.source_combo.currentIndexChanged.connect(self._apply_filter)
+        layout.addWidget(self.source_combo)
+
+        self.error_btn = QPushButton("Next Error")
+        self.error_btn.setToolTip("Jump to the next error (F8, Shift+F8 for the previous one)")
+        self.error_btn.clicked.connect(lambda: self.terminal.next_error())
+        layout.addWidget(self.error_btn)
+
+        for button in (self.prev_btn, self.next_btn, self.error_btn):
+            button.setProperty("btnType", "secondary")
+
+        # Counting matches runs once typing pauses
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.setInterval(150)
+        self._count_timer.timeout.connect(self._update_match_count)
+
+        terminal.sources_changed.connect(self._refresh_sources)
+        terminal.find_requested.connect(self.focus_find)
+
+    def focus_find(self):
+        self.find_edit.setFocus()
+        self.find_edit.selectAll()
+
+    def _find_from_edit(self):
+        backwards = bool(QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier)
+        self.find(backwards)
+
+    def find(self, backwards=False):
+        query = self.find_edit.text()
+        if query and not self.terminal.find_next(query, backwards):
+            self.match_label.setText("No matches")
+
+    def _update_match_count(self):
+        query = self.find_edit.text()
+        if not query:
+            self.match_label.setText("")
+            return
+        count = self.terminal.count_matches(query)
+        suffix = "+" if count >= MATCH_COUNT_LIMIT else ""
+        self.match_label.setText(f"{count}{suffix} match{'es' if count != 1 else ''}")
+
+    def _refresh_sources(self):
+        current = self.source_combo.currentData()
+        self.source_combo.blockSignals(True)
+        self.source_combo.clear()
+        self.source_combo.addItem("All sources", None)
+        for source in self.terminal.store.sources():
+            if source:
+                self.source_combo.addItem(source, source)
+        index = self.source_combo.findData(current)
+        self.source_combo.setCurrentIndex(max(0, index))
+        self.source_combo.blockSignals(False)
+
+    def _apply_filter(self):
+        levels = LEVEL_FILTERS[self.level_combo.currentIndex()][1]
+        self.terminal.set_filter(levels, self.source_combo.currentData())
+        if self.find_edit.text():
+            self._count_timer.start()
+
+
+#----------Benchmark----------
+def benchmark_terminal(total_lines=1000000, producers=4, capacity=VERBOSE_CAPACITY):
+    """
+    Flood a terminal from worker threads and report sustained lines/sec together with the
+    longest gap seen by a 5 ms heartbeat timer (how long the event loop was blocked), then
+    time repaints at random scroll positions with everything retained.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    import random
+
+    # The application's own event loop runs the flood, which also keeps it referenced
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    terminal = MiniTerminal(capacity=capacity)
+    terminal.resize(900, 300)
+    terminal.show()
+
+    stalls = []
+    last_beat = [time.perf_counter()]
+
+    def heartbeat():
+        now = time.perf_counter()
+        stalls.append(now - last_beat[0])
+        last_beat[0] = now
+
+    beat = QTimer()
+    beat.setInterval(5)
+    beat.timeout.connect(heartbeat)
+    beat.start()
+
+    per_producer = total_lines // producers
+    expected = per_producer * producers
+    sample = "\033[36m[ 42% ]: compiling.release src/Hooks.cpp\033[0m"
+
+    def produce(index):
+        for i in range(per_producer):
+            terminal.append_text(f"{sample} #{index}-{i}")
+
+    done = QTimer()
+    done.setInterval(10)
+    done.timeout.connect(lambda: app.quit() if terminal.lines_rendered >= expected else None)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=produce, args=(i,), daemon=True) for i in range(producers)]
+    for thread in threads:
+        thread.start()
+    done.start()
+    app.exec()
+    elapsed = time.perf_counter() - start
+    beat.stop()
+    done.stop()
+
+    # Scrolling: jump to random positions and repaint synchronously
+    sb = terminal.verticalScrollBar()
+    paints = []
+    for _ in range(200):
+        sb.setValue(random.randint(0, sb.maximum()))
+        paint_start = time.perf_counter()
+        terminal.viewport().repaint()
+        paints.append(time.perf_counter() - paint_start)
+    paints.sort()
+
+    # Index queries over the full history
+    query_start = time.perf_counter()
+    terminal.find_next("no such text anywhere")
+    search_ms = (time.perf_counter() - query_start) * 1000.0
+    query_start = time.perf_counter()
+    terminal.set_filter(LEVEL_FILTERS[2][1])
+    terminal.set_filter(None)
+    filter_ms = (time.perf_counter() - query_start) * 1000.0
+
+    return {
+        "lines": expected,
+        "retained": len(terminal.store),
+        "seconds": elapsed,
+        "lines_per_sec": expected / elapsed if elapsed else 0.0,
+        "max_stall_ms": max(stalls, default=0.0) * 1000.0,
+        "paint_median_ms": paints[len(paints) // 2] * 1000.0,
+        "paint_max_ms": paints[-1] * 1000.0,
+        "search_ms": search_ms,
+        "filter_ms": filter_ms,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="MiniTerminal write throughput and scrolling benchmark")
+    parser.add_argument("--lines", type=int, default=1000000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=VERBOSE_CAPACITY)
+    args = parser.parse_args()
+    result = benchmark_terminal(args.lines, args.producers, args.capacity)
+    print(f"{result['lines']} lines in {result['seconds']:.2f}s ({result['lines_per_sec']:.0f} lines/s), "
+          f"longest UI stall {result['max_stall_ms']:.0f} ms, {result['retained']} retained, "
+          f"repaint median {result['paint_median_ms']:.2f} ms / max {result['paint_max_ms']:.2f} ms, "
+          f"full-history search {result['search_ms']:.1f} ms, level filter {result['filter_ms']:.1f} ms")
@@ -1,8 +1,339 @@
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, pyqtSignal, qInstallMessageHandler
+import os
+import sys
+import re
 import json
+import time
+import hashlib
+import inspect
+import functools
 from pathlib import Path
 from modules.config_utils import get_config_directory
+from modules.config_manager import get_config_namespace
+
+#----------Stylesheet Cache----------
+# Sizes the stylesheets are rendered for; part of every cached sheet's identity
+DEFAULT_TYPOGRAPHY = {'header_size': 14, 'text_size': 11}
+# Rendered sheets keyed by (component, theme colours, generation); the generation is
+# bumped when typography (or a theme definition) changes
+_stylesheet_cache = {}
+_style_generation = 0
+style_stats = {'hits': 0, 'misses': 0, 'applied': 0, 'skipped': 0, 'compiled_hits': 0, 'compiled_writes': 0}
+
+
+def cached_stylesheet(component, theme, build):
+    """Return the sheet for component under theme, calling build() only the first time"""
+    key = (component, tuple(theme.items()), _style_generation)
+    sheet = _stylesheet_cache.get(key)
+    if sheet is None:
+        sheet = _stylesheet_cache[key] = build()
+        style_stats['misses'] += 1
+    else:
+        style_stats['hits'] += 1
+    return sheet
+
+
+def apply_stylesheet(widget, sheet):
+    """setStyleSheet only when the sheet differs: Qt re-parses and re-polishes the subtree even for an identical one"""
+    if widget.styleSheet() == sheet:
+        style_stats['skipped'] += 1
+        return False
+    widget.setStyleSheet(sheet)
+    style_stats['applied'] += 1
+    return True
+
+
+def invalidate_stylesheets():
+    """Drop every rendered sheet (typography or theme definitions changed)"""
+    global _style_generation
+    _style_generation += 1
+    _stylesheet_cache.clear()
+
+
+def memoized_style(method):
+    """Cache a get_*_style(…, theme_name=None) method per theme colours and arguments"""
+    signature = inspect.signature(method)
+    component = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple((name, value) for name, value in bound.arguments.items()
+                          if name not in ('self', 'theme_name'))
+        theme = self.get_theme(bound.arguments.get('theme_name'))
+        return cached_stylesheet((component, arguments), theme, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+
+#----------Themes----------
+BUILTIN_THEMES = {
+    'dark': {
+        'name': 'Dark Theme',
+        'window_bg': '#1e1e1e',
+        'bg_primary': '#2d2d2d',
+        'bg_secondary': '#252525',
+        'text_primary': '#e0e0e0',
+        'text_secondary': '#b0b0b0',
+        'text_light': '#ffffff',
+        'button_bg': '#0078d4',
+        'button_hover': '#106ebe',
+        'button_pressed': '#005a9e',
+        'input_bg': '#2d2d2d',
+        'input_border': '#404040',
+        'input_focus': '#0078d4',
+        'menu_item_selected': '#0078d4',
+        'separator': '#404040',
+        'menu_bg': '#2d2d2d',
+        'menu_item': '#e0e0e0',
+        'menu_item_hover': '#404040',
+        'menu_item_selected_active': '#106ebe',
+        'scrollbar_bg': '#404040',
+        'scrollbar_handle': '#606060',
+        'scrollbar_handle_hover': '#808080',
+        'terminal_bg': '#0d1117',
+        'terminal_text': '#ffffff',
+        'success_color': '#27ae60',
+        'warning_color': '#f39c12',
+        'error_color': '#e74c3c',
+        'info_color': '#3498db'
+    },
+    'light': {
+        'name': 'Light Theme',
+        'window_bg': '#f8f9fa',
+        'bg_primary': '#ffffff',
+        'bg_secondary': '#e9ecef',
+        'text_primary': '#212529',
+        'text_secondary': '#6c757d',
+        'text_light': '#ffffff',
+        'button_bg': '#007bff',
+        'button_hover': '#0056b3',
+        'button_pressed': '#004085',
+        'input_bg': '#ffffff',
+        'input_border': '#ced4da',
+        'input_focus': '#007bff',
+        'menu_item_selected': '#007bff',
+        'separator': '#dee2e6',
+        'menu_bg': '#ffffff',
+        'menu_item': '#495057',
+        'menu_item_hover': '#e9ecef',
+        'menu_item_selected_active': '#0056b3',
+        'scrollbar_bg': '#e9ecef',
+        'scrollbar_handle': '#adb5bd',
+        'scrollbar_handle_hover': '#6c757d',
+        'terminal_bg': '#ffffff',
+        'terminal_text': '#212529',
+        'success_color': '#28a745',
+        'warning_color': '#ffc107',
+        'error_color': '#dc3545',
+        'info_color': '#17a2b8'
+    }
+}
+# Every theme defines these; a theme file missing one is rejected
+REQUIRED_THEME_KEYS = tuple(key for key in BUILTIN_THEMES['dark'] if key != 'name')
+# User themes: <config>/themes/<theme id>.json, a JSON object with a string for each
+# REQUIRED_THEME_KEYS entry and an optional display "name". dark.json / light.json
+# replace the built-in themes of the same id
+THEMES_DIR_NAME = "themes"
+# Rendered application stylesheets, <theme id>-<key>.qss
+COMPILED_DIR_NAME = "compiled"
+# Values end up inside QSS declarations; braces or semicolons would break every rule after them
+_THEME_VALUE_RE = re.compile(r"^[^{};]+$")
+
+
+def get_themes_directory():
+    return get_config_directory() / THEMES_DIR_NAME
+
+
+def load_theme_file(path):
+    """Read and validate one theme file; returns (theme, sha1 of the file). Raises OSError/ValueError"""
+    path = Path(path)
+    data = path.read_bytes()
+    try:
+        raw = json.loads(data.decode("utf-8"))
+    except ValueError as e:
+        raise ValueError(f"not valid JSON ({e})")
+    if not isinstance(raw, dict):
+        raise ValueError("expected a JSON object")
+    missing = [key for key in REQUIRED_THEME_KEYS if key not in raw]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    invalid = [key for key in REQUIRED_THEME_KEYS
+               if not isinstance(raw[key], str) or not _THEME_VALUE_RE.match(raw[key].strip())]
+    if invalid:
+        raise ValueError(f"invalid value for {', '.join(invalid)}")
+    theme = {'name': str(raw.get('name') or path.stem.replace('_', ' ').title())}
+    theme.update((key, raw[key].strip()) for key in REQUIRED_THEME_KEYS)
+    return theme, hashlib.sha1(data).hexdigest()
+
+
+_source_stamp = None
+
+
+def _style_source_stamp():
+    """Changes whenever this module (where the QSS templates live) is edited"""
+    global _source_stamp
+    if _source_stamp is None:
+        try:
+            st = os.stat(__file__)
+            _source_stamp = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            _source_stamp = []
+    return _source_stamp
+
+
+def _write_compiled(path, sheet):
+    """Atomically store a compiled stylesheet and drop older ones for the same theme"""
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(sheet)
+        os.replace(tmp_path, path)
+        theme_id = path.stem.rsplit("-", 1)[0]
+        for stale in path.parent.glob(f"{theme_id}-*.qss"):
+            if stale != path and stale.stem.rsplit("-", 1)[0] == theme_id:
+                stale.unlink()
+        style_stats['compiled_writes'] += 1
+    except OSError:
+        pass
+
+
+#----------Application Stylesheet----------
+# Dynamic property naming the sheet a widget (and everything inside it) takes from the
+# application stylesheet; selectors match it the same way they match btnType
+THEME_SCOPE_PROPERTY = "themeScope"
+# (scope, ThemeManager style method) in cascade order. A later rule wins a specificity
+# tie, so the main window comes first and containers come before the widgets they hold
+APPLICATION_SCOPES = (
+    ("MainWindow", "get_main_window_style"),
+    ("MainMenu", "get_menu_style"),
+    ("TerminalContainer", "get_terminal_container_style"),
+    ("Terminal", "get_terminal_style"),
+    ("TerminalToggle", "get_terminal_toggle_style"),
+    ("NotificationContainer", "get_notification_container_style"),
+    ("VersionNotification", "get_version_notification_style"),
+    ("EnvVarsPanel", "get_env_vars_style"),
+    ("InstallToolsPanel", "get_install_tools_style"),
+    ("CreateProjectPanel", "get_create_project_style"),
+    ("BuildProjectPanel", "get_build_project_style"),
+    ("UpdateProjectDepsPanel", "get_update_deps_style"),
+    ("DetachGitPanel", "get_detach_git_style"),
+    ("BackupDevRootPanel", "get_backup_dev_root_style"),
+    ("RefreshProjectPanel", "get_refresh_project_style"),
+    ("SettingsPanel", "get_settings_style"),
+    ("ExplorerPanel", "get_explorer_style"),
+    ("ProjectHealthPanel", "get_project_health_style"),
+    ("ProgressWidget", "get_progress_widget_style"),
+    ("ActivityIndicator", "get_activity_indicator_style"),
+)
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+# Qt's QSS parser drops the whole sheet on any of these: it has no functional pseudo-classes
+# such as :not(), and no sibling combinators
+_ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+_UNSUPPORTED_SELECTOR_RE = re.compile(r":[\w-]+\(|[+~]")
+
+
+def set_theme_scope(widget, scope):
+    """Tag a widget so its APPLICATION_SCOPES sheet applies to it and its children"""
+    widget.setProperty(THEME_SCOPE_PROPERTY, scope)
+
+
+def set_widget_role(widget, name, value):
+    """Change a role property used by selectors and re-polish only that widget"""
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    return True
+
+
+def _split_top_level(text, separator):
+    """Split on separator outside of [...], (...) and quotes"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif ch == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _scope_selector(selector, attribute, scope):
+    """
+    A widget's own sheet applies to the widget and its children, so a scoped selector
+    becomes two: one for descendants of the scoped widget and one with the attribute on
+    its first compound, which matches the scoped widget itself. Selectors that already
+    start with the scope's own class only need the second; the first could never match
+    and would just be one more rule for Qt to test against every widget.
+    """
+    end, insert, depth, quote = len(selector), None, 0, None
+    for i, ch in enumerate(selector):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif depth == 0 and (ch.isspace() or ch == ">"):
+            end = i
+            break
+        elif depth == 0 and ch == ":" and insert is None:
+            insert = i
+    insert = end if insert is None else insert
+    own = selector[:insert] + attribute + selector[insert:]
+    if selector[:insert] == scope:
+        return [own]
+    return [f"{attribute} {selector}", own]
+
+
+def scope_stylesheet(sheet, scope):
+    """Rewrite a widget stylesheet so it only matches the widget tagged with scope and its children"""
+    attribute = f'[{THEME_SCOPE_PROPERTY}="{scope}"]'
+    rules = []
+    for block in _COMMENT_RE.sub("", sheet).split("}"):
+        if "{" not in block:
+            continue
+        selectors, body = block.split("{", 1)
+        scoped = []
+        for selector in _split_top_level(selectors, ","):
+            selector = " ".join(selector.split())
+            if selector:
+                scoped.extend(_scope_selector(selector, attribute, scope))
+        if scoped:
+            rules.append(f"{', '.join(scoped)} {{ {' '.join(body.split())} }}")
+    return "\n".join(rules)
+
+
+def stylesheet_errors(sheet):
+    """Rules of a scope_stylesheet() result (one per line) that Qt would fail to parse"""
+    errors = []
+    for line in sheet.splitlines():
+        selectors, brace, body = line.partition("{")
+        body, closing, rest = body.rpartition("}")
+        if not brace or not closing or rest.strip() or "{" in body or "}" in body:
+            errors.append(line)
+        elif _UNSUPPORTED_SELECTOR_RE.search(_ATTRIBUTE_RE.sub("", selectors)):
+            errors.append(line)
+        elif any(":" not in declaration for declaration in _split_top_level(body, ";")
+                 if declaration.strip()):
+            errors.append(line)
+    return errors
 
 
 class ThemeManager(QObject):
@@ -13,68 +344,15 @@ class ThemeManager(QObject):
     def __init__(self):
         super().__init__()
         self.current_theme = 'dark'
-        self.themes = {
-            'dark': {
-                'name': 'Dark Theme',
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'bg_secondary': '#252525',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'text_light': '#ffffff',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'menu_item_selected': '#0078d4',
-                'separator': '#404040',
-                'menu_bg': '#2d2d2d',
-                'menu_item': '#e0e0e0',
-                'menu_item_hover': '#404040',
-                'menu_item_selected_active': '#106ebe',
-                'scrollbar_bg': '#404040',
-                'scrollbar_handle': '#606060',
-                'scrollbar_handle_hover': '#808080',
-                'terminal_bg': '#0d1117',
-                'terminal_text': '#ffffff',
-                'success_color': '#27ae60',
-                'warning_color': '#f39c12',
-                'error_color': '#e74c3c',
-                'info_color': '#3498db'
-            },
-            'light': {
-                'name': 'Light Theme',
-                'window_bg': '#f8f9fa',
-                'bg_primary': '#ffffff',
-                'bg_secondary': '#e9ecef',
-                'text_primary': '#212529',
-                'text_secondary': '#6c757d',
-                'text_light': '#ffffff',
-                'button_bg': '#007bff',
-                'button_hover': '#0056b3',
-                'button_pressed': '#004085',
-                'input_bg': '#ffffff',
-                'input_border': '#ced4da',
-                'input_focus': '#007bff',
-                'menu_item_selected': '#007bff',
-                'separator': '#dee2e6',
-                'menu_bg': '#ffffff',
-                'menu_item': '#495057',
-                'menu_item_hover': '#e9ecef',
-                'menu_item_selected_active': '#0056b3',
-                'scrollbar_bg': '#e9ecef',
-                'scrollbar_handle': '#adb5bd',
-                'scrollbar_handle_hover': '#6c757d',
-                'terminal_bg': '#ffffff',
-                'terminal_text': '#212529',
-                'success_color': '#28a745',
-                'warning_color': '#ffc107',
-                'error_color': '#dc3545',
-                'info_color': '#17a2b8'
-            }
-        }
+        self.themes = {name: dict(theme) for name, theme in BUILTIN_THEMES.items()}
+        # Theme files are parsed on demand: the active one at startup, the rest by discover_themes()
+        self.user_themes = set()
+        self.theme_errors = {}
+        self._theme_digests = {}
+        self._discovered = False
+        
+        self.typography = dict(DEFAULT_TYPOGRAPHY)
+        self.last_apply_ms = None
         
         # Load saved theme preference
         self.load_theme_preference()
@@ -86,7 +364,7 @@ class ThemeManager(QObject):
     
     def set_theme(self, theme_name):
         """Set the current theme and emit signal"""
-        if theme_name in self.themes:
+        if theme_name in self.themes or self.load_user_theme(theme_name):
             if theme_name != self.current_theme:
                 self.current_theme = theme_name
                 self.save_theme_preference()
@@ -95,60 +373,134 @@ class ThemeManager(QObject):
             return True
         return False
     
+    def set_typography(self, header_size=None, text_size=None):
+        """Change the typography sizes; cached stylesheets are re-rendered on next use"""
+        typography = dict(self.typography)
+        if header_size is not None:
+            typography['header_size'] = header_size
+        if text_size is not None:
+            typography['text_size'] = text_size
+        if typography == self.typography:
+            return False
+        self.typography = typography
+        invalidate_stylesheets()
+        self.theme_changed.emit(self.current_theme)
+        return True
+    
+    @memoized_style
+    def get_application_style(self, theme_name=None):
+        """
+        Every APPLICATION_SCOPES sheet, scoped and joined into one application stylesheet.
+        The result is also kept on disk per theme file hash and typography, so a later
+        start reads it back instead of rendering and scoping every panel sheet again.
+        """
+        path = self.get_compiled_style_path(theme_name)
+        try:
+            sheet = path.read_text(encoding="utf-8")
+            style_stats['compiled_hits'] += 1
+            return sheet
+        except OSError:
+            pass
+        sheet = "\n".join(scope_stylesheet(getattr(self, method)(theme_name), scope)
+                          for scope, method in APPLICATION_SCOPES)
+        # One bad rule would make Qt discard the whole application stylesheet
+        errors = stylesheet_errors(sheet)
+        if errors:
+            raise ValueError(f"Application stylesheet would not parse: {errors[0][:200]}"
+                             + (f" (and {len(errors) - 1} more)" if len(errors) > 1 else ""))
+        _write_compiled(path, sheet)
+        return sheet
+    
+    def apply_application_theme(self, app=None):
+        """Put the current theme on the QApplication: one stylesheet, one re-polish pass"""
+        app = app or QApplication.instance()
+        if app is None:
+            return False
+        start = time.perf_counter()
+        applied = apply_stylesheet(app, self.get_application_style())
+        self.last_apply_ms = (time.perf_counter() - start) * 1000.0
+        return applied
+    
     def get_available_themes(self):
         """Get list of available theme names and display names"""
+        self.discover_themes()
         return [(name, theme['name']) for name, theme in self.themes.items()]
     
+    #----------Theme Files----------
+    def load_user_theme(self, theme_name):
+        """Parse themes/<theme_name>.json if there is one; True when the theme is usable"""
+        path = get_themes_directory() / f"{theme_name}.json"
+        if not path.is_file():
+            return False
+        try:
+            theme, digest = load_theme_file(path)
+        except (OSError, ValueError) as e:
+            self.theme_errors[theme_name] = str(e)
+            print(f"[WARN] Theme file {path} ignored: {e}")
+            return False
+        self.themes[theme_name] = theme
+        self._theme_digests[theme_name] = digest
+        self.user_themes.add(theme_name)
+        self.theme_errors.pop(theme_name, None)
+        return True
+    
+    def discover_themes(self, force=False):
+        """Load the theme files not parsed yet (done once, when the list of themes is first needed)"""
+        if self._discovered and not force:
+            return
+        self._discovered = True
+        try:
+            paths = sorted(get_themes_directory().glob("*.json"))
+        except OSError:
+            paths = []
+        for path in paths:
+            if force or path.stem not in self.user_themes:
+                self.load_user_theme(path.stem)
+    
+    def get_theme_digest(self, theme_name=None):
+        """sha1 of the theme's file (of its colours for a built-in theme)"""
+        theme_name = theme_name or self.current_theme
+        digest = self._theme_digests.get(theme_name)
+        if digest is None:
+            encoded = json.dumps(self.get_theme(theme_name), sort_keys=True).encode("utf-8")
+            digest = self._theme_digests[theme_name] = hashlib.sha1(encoded).hexdigest()
+        return digest
+    
+    def get_compiled_style_path(self, theme_name=None):
+        """Where the application stylesheet for a theme and the current typography is cached"""
+        theme_name = theme_name or self.current_theme
+        key = json.dumps([self.get_theme_digest(theme_name), self.typography, _style_source_stamp()],
+                         sort_keys=True)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return get_themes_directory() / COMPILED_DIR_NAME / f"{theme_name}-{digest}.qss"
+    
     def get_current_theme_name(self):
         """Get the display name of the current theme"""
         return self.themes[self.current_theme]['name']
     
     def load_theme_preference(self):
         """Load theme preference from config file"""
-        try:
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_settings.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    settings = json.load(f)
-                    theme = settings.get('theme', 'dark')
-                    if theme in self.themes:
-                        self.current_theme = theme
-        except Exception:
-            # Use default theme if loading fails
+        theme = get_config_namespace("settings").get('theme')
+        # A theme file may replace a built-in theme, so look for one either way
+        if self.load_user_theme(theme) or theme in self.themes:
+            self.current_theme = theme
+        else:
             self.current_theme = 'dark'
     
     def save_theme_preference(self):
-        """Save theme preference to config file"""
-        try:
-            # Use config directory from dev root or fallback
-            config_dir = get_config_directory()
-            config_file = config_dir / "clibdt_settings.json"
-            settings = {}
-            
-            # Load existing settings if file exists
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    settings = json.load(f)
-            
-            # Update theme setting
-            settings['theme'] = self.current_theme
-            
-            # Save back to file
-            with open(config_file, 'w') as f:
-                json.dump(settings, f, indent=2)
-                
-        except Exception:
-            # Silently fail if saving fails
-            pass
+        """Save theme preference (written to the config file in the background)"""
+        get_config_namespace("settings").set('theme', self.current_theme)
     
     def apply_theme_to_widget(self, widget, theme_name=None):
         """Apply theme colors to a widget with comprehensive styling"""
+        apply_stylesheet(widget, self.get_widget_style(theme_name))
+    
+    @memoized_style
+    def get_widget_style(self, theme_name=None):
+        """Comprehensive widget styling used by apply_theme_to_widget"""
         theme = self.get_theme(theme_name)
         
-        # Apply comprehensive theme to widget
-        widget.setStyleSheet(f"""
+        return f"""
             QWidget {{
                 background-color: {theme['window_bg']};
                 color: {theme['text_primary']};
@@ -359,8 +711,9 @@ class ThemeManager(QObject):
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
                 height: 0px;
             }}
-        """)
+        """
     
+    @memoized_style
     def get_button_style(self, button_type='primary', theme_name=None):
         """Get styled button CSS for different button types"""
         theme = self.get_theme(theme_name)
@@ -458,6 +811,7 @@ class ThemeManager(QObject):
                 }}
             """
     
+    @memoized_style
     def get_input_style(self, input_type='text', theme_name=None):
         """Get styled input CSS for different input types"""
         theme = self.get_theme(theme_name)
@@ -541,6 +895,7 @@ class ThemeManager(QObject):
                 }}
             """
 
+    @memoized_style
     def get_env_vars_style(self, theme_name=None):
         """Get styled CSS for EnvVarsPanel following AI Theme Instructions"""
         theme = self.get_theme(theme_name)
@@ -627,6 +982,48 @@ class ThemeManager(QObject):
                 font-style: italic !important;
             }}
             
+            /* Status label states, selected by set_status through the statusType property */
+            EnvVarsPanel QLabel#status_label[statusType="success"] {{
+                color: #27ae60;
+                background-color: rgba(39, 174, 96, 0.1);
+                border: 1px solid #27ae60;
+                border-radius: 6px;
+                padding: 8px 12px;
+                font-size: 11px;
+                font-weight: bold;
+                margin: 4px 0px;
+            }}
+            EnvVarsPanel QLabel#status_label[statusType="error"] {{
+                color: #e74c3c;
+                background-color: rgba(231, 76, 60, 0.1);
+                border: 1px solid #e74c3c;
+                border-radius: 6px;
+                padding: 8px 12px;
+                font-size: 11px;
+                font-weight: bold;
+                margin: 4px 0px;
+            }}
+            EnvVarsPanel QLabel#status_label[statusType="warning"] {{
+                color: #f39c12;
+                background-color: rgba(243, 156, 18, 0.1);
+                border: 1px solid #f39c12;
+                border-radius: 6px;
+                padding: 8px 12px;
+                font-size: 11px;
+                font-weight: bold;
+                margin: 4px 0px;
+            }}
+            EnvVarsPanel QLabel#status_label[statusType="info"] {{
+                color: #3498db;
+                background-color: rgba(52, 152, 219, 0.1);
+                border: 1px solid #3498db;
+                border-radius: 6px;
+                padding: 8px 12px;
+                font-size: 11px;
+                font-weight: bold;
+                margin: 4px 0px;
+            }}
+            
             /* Input field styling - compact sizing */
             EnvVarsPanel QLineEdit,
             EnvVarsPanel QLineEdit:hover,
@@ -777,6 +1174,7 @@ class ThemeManager(QObject):
             }}
         """
 
+    @memoized_style
     def get_create_project_style(self, theme_name=None):
         """Get styled CSS for CreateProjectPanel following AI Theme Instructions"""
         theme = self.get_theme(theme_name)
@@ -980,6 +1378,7 @@ class ThemeManager(QObject):
             }}
         """
 
+    @memoized_style
     def get_install_tools_style(self, theme_name=None):
         """Get styled CSS for InstallToolsPanel with comprehensive theming"""
         theme = self.get_theme(theme_name)
@@ -1320,4 +1719,2263 @@ class ThemeManager(QObject):
                 border-radius: 5px !important;
                 background-color: transparent !important;
             }}
-        """ 
\ No newline at end of file
+        """
+
+    @memoized_style
+    def get_main_window_style(self, theme_name=None):
+        """Main window base styles, under every panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            QMainWindow {{
+                background-color: {theme['window_bg']};
+            }}
+            QWidget {{
+                background-color: {theme['window_bg']};
+                color: {theme['text_primary']};
+            }}
+            /* Global fallback styles. Qt has no :not(), so each is a default rule that the
+               panels' more specific rules (#objectName, [btnType="..."]) override */
+            QLabel {{
+                background-color: transparent;
+                color: {theme['text_primary']};
+                font-size: 11px;
+                font-weight: normal;
+            }}
+            QLabel[objectName*="title"], QLabel[objectName*="header"] {{
+                font-size: 14px;
+                font-weight: bold;
+            }}
+            QPushButton {{
+                background-color: {theme['button_bg']};
+                color: {theme['text_light']};
+                border: 1px solid {theme['button_bg']};
+                border-radius: 4px;
+                padding: 5px 10px;
+                font-size: 11px;
+                font-weight: normal;
+            }}
+            QPushButton:hover {{
+                background-color: {theme['button_hover']};
+                border-color: {theme['button_hover']};
+            }}
+            QPushButton:pressed {{
+                background-color: {theme['button_pressed']};
+                border-color: {theme['button_pressed']};
+            }}
+            QLineEdit {{
+                background-color: {theme['input_bg']};
+                color: {theme['text_primary']};
+                border: 2px solid {theme['input_border']};
+                border-radius: 4px;
+                padding: 5px;
+                font-size: 11px;
+                font-weight: normal;
+            }}
+            QLineEdit:focus {{
+                border-color: {theme['input_focus']};
+            }}
+            QTextEdit {{
+                background-color: {theme['input_bg']};
+                color: {theme['text_primary']};
+                border: 2px solid {theme['input_border']};
+                border-radius: 4px;
+                padding: 5px;
+                font-size: 11px;
+            }}
+            QTextEdit:focus {{
+                border-color: {theme['input_focus']};
+            }}
+            QPlainTextEdit {{
+                background-color: {theme['input_bg']};
+                color: {theme['text_primary']};
+                border: 2px solid {theme['input_border']};
+                border-radius: 4px;
+                padding: 5px;
+                font-size: 11px;
+            }}
+            QPlainTextEdit:focus {{
+                border-color: {theme['input_focus']};
+            }}
+        """
+
+    @memoized_style
+    def get_menu_style(self, theme_name=None):
+        """Side menu list"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            QListWidget {{
+                background-color: transparent;
+                border: none;
+                border-radius: 6px;
+                padding: 6px;
+                font-family: 'Segoe UI', Arial, sans-serif;
+                font-size: 12px;
+                color: {theme['text_primary']};
+                outline: none;
+            }}
+            QListWidget::item {{
+                background-color: transparent;
+                border: none;
+                border-radius: 4px;
+                padding: 6px 10px;
+                margin: 1px 0px;
+                font-weight: normal;
+            }}
+            QListWidget::item:hover {{
+                background-color: {theme['bg_secondary']};
+            }}
+            QListWidget::item:selected {{
+                background-color: {theme['menu_item_selected']};
+                color: {theme['text_light']};
+                font-weight: bold;
+            }}
+            QListWidget::item:selected:active {{
+                background-color: {theme['button_pressed']};
+                color: {theme['text_light']};
+            }}
+            QScrollBar:vertical {{
+                background-color: {theme['bg_secondary']};
+                width: 6px;
+                border-radius: 3px;
+            }}
+            QScrollBar::handle:vertical {{
+                background-color: {theme['text_secondary']};
+                border-radius: 3px;
+                min-height: 16px;
+            }}
+            QScrollBar::handle:vertical:hover {{
+                background-color: {theme['text_primary']};
+            }}
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+                height: 0px;
+            }}
+        """
+
+    @memoized_style
+    def get_terminal_container_style(self, theme_name=None):
+        """Frame around the terminal"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            QWidget#terminal_container {{
+                background-color: {theme['bg_primary']};
+                border-top: 1px solid {theme['separator']};
+                border-radius: 0px;
+            }}
+        """
+
+    @memoized_style
+    def get_terminal_style(self, theme_name=None):
+        """Mini terminal"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            MiniTerminal {{
+                background-color: {theme['terminal_bg']} !important;
+                color: {theme['terminal_text']} !important;
+                border: 1px solid {theme['input_border']};
+                border-radius: 6px;
+                padding: 10px;
+                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+                font-size: 10px;
+                selection-background-color: {theme['menu_item_selected']};
+            }}
+            MiniTerminal QScrollBar:vertical {{
+                background-color: {theme['scrollbar_bg']};
+                width: 8px;
+                border-radius: 4px;
+            }}
+            MiniTerminal QScrollBar::handle:vertical {{
+                background-color: {theme['scrollbar_handle']};
+                border-radius: 4px;
+                min-height: 20px;
+            }}
+            MiniTerminal QScrollBar::handle:vertical:hover {{
+                background-color: {theme['scrollbar_handle_hover']};
+            }}
+            MiniTerminal QScrollBar::add-line:vertical, MiniTerminal QScrollBar::sub-line:vertical {{
+                height: 0px;
+            }}
+        """
+
+    @memoized_style
+    def get_terminal_toggle_style(self, theme_name=None):
+        """Terminal show/hide button"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            QPushButton {{
+                background-color: {theme['bg_secondary']};
+                color: {theme['text_primary']};
+                border: 1px solid {theme['input_border']};
+                border-radius: 6px;
+                padding: 6px 12px;
+                font-size: 11px;
+                font-weight: normal;
+            }}
+            QPushButton:hover {{
+                background-color: {theme['input_border']};
+                border-color: {theme['text_primary']};
+            }}
+            QPushButton:pressed {{
+                background-color: {theme['button_pressed']};
+                border-color: {theme['button_pressed']};
+            }}
+        """
+
+    @memoized_style
+    def get_notification_container_style(self, theme_name=None):
+        """Menu row holding the update notification (no theme colours, it stays transparent)"""
+        return """
+            QWidget {
+                background-color: transparent;
+                border: none;
+                margin: 2px;
+            }
+        """
+
+    @memoized_style
+    def get_version_notification_style(self, theme_name=None):
+        """Update available label"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            QLabel {{
+                color: {theme['success_color']};
+                font-weight: bold;
+                font-size: 10px;
+                padding: 2px 4px;
+                background-color: transparent;
+            }}
+        """
+
+    @memoized_style
+    def get_backup_dev_root_style(self, theme_name=None):
+        """Backup Dev Root panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            /* Ultra-compact styling that overrides ALL global styling */
+            BackupDevRootPanel,
+            BackupDevRootPanel * {{
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                background-color: {theme['window_bg']} !important;
+                color: {theme['text_primary']} !important;
+                font-family: 'Segoe UI', Arial, sans-serif !important;
+            }}
+
+            /* Typography Hierarchy - Only headers are bold */
+            BackupDevRootPanel QLabel {{
+                background-color: transparent !important;
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                font-weight: normal !important;
+            }}
+
+            /* Header elements - ONLY these are bold */
+            BackupDevRootPanel QLabel#main_title {{
+                font-size: 18px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 2px !important;
+                background: transparent !important;
+            }}
+
+            BackupDevRootPanel QLabel#section_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+                margin-bottom: 8px !important;
+                font-weight: normal !important;
+            }}
+
+            BackupDevRootPanel QLabel#section_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-top: 8px !important;
+                margin-bottom: 4px !important;
+                background: transparent !important;
+            }}
+
+            /* Divider lines */
+            BackupDevRootPanel QLabel#title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            BackupDevRootPanel QLabel#section_title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* Input field styling - responsive resizing */
+            BackupDevRootPanel QLineEdit,
+            BackupDevRootPanel QLineEdit:hover,
+            BackupDevRootPanel QLineEdit:focus {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-height: 24px !important;
+                max-height: 32px !important;
+            }}
+
+            BackupDevRootPanel QLineEdit:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            BackupDevRootPanel QLineEdit:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            /* CheckBox styling - completely transparent background */
+            BackupDevRootPanel QCheckBox {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                spacing: 8px !important;
+                padding: 2px 0px !important;
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+            }}
+
+            /* Override any inherited backgrounds from parent widgets */
+            BackupDevRootPanel QCheckBox,
+            BackupDevRootPanel QCheckBox:hover,
+            BackupDevRootPanel QCheckBox:pressed,
+            BackupDevRootPanel QCheckBox:checked {{
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+            }}
+
+            BackupDevRootPanel QCheckBox::indicator {{
+                width: 16px !important;
+                height: 16px !important;
+                border: 2px solid {theme['input_border']} !important;
+                background-color: {theme['input_bg']} !important;
+                border-radius: 3px !important;
+            }}
+
+            BackupDevRootPanel QCheckBox::indicator:checked {{
+                background-color: {theme['button_bg']} !important;
+                border-color: {theme['button_bg']} !important;
+                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
+            }}
+
+            BackupDevRootPanel QCheckBox:hover::indicator:unchecked {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            /* Ensure checkbox text area is completely transparent */
+            BackupDevRootPanel QCheckBox::text {{
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* Nuclear option: Override ALL possible checkbox backgrounds */
+            BackupDevRootPanel QCheckBox * {{
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+            }}
+
+            /* Progress Bar styling */
+            BackupDevRootPanel QProgressBar {{
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                text-align: center !important;
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                font-weight: normal !important;
+                min-height: 24px !important;
+                max-height: 32px !important;
+            }}
+
+            BackupDevRootPanel QProgressBar::chunk {{
+                background-color: {theme['success_color']} !important;
+                border-radius: 2px !important;
+            }}
+
+            /* Button styling - unified gradient system with responsive sizing */
+            BackupDevRootPanel QPushButton,
+            BackupDevRootPanel QPushButton:hover,
+            BackupDevRootPanel QPushButton:pressed,
+            BackupDevRootPanel QPushButton:disabled {{
+                border: none !important;
+                padding: 8px 16px !important;
+                border-radius: 6px !important;
+                font-size: 11px !important;
+                font-weight: bold !important;
+                min-height: 16px !important;
+                margin: 2px 4px !important;
+            }}
+
+            BackupDevRootPanel QPushButton:disabled {{
+                background-color: {theme['text_secondary']} !important;
+                color: {theme['text_secondary']} !important;
+                opacity: 0.6 !important;
+            }}
+
+            /* Success action buttons - Green theme with bright hover effects */
+            BackupDevRootPanel QPushButton[btnType="success"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['success_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            BackupDevRootPanel QPushButton[btnType="success"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
+                border: 2px solid #a9dfbf !important;
+                color: #ffffff !important;
+                padding: 7px 13px !important;
+            }}
+
+            BackupDevRootPanel QPushButton[btnType="success"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #27ae60, stop:1 #229954) !important;
+                border: 2px solid #1e8449 !important;
+                color: #ffffff !important;
+                padding: 8px 14px !important;
+            }}
+
+            /* Folder buttons - Blue theme with bright hover effects */
+            BackupDevRootPanel QPushButton[btnType="folder"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['info_color']}, stop:1 {theme['info_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['info_color']} !important;
+                padding: 6px 8px !important;
+            }}
+
+            BackupDevRootPanel QPushButton[btnType="folder"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #85c1e9, stop:0.5 #5dade2, stop:1 #3498db) !important;
+                border: 2px solid #a9cce3 !important;
+                color: #ffffff !important;
+                padding: 7px 9px !important;
+            }}
+
+            BackupDevRootPanel QPushButton[btnType="folder"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #2980b9, stop:1 #21618c) !important;
+                border: 2px solid #1b4f72 !important;
+                color: #ffffff !important;
+                padding: 8px 10px !important;
+            }}
+
+            /* Uninstall/Danger buttons - Red theme with bright hover effects */
+            BackupDevRootPanel QPushButton[btnType="uninstall"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['error_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            BackupDevRootPanel QPushButton[btnType="uninstall"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b) !important;
+                border: 2px solid #f1948a !important;
+                color: #ffffff !important;
+            }}
+
+            BackupDevRootPanel QPushButton[btnType="uninstall"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                border: 1px solid {theme['error_color']} !important;
+                opacity: 0.8 !important;
+            }}
+        """
+
+    @memoized_style
+    def get_build_project_style(self, theme_name=None):
+        """Build panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            /* Nuclear option: Override ALL global styling with ultra-compact layout */
+            BuildProjectPanel,
+            BuildProjectPanel * {{
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                background-color: {theme['window_bg']} !important;
+                color: {theme['text_primary']} !important;
+                font-family: 'Segoe UI', Arial, sans-serif !important;
+            }}
+
+            /* Typography Hierarchy - Only headers are bold */
+            BuildProjectPanel QLabel {{
+                background-color: transparent !important;
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                font-weight: normal !important;
+            }}
+
+            /* Header elements - ONLY these are bold */
+            BuildProjectPanel QLabel#build_project_title {{
+                font-size: 18px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                background: transparent !important;
+                padding: 6px 0px !important;
+            }}
+
+            BuildProjectPanel QLabel#title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            BuildProjectPanel QLabel#build_project_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 11px !important;
+                margin-bottom: 8px !important;
+                font-weight: normal !important;
+            }}
+
+            BuildProjectPanel QLabel#section_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-top: 8px !important;
+                margin-bottom: 4px !important;
+                background: transparent !important;
+                padding: 4px 0px !important;
+            }}
+
+            BuildProjectPanel QLabel#section_title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            BuildProjectPanel QLabel#section_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+                margin-bottom: 6px !important;
+                font-weight: normal !important;
+            }}
+
+            BuildProjectPanel QLabel#metadata_label {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                font-weight: normal !important;
+                background: transparent !important;
+            }}
+
+            /* Separator styling */
+            BuildProjectPanel QLabel#section_divider {{
+                background-color: {theme['separator']} !important;
+                height: 2px !important;
+                margin: 8px 0px !important;
+            }}
+
+            /* Input styling - responsive and modern */
+            BuildProjectPanel QLineEdit,
+            BuildProjectPanel QLineEdit:hover,
+            BuildProjectPanel QLineEdit:focus {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-width: 120px !important;
+            }}
+
+            BuildProjectPanel QLineEdit:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            BuildProjectPanel QLineEdit:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            /* Project name combo box styling */
+            BuildProjectPanel QComboBox#project_name_input {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-width: 150px !important;
+            }}
+
+            BuildProjectPanel QComboBox#project_name_input:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            BuildProjectPanel QComboBox#project_name_input:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            BuildProjectPanel QComboBox#project_name_input::drop-down {{
+                border: none !important;
+                width: 24px !important;
+            }}
+
+            BuildProjectPanel QComboBox#project_name_input::down-arrow {{
+                image: none !important;
+                border-left: 6px solid transparent !important;
+                border-right: 6px solid transparent !important;
+                border-top: 6px solid {theme['text_primary']} !important;
+                margin-right: 6px !important;
+            }}
+
+            BuildProjectPanel QComboBox#project_name_input QAbstractItemView {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                selection-background-color: {theme['button_bg']} !important;
+                selection-color: {theme['text_light']} !important;
+                padding: 4px !important;
+            }}
+
+            /* Metadata input fields styling */
+            BuildProjectPanel QLineEdit#project_name_input,
+            BuildProjectPanel QLineEdit#version_input,
+            BuildProjectPanel QLineEdit#author_input,
+            BuildProjectPanel QLineEdit#description_input {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-width: 120px !important;
+            }}
+
+            BuildProjectPanel QLineEdit#project_name_input:hover,
+            BuildProjectPanel QLineEdit#version_input:hover,
+            BuildProjectPanel QLineEdit#author_input:hover,
+            BuildProjectPanel QLineEdit#description_input:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            BuildProjectPanel QLineEdit#project_name_input:focus,
+            BuildProjectPanel QLineEdit#version_input:focus,
+            BuildProjectPanel QLineEdit#author_input:focus,
+            BuildProjectPanel QLineEdit#description_input:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            /* ComboBox styling - responsive resizing */
+            BuildProjectPanel QComboBox,
+            BuildProjectPanel QComboBox:hover,
+            BuildProjectPanel QComboBox:focus {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-width: 120px !important;
+            }}
+
+            BuildProjectPanel QComboBox:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            BuildProjectPanel QComboBox:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            BuildProjectPanel QComboBox::drop-down {{
+                border: none !important;
+                width: 24px !important;
+            }}
+
+            BuildProjectPanel QComboBox::down-arrow {{
+                image: none !important;
+                border-left: 6px solid transparent !important;
+                border-right: 6px solid transparent !important;
+                border-top: 6px solid {theme['text_primary']} !important;
+                margin-right: 6px !important;
+            }}
+
+            BuildProjectPanel QComboBox QAbstractItemView {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                selection-background-color: {theme['button_bg']} !important;
+                selection-color: {theme['text_light']} !important;
+                padding: 4px !important;
+            }}
+
+            /* CheckBox styling - transparent background */
+            BuildProjectPanel QCheckBox {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                spacing: 8px !important;
+                padding: 2px 0px !important;
+                background: transparent !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+            }}
+
+            BuildProjectPanel QCheckBox::indicator {{
+                width: 16px !important;
+                height: 16px !important;
+                border: 2px solid {theme['input_border']} !important;
+                background-color: {theme['input_bg']} !important;
+                border-radius: 3px !important;
+            }}
+
+            BuildProjectPanel QCheckBox::indicator:checked {{
+                background-color: {theme['button_bg']} !important;
+                border-color: {theme['button_bg']} !important;
+                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
+            }}
+
+            BuildProjectPanel QCheckBox:hover::indicator:unchecked {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            /* Progress Bar styling */
+            BuildProjectPanel QProgressBar#build_progress_bar {{
+                border: 1px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                text-align: center !important;
+                font-size: 11px !important;
+                color: {theme['text_primary']} !important;
+                background-color: {theme['input_bg']} !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+            }}
+
+            BuildProjectPanel QProgressBar#build_progress_bar::chunk {{
+                background-color: {theme['button_bg']} !important;
+                border-radius: 4px !important;
+            }}
+
+            /* Button styling - unified gradient system with responsive sizing */
+            BuildProjectPanel QPushButton,
+            BuildProjectPanel QPushButton:hover,
+            BuildProjectPanel QPushButton:pressed,
+            BuildProjectPanel QPushButton:disabled {{
+                border: none !important;
+                padding: 8px 16px !important;
+                border-radius: 6px !important;
+                font-size: 11px !important;
+                font-weight: bold !important;
+                min-height: 16px !important;
+                margin: 2px 4px !important;
+            }}
+
+            BuildProjectPanel QPushButton:disabled {{
+                background-color: {theme['text_secondary']} !important;
+                color: {theme['text_secondary']} !important;
+                opacity: 0.6 !important;
+            }}
+
+            /* Success action buttons */
+            BuildProjectPanel QPushButton[btnType="success"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['success_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            BuildProjectPanel QPushButton[btnType="success"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
+                border: 2px solid #a9dfbf !important;
+                color: #ffffff !important;
+                padding: 7px 13px !important;
+            }}
+
+            BuildProjectPanel QPushButton[btnType="success"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #27ae60, stop:1 #229954) !important;
+                border: 2px solid #1e8449 !important;
+                color: #ffffff !important;
+                padding: 8px 14px !important;
+            }}
+
+            /* Uninstall/Danger buttons */
+            BuildProjectPanel QPushButton[btnType="uninstall"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['error_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            BuildProjectPanel QPushButton[btnType="uninstall"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b) !important;
+                border: 2px solid #f1948a !important;
+                color: #ffffff !important;
+            }}
+
+            BuildProjectPanel QPushButton[btnType="uninstall"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                border: 1px solid {theme['error_color']} !important;
+                opacity: 0.8 !important;
+            }}
+
+            /* Secondary button - Gray theme */
+            BuildProjectPanel QPushButton[btnType="secondary"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #6c757d, stop:1 #5a6268) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid #5a6268 !important;
+            }}
+            BuildProjectPanel QPushButton[btnType="secondary"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #868e96, stop:1 #6c757d) !important;
+                border: 1px solid #868e96 !important;
+            }}
+            BuildProjectPanel QPushButton[btnType="secondary"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #5a6268, stop:1 #495057) !important;
+                border: 1px solid #495057 !important;
+            }}
+        """
+
+    @memoized_style
+    def get_detach_git_style(self, theme_name=None):
+        """Detach Git panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            /* Nuclear option: Override ALL global styling with ultra-compact layout */
+            DetachGitPanel,
+            DetachGitPanel * {{
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                background-color: {theme['window_bg']} !important;
+                color: {theme['text_primary']} !important;
+                font-family: 'Segoe UI', Arial, sans-serif !important;
+            }}
+
+            /* Typography Hierarchy - Only headers are bold */
+            DetachGitPanel QLabel {{
+                background-color: transparent !important;
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                font-weight: normal !important;
+            }}
+
+            /* Main title - largest and most prominent */
+            DetachGitPanel QLabel#main_title {{
+                font-size: 18px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 6px 0px !important;
+            }}
+
+            /* Color-coded section titles */
+            DetachGitPanel QLabel#custom_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['info_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            DetachGitPanel QLabel#success_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['success_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            DetachGitPanel QLabel#warning_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['warning_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            DetachGitPanel QLabel#section_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            /* Section descriptions */
+            DetachGitPanel QLabel#section_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+                margin-bottom: 6px !important;
+            }}
+
+            DetachGitPanel QLabel#warning_label {{
+                color: {theme['warning_color']} !important;
+                font-size: 10px !important;
+                font-weight: normal !important;
+            }}
+
+            DetachGitPanel QLabel#git_status_label {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                font-weight: normal !important;
+                padding: 4px 0px !important;
+            }}
+
+            /* Divider lines */
+            DetachGitPanel QLabel#title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+
+
+            /* ComboBox styling - responsive resizing */
+            DetachGitPanel QComboBox,
+            DetachGitPanel QComboBox:hover,
+            DetachGitPanel QComboBox:focus {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-width: 120px !important;
+            }}
+
+            DetachGitPanel QComboBox:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            DetachGitPanel QComboBox:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            DetachGitPanel QComboBox::drop-down {{
+                border: none !important;
+                width: 24px !important;
+            }}
+
+            DetachGitPanel QComboBox::down-arrow {{
+                image: none !important;
+                border-left: 6px solid transparent !important;
+                border-right: 6px solid transparent !important;
+                border-top: 6px solid {theme['text_primary']} !important;
+                margin-right: 6px !important;
+            }}
+
+            DetachGitPanel QComboBox QAbstractItemView {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                selection-background-color: {theme['button_bg']} !important;
+                selection-color: {theme['text_light']} !important;
+                padding: 4px !important;
+            }}
+
+            /* Progress Bar styling */
+            DetachGitPanel QProgressBar#detach_progress_bar {{
+                border: 1px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                text-align: center !important;
+                font-size: 11px !important;
+                color: {theme['text_primary']} !important;
+                background-color: {theme['input_bg']} !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+            }}
+
+            DetachGitPanel QProgressBar#detach_progress_bar::chunk {{
+                background-color: {theme['button_bg']} !important;
+                border-radius: 4px !important;
+            }}
+
+            /* Base button styling for all states */
+            DetachGitPanel QPushButton,
+            DetachGitPanel QPushButton:hover,
+            DetachGitPanel QPushButton:pressed,
+            DetachGitPanel QPushButton:disabled {{
+                border: none !important;
+                padding: 8px 16px !important;
+                border-radius: 6px !important;
+                font-size: 11px !important;
+                font-weight: bold !important;
+                min-height: 16px !important;
+                margin: 2px 4px !important;
+            }}
+
+            /* General disabled button styling (applies to ALL button types) */
+            DetachGitPanel QPushButton:disabled {{
+                background-color: {theme['text_secondary']} !important;
+                color: {theme['text_secondary']} !important;
+                opacity: 0.6 !important;
+            }}
+
+            /* Uninstall/Danger buttons - Red theme with bright hover effects */
+            DetachGitPanel QPushButton[btnType="uninstall"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['error_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            DetachGitPanel QPushButton[btnType="uninstall"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b) !important;
+                border: 2px solid #f1948a !important;
+                color: #ffffff !important;
+            }}
+
+            DetachGitPanel QPushButton[btnType="uninstall"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                border: 1px solid {theme['error_color']} !important;
+                opacity: 0.8 !important;
+            }}
+
+            /* Secondary utility buttons */
+            DetachGitPanel QPushButton[btnType="secondary"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #6c757d, stop:1 #5a6268) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid #5a6268 !important;
+                padding: 6px 12px !important;
+            }}
+
+            DetachGitPanel QPushButton[btnType="secondary"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #bdc3c7, stop:0.5 #95a5a6, stop:1 #7f8c8d) !important;
+                border: 2px solid #d5dbdb !important;
+                color: #ffffff !important;
+            }}
+
+            DetachGitPanel QPushButton[btnType="secondary"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #5a6268, stop:1 #495057) !important;
+                border: 1px solid #495057 !important;
+            }}
+        """
+
+    @memoized_style
+    def get_explorer_style(self, theme_name=None):
+        """Explorer panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            /* Main panel styling */
+            ExplorerPanel {{
+                background-color: {theme['window_bg']};
+                color: {theme['text_primary']};
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }}
+
+            /* Main title styling */
+            ExplorerPanel QLabel#main_title {{
+                font-size: 18px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 6px 0px !important;
+                background: transparent !important;
+            }}
+
+            /* Divider lines */
+            ExplorerPanel QLabel#title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* Section descriptions */
+            ExplorerPanel QLabel#section_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+                margin-bottom: 6px !important;
+                background: transparent !important;
+            }}
+
+            /* Folders list styling */
+            ExplorerPanel QListWidget#folders_list {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                padding: 8px !important;
+                font-size: 11px !important;
+                selection-background-color: {theme['menu_item_selected']} !important;
+                selection-color: {theme['text_light']} !important;
+            }}
+
+            ExplorerPanel QListWidget::item {{
+                background-color: transparent !important;
+                border: none !important;
+                border-radius: 4px !important;
+                padding: 8px 12px !important;
+                margin: 2px 0px !important;
+                font-weight: normal !important;
+            }}
+
+            ExplorerPanel QListWidget::item:hover {{
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            ExplorerPanel QListWidget::item:selected {{
+                background-color: {theme['menu_item_selected']} !important;
+                color: {theme['text_light']} !important;
+                font-weight: bold !important;
+            }}
+
+            /* Scrollbar styling */
+            ExplorerPanel QListWidget QScrollBar:vertical {{
+                background-color: {theme['scrollbar_bg']} !important;
+                width: 8px !important;
+                border-radius: 4px !important;
+            }}
+
+            ExplorerPanel QListWidget QScrollBar::handle:vertical {{
+                background-color: {theme['scrollbar_handle']} !important;
+                border-radius: 4px !important;
+                min-height: 20px !important;
+            }}
+
+            ExplorerPanel QListWidget QScrollBar::handle:vertical:hover {{
+                background-color: {theme['scrollbar_handle_hover']} !important;
+            }}
+
+            ExplorerPanel QListWidget QScrollBar::add-line:vertical, 
+            ExplorerPanel QListWidget QScrollBar::sub-line:vertical {{
+                height: 0px !important;
+            }}
+        """
+
+    @memoized_style
+    def get_git_commit_style(self, theme_name=None):
+        """Git commit panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            /* Nuclear option: Override ALL global styling with ultra-compact layout */
+            GitCommitPanel,
+            GitCommitPanel * {{
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                background-color: {theme['window_bg']} !important;
+                color: {theme['text_primary']} !important;
+                font-family: 'Segoe UI', Arial, sans-serif !important;
+            }}
+
+            /* Typography Hierarchy - Only headers are bold */
+            GitCommitPanel QLabel {{
+                background-color: transparent !important;
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                font-weight: normal !important;
+            }}
+
+            /* Main title - largest and most prominent */
+            GitCommitPanel QLabel#main_title {{
+                font-size: 18px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 6px 0px !important;
+            }}
+
+            /* Color-coded section titles */
+            GitCommitPanel QLabel#custom_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['info_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            GitCommitPanel QLabel#success_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['success_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            GitCommitPanel QLabel#section_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            /* Section descriptions */
+            GitCommitPanel QLabel#section_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+                margin-bottom: 6px !important;
+            }}
+
+            /* Divider lines */
+            GitCommitPanel QLabel#title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* LineEdit styling - responsive resizing */
+            GitCommitPanel QLineEdit,
+            GitCommitPanel QLineEdit:hover,
+            GitCommitPanel QLineEdit:focus {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-width: 120px !important;
+            }}
+
+            GitCommitPanel QLineEdit:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            GitCommitPanel QLineEdit:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            /* CheckBox styling - transparent background */
+            GitCommitPanel QCheckBox {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                spacing: 8px !important;
+                padding: 2px 0px !important;
+                background: transparent !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+            }}
+
+            GitCommitPanel QCheckBox::indicator {{
+                width: 16px !important;
+                height: 16px !important;
+                border: 2px solid {theme['input_border']} !important;
+                background-color: {theme['input_bg']} !important;
+                border-radius: 3px !important;
+            }}
+
+            GitCommitPanel QCheckBox::indicator:checked {{
+                background-color: {theme['button_bg']} !important;
+                border-color: {theme['button_bg']} !important;
+                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
+            }}
+
+            GitCommitPanel QCheckBox:hover::indicator:unchecked {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            /* Base button styling for all states */
+            GitCommitPanel QPushButton,
+            GitCommitPanel QPushButton:hover,
+            GitCommitPanel QPushButton:pressed,
+            GitCommitPanel QPushButton:disabled {{
+                border: none !important;
+                padding: 8px 16px !important;
+                border-radius: 6px !important;
+                font-size: 11px !important;
+                font-weight: bold !important;
+                min-height: 16px !important;
+                margin: 2px 4px !important;
+            }}
+
+            /* General disabled button styling (applies to ALL button types) */
+            GitCommitPanel QPushButton:disabled {{
+                background-color: {theme['text_secondary']} !important;
+                color: {theme['text_secondary']} !important;
+                opacity: 0.6 !important;
+            }}
+
+            /* Success action buttons - Green theme with bright hover effects */
+            GitCommitPanel QPushButton[btnType="success"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['success_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            GitCommitPanel QPushButton[btnType="success"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
+                border: 2px solid #a9dfbf !important;
+                color: #ffffff !important;
+                padding: 7px 13px !important;
+            }}
+
+            GitCommitPanel QPushButton[btnType="success"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #27ae60, stop:1 #229954) !important;
+                border: 2px solid #1e8449 !important;
+                color: #ffffff !important;
+                padding: 8px 14px !important;
+            }}
+        """
+
+    @memoized_style
+    def get_project_health_style(self, theme_name=None):
+        """Project Health panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            QWidget {{
+                background-color: {theme['window_bg']};
+                color: {theme['text_primary']};
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }}
+            QLabel#main_title {{
+                font-size: 18px;
+                font-weight: bold;
+                color: {theme['text_primary']};
+                margin-bottom: 4px;
+                padding: 6px 0px;
+            }}
+            QLabel#title_divider {{
+                background-color: {theme['separator']};
+                border: none;
+                margin: 0px;
+                padding: 0px;
+            }}
+            QLabel#section_desc {{
+                color: {theme['text_secondary']};
+                font-size: 10px;
+                margin-bottom: 6px;
+            }}
+            QLabel#status_label {{
+                color: {theme['info_color']};
+                font-size: 11px;
+            }}
+            QTableWidget#health_table {{
+                background-color: {theme['input_bg']};
+                border: 2px solid {theme['input_border']};
+                border-radius: 6px;
+                gridline-color: {theme['separator']};
+                font-size: 11px;
+                selection-background-color: {theme['menu_item_selected']};
+                selection-color: {theme['text_light']};
+            }}
+            QHeaderView::section {{
+                background-color: {theme['window_bg']};
+                color: {theme['text_secondary']};
+                border: none;
+                border-bottom: 1px solid {theme['separator']};
+                padding: 4px 8px;
+                font-weight: bold;
+            }}
+            QPushButton {{
+                border: none;
+                border-radius: 6px;
+                font-size: 11px;
+                font-weight: bold;
+                padding: 6px 12px;
+            }}
+            QPushButton[btnType="success"] {{
+                background-color: {theme['success_color']};
+                color: {theme['text_light']};
+            }}
+            QPushButton:disabled {{
+                background-color: {theme['text_secondary']};
+            }}
+        """
+
+    @memoized_style
+    def get_progress_widget_style(self, theme_name=None):
+        """Progress widget"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            ProgressWidget {{
+                background-color: {theme['bg_primary']};
+                border: 1px solid {theme['separator']};
+                border-radius: 6px;
+                padding: 8px;
+            }}
+
+            ProgressWidget QLabel#progress_title {{
+                color: {theme['text_primary']};
+                font-size: 13px;
+                font-weight: bold;
+                background: transparent;
+            }}
+
+            ProgressWidget QLabel#progress_status {{
+                color: {theme['text_secondary']};
+                font-size: 11px;
+                background: transparent;
+            }}
+
+            ProgressWidget QProgressBar {{
+                border: 2px solid {theme['separator']};
+                border-radius: 4px;
+                text-align: center;
+                background-color: {theme['window_bg']};
+                color: {theme['text_primary']};
+                font-size: 11px;
+                font-weight: bold;
+            }}
+
+            ProgressWidget QProgressBar::chunk {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['button_bg']}, stop:1 {theme['button_pressed']});
+                border-radius: 2px;
+            }}
+
+            ProgressWidget QPushButton {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['button_bg']}, stop:1 {theme['button_pressed']});
+                color: #ffffff;
+                border: 1px solid {theme['button_bg']};
+                border-radius: 4px;
+                padding: 6px 12px;
+                font-size: 11px;
+                font-weight: bold;
+            }}
+
+            ProgressWidget QPushButton:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['button_hover']}, stop:1 {theme['button_bg']});
+                border: 1px solid {theme['button_hover']};
+            }}
+
+            ProgressWidget QPushButton:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['button_pressed']}, stop:1 {theme['button_pressed']});
+                border: 1px solid {theme['button_pressed']};
+            }}
+
+            ProgressWidget QPushButton[btnType="danger"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
+                border: 1px solid {theme['error_color']};
+            }}
+
+            ProgressWidget QPushButton[btnType="danger"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
+                border: 1px solid {theme['error_color']};
+                opacity: 0.9;
+            }}
+
+            ProgressWidget QPushButton[btnType="success"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']});
+                border: 1px solid {theme['success_color']};
+            }}
+
+            ProgressWidget QPushButton[btnType="success"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']});
+                border: 1px solid {theme['success_color']};
+                opacity: 0.9;
+            }}
+        """
+
+    @memoized_style
+    def get_activity_indicator_style(self, theme_name=None):
+        """Activity indicator"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            ActivityIndicator {{
+                background-color: {theme['bg_primary']};
+                border: 1px solid {theme['separator']};
+                border-radius: 4px;
+                padding: 4px;
+            }}
+
+            ActivityIndicator QLabel#activity_message {{
+                color: {theme['text_secondary']};
+                font-size: 11px;
+                background: transparent;
+            }}
+
+            ActivityIndicator QLabel#activity_spinner {{
+                color: {theme['button_bg']};
+                font-size: 12px;
+                font-weight: bold;
+                background: transparent;
+                min-width: 20px;
+            }}
+        """
+
+    @memoized_style
+    def get_refresh_project_style(self, theme_name=None):
+        """Refresh Project panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            QWidget {{
+                background-color: {theme['window_bg']};
+                color: {theme['text_primary']};
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }}
+            QLabel#main_title {{
+                font-size: 18px;
+                font-weight: bold;
+                color: {theme['text_primary']};
+                margin-bottom: 4px;
+                padding: 6px 0px;
+            }}
+            QLabel#title_divider {{
+                background-color: {theme['separator']};
+                border: none;
+                margin: 0px;
+                padding: 0px;
+            }}
+            QLabel#section_desc {{
+                color: {theme['text_secondary']};
+                font-size: 10px;
+                margin-bottom: 6px;
+            }}
+            QLabel#status_label {{
+                color: {theme['info_color']};
+                font-size: 11px;
+                margin-bottom: 6px;
+            }}
+            QComboBox, QComboBox:hover, QComboBox:focus {{
+                background-color: {theme['input_bg']};
+                color: {theme['text_primary']};
+                border: 2px solid {theme['input_border']};
+                border-radius: 4px;
+                padding: 6px 8px;
+                font-size: 11px;
+                margin: 0px;
+                font-weight: normal;
+                min-width: 120px;
+            }}
+            QComboBox:hover {{
+                border-color: {theme['button_hover']};
+                background-color: {theme['input_bg']};
+            }}
+            QComboBox:focus {{
+                border-color: {theme['input_focus']};
+                background-color: {theme['input_bg']};
+            }}
+            QPushButton, QPushButton:hover, QPushButton:pressed, QPushButton:disabled {{
+                border: none;
+                padding: 8px 16px;
+                border-radius: 6px;
+                font-size: 11px;
+                font-weight: bold;
+                min-height: 16px;
+                margin: 2px 4px;
+            }}
+            QPushButton:disabled {{
+                background-color: {theme['text_secondary']};
+                color: {theme['text_secondary']};
+                opacity: 0.6;
+            }}
+            QPushButton[btnType="success"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']});
+                color: {theme['text_light']};
+                border: 1px solid {theme['success_color']};
+                padding: 6px 12px;
+            }}
+            QPushButton[btnType="success"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71);
+                border: 2px solid #a9dfbf;
+                color: #ffffff;
+                padding: 7px 13px;
+            }}
+            QPushButton[btnType="success"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #27ae60, stop:1 #229954);
+                border: 2px solid #1e8449;
+                color: #ffffff;
+                padding: 8px 14px;
+            }}
+            QPushButton[btnType="uninstall"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
+                color: {theme['text_light']};
+                border: 1px solid {theme['error_color']};
+                padding: 6px 12px;
+            }}
+            QPushButton[btnType="uninstall"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b);
+                border: 2px solid #f1948a;
+                color: #ffffff;
+            }}
+            QPushButton[btnType="uninstall"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']});
+                border: 1px solid {theme['error_color']};
+                opacity: 0.8;
+            }}
+        """
+
+    @memoized_style
+    def get_settings_style(self, theme_name=None):
+        """Settings panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            /* Base styling */
+            SettingsPanel {{
+                background-color: {theme['window_bg']};
+                color: {theme['text_primary']};
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }}
+
+            /* Main title styling */
+            SettingsPanel QLabel#main_title {{
+                font-size: 18px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 6px 0px !important;
+            }}
+
+            /* Main title divider */
+            SettingsPanel QLabel#title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* Section description */
+            SettingsPanel QLabel#section_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+                margin-bottom: 6px !important;
+            }}
+
+            /* Section titles */
+            SettingsPanel QLabel#section_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            /* Section title dividers */
+            SettingsPanel QLabel#section_title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* Setting labels */
+            SettingsPanel QLabel#setting_label {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                font-weight: normal !important;
+            }}
+
+            /* ComboBox styling */
+            SettingsPanel QComboBox {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                min-height: 24px !important;
+                max-height: 32px !important;
+            }}
+
+            SettingsPanel QComboBox:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            SettingsPanel QComboBox:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            SettingsPanel QComboBox::drop-down {{
+                border: none !important;
+                width: 24px !important;
+            }}
+
+            SettingsPanel QComboBox::down-arrow {{
+                image: none !important;
+                border-left: 6px solid transparent !important;
+                border-right: 6px solid transparent !important;
+                border-top: 6px solid {theme['text_primary']} !important;
+                margin-right: 6px !important;
+            }}
+
+            SettingsPanel QComboBox QAbstractItemView {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                selection-background-color: {theme['button_bg']} !important;
+                selection-color: {theme['text_light']} !important;
+                padding: 4px !important;
+            }}
+
+            /* CheckBox styling */
+            SettingsPanel QCheckBox {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                spacing: 8px !important;
+                padding: 2px 0px !important;
+                min-height: 24px !important;
+                max-height: 32px !important;
+            }}
+
+            SettingsPanel QCheckBox::indicator {{
+                width: 16px !important;
+                height: 16px !important;
+                border: 2px solid {theme['input_border']} !important;
+                background-color: {theme['input_bg']} !important;
+                border-radius: 3px !important;
+            }}
+
+            SettingsPanel QCheckBox::indicator:checked {{
+                background-color: {theme['button_bg']} !important;
+                border-color: {theme['button_bg']} !important;
+                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
+            }}
+
+            SettingsPanel QCheckBox:hover::indicator:unchecked {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            /* Button styling */
+            SettingsPanel QPushButton {{
+                border: none !important;
+                padding: 8px 16px !important;
+                border-radius: 6px !important;
+                font-size: 11px !important;
+                font-weight: bold !important;
+                min-height: 24px !important;
+                max-height: 32px !important;
+                margin: 2px 4px !important;
+            }}
+
+            SettingsPanel QPushButton:disabled {{
+                background-color: {theme['text_secondary']} !important;
+                color: {theme['text_secondary']} !important;
+                opacity: 0.6 !important;
+            }}
+
+            /* Success buttons */
+            SettingsPanel QPushButton[btnType="success"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['success_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            SettingsPanel QPushButton[btnType="success"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
+                border: 2px solid #a9dfbf !important;
+                color: #ffffff !important;
+                padding: 7px 13px !important;
+            }}
+
+            SettingsPanel QPushButton[btnType="success"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #27ae60, stop:1 #229954) !important;
+                border: 2px solid #1e8449 !important;
+                color: #ffffff !important;
+                padding: 8px 14px !important;
+            }}
+
+            /* Secondary buttons */
+            SettingsPanel QPushButton[btnType="secondary"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #6c757d, stop:1 #5a6268) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid #5a6268 !important;
+                padding: 6px 12px !important;
+            }}
+
+            SettingsPanel QPushButton[btnType="secondary"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #bdc3c7, stop:0.5 #95a5a6, stop:1 #7f8c8d) !important;
+                border: 2px solid #d5dbdb !important;
+                color: #ffffff !important;
+            }}
+
+            SettingsPanel QPushButton[btnType="secondary"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #5a6268, stop:1 #495057) !important;
+                border: 1px solid #495057 !important;
+            }}
+
+            /* About section styling */
+            SettingsPanel QLabel#about_version {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+            }}
+
+            SettingsPanel QLabel#about_link {{
+                color: {theme['info_color']} !important;
+                font-size: 10px !important;
+            }}
+
+            SettingsPanel QLabel#about_link:hover {{
+                color: {theme['button_hover']} !important;
+            }}
+        """
+
+    @memoized_style
+    def get_update_deps_style(self, theme_name=None):
+        """Update Deps panel"""
+        theme = self.get_theme(theme_name)
+        
+        return f"""
+            /* Nuclear option: Override ALL global styling with ultra-compact layout */
+            UpdateProjectDepsPanel,
+            UpdateProjectDepsPanel * {{
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                background-color: {theme['window_bg']} !important;
+                color: {theme['text_primary']} !important;
+                font-family: 'Segoe UI', Arial, sans-serif !important;
+            }}
+
+            /* Typography Hierarchy - Only headers are bold */
+            UpdateProjectDepsPanel QLabel {{
+                background-color: transparent !important;
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                padding: 0px !important;
+                border: none !important;
+                font-weight: normal !important;
+            }}
+
+            /* Main title - largest and most prominent */
+            UpdateProjectDepsPanel QLabel#main_title {{
+                font-size: 18px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 6px 0px !important;
+            }}
+
+            /* Color-coded section titles */
+            UpdateProjectDepsPanel QLabel#custom_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['info_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            UpdateProjectDepsPanel QLabel#success_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['success_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            UpdateProjectDepsPanel QLabel#warning_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['warning_color']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            UpdateProjectDepsPanel QLabel#section_title {{
+                font-size: 13px !important;
+                font-weight: bold !important;
+                color: {theme['text_primary']} !important;
+                margin-bottom: 4px !important;
+                padding: 4px 0px !important;
+            }}
+
+            /* Section descriptions */
+            UpdateProjectDepsPanel QLabel#section_desc {{
+                color: {theme['text_secondary']} !important;
+                font-size: 10px !important;
+                margin-bottom: 6px !important;
+            }}
+
+            UpdateProjectDepsPanel QLabel#warning_label {{
+                color: {theme['warning_color']} !important;
+                font-size: 10px !important;
+                font-weight: normal !important;
+            }}
+
+            /* Divider lines */
+            UpdateProjectDepsPanel QLabel#title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            UpdateProjectDepsPanel QLabel#success_title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            UpdateProjectDepsPanel QLabel#custom_title_divider {{
+                background-color: {theme['separator']} !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* ComboBox styling - responsive resizing */
+            UpdateProjectDepsPanel QComboBox,
+            UpdateProjectDepsPanel QComboBox:hover,
+            UpdateProjectDepsPanel QComboBox:focus {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 4px !important;
+                padding: 6px 8px !important;
+                font-size: 11px !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+                min-width: 120px !important;
+            }}
+
+            UpdateProjectDepsPanel QComboBox:hover {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            UpdateProjectDepsPanel QComboBox:focus {{
+                border-color: {theme['input_focus']} !important;
+                background-color: {theme['input_bg']} !important;
+            }}
+
+            UpdateProjectDepsPanel QComboBox::drop-down {{
+                border: none !important;
+                width: 24px !important;
+            }}
+
+            UpdateProjectDepsPanel QComboBox::down-arrow {{
+                image: none !important;
+                border-left: 6px solid transparent !important;
+                border-right: 6px solid transparent !important;
+                border-top: 6px solid {theme['text_primary']} !important;
+                margin-right: 6px !important;
+            }}
+
+            UpdateProjectDepsPanel QComboBox QAbstractItemView {{
+                background-color: {theme['input_bg']} !important;
+                color: {theme['text_primary']} !important;
+                border: 2px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                selection-background-color: {theme['button_bg']} !important;
+                selection-color: {theme['text_light']} !important;
+                padding: 4px !important;
+            }}
+
+            /* CheckBox styling - completely transparent background */
+            UpdateProjectDepsPanel QCheckBox {{
+                color: {theme['text_primary']} !important;
+                font-size: 11px !important;
+                spacing: 8px !important;
+                padding: 2px 0px !important;
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+            }}
+
+            /* Override any inherited backgrounds from parent widgets */
+            UpdateProjectDepsPanel QCheckBox,
+            UpdateProjectDepsPanel QCheckBox:hover,
+            UpdateProjectDepsPanel QCheckBox:pressed,
+            UpdateProjectDepsPanel QCheckBox:checked {{
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+            }}
+
+            UpdateProjectDepsPanel QCheckBox::indicator {{
+                width: 16px !important;
+                height: 16px !important;
+                border: 2px solid {theme['input_border']} !important;
+                background-color: {theme['input_bg']} !important;
+                border-radius: 3px !important;
+            }}
+
+            UpdateProjectDepsPanel QCheckBox::indicator:checked {{
+                background-color: {theme['button_bg']} !important;
+                border-color: {theme['button_bg']} !important;
+                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
+            }}
+
+            UpdateProjectDepsPanel QCheckBox:hover::indicator:unchecked {{
+                border-color: {theme['button_hover']} !important;
+                background-color: {theme['bg_secondary']} !important;
+            }}
+
+            /* Ensure checkbox text area is completely transparent */
+            UpdateProjectDepsPanel QCheckBox::text {{
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+            }}
+
+            /* Nuclear option: Override ALL possible checkbox backgrounds */
+            UpdateProjectDepsPanel QCheckBox * {{
+                background: transparent !important;
+                background-color: transparent !important;
+                border: none !important;
+            }}
+
+            /* Progress Bar styling */
+            UpdateProjectDepsPanel QProgressBar#update_progress_bar {{
+                border: 1px solid {theme['input_border']} !important;
+                border-radius: 6px !important;
+                text-align: center !important;
+                font-size: 11px !important;
+                color: {theme['text_primary']} !important;
+                background-color: {theme['input_bg']} !important;
+                margin: 0px !important;
+                font-weight: normal !important;
+            }}
+
+            UpdateProjectDepsPanel QProgressBar#update_progress_bar::chunk {{
+                background-color: {theme['button_bg']} !important;
+                border-radius: 4px !important;
+            }}
+
+            /* Base button styling for all states */
+            UpdateProjectDepsPanel QPushButton,
+            UpdateProjectDepsPanel QPushButton:hover,
+            UpdateProjectDepsPanel QPushButton:pressed,
+            UpdateProjectDepsPanel QPushButton:disabled {{
+                border: none !important;
+                padding: 8px 16px !important;
+                border-radius: 6px !important;
+                font-size: 11px !important;
+                font-weight: bold !important;
+                min-height: 16px !important;
+                margin: 2px 4px !important;
+            }}
+
+            /* General disabled button styling (applies to ALL button types) */
+            UpdateProjectDepsPanel QPushButton:disabled {{
+                background-color: {theme['text_secondary']} !important;
+                color: {theme['text_secondary']} !important;
+                opacity: 0.6 !important;
+            }}
+
+            /* Success action buttons - Green theme with bright hover effects */
+            UpdateProjectDepsPanel QPushButton[btnType="success"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['success_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            UpdateProjectDepsPanel QPushButton[btnType="success"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
+                border: 2px solid #a9dfbf !important;
+                color: #ffffff !important;
+                padding: 7px 13px !important;
+            }}
+
+            UpdateProjectDepsPanel QPushButton[btnType="success"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #27ae60, stop:1 #229954) !important;
+                border: 2px solid #1e8449 !important;
+                color: #ffffff !important;
+                padding: 8px 14px !important;
+            }}
+
+            /* Uninstall/Danger buttons - Red theme with bright hover effects */
+            UpdateProjectDepsPanel QPushButton[btnType="uninstall"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                color: {theme['text_light']} !important;
+                border: 1px solid {theme['error_color']} !important;
+                padding: 6px 12px !important;
+            }}
+
+            UpdateProjectDepsPanel QPushButton[btnType="uninstall"]:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b) !important;
+                border: 2px solid #f1948a !important;
+                color: #ffffff !important;
+            }}
+
+            UpdateProjectDepsPanel QPushButton[btnType="uninstall"]:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
+                border: 1px solid {theme['error_color']} !important;
+                opacity: 0.8 !important;
+            }}
+        """
+
+#----------Benchmark----------
+# One frame at 60 Hz: a panel switch slower than this is visible
+PANEL_SWITCH_TARGET_MS = 16.0
+
+
+def _summarize(label, samples):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"{label}: mean {mean:.2f} ms, p95 {p95:.2f} ms, max {samples[-1]:.2f} ms ({len(samples)} samples)"
+
+
+def benchmark_theme_switching(window, rounds=5):
+    """
+    Time theme switches and panel switches on a shown MainWindow (events processed after
+    each step) and report how many stylesheets were rendered, applied and skipped.
+    """
+    app = QApplication.instance()
+    manager = window.theme_manager
+    original = manager.current_theme
+    original_panel = window.stack.currentIndex()
+
+    # Qt only warns when it discards a stylesheet, so count those warnings: timings taken
+    # against a sheet that never applied would be meaningless
+    parse_failures = []
+
+    def on_qt_message(mode, context, message):
+        if "Could not parse" in message:
+            parse_failures.append(message)
+        elif previous_handler is not None:
+            previous_handler(mode, context, message)
+        else:
+            sys.stderr.write(message + "\n")
+
+    previous_handler = qInstallMessageHandler(on_qt_message)
+    for index in range(window.stack.count()):
+        window.ensure_panel(index)
+    app.processEvents()
+
+    stats_before = dict(style_stats)
+    theme_times = []
+    for _ in range(rounds):
+        for name, _display in manager.get_available_themes():
+            start = time.perf_counter()
+            manager.set_theme(name)
+            app.processEvents()
+            theme_times.append((time.perf_counter() - start) * 1000.0)
+    manager.set_theme(original)
+    app.processEvents()
+    theme_stats = {key: style_stats[key] - stats_before[key] for key in style_stats}
+
+    stats_before = dict(style_stats)
+    panel_times = []
+    for _ in range(rounds):
+        for index in range(window.stack.count()):
+            start = time.perf_counter()
+            window.show_panel(index)
+            app.processEvents()
+            panel_times.append((time.perf_counter() - start) * 1000.0)
+    window.show_panel(original_panel)
+    app.processEvents()
+    panel_stats = {key: style_stats[key] - stats_before[key] for key in style_stats}
+    qInstallMessageHandler(previous_handler)
+
+    slow = sum(1 for sample in panel_times if sample > PANEL_SWITCH_TARGET_MS)
+    return "\n".join([
+        _summarize("Theme switch", theme_times),
+        f"  sheets rendered {theme_stats['misses']}, from cache {theme_stats['hits']}, "
+        f"applied {theme_stats['applied']}, unchanged {theme_stats['skipped']}; "
+        f"last application stylesheet set in {manager.last_apply_ms or 0:.2f} ms",
+        _summarize("Panel switch", panel_times),
+        f"  sheets rendered {panel_stats['misses']}, from cache {panel_stats['hits']}, "
+        f"applied {panel_stats['applied']}, unchanged {panel_stats['skipped']}; "
+        f"{slow} of {len(panel_times)} over the {PANEL_SWITCH_TARGET_MS:.0f} ms target",
+        f"Stylesheets Qt failed to parse: {len(parse_failures)}",
+    ])
@@ -3,9 +3,9 @@ import subprocess
 import shutil
 from pathlib import Path
 from colorama import init, Fore, Style
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.console import Console
-import json
+from modules.project_index import get_project_index, fill_project_combo, apply_project_changes
+from modules.theme_manager import set_theme_scope
+from modules.config_manager import get_config_namespace
 
 init(autoreset=True)
 
@@ -20,6 +20,7 @@ def prompt_yesno(message, default="n"):
 
 def run_with_progress(cmd, description, console, show_progress=True):
     if show_progress:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -43,6 +44,7 @@ def run_with_progress(cmd, description, console, show_progress=True):
             return None
 
 def update_project_deps():
+    from rich.console import Console
     console = Console()
     
     #----------dev root----------
@@ -227,6 +229,7 @@ class UpdateThread(QThread):
 class UpdateProjectDepsPanel(QWidget):
     def __init__(self, parent=None, status_callback=None, theme_manager=None):
         super().__init__(parent)
+        set_theme_scope(self, "UpdateProjectDepsPanel")
         self.status_callback = status_callback
         self.update_thread = None
         self.commit_thread = None
@@ -425,73 +428,37 @@ class UpdateProjectDepsPanel(QWidget):
         layout.addStretch()
         
         self.setLayout(layout)
-        
-        # Connect to theme manager if provided
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
     
     def showEvent(self, event):
-        """Override showEvent to apply theme when panel becomes visible"""
+        """Load projects the first time the panel is shown"""
         super().showEvent(event)
-        # Ensure we're connected to the main window's theme manager
-        try:
-            main_window = self.window()
-            theme_manager = getattr(main_window, 'theme_manager', None)
-            if theme_manager:
-                self.set_theme_manager(theme_manager)
-        except Exception:
-            pass
-        # Apply theme when panel is shown
-        self.apply_theme()
-        
         # Load projects when panel is first shown (lazy loading)
         if not hasattr(self, '_projects_loaded'):
             self.load_projects()
             self._projects_loaded = True
     
-    def load_projects(self):
-        """Load available projects from dev_root/projects folder"""
+    def load_projects(self, index=None):
+        """Load available projects from the shared project index (no disk scan when unchanged)"""
         try:
-            # Import the new project detection module
-            try:
-                from modules.refresh_project import is_valid_clib_project
-            except ImportError:
-                # Fallback to old xmake.lua detection if module not available
-                def is_valid_clib_project(project_path):
-                    return (project_path / "xmake.lua").exists()
-            
-            dev_root = os.getenv("XSE_CLIBDT_DEVROOT")
-            if not dev_root:
-                self.project_combo.addItem("No dev root found")
+            index = index or get_project_index()
+            if index is None:
+                fill_project_combo(self.project_combo, [], empty_text="No dev root found")
                 return
             
-            projects_path = Path(dev_root) / "projects"
-            if not projects_path.exists():
-                self.project_combo.addItem("No projects folder found")
+            if not index.root_exists():
+                fill_project_combo(self.project_combo, [], empty_text="No projects folder found")
                 return
             
-            projects = []
-            for item in projects_path.iterdir():
-                if item.is_dir() and is_valid_clib_project(item):
-                    projects.append(item.name)
-            
-            if not projects:
-                self.project_combo.addItem("No valid ClibDT projects found")
-                return
-            
-            projects.sort()
-            self.project_combo.addItems(projects)
-            
-            # Select last used project if available
-            if hasattr(self, 'last_project') and self.last_project in projects:
-                self.project_combo.setCurrentText(self.last_project)
-            elif projects:
-                self.project_combo.setCurrentText(projects[0])
+            fill_project_combo(self.project_combo, index.names(), getattr(self, 'last_project', None))
                 
         except Exception as e:
             self.project_combo.addItem(f"Error loading projects: {e}")
     
+    def on_projects_changed(self, index, changes):
+        """Project index listener: patch the picker once the panel has been shown"""
+        if getattr(self, '_projects_loaded', False):
+            apply_project_changes(self.project_combo, changes)
+    
     def on_project_changed(self, project_name):
         """Handle project selection change"""
         if project_name and not project_name.startswith("No ") and not project_name.startswith("Error"):
@@ -502,41 +469,19 @@ class UpdateProjectDepsPanel(QWidget):
                 self.save_preferences()
     
     def load_preferences(self):
-        """Load user preferences from a simple config file"""
-        self.last_update_packages = True
-        self.last_upgrade_deps = True
-        self.last_project = None
-        
-        try:
-            # Use config folder in parent root
-            config_dir = Path(__file__).parent.parent / "config"
-            config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-            config_file = config_dir / "clibdt_update_prefs.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    prefs = json.load(f)
-                    self.last_update_packages = prefs.get('update_packages', True)
-                    self.last_upgrade_deps = prefs.get('upgrade_deps', True)
-                    self.last_project = prefs.get('last_project', None)
-        except Exception:
-            pass
+        """Load user preferences from the update_deps config namespace"""
+        prefs = get_config_namespace("update_deps")
+        self.last_update_packages = prefs.get('update_packages')
+        self.last_upgrade_deps = prefs.get('upgrade_deps')
+        self.last_project = prefs.get('last_project')
     
     def save_preferences(self):
-        """Save user preferences to a simple config file"""
-        try:
-            # Use config folder in parent root
-            config_dir = Path(__file__).parent.parent / "config"
-            config_dir.mkdir(exist_ok=True)  # Ensure config directory exists
-            config_file = config_dir / "clibdt_update_prefs.json"
-            prefs = {
-                'update_packages': self.update_packages_cb.isChecked(),
-                'upgrade_deps': self.upgrade_deps_cb.isChecked(),
-                'last_project': getattr(self, 'last_project', None)
-            }
-            with open(config_file, 'w') as f:
-                json.dump(prefs, f, indent=2)
-        except Exception:
-            pass
+        """Record user preferences; the config store writes them once changes settle"""
+        get_config_namespace("update_deps").update(
+            update_packages=self.update_packages_cb.isChecked(),
+            upgrade_deps=self.upgrade_deps_cb.isChecked(),
+            last_project=getattr(self, 'last_project', None)
+        )
     
     def status(self, msg):
         if self.status_callback:
@@ -545,329 +490,6 @@ class UpdateProjectDepsPanel(QWidget):
     def set_theme_manager(self, theme_manager):
         """Set the theme manager for this panel"""
         self.theme_manager = theme_manager
-        if self.theme_manager:
-            self.theme_manager.theme_changed.connect(self.apply_theme)
-        self.apply_theme()
-    
-    def apply_theme(self):
-        """Apply current theme to the panel"""
-        if self.theme_manager:
-            theme = self.theme_manager.get_theme()
-        else:
-            # Fallback theme
-            theme = {
-                'window_bg': '#1e1e1e',
-                'bg_primary': '#2d2d2d',
-                'bg_secondary': '#252525',
-                'text_primary': '#e0e0e0',
-                'text_secondary': '#b0b0b0',
-                'text_light': '#ffffff',
-                'button_bg': '#0078d4',
-                'button_hover': '#106ebe',
-                'button_pressed': '#005a9e',
-                'input_bg': '#2d2d2d',
-                'input_border': '#404040',
-                'input_focus': '#0078d4',
-                'separator': '#404040',
-                'success_color': '#27ae60',
-                'error_color': '#e74c3c',
-                'warning_color': '#f39c12',
-                'info_color': '#3498db'
-            }
-        
-        # Ultra-compact styling that overrides ALL global styling
-        self.setStyleSheet(f"""
-            /* Nuclear option: Override ALL global styling with ultra-compact layout */
-            UpdateProjectDepsPanel,
-            UpdateProjectDepsPanel * {{
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                background-color: {theme['window_bg']} !important;
-                color: {theme['text_primary']} !important;
-                font-family: 'Segoe UI', Arial, sans-serif !important;
-            }}
-            
-            /* Typography Hierarchy - Only headers are bold */
-            UpdateProjectDepsPanel QLabel {{
-                background-color: transparent !important;
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                padding: 0px !important;
-                border: none !important;
-                font-weight: normal !important;
-            }}
-            
-            /* Main title - largest and most prominent */
-            UpdateProjectDepsPanel QLabel#main_title {{
-                font-size: 18px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                padding: 6px 0px !important;
-            }}
-            
-            /* Color-coded section titles */
-            UpdateProjectDepsPanel QLabel#custom_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['info_color']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            UpdateProjectDepsPanel QLabel#success_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['success_color']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            UpdateProjectDepsPanel QLabel#warning_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['warning_color']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            UpdateProjectDepsPanel QLabel#section_title {{
-                font-size: 13px !important;
-                font-weight: bold !important;
-                color: {theme['text_primary']} !important;
-                margin-bottom: 4px !important;
-                padding: 4px 0px !important;
-            }}
-            
-            /* Section descriptions */
-            UpdateProjectDepsPanel QLabel#section_desc {{
-                color: {theme['text_secondary']} !important;
-                font-size: 10px !important;
-                margin-bottom: 6px !important;
-            }}
-            
-            UpdateProjectDepsPanel QLabel#warning_label {{
-                color: {theme['warning_color']} !important;
-                font-size: 10px !important;
-                font-weight: normal !important;
-            }}
-            
-            /* Divider lines */
-            UpdateProjectDepsPanel QLabel#title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            UpdateProjectDepsPanel QLabel#success_title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            UpdateProjectDepsPanel QLabel#custom_title_divider {{
-                background-color: {theme['separator']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            /* ComboBox styling - responsive resizing */
-            UpdateProjectDepsPanel QComboBox,
-            UpdateProjectDepsPanel QComboBox:hover,
-            UpdateProjectDepsPanel QComboBox:focus {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 4px !important;
-                padding: 6px 8px !important;
-                font-size: 11px !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-                min-width: 120px !important;
-            }}
-            
-            UpdateProjectDepsPanel QComboBox:hover {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            UpdateProjectDepsPanel QComboBox:focus {{
-                border-color: {theme['input_focus']} !important;
-                background-color: {theme['input_bg']} !important;
-            }}
-            
-            UpdateProjectDepsPanel QComboBox::drop-down {{
-                border: none !important;
-                width: 24px !important;
-            }}
-            
-            UpdateProjectDepsPanel QComboBox::down-arrow {{
-                image: none !important;
-                border-left: 6px solid transparent !important;
-                border-right: 6px solid transparent !important;
-                border-top: 6px solid {theme['text_primary']} !important;
-                margin-right: 6px !important;
-            }}
-            
-            UpdateProjectDepsPanel QComboBox QAbstractItemView {{
-                background-color: {theme['input_bg']} !important;
-                color: {theme['text_primary']} !important;
-                border: 2px solid {theme['input_border']} !important;
-                border-radius: 6px !important;
-                selection-background-color: {theme['button_bg']} !important;
-                selection-color: {theme['text_light']} !important;
-                padding: 4px !important;
-            }}
-            
-            /* CheckBox styling - completely transparent background */
-            UpdateProjectDepsPanel QCheckBox {{
-                color: {theme['text_primary']} !important;
-                font-size: 11px !important;
-                spacing: 8px !important;
-                padding: 2px 0px !important;
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-            }}
-            
-            /* Override any inherited backgrounds from parent widgets */
-            UpdateProjectDepsPanel QCheckBox,
-            UpdateProjectDepsPanel QCheckBox:hover,
-            UpdateProjectDepsPanel QCheckBox:pressed,
-            UpdateProjectDepsPanel QCheckBox:checked {{
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-            }}
-            
-            UpdateProjectDepsPanel QCheckBox::indicator {{
-                width: 16px !important;
-                height: 16px !important;
-                border: 2px solid {theme['input_border']} !important;
-                background-color: {theme['input_bg']} !important;
-                border-radius: 3px !important;
-            }}
-            
-            UpdateProjectDepsPanel QCheckBox::indicator:checked {{
-                background-color: {theme['button_bg']} !important;
-                border-color: {theme['button_bg']} !important;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=) !important;
-            }}
-            
-            UpdateProjectDepsPanel QCheckBox:hover::indicator:unchecked {{
-                border-color: {theme['button_hover']} !important;
-                background-color: {theme['bg_secondary']} !important;
-            }}
-            
-            /* Ensure checkbox text area is completely transparent */
-            UpdateProjectDepsPanel QCheckBox::text {{
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-            
-            /* Nuclear option: Override ALL possible checkbox backgrounds */
-            UpdateProjectDepsPanel QCheckBox * {{
-                background: transparent !important;
-                background-color: transparent !important;
-                border: none !important;
-            }}
-            
-            /* Progress Bar styling */
-            UpdateProjectDepsPanel QProgressBar#update_progress_bar {{
-                border: 1px solid {theme['input_border']} !important;
-                border-radius: 6px !important;
-                text-align: center !important;
-                font-size: 11px !important;
-                color: {theme['text_primary']} !important;
-                background-color: {theme['input_bg']} !important;
-                margin: 0px !important;
-                font-weight: normal !important;
-            }}
-            
-            UpdateProjectDepsPanel QProgressBar#update_progress_bar::chunk {{
-                background-color: {theme['button_bg']} !important;
-                border-radius: 4px !important;
-            }}
-            
-            /* Base button styling for all states */
-            UpdateProjectDepsPanel QPushButton,
-            UpdateProjectDepsPanel QPushButton:hover,
-            UpdateProjectDepsPanel QPushButton:pressed,
-            UpdateProjectDepsPanel QPushButton:disabled {{
-                border: none !important;
-                padding: 8px 16px !important;
-                border-radius: 6px !important;
-                font-size: 11px !important;
-                font-weight: bold !important;
-                min-height: 16px !important;
-                margin: 2px 4px !important;
-            }}
-            
-            /* General disabled button styling (applies to ALL button types) */
-            UpdateProjectDepsPanel QPushButton:disabled {{
-                background-color: {theme['text_secondary']} !important;
-                color: {theme['text_secondary']} !important;
-                opacity: 0.6 !important;
-            }}
-            
-            /* Success action buttons - Green theme with bright hover effects */
-            UpdateProjectDepsPanel QPushButton[btnType="success"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['success_color']}, stop:1 {theme['success_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['success_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            UpdateProjectDepsPanel QPushButton[btnType="success"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #82e0aa, stop:0.5 #58d68d, stop:1 #2ecc71) !important;
-                border: 2px solid #a9dfbf !important;
-                color: #ffffff !important;
-                padding: 7px 13px !important;
-            }}
-            
-            UpdateProjectDepsPanel QPushButton[btnType="success"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954) !important;
-                border: 2px solid #1e8449 !important;
-                color: #ffffff !important;
-                padding: 8px 14px !important;
-            }}
-            
-            /* Uninstall/Danger buttons - Red theme with bright hover effects */
-            UpdateProjectDepsPanel QPushButton[btnType="uninstall"] {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
-                color: {theme['text_light']} !important;
-                border: 1px solid {theme['error_color']} !important;
-                padding: 6px 12px !important;
-            }}
-            
-            UpdateProjectDepsPanel QPushButton[btnType="uninstall"]:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ec7063, stop:0.5 #e74c3c, stop:1 #c0392b) !important;
-                border: 2px solid #f1948a !important;
-                color: #ffffff !important;
-            }}
-            
-            UpdateProjectDepsPanel QPushButton[btnType="uninstall"]:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {theme['error_color']}, stop:1 {theme['error_color']}) !important;
-                border: 1px solid {theme['error_color']} !important;
-                opacity: 0.8 !important;
-            }}
-        """)
     
     def start_update(self):
         if not self.update_packages_cb.isChecked() and not self.upgrade_deps_cb.isChecked():
@@ -0,0 +1,196 @@
+"""
+Cached, conditional check of the latest ClibDT version on the Nexus page.
+
+    python -m modules.version_check [--url URL] [--force] [--ttl SECONDS]
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import threading
+
+from modules.utilities.common import VERSION, NEXUS_URL
+from modules.config_utils import get_config_directory
+
+#----------Version Check Settings----------
+CACHE_FILE_NAME = "version_check.json"
+DEFAULT_TTL_SECONDS = 6 * 3600
+# A failed check is retried sooner than a successful one is refreshed
+ERROR_TTL_SECONDS = 15 * 60
+REQUEST_TIMEOUT = 5
+CHUNK_SIZE = 16 * 1024
+# Give up on pages that never contain the marker instead of downloading them whole
+MAX_READ_BYTES = 4 * 1024 * 1024
+VERSION_RE = re.compile(rb'<div class="stat">([\d\.]+)</div>')
+# Bytes kept from the previous chunk so a marker split across chunks is still found
+_OVERLAP = 64
+
+_session = None
+_session_lock = threading.Lock()
+_cache_lock = threading.Lock()
+
+
+def get_session():
+    """One requests.Session per process so connections are reused (None without requests)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            try:
+                import requests
+            except ImportError:
+                return None
+            _session = requests.Session()
+            _session.headers["User-Agent"] = f"ClibDT/{VERSION}"
+        return _session
+
+
+#----------Cache----------
+def get_cache_path():
+    return get_config_directory() / CACHE_FILE_NAME
+
+
+def load_cache(url=NEXUS_URL):
+    """The last check result for url, or {}"""
+    try:
+        with open(get_cache_path(), "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) and cache.get("url") == url else {}
+
+
+def save_cache(cache):
+    path = get_cache_path()
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with _cache_lock:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def is_fresh(cache, ttl=DEFAULT_TTL_SECONDS, now=None):
+    if not cache.get("checked_at"):
+        return False
+    if cache.get("error"):
+        ttl = min(ttl, ERROR_TTL_SECONDS)
+    return (now or time.time()) - cache["checked_at"] < ttl
+
+
+#----------Network----------
+def read_version(response):
+    """Scan the body chunk by chunk and stop reading as soon as the version marker appears"""
+    tail = b""
+    read = 0
+    try:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if not chunk:
+                continue
+            data = tail + chunk
+            match = VERSION_RE.search(data)
+            if match:
+                return match.group(1).decode("ascii")
+            tail = data[-_OVERLAP:]
+            read += len(chunk)
+            if read >= MAX_READ_BYTES:
+                break
+    finally:
+        response.close()
+    return None
+
+
+def fetch_version(url=NEXUS_URL, cache=None, session=None):
+    """
+    Ask the server, sending the cached ETag/Last-Modified. Returns the new cache dict;
+    a 304 keeps the cached version. Raises on network errors.
+    """
+    cache = dict(cache or {})
+    session = session or get_session()
+    if session is None:
+        raise RuntimeError("requests module missing")
+    headers = {}
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    if cache.get("last_modified"):
+        headers["If-Modified-Since"] = cache["last_modified"]
+
+    response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)
+    if response.status_code == 304 and cache.get("online_version"):
+        response.close()
+        cache.update(checked_at=time.time(), error=None, not_modified=True)
+        return cache
+    if response.status_code != 200:
+        response.close()
+        raise RuntimeError(f"HTTP {response.status_code}")
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    online_version = read_version(response)
+    if online_version is None:
+        raise RuntimeError("version not found in page")
+    return {"url": url, "online_version": online_version, "etag": etag, "last_modified": last_modified,
+            "checked_at": time.time(), "error": None, "not_modified": False}
+
+
+def check_version(url=NEXUS_URL, ttl=DEFAULT_TTL_SECONDS, force=False, session=None):
+    """
+    Latest known version info: {'online_version', 'checked_at', 'error', 'from_cache', ...}.
+    A fresh cache answers without touching the network. Failures are cached briefly
+    (keeping the last good version) so an offline machine does not retry every launch.
+    """
+    cache = load_cache(url)
+    if not force and is_fresh(cache, ttl):
+        return dict(cache, from_cache=True)
+    try:
+        result = fetch_version(url, cache, session)
+    except Exception as e:
+        result = dict(cache, url=url, checked_at=time.time(), error=str(e))
+    save_cache(result)
+    return dict(result, from_cache=False)
+
+
+def update_available(info, local_version=VERSION):
+    online = (info or {}).get("online_version")
+    return online if online and online != local_version else None
+
+
+def check_version_async(callback, url=NEXUS_URL, ttl=DEFAULT_TTL_SECONDS):
+    """Run check_version on a daemon thread and hand the result to callback (on that thread)"""
+    def run():
+        try:
+            info = check_version(url, ttl)
+        except Exception as e:
+            info = {"error": str(e)}
+        callback(info)
+    thread = threading.Thread(target=run, name="ClibDTVersionCheck", daemon=True)
+    thread.start()
+    return thread
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check for a newer ClibDT release")
+    parser.add_argument("--url", default=NEXUS_URL)
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL_SECONDS)
+    parser.add_argument("--force", action="store_true", help="ignore the cached result")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    info = check_version(args.url, args.ttl, args.force)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    source = "cache" if info.get("from_cache") else ("304 not modified" if info.get("not_modified") else "network")
+    if info.get("error"):
+        print(f"[WARN] Version check failed: {info['error']} ({elapsed:.0f} ms)")
+    newer = update_available(info)
+    if info.get("online_version"):
+        state = f"update available: v{newer}" if newer else "up to date"
+        print(f"[INFO] Online v{info['online_version']}, local v{VERSION}: {state} ({source}, {elapsed:.0f} ms)")
+    return 0 if info.get("online_version") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
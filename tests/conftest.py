@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Tests import the app's packages the way ClibDT.py does, from the repository root
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def dev_root(tmp_path, monkeypatch):
+    """Point XSE_CLIBDT_DEVROOT at a temporary folder so config files stay out of the tree"""
+    monkeypatch.setenv("XSE_CLIBDT_DEVROOT", str(tmp_path))
+    return tmp_path
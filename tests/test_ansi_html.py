@@ -0,0 +1,125 @@
+import re
+import sys
+import subprocess
+from html.parser import HTMLParser
+
+import pytest
+
+from modules import ansi_html
+from modules.ansi_html import AnsiHtmlConverter, DEFAULT_PALETTE
+
+
+class SpanChecker(HTMLParser):
+    """Collects the text of converted HTML and fails on unbalanced or nested spans"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.depth = 0
+        self.text = []
+        self.styles = []
+
+    def handle_starttag(self, tag, attrs):
+        assert tag == "span"
+        assert self.depth == 0, "spans must not nest"
+        self.depth += 1
+        self.styles.append(dict(attrs)["style"])
+
+    def handle_endtag(self, tag):
+        assert tag == "span"
+        assert self.depth == 1, "closing a span that is not open"
+        self.depth -= 1
+
+    def handle_data(self, data):
+        self.text.append(data)
+
+
+def parse(html_text):
+    checker = SpanChecker()
+    checker.feed(html_text)
+    checker.close()
+    assert checker.depth == 0, "span left open"
+    return "".join(checker.text).replace("\xa0", " "), checker.styles
+
+
+RICH_SCRIPT = """
+import io, sys
+from rich.console import Console
+out = io.StringIO()
+Console(file=out, force_terminal=True, color_system=sys.argv[1], width=200, highlight=False).print(
+    "[bold yellow]warn[/] a<b> & c [italic underline]iu[/] "
+    "[color(208)]orange[/] [rgb(1,135,255) on #102030]blue[/]", end="")
+sys.stdout.write(out.getvalue())
+"""
+
+
+def rich_output(color_system):
+    pytest.importorskip("rich")
+    # A fresh interpreter per color system: rich caches rendered styles process-wide
+    result = subprocess.run([sys.executable, "-c", RICH_SCRIPT, color_system],
+                            capture_output=True, text=True, encoding="utf-8", check=True)
+    return result.stdout
+
+
+def test_colorama_output():
+    colorama = pytest.importorskip("colorama")
+    Fore, Style = colorama.Fore, colorama.Style
+    text = (f"{Fore.CYAN}[INFO] Changed to C:\\dev{Style.RESET_ALL} "
+            f"{Style.BRIGHT}{Fore.RED}[ERROR] <missing> & broken{Style.RESET_ALL} "
+            f"{Fore.LIGHTGREEN_EX}[OK] done{Fore.RESET}")
+
+    result = AnsiHtmlConverter().convert(text)
+    plain, styles = parse(result)
+
+    assert "\x1b" not in result
+    assert "&lt;missing&gt; &amp; broken" in result
+    assert plain == "[INFO] Changed to C:\\dev [ERROR] <missing> & broken [OK] done"
+    assert styles == [
+        f"color: {DEFAULT_PALETTE[6]};",
+        f"color: {DEFAULT_PALETTE[1]}; font-weight: bold;",
+        f"color: {DEFAULT_PALETTE[10]};",
+    ]
+
+
+@pytest.mark.parametrize("color_system", ["standard", "256", "truecolor"])
+def test_rich_output(color_system):
+    text = rich_output(color_system)
+
+    result = AnsiHtmlConverter().convert(text)
+    plain, styles = parse(result)
+
+    assert "\x1b" not in result
+    assert "a&lt;b&gt; &amp; c" in result
+    assert plain == "warn a<b> & c iu orange blue"
+    assert all(re.fullmatch(r"([a-z-]+: [^;]+; )*[a-z-]+: [^;]+;", style) for style in styles)
+    assert "font-style: italic; text-decoration: underline;" in styles
+    if color_system == "256":
+        assert "color: #ff8700;" in styles
+    if color_system == "truecolor":
+        assert "color: #ff8700;" in styles
+        assert "color: #0187ff; background-color: #102030;" in styles
+
+
+def test_extended_colors():
+    converter = AnsiHtmlConverter()
+    assert converter.convert("\x1b[38;5;9mx\x1b[0m") == f'<span style="color: {DEFAULT_PALETTE[9]};">x</span>'
+    assert converter.convert("\x1b[38;5;196mx") == '<span style="color: #ff0000;">x</span>'
+    assert converter.convert("\x1b[48;5;244mx") == '<span style="background-color: #808080;">x</span>'
+    assert converter.convert("\x1b[38;2;300;0;16mx") == '<span style="color: #ff0010;">x</span>'
+    # Colon separated form and a truncated sequence that must not raise
+    assert converter.convert("\x1b[38:2:1:2:3mx") == '<span style="color: #010203;">x</span>'
+    assert converter.convert("\x1b[38;5mx") == "x"
+
+
+def test_escaping_and_non_sgr_sequences():
+    converter = AnsiHtmlConverter()
+    assert converter.convert("a  <b> & \x1b[2Kc\x1b") == "a &nbsp;&lt;b&gt; &amp; c"
+    assert converter.convert("no escapes <here>") == "no escapes &lt;here&gt;"
+
+
+def test_caches_are_bounded(monkeypatch):
+    monkeypatch.setattr(ansi_html, "CACHE_LIMIT", 64)
+    converter = AnsiHtmlConverter()
+    for i in range(1000):
+        parse(converter.convert(f"\x1b[38;2;{i % 256};{i // 256};0m#\x1b[0m"))
+    assert len(converter._sgr_cache) <= 64
+    assert len(converter._tag_cache) <= 64
@@ -0,0 +1,137 @@
+import os
+import sys
+import json
+import time
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from modules.config_manager import ConfigStore, NAMESPACES
+
+SETTINGS_FILE = NAMESPACES["settings"][0]
+BUILD_FILE = NAMESPACES["build"][0]
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_burst_of_changes_is_written_once(dev_root):
+    store = ConfigStore(flush_delay=0.15, max_delay=10)
+    settings = store.namespace("settings")
+    for theme in ("light", "dark", "light", "ocean", "light"):
+        settings.set("theme", theme)
+        time.sleep(0.02)
+    path = dev_root / "config" / SETTINGS_FILE
+    assert not path.exists()
+
+    assert wait_for(lambda: store.writes == 1)
+    assert read(path)["theme"] == "light"
+    assert store.changes == 5
+    time.sleep(0.3)
+    assert store.writes == 1
+
+
+def test_unchanged_value_schedules_no_write(dev_root):
+    store = ConfigStore(flush_delay=0.05, max_delay=10)
+    settings = store.namespace("settings")
+    settings.set("theme", "light")
+    assert wait_for(lambda: store.writes == 1)
+    settings.update(theme="light")
+    assert store.changes == 1
+    assert store.flush() == 0
+
+
+def test_changes_that_never_settle_are_written_by_max_delay(dev_root):
+    store = ConfigStore(flush_delay=0.2, max_delay=0.3)
+    build = store.namespace("build")
+    path = dev_root / "config" / BUILD_FILE
+    start = time.monotonic()
+    written_while_busy = False
+    i = 0
+    while time.monotonic() - start < 1.0:
+        build.set("project", f"Plugin{i}")
+        i += 1
+        time.sleep(0.05)
+        written_while_busy = written_while_busy or path.exists()
+    assert written_while_busy
+    assert store.writes >= 2
+    assert wait_for(lambda: path.exists() and read(path)["project"] == f"Plugin{i - 1}")
+
+
+def test_dev_root_switch_keeps_pending_changes_for_the_old_root(dev_root, tmp_path_factory, monkeypatch):
+    store = ConfigStore(flush_delay=60, max_delay=60)
+    settings = store.namespace("settings")
+    settings.set("theme", "light")
+
+    other_root = tmp_path_factory.mktemp("other_root")
+    monkeypatch.setenv("XSE_CLIBDT_DEVROOT", str(other_root))
+    # The new root has no settings yet, so the default shows and nothing is owed to it
+    assert settings.get("theme") == "dark"
+    assert store.flush() == 1
+
+    assert read(dev_root / "config" / SETTINGS_FILE)["theme"] == "light"
+    assert not (other_root / "config" / SETTINGS_FILE).exists()
+
+
+def test_pending_changes_are_flushed_at_exit(dev_root):
+    script = ("from modules.config_manager import get_config_namespace\n"
+              "get_config_namespace('settings').set('theme', 'light')\n")
+    subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, check=True,
+                   env=dict(os.environ, XSE_CLIBDT_DEVROOT=str(dev_root)))
+    assert read(dev_root / "config" / SETTINGS_FILE)["theme"] == "light"
+
+
+def test_update_rejects_wrong_types(dev_root):
+    store = ConfigStore(flush_delay=0.01, max_delay=10)
+    build = store.namespace("build")
+    with pytest.raises(TypeError):
+        build.update(project="Plugin", build_mode=1.5)
+    with pytest.raises(TypeError):
+        build.set("clean_build", "yes")
+    # Nothing from a rejected update is applied
+    assert build.get("project") is None
+    assert store.changes == 0
+
+
+@pytest.mark.parametrize("value", [{"a", "b"}, Path("C:/dev"), ["ok", object()]])
+def test_update_rejects_unserializable_values(dev_root, value):
+    store = ConfigStore(flush_delay=0.01, max_delay=10)
+    build = store.namespace("build")
+    # project accepts any type, so only the serializability check stands in the way
+    with pytest.raises(TypeError, match="JSON serializable"):
+        build.update(deploy=True, project=value)
+    assert build.get("deploy") is False
+    assert store.changes == 0
+
+
+def test_writer_survives_an_unserializable_namespace(dev_root, capsys):
+    store = ConfigStore(flush_delay=0.05, max_delay=10)
+    launcher = store.namespace("launcher")
+    launcher.set("pinned_items", ["ok"])
+    assert wait_for(lambda: store.writes == 1)
+    # Bypass the check in update(), as a caller mutating the cached values would
+    with store.lock:
+        launcher._values["pinned_items"].append({"not", "json"})
+        store.mark_dirty(launcher)
+    store.namespace("settings").set("theme", "light")
+
+    assert wait_for(lambda: store.writes == 2)
+    assert store._writer.is_alive()
+    assert read(dev_root / "config" / SETTINGS_FILE)["theme"] == "light"
+    assert "[WARN] Could not save " + NAMESPACES["launcher"][0] in capsys.readouterr().out
+
+    store.namespace("settings").set("theme", "dark")
+    assert wait_for(lambda: store.writes == 3)
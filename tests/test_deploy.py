@@ -0,0 +1,65 @@
+import pytest
+
+from modules import deploy
+from modules.config_manager import get_config_namespace
+from modules.deploy import deploy_build, resolve_deploy_targets
+
+SE_AE = ["--skyrim_se=y", "--skyrim_ae=y"]
+
+
+@pytest.fixture
+def configure(dev_root, monkeypatch):
+    """Write deploy targets and set (or clear) XSE_TES5_MODS_PATH"""
+    def apply(targets, mods=None):
+        if mods is None:
+            monkeypatch.delenv("XSE_TES5_MODS_PATH", raising=False)
+        else:
+            monkeypatch.setenv("XSE_TES5_MODS_PATH", str(mods))
+        get_config_namespace("deploy").set("targets", targets)
+    return apply
+
+
+def test_default_target_needs_mods_path(configure, tmp_path):
+    configure({})
+    assert resolve_deploy_targets(tmp_path / "Foo", SE_AE) == []
+    configure({}, mods=tmp_path / "mods")
+    assert resolve_deploy_targets(tmp_path / "Foo", SE_AE) == [tmp_path / "mods" / "Foo" / "SKSE" / "Plugins"]
+
+
+def test_invalid_templates_are_skipped(configure, tmp_path):
+    good = str(tmp_path / "out" / "{project}")
+    configure({"se_ae": ["{mods}/{project}/SKSE/Plugins", "{nope}/x", 42, "relative/{project}", "/", good]})
+    messages = []
+
+    targets = resolve_deploy_targets(tmp_path / "Foo", SE_AE, messages.append)
+
+    assert targets == [tmp_path / "out" / "Foo"]
+    assert len(messages) == 5 and all(m.startswith("[WARN]") for m in messages)
+    assert "XSE_TES5_MODS_PATH is not set" in messages[0]
+
+
+def test_deploy_errors_do_not_raise(configure, tmp_path, monkeypatch):
+    configure({})
+    project = tmp_path / "Foo"
+    (project / "build" / "windows" / "x64" / "release").mkdir(parents=True)
+    (project / "build" / "windows" / "x64" / "release" / "Foo.dll").write_bytes(b"dll")
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(deploy, "resolve_deploy_targets", broken)
+    messages = []
+    assert deploy_build(project, "release", SE_AE, messages.append) is False
+    assert messages == ["[ERROR] Deploy failed: boom"]
+
+
+def test_deploy_copies_artifacts(configure, tmp_path):
+    project = tmp_path / "Foo"
+    mode_dir = project / "build" / "windows" / "x64" / "release"
+    mode_dir.mkdir(parents=True)
+    (mode_dir / "Foo.dll").write_bytes(b"dll")
+    configure({}, mods=tmp_path / "mods")
+    messages = []
+
+    assert deploy_build(project, "release", SE_AE, messages.append)
+    assert (tmp_path / "mods" / "Foo" / "SKSE" / "Plugins" / "Foo.dll").read_bytes() == b"dll"
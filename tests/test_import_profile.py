@@ -0,0 +1,40 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from modules import import_profile
+from modules.import_profile import DEFERRED_MODULES, REPO_ROOT
+
+
+@pytest.fixture(autouse=True)
+def startup_env(dev_root, monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    monkeypatch.delenv(import_profile.BUDGET_ENV_VAR, raising=False)
+
+
+def test_startup_within_budget():
+    assert import_profile.main(["--check"]) == 0
+
+
+def test_check_fails_over_budget(capsys):
+    assert import_profile.main(["--check", "--budget", "0"]) == 1
+    assert "[ERROR]" in capsys.readouterr().out
+
+
+def test_check_fails_when_deferred_module_loads(monkeypatch, capsys):
+    # theme_manager is part of startup, so declaring it deferred must trip the check
+    monkeypatch.setattr(import_profile, "DEFERRED_MODULES", DEFERRED_MODULES + ("modules.theme_manager",))
+    assert import_profile.main(["--check", "--budget", "100000"]) == 1
+    assert "meant to be deferred: modules.theme_manager" in capsys.readouterr().out
+
+
+def test_deferred_modules_not_in_sys_modules_after_import():
+    script = ("import sys, ClibDT\n"
+              f"print('\\n'.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, env=dict(os.environ),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split() == []
@@ -0,0 +1,53 @@
+import pytest
+
+from modules import job_control
+from modules.job_control import BuildJobBudget, MemoryPeakMonitor, get_tu_peak_bytes, record_tu_peak_bytes
+
+GB = 1024 ** 3
+
+
+@pytest.fixture
+def free_memory(monkeypatch):
+    """Scripted free-memory readings; the last value repeats"""
+    readings = []
+
+    def read():
+        return readings.pop(0) if len(readings) > 1 else readings[0]
+
+    monkeypatch.setattr(job_control, "get_free_memory_bytes", read)
+    return readings
+
+
+def run_monitor(monitor, jobs):
+    monitor.start()
+    # A few sampling intervals take in the scripted readings
+    monitor._stop.wait(monitor.interval * 5)
+    return monitor.stop(jobs)
+
+
+def test_peak_per_job_for_an_exclusive_build(dev_root, free_memory):
+    free_memory[:] = [16 * GB, 12 * GB, 12 * GB]
+    budget = BuildJobBudget(total_jobs=8)
+    lease = budget.acquire(4)
+    assert not lease.shared()
+    assert run_monitor(MemoryPeakMonitor(interval=0.01, lease=lease), lease.jobs) == GB
+
+
+def test_no_peak_while_another_build_holds_jobs(dev_root, free_memory):
+    free_memory[:] = [16 * GB, 8 * GB, 8 * GB]
+    budget = BuildJobBudget(total_jobs=8)
+    lease = budget.acquire(4)
+    monitor = MemoryPeakMonitor(interval=0.01, lease=lease).start()
+    other = budget.acquire(4)
+    assert lease.shared() and other.shared()
+    monitor._stop.wait(0.05)
+    other.release()
+    assert monitor.stop(lease.jobs) is None
+    assert not lease.shared()
+
+
+def test_peak_history_keeps_recent_samples(dev_root):
+    for peak in (1, 2, 3, 4, 5, 6):
+        record_tu_peak_bytes("C:/dev/Foo", "release", peak * GB)
+    assert get_tu_peak_bytes("C:/dev/Foo", "release") == 6 * GB
+    assert not list((dev_root / "config").glob("*.tmp"))
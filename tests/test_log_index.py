@@ -0,0 +1,79 @@
+import pytest
+
+from modules.log_index import LogIndex, CHUNK_LINES
+from modules.log_store import LogStore, LEVEL_ERROR, LEVEL_WARN
+
+
+def fill(capacity, total, special):
+    """A store of `total` lines where special maps seq -> text; the rest are plain build lines"""
+    store = LogStore(capacity)
+    index = LogIndex(store)
+    for seq in range(total):
+        store.append(special.get(seq, f"compiling.release src/file{seq}.cpp"))
+    return store, index
+
+
+def linear(store, query):
+    return [seq for seq in range(store.first_seq, store.next_seq)
+            if query in store.text(seq).lower()]
+
+
+def test_find_next_in_partly_evicted_chunk():
+    # The repro from the fix: 2500 is evicted but shares a chunk with 3050
+    store, index = fill(2000, 5000, {2500: "needle", 3050: "needle", 4900: "needle"})
+    assert store.first_seq == 3000
+    assert 2500 // CHUNK_LINES == 3050 // CHUNK_LINES
+
+    assert index.find_next("needle", -1) == 3050
+    assert index.find_next("NEEDLE", 3050) == 4900
+    assert index.find_next("needle", 4900) is None
+    assert index.find_all("needle") == [3050, 4900]
+
+
+def test_find_prev_across_eviction():
+    store, index = fill(2000, 5000, {2500: "needle", 3050: "needle", 4900: "needle"})
+
+    assert index.find_prev("needle", store.next_seq) == 4900
+    assert index.find_prev("needle", 4900) == 3050
+    assert index.find_prev("needle", 3050) is None
+
+
+def test_search_matches_a_linear_scan_after_wrapping():
+    special = {seq: f"[ERROR] needle {seq}" for seq in range(0, 7000, 337)}
+    store, index = fill(1500, 7000, special)
+    expected = linear(store, "needle")
+    assert expected and expected[0] >= store.first_seq
+
+    assert index.find_all("needle") == expected
+    walked, seq = [], -1
+    while (seq := index.find_next("needle", seq)) is not None:
+        walked.append(seq)
+    assert walked == expected
+    walked, seq = [], store.next_seq
+    while (seq := index.find_prev("needle", seq)) is not None:
+        walked.append(seq)
+    assert walked == expected[::-1]
+
+
+def test_level_navigation_across_eviction():
+    special = {100: "[ERROR] early", 2500: "[ERROR] evicted", 3500: "x.cpp(3): error C2065: y",
+               3600: "[WARN] careful", 4200: "[ERROR] late"}
+    store, index = fill(2000, 5000, special)
+
+    assert index.next_with_level(-1) == 3500
+    assert index.next_with_level(3500) == 4200
+    assert index.next_with_level(4200) is None
+    assert index.next_with_level(-1, (LEVEL_WARN, LEVEL_ERROR)) == 3500
+    assert index.next_with_level(3500, (LEVEL_WARN, LEVEL_ERROR)) == 3600
+    assert index.prev_with_level(store.next_seq) == 4200
+    assert index.prev_with_level(3500) is None
+    assert index.count(LEVEL_ERROR) == 2
+    assert index.matching((LEVEL_ERROR,)) == [3500, 4200]
+
+
+@pytest.mark.parametrize("query", ["", "a\nb"])
+def test_unsearchable_queries(query):
+    _, index = fill(100, 10, {})
+    assert index.find_next(query, -1) is None
+    assert index.find_prev(query, 10) is None
+    assert index.find_all(query) == []
@@ -0,0 +1,109 @@
+import os
+import sys
+import stat
+
+import pytest
+
+from modules import object_cache
+from modules.object_cache import ObjectCache, parse_compile_args, pch_identity, run_compiler
+
+FAKE_CL = '''#!{python}
+import sys
+from pathlib import Path
+args = sys.argv[1:]
+source = Path(next(a for a in args if a.endswith(".cpp")))
+if "/E" in args:
+    sys.stdout.write(source.read_text())
+    sys.exit(0)
+with open(Path(__file__).with_name("compiles.log"), "a") as log:
+    log.write(f"{{source.name}}\\n")
+out = next(a[3:] for a in args if a.startswith("/Fo"))
+Path(out).write_bytes(b"OBJ " + source.read_bytes())
+print(source.name)
+'''
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A source tree with a pch.h, a fake cl that preprocesses by echoing the source, and a cache"""
+    if sys.platform.startswith("win"):
+        pytest.skip("the fake compiler is a shebang script")
+    compiler = tmp_path / "fake_cl"
+    compiler.write_text(FAKE_CL.format(python=sys.executable))
+    compiler.chmod(compiler.stat().st_mode | stat.S_IXUSR)
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "pch.h").write_text("#include <RE/Skyrim.h>\n")
+    (src / "main.cpp").write_text('#include "pch.h"\nint main() { return 0; }\n')
+    monkeypatch.chdir(tmp_path)
+    cache = ObjectCache(root=tmp_path / "cache", max_bytes=1024 ** 3)
+    return tmp_path, str(compiler), cache
+
+
+def compile_args(out, pch_path="build/pch.pch"):
+    return ["/c", "/nologo", "/std:c++latest", '/Yu"pch.h"', "/FIpch.h", f"/Fp{pch_path}",
+            f"/Fo{out}", "src/main.cpp"]
+
+
+def real_compiles(root):
+    log = root / "compiles.log"
+    return log.read_text().split() if log.exists() else []
+
+
+def test_parse_compile_args_strips_outputs():
+    parsed = parse_compile_args(compile_args("build/main.obj"))
+    assert parsed is not None
+    source, object_path, key_args = parsed
+    assert source == "src/main.cpp" and object_path == "build/main.obj"
+    assert not any(arg.startswith(("/Fo", "/Fp")) for arg in key_args)
+    assert parse_compile_args(["/c", "/Ycpch.h", "src/main.cpp"]) is None
+    assert parse_compile_args(["/c", "/Zi", "src/main.cpp"]) is None
+
+
+def test_pch_identity_follows_header_content(project):
+    root, _, _ = project
+    args = compile_args("build/main.obj")
+    first = pch_identity(args, "src/main.cpp")
+    assert first and first[0].startswith("pch=pch.h|")
+    assert pch_identity(args, "src/main.cpp") == first
+    (root / "src" / "pch.h").write_text("#include <RE/Skyrim.h>\n#define EXTRA 1\n")
+    assert pch_identity(args, "src/main.cpp") != first
+    assert pch_identity(["/c", "src/main.cpp"], "src/main.cpp") == []
+
+
+def test_hit_after_clean_and_miss_on_pch_change(project, capsys):
+    root, compiler, cache = project
+    out = root / "build" / "main.obj"
+    out.parent.mkdir()
+
+    assert run_compiler(compiler, compile_args(str(out)), cache) == 0
+    built = out.read_bytes()
+    out.unlink()
+
+    # A clean rebuild elsewhere: another object and .pch location, same content
+    other = root / "build" / "other.obj"
+    assert run_compiler(compiler, compile_args(str(other), "elsewhere/pch.pch"), cache) == 0
+    assert other.read_bytes() == built
+    assert real_compiles(root) == ["main.cpp"]
+    assert "main.cpp" in capsys.readouterr().out
+
+    # Editing the precompiled header must not reuse the object built against the old one
+    (root / "src" / "pch.h").write_text("#include <RE/Skyrim.h>\n#define EXTRA 1\n")
+    assert run_compiler(compiler, compile_args(str(out)), cache) == 0
+    assert real_compiles(root) == ["main.cpp", "main.cpp"]
+
+    stats = cache.stats()
+    assert (stats["hit"], stats["miss"], stats["entries"]) == (1, 2, 2)
+
+
+def test_stats_log_is_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(object_cache, "STATS_LOG_MAX_BYTES", 200)
+    cache = ObjectCache(root=tmp_path)
+    for _ in range(500):
+        cache.record("hit")
+    cache.record("miss", 3)
+    cache.record("evicted", 2)
+
+    assert os.path.getsize(tmp_path / "stats.log") <= 200 + len("uncacheable 1\n")
+    stats = cache.stats()
+    assert (stats["hit"], stats["miss"], stats["evicted"], stats["uncacheable"]) == (500, 3, 2, 0)
@@ -0,0 +1,135 @@
+import os
+import shutil
+
+import pytest
+
+from modules.project_index import ProjectIndex, ProjectChanges, fill_project_combo, apply_project_changes
+
+
+def make_project(root, name, version="1.0.0", xmake=True):
+    folder = root / name
+    folder.mkdir(parents=True)
+    if xmake:
+        write_xmake(folder, name, version)
+    return folder
+
+
+def write_xmake(folder, name, version):
+    path = folder / "xmake.lua"
+    path.write_text(f'set_project("{name}")\nset_version("{version}")\ntarget("{name}")\n')
+    # Coarse filesystem clocks: move the mtime so the stamp changes even at equal size
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def index(tmp_path):
+    root = tmp_path / "projects"
+    make_project(root, "Alpha")
+    make_project(root, "Beta", "2.0.0")
+    make_project(root, "Scratch", xmake=False)
+    index = ProjectIndex(root)
+    index.refresh()
+    return index
+
+
+def test_initial_scan(index):
+    assert index.names() == ["Alpha", "Beta"]
+    assert index.names(valid_only=False) == ["Alpha", "Beta", "Scratch"]
+    assert index.get("Beta").xmake_meta == {"project": "Beta", "version": "2.0.0", "target": "Beta"}
+    assert index.parses == 2
+
+
+def test_refresh_without_changes_parses_nothing(index):
+    parses = index.parses
+    changes = index.refresh()
+    assert not changes
+    assert index.parses == parses
+    assert index.scans == 2
+
+
+def test_add_remove_rename_and_update(index):
+    events = []
+    index.subscribe(lambda idx, changes: events.append(changes))
+    root = index.root
+
+    make_project(root, "Gamma")
+    (root / "Alpha").rename(root / "Zeta")
+    shutil.rmtree(root / "Beta")
+    changes = index.refresh()
+
+    assert (changes.added, changes.removed, changes.renamed) == (["Gamma"], ["Beta"], [("Alpha", "Zeta")])
+    assert index.names() == ["Gamma", "Zeta"]
+    # The renamed record keeps its parse: only Gamma's xmake.lua was read
+    assert index.get("Zeta").xmake_meta["project"] == "Alpha"
+    assert index.get("Zeta").path == root / "Zeta"
+    assert events and events[-1] is changes
+
+    parses = index.parses
+    write_xmake(root / "Gamma", "Gamma", "1.2.3")
+    changes = index.refresh()
+    assert changes.updated == ["Gamma"] and not (changes.added or changes.removed or changes.renamed)
+    assert index.get("Gamma").xmake_meta["version"] == "1.2.3"
+    assert index.parses == parses + 1
+
+
+def test_project_becoming_valid_is_an_addition(index):
+    write_xmake(index.root / "Scratch", "Scratch", "0.1.0")
+    assert index.refresh().added == ["Scratch"]
+    (index.root / "Scratch" / "xmake.lua").unlink()
+    assert index.refresh().removed == ["Scratch"]
+
+
+def test_refresh_project_touches_one_folder(index):
+    parses = index.parses
+    write_xmake(index.root / "Alpha", "Alpha", "9.9.9")
+    write_xmake(index.root / "Beta", "Beta", "9.9.9")
+    changes = index.refresh_project("Alpha")
+    assert changes.updated == ["Alpha"]
+    assert index.parses == parses + 1
+    assert index.get("Beta").xmake_meta["version"] == "2.0.0"
+
+
+def test_missing_root(tmp_path):
+    index = ProjectIndex(tmp_path / "nowhere")
+    assert not index.refresh()
+    assert index.names() == [] and not index.root_exists()
+
+
+#----------Pickers----------
+@pytest.fixture
+def combo(monkeypatch):
+    widgets = pytest.importorskip("PyQt6.QtWidgets")
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    app = widgets.QApplication.instance() or widgets.QApplication([])
+    yield widgets.QComboBox()
+    app.processEvents()
+
+
+def items(combo):
+    return [combo.itemText(i) for i in range(combo.count())]
+
+
+def test_fill_project_combo(combo):
+    seen = []
+    combo.currentTextChanged.connect(seen.append)
+    fill_project_combo(combo, ["Alpha", "Beta"], last_project="Beta")
+    assert items(combo) == ["Alpha", "Beta"] and combo.currentText() == "Beta"
+    assert seen == ["Beta"]
+    fill_project_combo(combo, [])
+    assert items(combo) == ["No valid ClibDT projects found"]
+
+
+def test_apply_project_changes_keeps_selection(combo):
+    fill_project_combo(combo, ["Alpha", "Beta", "Delta"], last_project="Beta")
+    seen = []
+    combo.currentTextChanged.connect(seen.append)
+
+    apply_project_changes(combo, ProjectChanges(added=["Charlie"], removed=["Delta"], renamed=[("Beta", "Omega")]))
+    assert items(combo) == ["Alpha", "Charlie", "Omega"]
+    assert combo.currentText() == "Omega" and seen == ["Omega"]
+
+    apply_project_changes(combo, ProjectChanges(removed=["Alpha", "Charlie", "Omega"]))
+    assert items(combo) == ["No valid ClibDT projects found"]
+    apply_project_changes(combo, ProjectChanges(added=["Alpha"]))
+    assert items(combo) == ["Alpha"]
@@ -0,0 +1,127 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from modules import version_check
+
+PAGE_HEAD = b'<html><body><div class="stat">9.9.9</div>'
+# Far more than the socket buffers hold, so a client that stops reading early is noticeable
+PAGE_PADDING = 32 * 1024 * 1024
+ETAG = '"v9.9.9"'
+LAST_MODIFIED = "Sat, 01 Aug 2026 10:00:00 GMT"
+
+
+class FakeNexus:
+    """Local http.server standing in for the Nexus page; records every request it gets"""
+
+    def __init__(self):
+        self.requests = []
+        self.bytes_sent = 0
+        self.body_done = threading.Event()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake.requests.append(dict(self.headers))
+                if self.headers.get("If-None-Match") == ETAG:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(PAGE_HEAD) + PAGE_PADDING))
+                self.send_header("ETag", ETAG)
+                self.send_header("Last-Modified", LAST_MODIFIED)
+                self.end_headers()
+                try:
+                    self.wfile.write(PAGE_HEAD)
+                    fake.bytes_sent = len(PAGE_HEAD)
+                    chunk = b" " * 16384
+                    for _ in range(PAGE_PADDING // len(chunk)):
+                        self.wfile.write(chunk)
+                        fake.bytes_sent += len(chunk)
+                except OSError:
+                    pass
+                finally:
+                    fake.body_done.set()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/mods/1"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def nexus():
+    server = FakeNexus()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    # Keep proxy settings of the environment away from localhost
+    session.trust_env = False
+    yield session
+    session.close()
+
+
+def test_marker_found_early_stops_streaming(dev_root, nexus, session):
+    info = version_check.check_version(nexus.url, force=True, session=session)
+
+    assert info["online_version"] == "9.9.9"
+    assert info["error"] is None and not info["from_cache"]
+    assert nexus.body_done.wait(10)
+    assert nexus.bytes_sent < PAGE_PADDING // 2
+
+
+def test_fresh_cache_makes_no_request(dev_root, nexus, session):
+    version_check.check_version(nexus.url, force=True, session=session)
+    info = version_check.check_version(nexus.url, session=session)
+
+    assert info["from_cache"]
+    assert info["online_version"] == "9.9.9"
+    assert len(nexus.requests) == 1
+
+
+def test_validators_sent_and_304_keeps_version(dev_root, nexus, session):
+    version_check.check_version(nexus.url, force=True, session=session)
+    info = version_check.check_version(nexus.url, force=True, session=session)
+
+    assert len(nexus.requests) == 2
+    assert nexus.requests[1].get("If-None-Match") == ETAG
+    assert nexus.requests[1].get("If-Modified-Since") == LAST_MODIFIED
+    assert info["not_modified"]
+    assert info["online_version"] == "9.9.9"
+    assert version_check.load_cache(nexus.url)["online_version"] == "9.9.9"
+
+
+def test_connection_refused_caches_error_and_keeps_version(dev_root, session):
+    server = FakeNexus()
+    version_check.check_version(server.url, force=True, session=session)
+    server.stop()
+    # Nothing listens on the port any more
+    with pytest.raises(OSError):
+        socket.create_connection(server.server.server_address, timeout=1).close()
+
+    info = version_check.check_version(server.url, force=True, session=session)
+    assert info["error"]
+    assert info["online_version"] == "9.9.9"
+
+    cached = version_check.load_cache(server.url)
+    assert cached["error"] and cached["online_version"] == "9.9.9"
+    # The failure is cached, so the next launch does not retry right away
+    again = version_check.check_version(server.url, session=session)
+    assert again["from_cache"] and again["error"]